@@ -214,11 +214,13 @@ from streamlines import fstreamplot
 #from pylab import figure, axes, plot, xlabel, ylabel, title, grid, savefig, show
 
 import gc
+import weakref
 import numpy as np
 import array
 import scipy as sp
 from scipy.interpolate import griddata
 from scipy.interpolate import interp1d
+from scipy.interpolate import CloughTocher2DInterpolator
 #from scipy.interpolate import Rbf
 from scipy.optimize import leastsq
 from scipy.optimize import curve_fit
@@ -2101,8 +2103,9 @@ def get2davgone(whichgroup=-1,itemspergroup=20):
         avgmem=np.load( fname )
         return( avgmem )
     tiny=np.finfo(t.dtype).tiny
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    # catalog has times, so no need to read each header below
+    fieldlinecat=fieldlinecatalog()
+    flist = [os.path.join("dumps/", fname) for fname in fieldlinecat['fname']]
     firstfieldlinefile=flist[0]
     #flist.sort()
     #
@@ -2128,9 +2131,8 @@ def get2davgone(whichgroup=-1,itemspergroup=20):
             if( fldindex / itemspergroup != whichgroup ):
                 continue
         #
-        print(( "Reading " + fldname + " ..." )) ; sys.stdout.flush()
         #rfdheaderonly("../"+fldname)
-        rfdheaderonly(fldname)
+        #rfdheaderonly(fldname)
         #
         if itert==0:
             # create array with 1 element
@@ -2139,7 +2141,7 @@ def get2davgone(whichgroup=-1,itemspergroup=20):
             # add an element
             localts=np.append(localts,np.arange(0,1))
         #
-        localts[itert]=t
+        localts[itert]=fieldlinecat['t'][fldindex]
         itert=itert+1
     #
     if len(localts)>1:
@@ -2155,8 +2157,16 @@ def get2davgone(whichgroup=-1,itemspergroup=20):
     #print "Total number of quantities: %d" % (i)
     print("Doing %d-th group of %d items" % (whichgroup, itemspergroup)) ; sys.stdout.flush()
     #end avg defs
-    itert=0
+    # which files loop below will read, so they can be read ahead in background
+    whichread=[]
     for fldindex, fldname in enumerate(flist):
+        whichread.append(True)
+        if( whichgroup >=0 and itemspergroup > 0 ):
+            if( fldindex / itemspergroup != whichgroup ):
+                whichread[fldindex]=False
+    #
+    itert=0
+    for fldindex, fldname in rfdprefetch(flist,whichread=whichread):
         if( whichgroup >=0 and itemspergroup > 0 ):
             if( fldindex / itemspergroup != whichgroup ):
                 continue
@@ -2252,7 +2262,7 @@ def get2davgone(whichgroup=-1,itemspergroup=20):
         # 16*1=16
         n=16
         # faraday
-        avg_absfdd+=(np.fabs(fdd)).sum(-1)[:,:,:,:,None]*localdt[itert] # take absolute value since oscillate around 0 near equator and would cancel out and give noise in fdd/fdd type calculations, such as for omegaf
+        avg_absfdd+=(fdd.fabs()).sum(-1)[:,:,:,:,None]*localdt[itert] # take absolute value since oscillate around 0 near equator and would cancel out and give noise in fdd/fdd type calculations, such as for omegaf
         #
         # 
         uuud=odot(uu,ud).sum(-1)[:,:,:,:,None]*localdt[itert]
@@ -2923,8 +2933,7 @@ def getdefaulttimes3():
     #
     (defaultfti,defaultftf)=getdefaulttimes1()
     #
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     lastfieldlinefile=flist[-1]
     rfdheaderonly(lastfieldlinefile)
     truetf=t
@@ -3639,48 +3648,51 @@ def vomegarot():
     #
 
     
-def horcalc(hortype=1,which1=1,which2=1,denfactor=None):
+def horcalc2d(hortype=1,which1=1,which2=1,denfactor=None):
     """
     Compute root mean square deviation of disk body from equatorial plane
+    Returns (hoverr2d,thetamid2d) as functions of (r,\phi), i.e. shape (nx,nz)
     """
     if denfactor is None:
         denfactor=rholab
     #
-    # determine when have to revert to which2
-    which=which1
+    # determine when have to revert to which2 (where which1 is empty for all \theta at given r,\phi)
+    which1=np.asarray(which1)
     testit=which1.sum(axis=1)
-    for i in np.arange(0,nx):
-        for k in np.arange(0,nz):
-            if testit[i,k]==0:
-                which[i,:,k]=which2[i,:,k]
+    which=np.where((testit==0)[:,None,:],which2,which1).astype(which1.dtype,copy=False)
     #
     tiny=np.finfo(rho.dtype).tiny
     #
-    thetamid3d=np.zeros((nx,ny,nz),dtype=h.dtype)
     # sum over \theta
     if hortype==1:
         up=(gdet*denfactor*(h-np.pi/2)*which).sum(axis=1)
         dn=(gdet*denfactor*which).sum(axis=1)
         # so average over \theta
-        thetamid2d=up/(dn+tiny)+np.pi/2.0
+        thetamid2d=(up/(dn+tiny)+np.pi/2.0).astype(h.dtype)  # thetamid2d depends upon r and \phi
         #print("thetamid2d")
         #god=thetamid2d[iofr(100),:]
         #print(god)
-        for j in np.arange(0,ny):
-            thetamid3d[:,j,:] = thetamid2d  # thetamid2d depends upon r and \phi
     else:
-        thetamid3d=0.5*np.pi+thetamid3d
+        thetamid2d=np.zeros(testit.shape,dtype=h.dtype)+0.5*np.pi
     #
-    up=(gdet*denfactor*(h-thetamid3d)**2*which).sum(axis=1)
+    up=(gdet*denfactor*(h-thetamid2d[:,None,:])**2*which).sum(axis=1)
     #up=(gdet*denfactor*(h-1.57)**2*which).sum(axis=1)
     dn=(gdet*denfactor*which).sum(axis=1)
-    hoverr2d= (up/(dn+tiny))**0.5
-    hoverr3d=np.empty((nx,ny,nz),dtype=h.dtype)
-    for j in np.arange(0,ny):
-        hoverr3d[:,j,:] = hoverr2d
+    hoverr2d=((up/(dn+tiny))**0.5).astype(h.dtype)
     #
-    #
-    return((hoverr3d,thetamid3d))
+    return((hoverr2d,thetamid2d))
+
+def hor2dto3d(val2d):
+    """ (nx,nz) function of (r,\phi) as read-only (nx,ny,nz) view (no copy) """
+    return(np.broadcast_to(val2d[:,None,:],(val2d.shape[0],ny,val2d.shape[1])))
+
+def horcalc(hortype=1,which1=1,which2=1,denfactor=None):
+    """
+    Compute root mean square deviation of disk body from equatorial plane
+    Returns (hoverr3d,thetamid3d) as read-only (nx,ny,nz) views of horcalc2d() results
+    """
+    (hoverr2d,thetamid2d)=horcalc2d(hortype=hortype,which1=which1,which2=which2,denfactor=denfactor)
+    return((hor2dto3d(hoverr2d),hor2dto3d(thetamid2d)))
 
 
 def gridcalc(hoverrconst=None,hoverr=None):
@@ -4201,6 +4213,179 @@ def luminosities(which=1,rdown=0.0,rup=1.0E3):
     return lumug,lumbsq,lumfull,lumug2,lumbsq2,lumfull2,lumug3,lumbsq3,lumfull3,lumug4,lumbsq4,lumfull4,lumsynch,lumsynchnon1,lumsynchnon2,lumsynchnon3
 
 
+# per-dump cache of conditions (e.g. bsq/rho>=minbsqorho, uu[1]<0) used by intangle(), horfluxcalc() and jetpowcalc().
+# getqtyvstime() calls these many times per dump with the same few thresholds, so each distinct condition is made once as a
+# boolean array, and each distinct combination of conditions once.  Conditions never asked for are never made.
+# Cache is dropped when any array it depends upon is replaced (e.g. by rfd(), cvel(), intangle_foravg2d()), but not if changed in place.
+condmaskcachemax=64
+condmaskcache={}
+condmasksources=None
+condmasksourcenames=['bsq','rho','ug','urad','uu','isunbound','h','tj','gdet']
+condmaskops={'<':np.less,'<=':np.less_equal,'>':np.greater,'>=':np.greater_equal,'==':np.equal}
+
+def condmasksourceref(obj):
+    try:
+        return(weakref.ref(obj))
+    except TypeError:
+        # e.g. scalar urad: just hold it
+        return(lambda: obj)
+
+def condmaskcheck():
+    global condmaskcache,condmasksources
+    current=[globals().get(name) for name in condmasksourcenames]
+    if condmasksources is not None and len(condmaskcache)<condmaskcachemax:
+        if all(ref() is obj for ref,obj in zip(condmasksources,current)):
+            return
+    condmaskcache={}
+    condmasksources=[condmasksourceref(obj) for obj in current]
+
+def condmaskquantity(qname):
+    """ quantity conditions are applied to: 'bsqorho','bsqorhophiavg','betatot','uu1','isunbound','tj','h', or ('dh',thetamid) for |h-thetamid| """
+    if qname=='uu1':
+        return(uu[1])
+    if qname=='isunbound':
+        return(isunbound)
+    if qname=='tj':
+        return(tj)
+    if qname=='h':
+        return(h)
+    key=('q',qname)
+    try:
+        hash(key)
+    except TypeError:
+        # e.g. ('dh',thetamid3d) with array-valued thetamid: don't cache
+        if qname[0]=='dh':
+            return(np.abs(h-qname[1]))
+        raise Exception('condmaskquantity','unknown quantity',qname)
+    if key not in condmaskcache:
+        if qname=='bsqorho':
+            condmaskcache[key]=bsq/rho
+        elif qname=='bsqorhophiavg':
+            # gdet-weighted \phi-average of bsq/rho, as 3D array (for cuts that shouldn't trigger artificial \phi-dependence)
+            bsqorho_phiavg0_up=np.sum(gdet*bsq/rho,axis=2)
+            bsqorho_phiavg0_dn=np.sum(gdet*1.0+rho*0.0,axis=2) # gdet is 2D by default
+            bsqorho_phiavg0=(bsqorho_phiavg0_up/bsqorho_phiavg0_dn).astype(bsq.dtype)
+            condmaskcache[key]=np.broadcast_to(bsqorho_phiavg0[:,:,None],bsq.shape)
+        elif qname=='betatot':
+            condmaskcache[key]=((gam-1)*ug+(4.0/3.0-1)*urad)/(1E-30 + bsq*0.5)
+        elif qname[0]=='dh':
+            condmaskcache[key]=np.abs(h-qname[1])
+        else:
+            raise Exception('condmaskquantity','unknown quantity',qname)
+    return(condmaskcache[key])
+
+def condmask(conds):
+    """
+    conds is list of (qname,op,value) (see condmaskquantity() and condmaskops), e.g. [('bsqorho','>=',10),('uu1','<',0.0)]
+    Returns boolean array where all conditions hold, or None if conds is empty.
+    """
+    conds=[cond for cond in conds if cond is not None]
+    if len(conds)==0:
+        return(None)
+    condmaskcheck()
+    try:
+        key=('and',frozenset(conds))
+        hash(key)
+    except TypeError:
+        # e.g. array-valued threshold: don't cache
+        key=None
+    if key in condmaskcache:
+        return(condmaskcache[key])
+    mask=None
+    for (qname,op,value) in conds:
+        onekey=None if key is None else ('m',qname,op,value)
+        if onekey in condmaskcache:
+            onemask=condmaskcache[onekey]
+        else:
+            onemask=condmaskops[op](condmaskquantity(qname),value)
+            if onekey is not None:
+                condmaskcache[onekey]=onemask
+        if mask is None:
+            mask=onemask
+        else:
+            mask=np.logical_and(mask,onemask)
+    if key is not None:
+        condmaskcache[key]=mask
+    return(mask)
+
+
+# Per-radius integrals for many thresholds on one quantity (e.g. intangle(q,minbsqorho=v) for v=5,10,20,40) from one pass.
+# Integrand is histogrammed over (radius, key) with bin edges at the thresholds themselves, and then cumulatively summed,
+# so each threshold's integral vs. r is a lookup that is exact (not just to bin width).  Cost doesn't grow with number of thresholds.
+class CondIntegral(object):
+    def __init__(self,integrand,key,edges,inclusive=False):
+        # inclusive=False: bins are edges[b-1]<=key<edges[b] (for <,>= conditions).  inclusive=True: edges[b-1]<key<=edges[b] (for <=,>)
+        key=np.broadcast_to(key,integrand.shape)
+        # compare in key's precision, as key>=value would
+        if np.issubdtype(key.dtype,np.floating):
+            self.edges=np.sort(np.asarray(edges,dtype=key.dtype))
+        else:
+            self.edges=np.sort(np.asarray(edges,dtype=np.float64))
+        self.inclusive=inclusive
+        self.numr=integrand.shape[0]
+        numbins=len(self.edges)+1
+        bins=np.searchsorted(self.edges,key,side='left' if inclusive else 'right')
+        bins+=numbins*np.arange(0,self.numr).reshape((self.numr,)+(1,)*(key.ndim-1))
+        weights=np.array(integrand,dtype=np.float64)
+        # nan key is outside any condition (as for comparisons)
+        weights[np.isnan(key)]=0.0
+        hist=np.bincount(bins.reshape(-1),weights=weights.reshape(-1),minlength=self.numr*numbins).reshape(self.numr,numbins)
+        self.cumsum=np.zeros((self.numr,numbins+1),dtype=np.float64)
+        np.cumsum(hist,axis=1,out=self.cumsum[:,1:])
+    #
+    def total(self):
+        return(self.cumsum[:,-1])
+    #
+    def sumwhere(self,op,value):
+        """ sum of integrand at each radius over cells with key op value.  value must be one of edges, and op <,>= (or <=,> if inclusive) """
+        if (op in ['<','>='] and self.inclusive) or (op in ['<=','>'] and not self.inclusive) or op not in ['<','<=','>','>=']:
+            raise Exception('CondIntegral.sumwhere','op does not match table',op)
+        jj=np.searchsorted(self.edges,np.asarray(value,dtype=self.edges.dtype))
+        if jj>=len(self.edges) or self.edges[jj]!=np.asarray(value,dtype=self.edges.dtype):
+            raise Exception('CondIntegral.sumwhere','value not one of edges',value)
+        below=self.cumsum[:,jj+1]
+        if op in ['<','<=']:
+            return(below)
+        else:
+            return(self.total()-below)
+
+def condintegral(qty,values,key='bsqorho',op='>=',conds=(),which=1):
+    """ CondIntegral of qty*which over cells where conds hold (see condmask()), binned by condmaskquantity(key) at values """
+    integrand=qty*which
+    insideall=condmask(list(conds))
+    if insideall is not None:
+        integrand=integrand*insideall
+    return(CondIntegral(integrand,condmaskquantity(key),values,inclusive=(op in ['<=','>'])))
+
+def intanglemany(qty,values,key='bsqorho',op='>=',conds=(),which=1):
+    """
+    [intangle(qty,...) for each threshold in values] from one pass, with threshold applied as key op value
+    e.g. intanglemany(q,[5,10,20,40]) is same as intangle(q,minbsqorho=v) for each v (up to roundoff of sum)
+    conds are further conditions as for condmask(), e.g. conds=[('uu1','<',0.0)] for inflowonly=1
+    """
+    table=condintegral(qty,values,key=key,op=op,conds=conds,which=which)
+    # as in intangle(): account for whether inputted phi slice or averaged, and for HARM vs. full 2\pi \phi-wedge
+    factor=_dx2*_dx3*(nz/len(qty[0,0,:]))
+    return([scaletofullwedge(table.sumwhere(op,value)*factor) for value in values])
+
+def horfluxcalcmany(values,ivalue=None,key='bsqorho',op='>=',conds=(),takeabs=1):
+    """ [horfluxcalc(ivalue=ivalue,minbsqorho=v,takeabs=takeabs) for each v in values] from one pass (only over radius ivalue if given) """
+    if takeabs==1:
+        tosum=np.abs(gdetB[1])
+    else:
+        tosum=gdetB[1]
+    keyqty=np.broadcast_to(condmaskquantity(key),tosum.shape)
+    insideall=condmask(list(conds))
+    if insideall is not None:
+        tosum=tosum*insideall
+    inclusive=(op in ['<=','>'])
+    if ivalue is not None:
+        table=CondIntegral(tosum[ivalue:ivalue+1],keyqty[ivalue:ivalue+1],values,inclusive=inclusive)
+        return([scaletofullwedge(table.sumwhere(op,value)[0]*_dx2*_dx3) for value in values])
+    table=CondIntegral(tosum,keyqty,values,inclusive=inclusive)
+    return([scaletofullwedge(table.sumwhere(op,value)*_dx2*_dx3) for value in values])
+
+
 # need integrate when nz=1 because just avg2d data.  Means averaged-out, so sum is recovered by multiplying by number of cells in \phi
 def intangle_foravg2d(qty,hoverr=None,thetamid=np.pi/2,minbsqorho=None,maxbsqorho=None,inflowonly=None,outflowonly=None,mumax=None,mumin=None,maxbeta=None,unboundonly=None,which=1,doabs=0):
     #
@@ -4240,75 +4425,56 @@ def intangle_foravg2d(qty,hoverr=None,thetamid=np.pi/2,minbsqorho=None,maxbsqorh
 def intangle(qty,hoverr=None,thetamid=np.pi/2,minbsqorho=None,maxbsqorho=None,inflowonly=None,outflowonly=None,mumax=None,mumin=None,maxbeta=None,unboundonly=None,which=1,doavgn3=1):
     integrand = qty
     #
+    # all conditions are cached per dump by condmask()
+    conds=[]
     #somehow gives slightly different answer than when computed directly
     if hoverr is not None:
-        insidehor = np.abs(h-thetamid)<hoverr
-    else:
-        hoverr = np.pi/2
-        thetamid = np.pi/2
-        insidehor = 1.0
+        conds.append((('dh',thetamid),'<',hoverr))
     #
     # minbsqorho to look at flow in high mag regions to approximate floor injection
     if minbsqorho != None:
-        insideminbsqorho = bsq/rho>=minbsqorho
-    else:
-        insideminbsqorho = 1
+        conds.append(('bsqorho','>=',minbsqorho))
     #
     # maxbsqorho for mdin
     if maxbsqorho != None:
-        insidemaxbsqorho = bsq/rho<=maxbsqorho
-    else:
-        insidemaxbsqorho = 1
+        conds.append(('bsqorho','<=',maxbsqorho))
     #
     # inflowonly for mdin
     # NOTEMARK: Not to be used for efficiency, but only Mdot(r) reporting
     if inflowonly != None:
-        insideinflowonly = uu[1]<0.0
-    else:
-        insideinflowonly = 1
+        conds.append(('uu1','<',0.0))
     #
     if outflowonly != None:
-        insideoutflowonly = uu[1]>0.0
-    else:
-        insideoutflowonly = 1
+        conds.append(('uu1','>',0.0))
     #
     #
     #v4asq=bsq/(rho+ug+(gam-1)*ug)
     #mum1fake=uu[0]*(1.0+v4asq)-1.0
-    # override (mum1fake or mu do poorly for marking boundary of jet)
-    mum1fake=bsq/rho
+    # override (mum1fake or mu do poorly for marking boundary of jet), so mum1fake=bsq/rho
     # mumax for wind
     # NOTEMARK: Not to be used for efficiency, but only Mdot(r) reporting
-    if mumax is None:
-        insidemumax = 1
-    else:
-        insidemumax = 1
-        insidemumax = insidemumax * (mum1fake<mumax)
+    if mumax is not None:
+        conds.append(('bsqorho','<',mumax))
     #
     # mumin for jet
     # NOTEMARK: Not to be used for efficiency, but only Mdot(r) reporting
-    if mumin is None:
-        insidemumin = 1
-    else:
-        insidemumin = 1
-        insidemumin = insidemumin * (mum1fake>=mumin)
+    if mumin is not None:
+        conds.append(('bsqorho','>=',mumin))
     #
-    if unboundonly is None:
-        insideunbound = 1
-    else:
-        insideunbound = (isunbound==1)
+    if unboundonly is not None:
+        conds.append(('isunbound','==',1))
     #
     # beta for wind
     #beta=((gam-1)*ug)*divideavoidinf(bsq*0.5)
-    beta=((gam-1)*ug)/(1E-30 + bsq*0.5)
-    betatot=((gam-1)*ug+(4.0/3.0-1)*urad)/(1E-30 + bsq*0.5)
-    if maxbeta is None:
-        insidebeta = 1
-    else:
-        insidebeta = (betatot<maxbeta) # using tot now
+    if maxbeta is not None:
+        conds.append(('betatot','<',maxbeta)) # using tot now
     #
     #
-    superintegrand=(integrand*insideinflowonly*insideoutflowonly*insidehor*insideminbsqorho*insidemaxbsqorho*insidemumin*insidemumax*insideunbound*insidebeta*which)
+    insideall=condmask(conds)
+    if insideall is None:
+        superintegrand=(integrand*which)
+    else:
+        superintegrand=(integrand*insideall*which)
     #
     if doavgn3==1:
         # this will be function of r
@@ -4433,6 +4599,202 @@ def restrictrphi_sum_vstheta(qty=None,iin=None,iout=None,kin=None,kout=None):
 
 
 
+# Batched spectral engine used by powervsm(), powervsl() and powervsn() (and qty_vsphi(), qty_vstheta(), qty_vsr()).
+# Instead of one np.fft.rfft per 1D slice (per r and \theta for m, per r and \phi for l, per \theta and \phi for n),
+# the whole (r-range,\theta,\phi) slab is transformed by one rfft along the chosen axis.
+# numpy already caches its own FFT twiddle factors per length, so the "plan" cached here is the part that was really
+# being redone for every slice: the stencil that remaps the non-uniform \theta or r grid onto the uniform grid the FFT needs.
+spectralplancachemax=64
+spectralplancache={}
+spectralplangrid=None
+
+def spectralplan(kind,iin,iout,size,xrange=None):
+    """
+    Cached linear interpolation stencil from the code grid onto a uniform grid of size points:
+    kind='h': \\theta at iavg=(iin+iout)/2 onto [0,\\pi] (as for remap2unih())
+    kind='r': r[iin:iout+1] onto xrange=(rinner,router) (as for remap2unir())
+    Outside the old grid values are linearly extrapolated like extrap1d() (set to 0 if that changes sign).
+    Returns (i0,w,edge) for use by spectralremap().
+    """
+    global spectralplancache,spectralplangrid
+    if spectralplangrid is None or spectralplangrid() is not h or len(spectralplancache)>=spectralplancachemax:
+        spectralplancache={}
+        spectralplangrid=condmasksourceref(h)
+    key=(kind,iin,iout,size,xrange)
+    if key in spectralplancache:
+        return(spectralplancache[key])
+    #
+    # assume original grid is cell-centered quantities
+    if kind=='h':
+        # NOTEMARK: assume radial averaging is small enough that grid doesn't vary that much over the span
+        iavg=int((iin+iout)*0.5)
+        xold=h[iavg,:,0]
+        xnew=np.pi*(0.5+np.arange(0,size))/(float(size-1))
+    elif kind=='r':
+        rinner,router=xrange
+        xold=r[iin:iout+1,ny//2,0] # ny/2 assumes integrated around equator as for disk OR radial grid doesn't depend upon \theta (which is true for all models so far: NOTEMARK)
+        xnew=rinner + (router-rinner)*(0.5+np.arange(0,size))/(float(size-1))
+    else:
+        raise Exception('spectralplan','unknown kind',kind)
+    nold=len(xold)
+    if nold<2:
+        raise Exception('spectralplan','need at least 2 points to remap',kind,iin,iout)
+    #
+    i0=np.clip(np.searchsorted(xold,xnew,side='right')-1,0,nold-2)
+    w=(xnew-xold[i0])/(xold[i0+1]-xold[i0])
+    # which end value extrapolated points must keep the sign of (-1 for interpolated points)
+    edge=np.zeros(size,dtype=int)-1
+    edge[xnew<xold[0]]=0
+    edge[xnew>xold[-1]]=nold-1
+    plan=(i0,w,edge)
+    spectralplancache[key]=plan
+    return(plan)
+
+def spectralremap(plan,vals,axis=0):
+    """ remap vals along axis with plan from spectralplan().  The remapped axis is returned as the last axis. """
+    i0,w,edge=plan
+    vals=np.moveaxis(np.asarray(vals),axis,-1)
+    v0=vals[...,i0]
+    result=v0 + w*(vals[...,i0+1]-v0)
+    outside=edge>=0
+    if np.any(outside):
+        # don't allow sign to change when extrapolating
+        part=result[...,outside]
+        part[np.sign(part)!=np.sign(vals[...,edge[outside]])]=0
+        result[...,outside]=part
+    return(result)
+
+def rfftabs(slab,axis,plan=None):
+    """
+    |rfft| of every 1D row of slab along axis from one np.fft.rfft call.
+    If plan (from spectralplan()) is given, rows are first remapped onto its uniform grid.
+    The transformed axis is returned as the last axis.
+    """
+    if plan is not None:
+        rows=spectralremap(plan,slab,axis)
+    else:
+        rows=np.moveaxis(slab,axis,-1)
+    return(np.absolute(np.fft.rfft(rows,axis=-1)))
+
+def powerratio(numer,denom):
+    # numer/denom (broadcast), with normal 0/0 and more aggressive x/0 both set to zero (i.e. assumed ignorable)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        ratio=numer/denom
+    return(np.where(np.logical_or(numer==0,denom==0),0,ratio))
+
+def powerspectrumtonx(Yfft,delta=1):
+    #translate |Y|^2 to nx size so can plot easier later and can store in nx stuff even if nfft>nx
+    # this does not interpolate the mode spectrum onto nx-sized data.  It just truncates modes if more than nx.
+    # Modes not measured (e.g. m not multiple of deltam for \phi-wedges) are zero.
+    powerfft=np.absolute(Yfft)**2
+    nfft=len(powerfft)
+    nummodes=min(nx,delta*(nfft-1)+1) # i.e. as if full range and delta*N zones
+    result=np.zeros(nx,dtype=powerfft.dtype)
+    modes=np.arange(0,nummodes,delta)
+    result[modes]=powerfft[modes//delta]
+    return(result)
+
+def powerbandindices(rin,rout):
+    # use direct avoidance of some cells (rather than just using which) in order to speed-up this otherwise slowish calculation
+    iin=iofr(rin)
+    iout=iofr(rout)
+    if iout<iin:
+        iout=iin
+    return(iin,iout)
+
+def powerbandslice(x,sl):
+    # restrict full-grid arrays to radial rows sl, leave scalars alone
+    if np.ndim(x)==3 and np.shape(x)[0]==nx:
+        return(x[sl])
+    return(x)
+
+def powerintegrand(qty,denom=None,doabs=0,minbsqorho=None,maxbsqorho=None,which=1,sl=slice(None)):
+    """
+    Volume-integrated numerator (and denominator if given) for power spectra over radial rows sl.
+    Cuts are on \\phi-averaged bsq/rho so can get power in a mode without triggering on artificial phi-dependent cut.
+    """
+    conds=[]
+    if minbsqorho is not None:
+        conds.append(('bsqorhophiavg','>',minbsqorho))
+    if maxbsqorho is not None:
+        conds.append(('bsqorhophiavg','<',maxbsqorho))
+    cut=condmask(conds)
+    if cut is not None:
+        cut=cut[sl]
+    #
+    which=powerbandslice(which,sl)
+    result=[]
+    for integrand in (qty,denom):
+        if integrand is None:
+            result.append(None)
+            continue
+        integrand=powerbandslice(integrand,sl)
+        if cut is not None:
+            integrand=integrand*cut
+        # required for things that are (e.g.) anti-symmetric across equator
+        if doabs==1:
+            integrand=np.fabs(integrand)
+        result.append(integrand*which*_dx1*_dx2*_dx3)
+    return(result[0],result[1])
+
+def phideltam():
+    # determine minimum true $m$ value due to $\phi$ box size
+    deltam=int(round(scaletofullwedge(1.0),0))
+    if deltam<1:
+        print(("deltam cannot be less than 1: %d" % deltam)) ; sys.stdout.flush()
+    else:
+        print(("deltam=%d" % deltam)) ; sys.stdout.flush()        
+    return(deltam)
+
+def powerspectra(qty=None,bands=None,kinds='mln',denom=1,doabs=0,minbsqorho=None,maxbsqorho=None,which=1,ignorephase=0):
+    """
+    m-, l- and n- power spectra of qty for every radial band in bands=[(rin,rout),...] from one call.
+    Same as powervsm(), powervsl() and powervsn() for each band (without their doonlyrequiredforpaper skipping),
+    but qty is formed once, the cut integrand over only the radii needed, and the m-spectra for all bands come from one rfft.
+    minbsqorho and maxbsqorho can be lists with a cut for each band (e.g. condmaxbsqorhorhs at each band's radius).
+    Returns dict kind ('m','l','n') -> array of shape (len(bands),nx)
+    """
+    numbands=len(bands)
+    minbsqorhos=minbsqorho if isinstance(minbsqorho,(list,tuple)) else [minbsqorho]*numbands
+    maxbsqorhos=maxbsqorho if isinstance(maxbsqorho,(list,tuple)) else [maxbsqorho]*numbands
+    iinout=[powerbandindices(rin,rout) for (rin,rout) in bands]
+    if len(set(zip(minbsqorhos,maxbsqorhos)))>1:
+        # different cut for each band, so each band's rows cut separately, then stacked so m-spectra still from one rfft
+        result={}
+        if 'm' in kinds:
+            numers=[powerintegrand(qty,doabs=doabs,minbsqorho=minbsqorhos[bb],maxbsqorho=maxbsqorhos[bb],which=which,sl=slice(iin,iout+1))[0] for bb, (iin,iout) in enumerate(iinout)]
+            starts=np.cumsum([0]+[len(numer) for numer in numers])
+            stackedinout=[(starts[bb],starts[bb+1]-1) for bb in range(numbands)]
+            deltam=phideltam()
+            result['m']=np.array([powerspectrumtonx(Yfft,deltam) for (qtyvsphi,Yfft) in powervsmbands(np.concatenate(numers,axis=0),stackedinout,ignorephase=ignorephase,ioff=0)])
+        otherkinds=''.join([kind for kind in kinds if kind!='m'])
+        if len(otherkinds)>0:
+            perband=[powerspectra(qty=qty,bands=[band],kinds=otherkinds,denom=denom,doabs=doabs,minbsqorho=minbsqorhos[bb],maxbsqorho=maxbsqorhos[bb],which=which,ignorephase=ignorephase) for bb, band in enumerate(bands)]
+            for kind in otherkinds:
+                result[kind]=np.array([oneband[kind][0] for oneband in perband])
+        return(result)
+    allindices=[ii for band in iinout for ii in band]
+    nrus=[]
+    if 'n' in kinds:
+        for (iin,iout) in iinout:
+            nrus.append(get_NRU(r[int((iin+iout)*0.5),ny//2,0]))
+            allindices=allindices+list(nrus[-1][4:6])
+    ioff=min(allindices)
+    sl=slice(ioff,max(allindices)+1)
+    numervsrhp,denomvsrhp=powerintegrand(qty,denom=denom,doabs=doabs,minbsqorho=minbsqorhos[0],maxbsqorho=maxbsqorhos[0],which=which,sl=sl)
+    #
+    result={}
+    if 'm' in kinds:
+        deltam=phideltam()
+        result['m']=np.array([powerspectrumtonx(Yfft,deltam) for (qtyvsphi,Yfft) in powervsmbands(numervsrhp,iinout,ignorephase=ignorephase,ioff=ioff)])
+    if 'l' in kinds:
+        result['l']=np.array([powervslband(numervsrhp,denomvsrhp,iin,iout,ignorephase=ignorephase,ioff=ioff)[0] for (iin,iout) in iinout])
+    if 'n' in kinds:
+        result['n']=np.array([powervsnband(numervsrhp,denomvsrhp,iin,iout,ignorephase=ignorephase,ioff=ioff,nru=nru)[0] for ((iin,iout),nru) in zip(iinout,nrus)])
+    return(result)
+
+
+
 # can't just truncate for spatial dependence because would then trigger on zeros.
 # note that \phi assumed to be periodic.  We correct for limited \phi-boxes here.
 # For fluctuations and getting auto-correlation or azimuthal correlation length: note that [a_m - a_0]_t / [a_0]_t = ([a_m]_t - [a_0]_t)/[a_0]_t = [a_m]_t/ [a_0]_t - 1  . So can subtracting off average at each time is same as subtracing the average over time from the time-averaged a_m.
@@ -4461,83 +4823,29 @@ def powervsm(doabs=0,rin=None,rout=None,qty=None,minbsqorho=None,maxbsqorho=None
             # always do for all radii and disk or jet
     #
     #
-    # use direct avoidance of some cells (rather than just using which) in order to speed-up this otherwise slowish calculation
-    iin=iofr(rin)
-    iout=iofr(rout)
-    if iout<iin:
-        iout=iin
-    #
-    ################
-    # first form average bsq/rho so can get power in a mode without triggering on artificial phi-dependent cut
-    bsqorho_phiavg0_up=np.sum(gdet*bsq/rho,axis=2)
-    bsqorho_phiavg0_dn=np.sum(gdet*1.0+rho*0.0,axis=2) # gdet is 2D by default
-    bsqorho_phiavg0=bsqorho_phiavg0_up/bsqorho_phiavg0_dn
-    #
-    #print("bsqorho_phiavg @ iin:")
-    #print(bsqorho_phiavg0[iin,:])
-    #print("bsqorho_phiavg @ iout:")
-    #print(bsqorho_phiavg0[iout,:])
-    #
-    # create 3D version
-    bsqorho_phiavg = np.zeros_like(bsq)
-    for kk in np.arange(0,nz):
-        bsqorho_phiavg[:,:,kk]=bsqorho_phiavg0[:,:]
-    #
+    iin,iout=powerbandindices(rin,rout)
     #
     ################
-    # setup properly-phi-cut integrand
-    integrand=qty
-    #
-    if minbsqorho is not None:
-        integrand = integrand*(bsqorho_phiavg>minbsqorho)
-    #
-    if maxbsqorho is not None:
-        integrand = integrand*(bsqorho_phiavg<maxbsqorho)
-    #
-    # required for things that are (e.g.) anti-symmetric across equator
-    if doabs==1:
-        integrand=np.fabs(integrand)
+    # setup properly-phi-cut integrand (only over radii used)
+    qtyvsrhp,nodenom=powerintegrand(qty,doabs=doabs,minbsqorho=minbsqorho,maxbsqorho=maxbsqorho,which=which,sl=slice(iin,iout+1))
     #
     NPU=nz
     ################
     # get quantity along \phi
-    qtyvsphi=np.zeros(NPU,dtype=np.float32)
     # now find powers for given cut, with nx m modes (generally, nx>=nz for most simulations, so should be fine and will resolve all modes)
     #
-    # FAST WAY
-    qtyvsrhp=integrand*which*_dx1*_dx2*_dx3
-    qtyvsphi,Yfft=qty_vsphi(size=NPU,qty=qtyvsrhp,iin=iin,iout=iout,ignorephase=IGNOREPHASE,dofft=1)
+    # FAST WAY: one rfft along \phi for whole slab
+    ((qtyvsphi,Yfft),)=powervsmbands(qtyvsrhp,[(iin,iout)],ignorephase=IGNOREPHASE,ioff=iin)
     #
     ### checks
     nfft=len(Yfft)
-    if nfft!=NPU/2+1:
-        print(("nfft=%d is not NPU/2+1=%d",nfft,NPU/2+1)) ; sys.stdout.flush()
+    if nfft!=NPU//2+1:
+        print(("nfft=%d is not NPU/2+1=%d",nfft,NPU//2+1)) ; sys.stdout.flush()
     #
     print(("qtyvsphi: nfft(ninput/2+1)=%d" % (nfft))) ; sys.stdout.flush()
     # power saved |a_m|^2 since final memory spot is real (not complex), so lose phase information
-    powerfft = (np.absolute(Yfft[0:nfft]))**2
-    #
-    # determine minimum true $m$ value due to $\phi$ box size
-    deltam=int(round(scaletofullwedge(1.0),0))
-    if deltam<1:
-        print(("deltam cannot be less than 1: %d" % deltam)) ; sys.stdout.flush()
-    else:
-        print(("deltam=%d" % deltam)) ; sys.stdout.flush()        
-    #
-    #
-    #translate to nx size so can plot easier later and can store in nx stuff even if nfft>nx
-    #
-    # this does not interpolate m-mode spectrum onto nx-sized data.  It just truncates m-modes if more than nx.
-    # So if NPU changes leading to change in nfft.....
-    numm=min(nx,deltam*(nfft-1)+1) # i.e. as if full 2pi and deltam*NPU zones
-    # have zeros for non-measured m
-    powervsmresult=np.zeros(nx,dtype=powerfft.dtype)
-    # initialize with all zeroes
-    for mm in np.arange(0,numm):
-        powervsmresult[mm]=0
-    # deal non-zero modes
-    for mm in np.arange(0,numm,deltam):
-        powervsmresult[mm]=powerfft[mm/deltam]
+    deltam=phideltam()
+    powervsmresult=powerspectrumtonx(Yfft,deltam)
     #
     ##################
     # very slow way
@@ -4555,61 +4863,53 @@ def powervsm(doabs=0,rin=None,rout=None,qty=None,minbsqorho=None,maxbsqorho=None
 
 # form \phi-only-dependent array
 def qty_vsphi(size=None,qty=None,iin=None,iout=None,ignorephase=1,dofft=0):
-    #
-    ###############################
-    # assumes qty is volume-integrated quantity
-    qtynew=scaletofullwedge(qty)
     #
     if nz!=size:
         print(("Not yet setup to resample for \phi-dependent quantity: nz=%d size=%d" % (nz,size))) ; sys.stdout.flush()
         exit
     #
-    ###############################
-    result=np.zeros(size,dtype=np.float32)
-    numinavgresult=0
-    Yfft=np.zeros(size/2+1,dtype=np.float32)
-    numinavg=0
-    #
-    ###############################
-    # sum over part of radial range
-    for ii in np.arange(iin,iout+1):
-        qtyslice=qtynew[ii,:,:]
-        #
-        if ignorephase==0 and dofft==1:
-            for jj in np.arange(len(qtyslice[:,0])):
-                # ignorephase==0 means don't just average in theta because each theta slice could be out of phase, giving (e.g.) amplitude=0 if added 2 out-of-phase same-$m$ oscillations
-                # So take absolute value now, so power-spectrum preserved, and so averaging power spectra in theta
-                Yfft[:]=Yfft[:] + np.absolute(np.fft.rfft(qtyslice[jj,:]))
-                numinavg=numinavg+1
-        # sum over theta (axis=0 really for \theta)
-        # note that sum of variables before FFT is same as doing sum over FFT for each \theta
-        # result is only phi-dependent
-        result=result + np.average(qtyslice,axis=0)
-        numinavgresult=numinavgresult+1
+    if dofft==0:
+        # assumes qty is volume-integrated quantity
+        result=np.average(np.average(scaletofullwedge(qty[iin:iout+1,:,:]),axis=1),axis=0)
+        Yfft=np.zeros(size//2+1,dtype=np.float32)
+        return(result,Yfft)
     #
+    ((result,Yfft),)=powervsmbands(qty,[(iin,iout)],ignorephase=ignorephase)
+    return(result,Yfft)
+
+# \phi-only-dependent arrays and their Fourier amplitudes for several radial bands [(iin,iout),...] at once
+def powervsmbands(qty,iinout,ignorephase=1,ioff=0):
     #
     ###############################
-    # get averages
-    result=result/numinavgresult
-    #
-    if ignorephase==0 and dofft==1:
-        Yfft=Yfft/numinavg
-    #
-    if numinavg==0:
-        print("Got numinavg=0 for qty_vsphi") ; sys.stdout.flush()
+    # assumes qty is volume-integrated quantity, with first row at radial index ioff
+    # only touch radii in some band, and transform each of them just once even if bands overlap
+    iall=np.unique(np.concatenate([np.arange(iin,iout+1) for (iin,iout) in iinout]))
+    qtynew=scaletofullwedge(qty[iall-ioff,:,:])
     #
     ###############################
-    #
-    #
-    if ignorephase==1 and dofft==1:
-        # then just Fourier transform the average
-        # get P_m
-        # get FFT
-        Yfft=np.fft.rfft(result)
+    # per-radius: average over theta (axis=1 really for \theta) so result is only phi-dependent
+    qtyvsphis=np.average(qtynew,axis=1)
+    if ignorephase==0:
+        # ignorephase==0 means don't just average in theta because each theta slice could be out of phase, giving (e.g.) amplitude=0 if added 2 out-of-phase same-$m$ oscillations
+        # So take absolute value now, so power-spectrum preserved, and so averaging power spectra in theta
+        Yffts=np.sum(rfftabs(qtynew,2),axis=1)
     #
     ###############################
+    # get averages over each band
+    results=[]
+    for (iin,iout) in iinout:
+        rows=slice(np.searchsorted(iall,iin),np.searchsorted(iall,iout)+1)
+        numinavgresult=iout-iin+1
+        result=np.sum(qtyvsphis[rows],axis=0)/numinavgresult
+        if ignorephase==0:
+            numinavg=numinavgresult*qtynew.shape[1]
+            Yfft=(np.sum(Yffts[rows],axis=0)/numinavg).astype(np.float32)
+        else:
+            # then just Fourier transform the average
+            Yfft=np.fft.rfft(result)
+        results.append((result,Yfft))
     #
-    return(result,Yfft)
+    return(results)
 
 # restricted radial range for sum so faster sum
 def restrictr_sum_3d(qty=None,iin=None,iout=None):
@@ -4665,6 +4965,92 @@ def restrictr_sum_3d(qty=None,iin=None,iout=None):
 #from scipy import *
 
 
+# Spherical harmonic transform on radial shells of our own (non-uniform \theta) grid, since the above libraries want their own \theta grids.
+# a_lm = \int qty Y_lm^* d\Omega, with d\Omega = \sin\theta d\theta d\phi from h and dxdxp[2][2] (i.e. angular part of gdet) as quadrature weights.
+# One FFT in \phi for all shells and \theta rows, then for each m a weighted sum over \theta against orthonormal associated Legendre functions.
+# The Legendre tables (with quadrature weights folded in) only depend upon the grid, so they are cached per shell for the current grid.
+shtablecachemax=64
+shtablecache={}
+shtablegrid=None
+
+def shlegendre(costh,sinth,lmax,mmax):
+    """
+    Orthonormal associated Legendre functions \\bar{P}_l^m(\\cos\\theta) (with Condon-Shortley phase), so Y_lm=\\bar{P}_l^m e^{im\\phi}.
+    Returns shape (mmax+1,lmax+1,len(costh)), zero for l<m.
+    Uses the usual recurrences in l at fixed m on the normalized functions, so no overflow at large l (unlike lpmn()).
+    """
+    plm=np.zeros((mmax+1,lmax+1,len(costh)),dtype=np.float64)
+    pmm=np.zeros(len(costh),dtype=np.float64)+np.sqrt(1.0/(4.0*np.pi))
+    for mm in np.arange(0,mmax+1):
+        if mm>0:
+            pmm=-np.sqrt((2.0*mm+1.0)/(2.0*mm))*sinth*pmm
+        plm[mm,mm]=pmm
+        if mm+1<=lmax:
+            plm[mm,mm+1]=np.sqrt(2.0*mm+3.0)*costh*pmm
+        for ll in np.arange(mm+2,lmax+1):
+            alm=np.sqrt((4.0*ll*ll-1.0)/(ll*ll-mm*mm))
+            blm=np.sqrt(((ll-1.0)**2-mm*mm)/(4.0*(ll-1.0)**2-1.0))
+            plm[mm,ll]=alm*(costh*plm[mm,ll-1]-blm*plm[mm,ll-2])
+    return(plm)
+
+def shtable(ii,lmax,mmax):
+    """ d\\Omega-weighted \\bar{P}_l^m at \\theta=h[ii,:,0] for m=0..mmax, shape (mmax+1,lmax+1,ny), cached per shell for the current grid """
+    global shtablecache,shtablegrid
+    if shtablegrid is None or shtablegrid() is not h or len(shtablecache)>=shtablecachemax:
+        shtablecache={}
+        shtablegrid=condmasksourceref(h)
+    key=(ii,lmax,mmax)
+    if key not in shtablecache:
+        theta=np.array(h[ii,:,0],dtype=np.float64)
+        dOmega=np.sin(theta)*dxdxp[2,2,ii,:,0]*_dx2 # \int d\phi done by FFT
+        shtablecache[key]=shlegendre(np.cos(theta),np.sin(theta),lmax,mmax)*dOmega
+    return(shtablecache[key])
+
+def shtransform(qty,radii=None,lmax=None,ii=None):
+    """
+    Spherical harmonic coefficients a_lm of qty on shells at radii (or radial indices ii).
+    qty is (nx,ny,nz), or batched (...,nx,ny,nz) (e.g. several dumps stacked) which are all done at once.
+    \\phi-wedges are treated as periodic, so only m=multiples of deltam are present.
+    Returns (alm,mlist), with alm shape (...,nshells,len(mlist),lmax+1) for m=mlist>=0 (a_{l,-m}=(-1)^m a_lm^* for real qty).
+    """
+    if ii is None:
+        ii=[iofr(rval) for rval in radii]
+    if lmax is None:
+        lmax=ny-1
+    deltam=int(round(scaletofullwedge(1.0),0))
+    nm=min(nz//2,lmax//deltam)+1
+    mlist=deltam*np.arange(0,nm)
+    #
+    shells=np.take(qty,ii,axis=-3)
+    if shells.shape[-1]!=nz:
+        # e.g. 2D quantity with 3D grid
+        shells=np.broadcast_to(shells,shells.shape[:-1]+(nz,))
+    # \int qty e^{-im\phi} d\phi over full 2\pi, with \phi measured from ph[0,0,0]
+    dph=dxdxp[3,3,0,0,0]*_dx3
+    qtym=np.fft.rfft(shells,axis=-1)[...,0:nm]*(dph*deltam)*np.exp(-1j*mlist*ph[0,0,0])
+    #
+    tables=np.array([shtable(i,lmax,mlist[-1])[mlist] for i in ii])
+    alm=np.einsum('smlj,...sjm->...sml',tables,qtym)
+    return(alm,mlist)
+
+def shpowervsl(qty,radii=None,lmax=None,ii=None):
+    """
+    Angular power C_l=\\sum_{m=-l}^{l}|a_lm|^2/(2l+1) on shells from shtransform(), so \\int qty^2 d\\Omega=\\sum_l (2l+1)C_l if all m are resolved.
+    Returns shape (...,nshells,nx): like powervsl(), l-spectrum is put into nx-sized array (truncated if more than nx) so can be stored per dump.
+    """
+    alm,mlist=shtransform(qty,radii=radii,lmax=lmax,ii=ii)
+    lmax=alm.shape[-1]-1
+    power=np.absolute(alm)**2
+    # m<0 have same power as m>0
+    power[...,1:,:]*=2.0
+    cl=np.sum(power,axis=-2)/(2.0*np.arange(0,lmax+1)+1.0)
+    #
+    numl=min(nx,lmax+1)
+    result=np.zeros(cl.shape[:-1]+(nx,),dtype=np.float32)
+    result[...,0:numl]=cl[...,0:numl]
+    return(result)
+
+
 # powervsl: at each time and each radius, phi-averaged and \theta-averaged (with chosen regions)
 # for vs. radius, best to average in radius a bit, but not too much so that destroys scale of structures want to resolve
 # note it's a fake l, not spherical polar harmonic (Laplace decomposition) type l that depends upon specific range chosen (i.e. k_\theta = (\theta_{\rm out} - \theta_{\rm in})/N_{\rm out-in})
@@ -4709,48 +5095,41 @@ def powervsl(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
         return(powervslresult)
     #
     #
-    # use direct avoidance of some cells (rather than just using which) in order to speed-up this otherwise slowish calculation
-    iin=iofr(rin)
-    iout=iofr(rout)
-    if iout<iin:
-        iout=iin
+    iin,iout=powerbandindices(rin,rout)
     #
     ################
-    # first form average bsq/rho so can get power in a mode without triggering on artificial phi-dependent cut
-    bsqorho_phiavg0_up=np.sum(gdet*bsq/rho,axis=2)
-    bsqorho_phiavg0_dn=np.sum(gdet*1.0+rho*0.0,axis=2) # gdet is 2D by default
-    bsqorho_phiavg0=bsqorho_phiavg0_up/bsqorho_phiavg0_dn
-    #
-    #print("bsqorho_phiavg @ iin:")
-    #print(bsqorho_phiavg0[iin,:])
-    #print("bsqorho_phiavg @ iout:")
-    #print(bsqorho_phiavg0[iout,:])
-    #
-    # create 3D version
-    bsqorho_phiavg = np.zeros_like(bsq)
-    for kk in np.arange(0,nz):
-        bsqorho_phiavg[:,:,kk]=bsqorho_phiavg0[:,:]
+    # setup properly-phi-cut integrand (only over radii used)
+    # choose
+    usedenom=1
     #
+    if useminmaxbsqorho==0:
+        minbsqorho=None
+        maxbsqorho=None
+    if usedenom==0:
+        denom=None
+    numervsrhp,denomvsrhp=powerintegrand(qty,denom=denom,doabs=doabs,minbsqorho=minbsqorho,maxbsqorho=maxbsqorho,which=which,sl=slice(iin,iout+1))
     #
-    ################
-    # setup properly-phi-cut integrand
-    integrand=qty
-    denomintegrand=denom
+    powervslresult,qtyvstheta,Yfft=powervslband(numervsrhp,denomvsrhp,iin,iout,ignorephase=IGNOREPHASE,ioff=iin)
     #
-    if useminmaxbsqorho==1:
-        if minbsqorho is not None:
-            integrand = integrand*(bsqorho_phiavg>minbsqorho)
-            denomintegrand = denomintegrand*(bsqorho_phiavg>minbsqorho)
-        #
-        if maxbsqorho is not None:
-            integrand = integrand*(bsqorho_phiavg<maxbsqorho)
-            denomintegrand = denomintegrand*(bsqorho_phiavg<maxbsqorho)
+    #
+    if printouts==1:
+        print("len(qtyvstheta)") ; sys.stdout.flush()
+        print((len(qtyvstheta))) ; sys.stdout.flush()
+        print("integrand") ; sys.stdout.flush()
+        print(numervsrhp) ; sys.stdout.flush()
+        print("which") ; sys.stdout.flush()
+        print(which) ; sys.stdout.flush()
+        print("qtyvstheta") ; sys.stdout.flush()
+        print(qtyvstheta) ; sys.stdout.flush()
+        print("Yfft") ; sys.stdout.flush()
+        print(Yfft) ; sys.stdout.flush()
         #
-    # required for things that are (e.g.) anti-symmetric across equator
-    if doabs==1:
-        integrand=np.fabs(integrand)
-        denomintegrand=np.fabs(denomintegrand)
     #
+    return(powervslresult)
+
+
+# l power for one band from volume-integrated numerator and denominator (from powerintegrand(), first row at radial index ioff)
+def powervslband(numervsrhp,denomvsrhp,iin,iout,ignorephase=0,ioff=0):
     ################
     # Determine range of k_\theta to store.  Using nx array in end, so can have nx final l values.  This means we can have up to 2*nx \theta data points.
     # Want to resolve radii of relevance.  Outer radius will do this at is $r=30r_g$.  All radii to do are just r_H,4r_g,8r_g,30r_g.
@@ -4758,7 +5137,7 @@ def powervsl(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
     # Just make NHU whatever it needs to be to fully cover 0..\pi using that smallest d\theta.  And then just truncate small-scale modes if not enough space.
     # want to wrap around entire sphere so really periodic (i.e. come back to original point)
     # no, now just \pi (not 2\pi) because no need for redundant info.
-    NHU = int(np.pi/(dxdxp[2][2][iofr(rhor),ny/2,0]*_dx2))
+    NHU = int(np.pi/(dxdxp[2][2][iofr(rhor),ny//2,0]*_dx2))
     print(("NHU=%d" % NHU)) ; sys.stdout.flush()
     #
     ################
@@ -4767,142 +5146,65 @@ def powervsl(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
     #
     # FAST WAY
     #
-    # choose
-    usedenom=1
-    #
-    if usedenom==1:
-        denomvstheta0=np.zeros(ny,dtype=np.float32)
-        denomvstheta0=1.0 + denomvstheta0
-        denomvsrhp=denomintegrand*which*_dx1*_dx2*_dx3
-        denomvstheta0,denomvstheta1,zeroYfft=qty_vstheta(inputsize=ny,size=NHU,qty=denomvsrhp,iin=iin,iout=iout,denomvstheta=denomvstheta0,ignorephase=IGNOREPHASE,dofft=0)
+    if denomvsrhp is not None:
+        denomvstheta0,denomvstheta1,zeroYfft=qty_vstheta(inputsize=ny,size=NHU,qty=denomvsrhp,iin=iin,iout=iout,ignorephase=ignorephase,dofft=0,ioff=ioff)
     else:
-        denomvstheta0=np.zeros(ny,dtype=np.float32)
-        denomvstheta0=1.0 + denomvstheta0
-        denomvstheta1=denomvstheta0
-        denomvsrhp=1*which*_dx1*_dx2*_dx3
-    #
-    #
+        denomvstheta0=np.ones(ny,dtype=np.float32)
     #
-    #qtyvstheta=np.zeros(NHU,dtype=np.float32)
-    numervsrhp=integrand*which*_dx1*_dx2*_dx3
-    qtyvstheta0,qtyvstheta1,Yfft=qty_vstheta(inputsize=ny,size=NHU,qty=numervsrhp,iin=iin,iout=iout,denomvstheta=denomvstheta0,ignorephase=IGNOREPHASE,dofft=1)
-    qtyvstheta=np.copy(qtyvstheta1)
+    qtyvstheta0,qtyvstheta1,Yfft=qty_vstheta(inputsize=ny,size=NHU,qty=numervsrhp,iin=iin,iout=iout,denomvstheta=denomvstheta0,ignorephase=ignorephase,dofft=1,ioff=ioff)
     #
-    #
-    if printouts==1:
-        print("len(qtyvstheta)") ; sys.stdout.flush()
-        print((len(qtyvstheta))) ; sys.stdout.flush()
-        print("integrand") ; sys.stdout.flush()
-        print(integrand) ; sys.stdout.flush()
-        print("which") ; sys.stdout.flush()
-        print(which) ; sys.stdout.flush()
-        print("qtyvstheta") ; sys.stdout.flush()
-        print(qtyvstheta) ; sys.stdout.flush()
-        print("Yfft") ; sys.stdout.flush()
-        print(Yfft) ; sys.stdout.flush()
-        #
-        #for iii in np.arange(0,len(qtyvstheta)):
-        #    print("iii=%d integrand=%g which=%g qtyvstheta=%g denomvstheta0=%g qtyvstheta=%g\n" % (iii,integrand[iii],which[iii],qtyvstheta[iii],denomvstheta0[iii],qtyvstheta[iii])) ; sys.stdout.flush()
-        #
     ################
     #
     #checks
     nfft=len(Yfft)
-    if nfft!=NHU/2+1:
-        print(("nfft=%d is not NHU/2+1=%d NHU=%d",nfft,NHU/2+1,NHU)) ; sys.stdout.flush()
+    if nfft!=NHU//2+1:
+        print(("nfft=%d is not NHU/2+1=%d NHU=%d",nfft,NHU//2+1,NHU)) ; sys.stdout.flush()
     #
     print(("qtyvstheta: nfft(ninput/2+1)=%d" % (nfft))) ; sys.stdout.flush()
     # power saved as |a_l|^2
-    powerfft = np.absolute(Yfft[0:nfft])**2
-    #
     # NOTEMARK: Assume always doing full \theta grid, so no need to check if resolve l=1,2,3 (i.e. low $l$)
     deltal=1
+    powervslresult=powerspectrumtonx(Yfft,deltal)
     #
-    #translate to nx size so can plot easier later and can store in nx stuff even if nfft>nx
-    #
-    # this does not interpolate l-mode spectrum onto nx-sized data.  It just truncates l-modes if more than nx.
-    # So if NHU changes leading to change in nfft.....
-    numl=min(nx,deltal*(nfft-1)+1) # i.e. as if full pi and deltal*NHU zones
-    # initialize with all zeroes
-    powervslresult=np.zeros(nx,dtype=powerfft.dtype)
-    for ll in np.arange(0,numl):
-        powervslresult[ll]=0
-    # deal non-zero modes
-    for ll in np.arange(0,numl,deltal):
-        powervslresult[ll]=powerfft[ll/deltal]
-    #
-    #
-    #
-    #
-    #
-    return(powervslresult)
+    return(powervslresult,np.copy(qtyvstheta1),Yfft)
 
 
 
 # form \theta-only-dependent array
-def qty_vstheta(inputsize=None,size=None,qty=None,iin=None,iout=None,denomvstheta=None,ignorephase=1,dofft=0):
+def qty_vstheta(inputsize=None,size=None,qty=None,iin=None,iout=None,denomvstheta=None,ignorephase=1,dofft=0,ioff=0):
     #
     ###############################
     # assumes qty is volume-integrated quantity
-    qtynew=scaletofullwedge(qty)
-    #
-    #
-    # qty comes in as shape (nx,ny,nz) even if nz=1
+    # qty comes in as shape (nx,ny,nz) even if nz=1, or just rows from radial index ioff on
+    qtynew=scaletofullwedge(qty[iin-ioff:iout-ioff+1,:,:])
     #
     #halfsize=size/2 # for interpolated but not final result
     halfsize=size # no, now just full size goes over \pi directly
+    plan=spectralplan('h',iin,iout,halfsize)
     #
     ###############################
-    # result0 has same shape as qtynew[i,:,k] = (ny)
-    result0=np.zeros(inputsize,dtype=np.float32)
-    numinavgresult0=0
+    # average over phi (axis=2) and radius
+    # note that sum of variables before FFT is same as doing sum over FFT for each \phi
+    # result0 is only theta-dependent and still on non-uniform grid
+    result0=np.average(np.average(qtynew,axis=2),axis=0)
     #Yfft0=np.zeros(inputsize/2+1,dtype=np.float32) # not needed since directly remap to uniform grid before taking fft
-    Yfft1=np.zeros(halfsize/2+1,dtype=np.float32) # if not computed, at least have to have as zero
-    numinavg=0
-    #
+    Yfft1=np.zeros(halfsize//2+1,dtype=np.float32) # if not computed, at least have to have as zero
     #
     ###############################
-    # sum over part of radial range
-    for ii in np.arange(iin,iout+1):
-        qtyslice=qtynew[ii,:,:]
-        #
-        if ignorephase==0 and dofft==1:
-            for kk in np.arange(len(qtyslice[0,:])):
-                qtyvstheta=qtyslice[:,kk]
-                qtyvsthetatemp=qtyvstheta/denomvstheta
-                # form stable ratio that removes geometry issues (but exaggerates simple wave mode amplitudes at large latitudes: NOTEMARK)
-                # need to account for 0/0
-                qtyvsthetatemp[qtyvstheta==0]=0 # normal 0/0 check
-                qtyvsthetatemp[denomvstheta==0]=0 # more aggressive in case x/0, just assume ignorable and set to zero
-                #
-                # only remap and do fft if data there
-                if np.sum(np.fabs(denomvstheta))>1E-20:
-                    #
-                    qtyvsthetatemp1=remap2unih(halfsize=halfsize,iin=iin,iout=iout,result0=qtyvsthetatemp)
-                    #
-                    # get P_l
-                    # get FFT (which is now valid since qtyvstheta is on uniform grid)
-                    Yfft1[:]=Yfft1[:] + np.absolute(np.fft.rfft(qtyvsthetatemp1))
-                    numinavg=numinavg+1
-        # sum over phi (axis=0 really for \theta and axis=1 really for \phi)
-        # note that sum of variables before FFT is same as doing sum over FFT for each \theta
-        # result0 is only theta-dependent and still on non-uniform grid
-        # when 2D and no \phi cells, still have 1 phi cell and can still sum over it.  Can't just add, since will add up [ny,nz] -> [ny,ny]
-        result0=result0 + np.average(qtyslice,axis=1)
-        numinavgresult0=numinavgresult0+1
-    #
-    ###############################
-    # get average
-    result0=result0/numinavgresult0
-    # get averaged spectrum
     if ignorephase==0 and dofft==1:
-        Yfft1=Yfft1/numinavg
+        # only remap and do fft if data there
+        if np.sum(np.fabs(denomvstheta))>1E-20:
+            # form stable ratio that removes geometry issues (but exaggerates simple wave mode amplitudes at large latitudes: NOTEMARK)
+            qtyvsthetatemp=powerratio(qtynew,denomvstheta[None,:,None])
+            # get P_l for every (r,\phi) slice at once on uniform grid and average
+            Yfft1s=rfftabs(qtyvsthetatemp,1,plan=plan)
+            Yfft1=np.average(Yfft1s.reshape(-1,Yfft1s.shape[-1]),axis=0).astype(np.float32)
+        else:
+            print("Got numinavg=0 for qty_vstheta") ; sys.stdout.flush()
     #
-    if numinavg==0:
-        print("Got numinavg=0 for qty_vstheta") ; sys.stdout.flush()
     ###############################
     # for normal non-fft result
-    result1=remap2unih(halfsize=halfsize,iin=iin,iout=iout,result0=result0)
+    result1=spectralremap(plan,result0)
     #
     ###############################
     # now append so really periodic.  Since phi-sum above already, just duplicate result in correct order
@@ -4921,22 +5223,8 @@ def qty_vstheta(inputsize=None,size=None,qty=None,iin=None,iout=None,denomvsthet
 
 def remap2unih(halfsize=None,iin=None,iout=None,result0=None):
     # now remap non-uniform grid that varies with radius, to a uniform grid that applies to all radii of relevance
-    result1=np.zeros(halfsize,dtype=np.float32)
-    # NOTEMARK: assume radial averaging is small enough that grid doesn't vary that much over the span
-    iavg=int((iin+iout)*0.5)
-    # assume original grid is cell-centered quantities
-    hnew=np.pi*(0.5+np.arange(0,halfsize))/(float(halfsize-1))
-    hold=h[iavg,:,0]
-    if 1==0:
-        # the below fills-in left-right no-value regions with constant extrapolation
-        result1=np.interp(hnew,hold,result0)
-    else:
-        # use linear extrapolation, which is good approximation for most quantities as one approaches the polar axis
-        result1fun=interp1d(hold,result0)
-        result1funextrap=extrap1d(result1fun)
-        result1=result1funextrap(hnew)
-    #
-    return(result1)
+    # use linear extrapolation, which is good approximation for most quantities as one approaches the polar axis
+    return(spectralremap(spectralplan('h',iin,iout,halfsize),result0))
 
 
 
@@ -4999,65 +5287,42 @@ def powervsn(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
     # 1) which should *not* have any radial dependence!
     # 2) qty includes gdet factor for integrals
     #
-    # use direct avoidance of some cells (rather than just using which) in order to speed-up this otherwise slowish calculation
-    iin=iofr(rin)
-    iout=iofr(rout)
-    if iout<iin:
-        iout=iin
-    #
-    ################
-    # first form average bsq/rho so can get power in a mode without triggering on artificial phi-dependent cut
-    bsqorho_phiavg0_up=np.sum(gdet*bsq/rho,axis=2)
-    bsqorho_phiavg0_dn=np.sum(gdet*1.0+rho*0.0,axis=2) # gdet is 2D by default
-    bsqorho_phiavg0=bsqorho_phiavg0_up/bsqorho_phiavg0_dn
-    #
-    #print("bsqorho_phiavg @ iin:")
-    #print(bsqorho_phiavg0[iin,:])
-    #print("bsqorho_phiavg @ iout:")
-    #print(bsqorho_phiavg0[iout,:])
-    #
-    # create 3D version
-    bsqorho_phiavg = np.zeros_like(bsq)
-    for kk in np.arange(0,nz):
-        bsqorho_phiavg[:,:,kk]=bsqorho_phiavg0[:,:]
+    iin,iout=powerbandindices(rin,rout)
     #
+    # radial range actually transformed
+    iavg=int((iin+iout)*0.5)
+    nru=get_NRU(r[iavg,ny//2,0])
+    trueiin,trueiout=nru[4],nru[5]
     #
     ################
-    # setup properly-phi-cut integrand
-    integrand=qty
-    denomintegrand=denom
-    #
-    if minbsqorho is not None:
-        integrand = integrand*(bsqorho_phiavg>minbsqorho)
-        denomintegrand = denomintegrand*(bsqorho_phiavg>minbsqorho)
-    #
-    if maxbsqorho is not None:
-        integrand = integrand*(bsqorho_phiavg<maxbsqorho)
-        denomintegrand = denomintegrand*(bsqorho_phiavg<maxbsqorho)
-    #
-    # required for things that are (e.g.) anti-symmetric across equator
-    if doabs==1:
-        integrand=np.fabs(integrand)
-        denomintegrand=np.fabs(denomintegrand)
+    # setup properly-phi-cut integrand (only over radii used)
+    numervsrhp,denomvsrhp=powerintegrand(qty,denom=denom,doabs=doabs,minbsqorho=minbsqorho,maxbsqorho=maxbsqorho,which=which,sl=slice(trueiin,trueiout+1))
     #
+    powervsnresult,qtyvsr,Yfft=powervsnband(numervsrhp,denomvsrhp,iin,iout,ignorephase=IGNOREPHASE,ioff=trueiin,nru=nru)
     #
+    return(powervsnresult)
+
+
+# n power for one band from volume-integrated numerator and denominator (from powerintegrand(), first row at radial index ioff)
+# nru is get_NRU() result for the band if already known
+def powervsnband(numervsrhp,denomvsrhp,iin,iout,ignorephase=0,ioff=0,nru=None):
     ################
-    # Get quantity along \theta
+    # Get quantity along r
     iavg=int((iin+iout)*0.5)
-    ravg=r[iavg,ny/2,0]
-    NRU,deltar,rinner,router,trueiin,trueiout=get_NRU(ravg)
+    ravg=r[iavg,ny//2,0]
+    if nru is None:
+        nru=get_NRU(ravg)
+    NRU,deltar,rinner,router,trueiin,trueiout=nru
     inputsize=(trueiout-trueiin+1)
     #
-    print(("rpick=%g trueiin=%d trueiout=%d rinner=%g router=%g NRU=%d inputsize=%d" % (r[iavg,ny/2,0],trueiin,trueiout,rinner,router,NRU,inputsize))) ; sys.stdout.flush()
+    print(("rpick=%g trueiin=%d trueiout=%d rinner=%g router=%g NRU=%d inputsize=%d" % (r[iavg,ny//2,0],trueiin,trueiout,rinner,router,NRU,inputsize))) ; sys.stdout.flush()
     #
-    denomvsrhp=denomintegrand*which*_dx1*_dx2*_dx3
     denomvsr0=np.zeros(inputsize,dtype=np.float32)
     denomvsr0=1.0+denomvsr0
-    denomvsr0,denomvsr1,zeroYfft=qty_vsr(inputsize=inputsize,size=NRU,qty=denomvsrhp,iin=trueiin,iout=trueiout,iavg=iavg,rinner=rinner,router=router,deltar=deltar,denomvsr=denomvsr0,ignorephase=IGNOREPHASE,dofft=0)
+    if denomvsrhp is not None:
+        denomvsr0,denomvsr1,zeroYfft=qty_vsr(inputsize=inputsize,size=NRU,qty=denomvsrhp,iin=trueiin,iout=trueiout,iavg=iavg,rinner=rinner,router=router,deltar=deltar,denomvsr=denomvsr0,ignorephase=ignorephase,dofft=0,ioff=ioff)
     #
-    numervsrhp=integrand*which*_dx1*_dx2*_dx3
-    #qtyvsr=np.zeros(NRU,dtype=np.float32)
-    qtyvsr0,qtyvsr1,Yfft=qty_vsr(inputsize=inputsize,size=NRU,qty=numervsrhp,iin=trueiin,iout=trueiout,iavg=iavg,rinner=rinner,router=router,deltar=deltar,denomvsr=denomvsr0,ignorephase=IGNOREPHASE,dofft=1)
+    qtyvsr0,qtyvsr1,Yfft=qty_vsr(inputsize=inputsize,size=NRU,qty=numervsrhp,iin=trueiin,iout=trueiout,iavg=iavg,rinner=rinner,router=router,deltar=deltar,denomvsr=denomvsr0,ignorephase=ignorephase,dofft=1,ioff=ioff)
     qtyvsr=np.copy(qtyvsr0)
     #
     # FAST WAY
@@ -5066,42 +5331,21 @@ def powervsn(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
     #
     print("len(qtyvsr)") ; sys.stdout.flush()
     print((len(qtyvsr))) ; sys.stdout.flush()
-    #print("qtyvsr") ; sys.stdout.flush()
-    #print(qtyvsr) ; sys.stdout.flush()
-    #
-    #for iii in np.arange(0,len(qtyvsr)):
-    #    print("iii=%d qtyvsr=%g\n" % (iii,qtyvsr[iii])) ; sys.stdout.flush()
     #
     ################
     # get P_n
     # get FFT (which is now valid since qtyvsr is on uniform grid)
     nfft=len(Yfft)
-    if nfft!=NRU/2+1:
-        print(("nfft=%d is not NRU/2+1=%d NRU=%d",nfft,NRU/2+1,NRU)) ; sys.stdout.flush()
+    if nfft!=NRU//2+1:
+        print(("nfft=%d is not NRU/2+1=%d NRU=%d",nfft,NRU//2+1,NRU)) ; sys.stdout.flush()
     #
     print(("qtyvsr: nfft(ninput/2+1)=%d" % (nfft))) ; sys.stdout.flush()
     # power saved as |a_n|^2
-    powerfft = np.absolute(Yfft[0:nfft])**2
-    #
     # range of \delta r changes for each r, so have to account for this when measuring n and Q_n
     deltan=1
+    powervsnresult=powerspectrumtonx(Yfft,deltan)
     #
-    #translate to nx size so can plot easier later and can store in nx stuff even if nfft>nx
-    #
-    # this does not interpolate n-mode spectrum onto nx-sized data.  It just truncates n-modes if more than nx.
-    # So if NRU changes leading to change in nfft.....
-    numn=min(nx,deltan*(nfft-1)+1) # i.e. as if full \delta r and deltan*NRU zones
-    # initialize with all zeroes
-    powervsnresult=np.zeros(nx,dtype=powerfft.dtype)
-    for nn in np.arange(0,numn):
-        powervsnresult[nn]=0
-    # deal non-zero modes
-    for nn in np.arange(0,numn,deltan):
-        powervsnresult[nn]=powerfft[nn/deltan]
-    #
-    #
-    #
-    return(powervsnresult)
+    return(powervsnresult,qtyvsr,Yfft)
 
 
 
@@ -5109,55 +5353,37 @@ def powervsn(doabs=0,rin=None,rout=None,qty=None,denom=1,minbsqorho=None,maxbsqo
 
 
 # form r-only-dependent array
-def qty_vsr(inputsize=None,size=None,qty=None,iin=None,iout=None,iavg=None,rinner=None,router=None,deltar=None,denomvsr=None,ignorephase=1,dofft=0):
+def qty_vsr(inputsize=None,size=None,qty=None,iin=None,iout=None,iavg=None,rinner=None,router=None,deltar=None,denomvsr=None,ignorephase=1,dofft=0,ioff=0):
     #
     ###############################
-    # qty comes in as shape (nx,ny,nz) even if nz=1
+    # qty comes in as shape (nx,ny,nz) even if nz=1, or just rows from radial index ioff on
     # assumes qty is volume-integrated quantity
-    qtynew=scaletofullwedge(qty)
-    #
-    ###############################
     # get only part of radial range want to transform
-    qtypart=qtynew[iin:iout+1,:,:]
+    qtypart=scaletofullwedge(qty[iin-ioff:iout-ioff+1,:,:])
+    plan=spectralplan('r',iin,iout,size,xrange=(rinner,router))
     #
     ###############################
     # result0 has shape = (size = iout-iin+1)
-    result0=np.zeros(inputsize,dtype=np.float32)
-    # sum over theta and phi
-    #result0=(qtypart.sum(axis=2)).sum(axis=1)
     # average over theta and phi
     result0=np.average(np.average(qtypart,axis=2),axis=1)
     #
     #
     ###############################
-    Yfft1=np.zeros(size/2+1,dtype=np.float32) # if not computed, at least have to have as zero for return
-    numinavg=0
+    Yfft1=np.zeros(size//2+1,dtype=np.float32) # if not computed, at least have to have as zero for return
     if ignorephase==0 and dofft==1:
         #
-        for jj in np.arange(0,len(qtypart[0,:,0])):
-            for kk in np.arange(0,len(qtypart[0,0,:])):
-                qtyvsr=qtypart[:,jj,kk]
-                # more stable ratio.  Also consistent with using gdet-volume-integration for numerator and denominator, which wouldn't make sense for direct ratio
-                qtyvsrtemp=qtyvsr/denomvsr
-                qtyvsrtemp[qtyvsr==0]=0 # normal 0/0 check
-                qtyvsrtemp[denomvsr==0]=0 # more aggressive in case x/0, justr assume ignorable and set to zero
-                #
-                if np.sum(np.fabs(denomvsr))>1E-20:
-                    qtyvsrtemp1=remap2unir(rinner=rinner,router=router,size=size,iin=iin,iout=iout,result0=qtyvsrtemp)
-                    #
-                    Yfft1[:]=Yfft1[:] + np.absolute(np.fft.rfft(qtyvsrtemp1))
-                    numinavg=numinavg+1
-        #
-        # divide-out by number of spectra used in sum, so becomes average
-        Yfft1=Yfft1/numinavg
-        #
-        if numinavg==0:
+        if np.sum(np.fabs(denomvsr))>1E-20:
+            # more stable ratio.  Also consistent with using gdet-volume-integration for numerator and denominator, which wouldn't make sense for direct ratio
+            qtyvsrtemp=powerratio(qtypart,denomvsr[:,None,None])
+            # spectra of every (\theta,\phi) slice at once on uniform grid, averaged
+            Yfft1s=rfftabs(qtyvsrtemp,0,plan=plan)
+            Yfft1=np.average(Yfft1s.reshape(-1,Yfft1s.shape[-1]),axis=0).astype(np.float32)
+        else:
             print("Got numinavg=0 for qty_vsr") ; sys.stdout.flush()
     #
     #
     ###############################
-    result1=np.zeros(size,dtype=np.float32)
-    result1=remap2unir(rinner=rinner,router=router,size=size,iin=iin,iout=iout,result0=result0)
+    result1=spectralremap(plan,result0)
     #
     ###############################
     if ignorephase==1 and dofft==1:
@@ -5166,23 +5392,10 @@ def qty_vsr(inputsize=None,size=None,qty=None,iin=None,iout=None,iavg=None,rinne
     ###############################
     return(result0,result1,Yfft1)
 
-#def remap2unih(halfsize=None,iin=None,iout=None,result0=None):
-
 def remap2unir(rinner=None,router=None,size=None,iin=None,iout=None,result0=None):
     # now remap non-uniform grid that varies with radius to uniform grid with radius
-    # assume original grid is cell-centered quantities
-    rnew=rinner + (router-rinner)*(0.5+np.arange(0,size))/(float(size-1))
-    rold=r[iin:iout+1,ny/2,0] # ny/2 assumes integrated around equator as for disk OR radial grid doesn't depend upon \theta (which is true for all models so far: NOTEMARK)
-    if 1==0:
-        # the below fills-in left-right no-value regions with constant extrapolation
-        result1=np.interp(rnew,rold,result0)
-    else:
-        # use linear extrapolation
-        result1fun=interp1d(rold,result0)
-        result1funextrap=extrap1d(result1fun)
-        result1=result1funextrap(rnew)
-
-    return(result1)
+    # use linear extrapolation
+    return(spectralremap(spectralplan('r',iin,iout,size,xrange=(rinner,router)),result0))
 
 
 
@@ -5198,8 +5411,9 @@ def remap2unir(rinner=None,router=None,size=None,iin=None,iout=None,result0=None
 
 
 # compute integrated optical depth
-def compute_taurad(domergeangles=True,radiussettau1zero=80):
-        # uses uu[], KAPPAUSER, KAPPAESUSER, gv3, r
+def compute_taurad1(radiussettau1zero=80):
+        # radial optical depth of each cell
+        # uses uu[0], KAPPAUSER, KAPPAESUSER, gv3[1,1], r
         #
         thetavel=0.0
         betasq=1.0-1.0/(uu[0]**2)
@@ -5208,8 +5422,6 @@ def compute_taurad(domergeangles=True,radiussettau1zero=80):
         gamfactor=uu[0]*(1.0-betavel*np.cos(thetavel))
         #drco=_dx1*np.sqrt(np.fabs(gv3[1,1]))/(2.0*uu[0])
         drco=_dx1*np.sqrt(np.fabs(gv3[1,1]))*gamfactor
-        dhco=_dx2*np.sqrt(np.fabs(gv3[2,2]))*uu[0]
-        dphco=_dx3*np.sqrt(np.fabs(gv3[3,3]))*uu[0]
         #
         taurad1=(KAPPAUSER+KAPPAESUSER)*drco
         # http://arxiv.org/pdf/astro-ph/0408590.pdf equation~3
@@ -5218,8 +5430,18 @@ def compute_taurad(domergeangles=True,radiussettau1zero=80):
         # FREE PARAMETER:
         #radiussettau1zero=80
         #
-        ############# taurad1
         taurad1[r[:,0,0]>radiussettau1zero,:,:]=0 # to get rid of parts of flow that aren't in steady-state and wouldn't have contributed
+        tauradeff1[r[:,0,0]>radiussettau1zero,:,:]=0
+        return(taurad1,tauradeff1)
+
+def compute_taurad(domergeangles=True,radiussettau1zero=80):
+        # uses uu[], KAPPAUSER, KAPPAESUSER, gv3, r
+        #
+        dhco=_dx2*np.sqrt(np.fabs(gv3[2,2]))*uu[0]
+        dphco=_dx3*np.sqrt(np.fabs(gv3[3,3]))*uu[0]
+        #
+        taurad1,tauradeff1=compute_taurad1(radiussettau1zero=radiussettau1zero)
+        #
         #np.set_printoptions(threshold=sys.maxint)
         #print("taurad1") ; sys.stdout.flush()
         #print(taurad1[:,0,0]) ; sys.stdout.flush()
@@ -5238,7 +5460,6 @@ def compute_taurad(domergeangles=True,radiussettau1zero=80):
         #print(taurad1flipintegrated[:,0,0]) ; sys.stdout.flush()
         #
         ############# tauradeff1
-        tauradeff1[r[:,0,0]>radiussettau1zero,:,:]=0 # to get rid of parts of flow that aren't in steady-state and wouldn't have contributed
         np.set_printoptions(threshold=sys.maxsize)
         #print("tauradeff1") ; sys.stdout.flush()
         #print(tauradeff1[:,0,0]) ; sys.stdout.flush()
@@ -5256,6 +5477,16 @@ def compute_taurad(domergeangles=True,radiussettau1zero=80):
         #print("tauradeff1flipintegrated") ; sys.stdout.flush()
         #print(tauradeff1flipintegrated[:,0,0]) ; sys.stdout.flush()
         #
+        if radialblock is not None:
+            # only have this radial block (plus halo cells above it) of the grid, so add what the other blocks contribute (see runradialblocks())
+            if radialblock['radiussettau1zero']!=radiussettau1zero:
+                raise Exception('compute_taurad','radialblock carries were computed for radiussettau1zero=%g not %g' % (radialblock['radiussettau1zero'],radiussettau1zero))
+            nxblock=radialblock['nxblock']
+            taurad1integrated+=radialblock['taurad1before']
+            taurad1flipintegrated+=radialblock['taurad1after']-taurad1[nxblock:].sum(axis=0)
+            tauradeff1integrated+=radialblock['tauradeff1before']
+            tauradeff1flipintegrated+=radialblock['tauradeff1after']-tauradeff1[nxblock:].sum(axis=0)
+        #
         ########################### taurad2 (from theta=0 pole)
         taurad2=(KAPPAUSER+KAPPAESUSER)*dhco
         taurad2integrated=np.cumsum(taurad2,axis=1)
@@ -5362,66 +5593,307 @@ def plc(myvar,xcoord=None,ycoord=None,ax=None,picker=False,**kwargs): #plc
         plt.colorbar(res,ax=ax)
     return(ax)
 
-def reinterp(vartointerp,extent,ncell,domask=1,isasymmetric=False,interporder='cubic'):
-#def reinterp(vartointerp,extent,ncell,domask=1,isasymmetric=False,interporder='linear'):
-    global xi,yi,zi
-    #grid3d("gdump")
-    #rfd("fieldline0250.bin")
-    xraw=r*np.sin(h)
-    yraw=r*np.cos(h)
+# (kind,sliceinfo,extent,ncell) -> triangulation etc. for reinterpgrid()
+reinterpcache={}
+# how many of those to keep (e.g. a few extents per movie frame)
+reinterpcachemax=16
+
+def reinterpgrid(kind,getpoints,var,extent,ncell,interporder,sliceinfo=()):
+    """
+    Same as griddata((x,y),var,(xi[None,:],yi[:,None]),method=interporder) with (x,y)=getpoints() on a uniform
+    (var can also be [npoints,nvars] to do several at once)
+    ncell x ncell grid covering extent, but what only depends on the grid is made once and cached per
+    (kind,sliceinfo,extent,ncell) until r,h,ph change:
+    interporder='linear': triangulation and barycentric weights as sparse matrix, so each var is one matrix-vector product.
+    interporder='cubic': Clough-Tocher interpolator whose values get replaced, so no new triangulation (gradients depend on var so still computed).
+    Returns (xi,yi,zi)
+    """
+    global reinterpcache
+    key=(kind,sliceinfo,tuple(extent),ncell)
+    entry=reinterpcache.get(key)
+    if entry is None or entry['r'] is not r or entry['h'] is not h or entry['ph'] is not ph:
+        x,y=getpoints()
+        xi = np.linspace(extent[0], extent[1], ncell)
+        yi = np.linspace(extent[2], extent[3], ncell)
+        entry={'r':r,'h':h,'ph':ph,'xi':xi,'yi':yi,'points':np.column_stack((x,y))}
+        if len(reinterpcache)>=reinterpcachemax:
+            reinterpcache={}
+        reinterpcache[key]=entry
+    xi=entry['xi']
+    yi=entry['yi']
+    #
+    if interporder=='linear':
+        if 'matrix' not in entry:
+            import scipy.sparse
+            from scipy.spatial import Delaunay
+            tri=Delaunay(entry['points'])
+            xgrid,ygrid=np.broadcast_arrays(xi[None,:],yi[:,None])
+            points=np.column_stack((xgrid.reshape(-1),ygrid.reshape(-1)))
+            simplex=tri.find_simplex(points)
+            inside=simplex>=0
+            transform=tri.transform[simplex[inside]]
+            bary=np.einsum('ijk,ik->ij',transform[:,:2,:],points[inside]-transform[:,2,:])
+            weights=np.column_stack((bary,1.0-bary.sum(axis=1)))
+            rows=np.repeat(np.nonzero(inside)[0],3)
+            cols=tri.simplices[simplex[inside]].reshape(-1)
+            entry['matrix']=scipy.sparse.csr_matrix((weights.reshape(-1),(rows,cols)),shape=(len(points),len(entry['points'])))
+            entry['outside']=~inside.reshape(xgrid.shape)
+        zi=(entry['matrix']@np.asarray(var,dtype=np.float64)).reshape(entry['outside'].shape+np.shape(var)[1:])
+        zi[entry['outside']]=np.nan
+    elif interporder=='cubic':
+        if 'cubic' in entry and hasattr(entry['cubic'],'_set_values'):
+            entry['cubic']._set_values(var)
+        else:
+            entry['cubic']=CloughTocher2DInterpolator(entry['points'],var)
+        zi=entry['cubic'](xi[None,:],yi[:,None])
+    else:
+        zi=griddata(entry['points'], var, (xi[None,:], yi[:,None]), method=interporder)
+    return(xi,yi,zi)
+
+def usestructuredreinterp():
+    # whether reinterp() and reinterpxy() use reinterpstructured() (set by main()), else griddata
+    return('usestructuredreinterpglobal' in globals() and usestructuredreinterpglobal)
+
+def reinterpmask(zi,xi,yi,domask):
+    # mask inside horizon as reinterp() does
+    if domask!=0:
+        interior = np.sqrt((xi[None,:]**2) + (yi[:,None]**2)) < (1+np.sqrt(1-a**2))*domask
+        return(ma.masked_where(interior, zi))
+    return(zi)
+
+# cells continued across the poles in reinterpstructured() (enough for cubic)
+reinterpghost=3
+
+def reinterpstructuredcoords(kind,extent,ncell):
+    """
+    Fractional (i,j) or (i,k) grid indices of each pixel of ncell x ncell image covering extent,
+    from inverting r(x1) and h(x1,x2) (kind='reinterp', x-z plane at \phi=0 and mirror \phi=\pi side for x<0)
+    or r(x1) and ph(x3) (kind='reinterpxy', equatorial plane).
+    Cached in reinterpcache like reinterpgrid().  Entry has coords=None if grid isn't of that form (e.g. tilted).
+    """
+    global reinterpcache
+    from scipy.ndimage import map_coordinates
+    key=(kind+'structured',(),tuple(extent),ncell)
+    entry=reinterpcache.get(key)
+    if entry is not None and entry['r'] is r and entry['h'] is h and entry['ph'] is ph:
+        return(entry)
+    #
+    xi = np.linspace(extent[0], extent[1], ncell)
+    yi = np.linspace(extent[2], extent[3], ncell)
+    entry={'r':r,'h':h,'ph':ph,'xi':xi,'yi':yi,'coords':None}
+    if len(reinterpcache)>=reinterpcachemax:
+        reinterpcache={}
+    reinterpcache[key]=entry
+    xgrid,ygrid=np.broadcast_arrays(xi[None,:],yi[:,None])
+    #
+    # r must depend only on x1
+    r1d=r[:,0,0]
+    if np.any(np.diff(r1d)<=0) or not np.allclose(r[:,:,0],r1d[:,None]) or not np.allclose(r[:,0,:],r1d[:,None]):
+        return(entry)
+    if kind=='reinterp':
+        radius=np.sqrt(xgrid**2+ygrid**2)
+        theta=np.arctan2(np.fabs(xgrid),ygrid)
+        kval=min(h.shape[2]-1,nz//2)
+        if not np.allclose(h[:,:,0],h[:,:,kval]):
+            return(entry)
+    else:
+        radius=np.sqrt(xgrid**2+ygrid**2)
+        phi=np.arctan2(ygrid,xgrid)
+        # assume ph uniform in x3 (uses dxdxp[3,3] since 2D gdump may only have k=0)
+        dph=_dx3*dxdxp[3,3,0,0,0]
+        ph0=ph[0,ny//2,0]
+        if not np.allclose(ph[:,ny//2,:],ph[0:1,ny//2,:]):
+            return(entry)
+    #
+    ifrac=np.interp(radius,r1d,np.arange(nx),left=np.nan,right=np.nan)
+    outside=np.isnan(ifrac)
+    ifrac[outside]=0.0
+    if kind=='reinterp':
+        # table of j(\theta) for each i, so j at fractional i is bilinear lookup.
+        # j includes reinterpghost cells continued across each pole (\theta<0 or >\pi, other side of axis), as griddata would use the mirrored points there.
+        numtheta=4*ny
+        thetatab=np.linspace(0.0,np.pi,numtheta)
+        jtab=np.empty((nx,numtheta))
+        ghost=reinterpghost
+        for i in np.arange(0,nx):
+            hext=np.concatenate((-h[i,ghost-1::-1,0],h[i,:,0],2.0*np.pi-h[i,:-ghost-1:-1,0]))
+            jtab[i]=np.interp(thetatab,hext,np.arange(ny+2*ghost))
+        jfrac=map_coordinates(jtab,[ifrac,theta/np.pi*(numtheta-1)],order=1,mode='nearest')
+        entry['coords']=np.array([ifrac,jfrac])
+        entry['left']=xgrid<0
+    else:
+        # \phi periodic over the simulated wedge (for a \pi wedge that's the old mirroring through the axis)
+        phiwedge=nz*dph
+        kfrac=np.mod(phi-ph0,phiwedge)/dph
+        entry['coords']=np.array([ifrac,kfrac])
+    entry['outside']=outside
+    return(entry)
+
+def reinterpstructured(kind,vartointerp,extent,ncell,interporder,isasymmetric=False):
+    """
+    reinterp() (kind='reinterp') or reinterpxy() (kind='reinterpxy') for logically structured grid:
+    pixel -> fractional grid index done once (reinterpstructuredcoords()), then each variable is just
+    map_coordinates() on the 2D slice (interporder 'linear' order 1, 'cubic' order 3 spline, 'nearest' order 0).
+    Returns (xi,yi,zi), zi=None if grid not structured so caller should use griddata.
+    """
+    from scipy.ndimage import map_coordinates
+    entry=reinterpstructuredcoords(kind,extent,ncell)
+    xi=entry['xi']
+    yi=entry['yi']
+    if entry['coords'] is None:
+        return(xi,yi,None)
+    order={'nearest':0,'linear':1,'cubic':3}[interporder]
+    coords=entry['coords']
+    zi=np.empty(coords.shape[1:],dtype=np.float64)
+    if kind=='reinterp':
+        # NOTEMARK: x>0 shows k=0 or \phi=0, x<0 shows k=NZ/2 or \phi=\pi (around other side of axis)
+        kval=min(vartointerp.shape[2]-1,nz//2)
+        var=np.asarray(vartointerp[:,:,0],dtype=np.float64)
+        varmirror=np.asarray(vartointerp[:,:,kval],dtype=np.float64)
+        if isasymmetric:
+            varmirror=-varmirror
+        left=entry['left']
+        # add ghost cells across poles from other side of axis
+        ghost=reinterpghost
+        varext=np.concatenate((varmirror[:,ghost-1::-1],var,varmirror[:,:-ghost-1:-1]),axis=1)
+        varmirrorext=np.concatenate((var[:,ghost-1::-1],varmirror,var[:,:-ghost-1:-1]),axis=1)
+        zi[~left]=map_coordinates(varext,coords[:,~left],order=order,mode='nearest')
+        zi[left]=map_coordinates(varmirrorext,coords[:,left],order=order,mode='nearest')
+    else:
+        # pad in k with periodic copies so spline sees neighbors across k=0
+        var=np.asarray(vartointerp[:,ny//2,:],dtype=np.float64)
+        pad=min(3,var.shape[1])
+        var=np.concatenate((var[:,-pad:],var,var[:,0:pad]),axis=1)
+        zi[...]=map_coordinates(var,[coords[0],coords[1]+pad],order=order,mode='nearest')
+    zi[entry['outside']]=np.nan
+    return(xi,yi,zi)
+
+def reinterppoints():
+    # (x,z) of \phi=0 slice and its mirror (\phi=\pi side) as point cloud for reinterp()
+    xraw=r[:,:,0]*np.sin(h[:,:,0])
+    yraw=r[:,:,0]*np.cos(h[:,:,0])
     # NOTEMARK: This chooses to show k=0 or \phi=0
-    x=xraw[:,:,0].view().reshape(-1)
-    y=yraw[:,:,0].view().reshape(-1)
-    var=vartointerp[:,:,0].view().reshape(-1)
+    x=xraw.view().reshape(-1)
+    y=yraw.view().reshape(-1)
     #mirror
     x=np.concatenate((-x,x))
     y=np.concatenate((y,y))
+    return(x,y)
+
+def reinterpvar(vartointerp,isasymmetric=False):
+    # values at reinterppoints()
+    var=vartointerp[:,:,0].view().reshape(-1)
     # NOTEMARK: This chooses to show k=NZ/2 or \phi=\pi (around other side of axis)
-    kval=min(vartointerp.shape[2]-1,nz/2)
+    kval=min(vartointerp.shape[2]-1,nz//2)
     varmirror = vartointerp[:,:,kval].view().reshape(-1)
     if isasymmetric:
-        varmirror *= -1.
-    var=np.concatenate((varmirror,var))
-    # define grid.
-    xi = np.linspace(extent[0], extent[1], ncell)
-    yi = np.linspace(extent[2], extent[3], ncell)
-    # grid the data.
-    zi = griddata((x, y), var, (xi[None,:], yi[:,None]), method=interporder)
-    #zi[interior] = np.ma.masked
-    if domask!=0:
-        interior = np.sqrt((xi[None,:]**2) + (yi[:,None]**2)) < (1+np.sqrt(1-a**2))*domask
-        varinterpolated = ma.masked_where(interior, zi)
-    else:
-        varinterpolated = zi
-    return(varinterpolated)
+        varmirror = -varmirror
+    return(np.concatenate((varmirror,var)))
 
-def reinterpxy(vartointerp,extent,ncell,domask=1,interporder='cubic'):
-    global xi,yi,zi
-    #grid3d("gdump")
-    #rfd("fieldline0250.bin")
-    xraw=r*np.sin(h)*np.cos(ph)
-    yraw=r*np.sin(h)*np.sin(ph)
+def reinterpxydomirror():
+    # whether reinterpxy() mirrors (x,y)->(-x,-y) to fill a \phi wedge smaller than 2\pi
+    return(nz*_dx3*dxdxp[3,3,0,0,0] < 0.99 * 2 * np.pi)
+
+def reinterpxypoints():
+    # (x,y) of equatorial slice as point cloud for reinterpxy()
+    xraw=r[:,ny//2,:]*np.sin(h[:,ny//2,:])*np.cos(ph[:,ny//2,:])
+    yraw=r[:,ny//2,:]*np.sin(h[:,ny//2,:])*np.sin(ph[:,ny//2,:])
     #2 cells below the midplane
-    x=xraw[:,ny//2,:].view().reshape(-1)
-    y=yraw[:,ny//2,:].view().reshape(-1)
-    var=vartointerp[:,ny//2,:].view().reshape(-1)
+    x=xraw.view().reshape(-1)
+    y=yraw.view().reshape(-1)
     #mirror
-    if nz*_dx3*dxdxp[3,3,0,0,0] < 0.99 * 2 * np.pi:
+    if reinterpxydomirror():
         x=np.concatenate((-x,x))
         y=np.concatenate((-y,y))
+    return(x,y)
+
+def reinterpxyvar(vartointerp):
+    # values at reinterpxypoints()
+    var=vartointerp[:,ny//2,:].view().reshape(-1)
+    if reinterpxydomirror():
         var=np.concatenate((var,var))
-    # define grid.
-    xi = np.linspace(extent[0], extent[1], ncell)
-    yi = np.linspace(extent[2], extent[3], ncell)
-    # grid the data.
-    zi = griddata((x, y), var, (xi[None,:], yi[:,None]), method=interporder)
+    return(var)
+
+def reinterp(vartointerp,extent,ncell,domask=1,isasymmetric=False,interporder='cubic'):
+#def reinterp(vartointerp,extent,ncell,domask=1,isasymmetric=False,interporder='linear'):
+    global xi,yi,zi
+    #grid3d("gdump")
+    #rfd("fieldline0250.bin")
+    if usestructuredreinterp():
+        # invert r(x1), h(x1,x2) per pixel instead of triangulating
+        xi,yi,zi = reinterpstructured('reinterp',vartointerp,extent,ncell,interporder,isasymmetric=isasymmetric)
+        if zi is not None:
+            return(reinterpmask(zi,xi,yi,domask))
+    var=reinterpvar(vartointerp,isasymmetric=isasymmetric)
+    # grid the data (triangulation of (x,y) cached, see reinterpgrid()).
+    xi,yi,zi = reinterpgrid('reinterp',reinterppoints,var,extent,ncell,interporder)
     #zi[interior] = np.ma.masked
-    if domask!=0:
-        interior = np.sqrt((xi[None,:]**2) + (yi[:,None]**2)) < (1+np.sqrt(1-a**2))*domask
-        varinterpolated = ma.masked_where(interior, zi)
-    else:
-        varinterpolated = zi
-    return(varinterpolated)
+    return(reinterpmask(zi,xi,yi,domask))
+
+def reinterpxy(vartointerp,extent,ncell,domask=1,interporder='cubic'):
+    global xi,yi,zi
+    #grid3d("gdump")
+    #rfd("fieldline0250.bin")
+    if usestructuredreinterp():
+        # invert r(x1), ph(x3) per pixel instead of triangulating
+        xi,yi,zi = reinterpstructured('reinterpxy',vartointerp,extent,ncell,interporder)
+        if zi is not None:
+            return(reinterpmask(zi,xi,yi,domask))
+    var=reinterpxyvar(vartointerp)
+    # grid the data (triangulation of (x,y) cached, see reinterpgrid()).
+    xi,yi,zi = reinterpgrid('reinterpxy',reinterpxypoints,var,extent,ncell,interporder,sliceinfo=(reinterpxydomirror(),))
+    #zi[interior] = np.ma.masked
+    return(reinterpmask(zi,xi,yi,domask))
+
+def reinterp_many(fields,extent,ncell,domask=1,interporder='cubic',asymmetric=(),plane='xz'):
+    """
+    Interpolate several fields onto the same ncell x ncell image at once, as reinterp() (plane='xz') or reinterpxy() (plane='xy') would each.
+    fields: dict name -> 3D array
+    domask: value for all fields, or dict name -> value (missing names use 1)
+    asymmetric: names whose sign flips across the polar axis (reinterp()'s isasymmetric=True), plane='xz' only
+    The grid-only work (point cloud and mirroring, triangulation or inverse coordinates, horizon masks) is done once,
+    and with griddata all fields are interpolated together as one stacked array.
+    Returns dict name -> masked array
+    """
+    global xi,yi,zi
+    kind={'xz':'reinterp','xy':'reinterpxy'}[plane]
+    names=list(fields.keys())
+    if len(names)==0:
+        return({})
+    izs=None
+    if usestructuredreinterp():
+        izs={}
+        for name in names:
+            xi,yi,zi = reinterpstructured(kind,fields[name],extent,ncell,interporder,isasymmetric=(name in asymmetric))
+            if zi is None:
+                izs=None
+                break
+            izs[name]=zi
+    if izs is None:
+        if plane=='xz':
+            var=np.column_stack([reinterpvar(fields[name],isasymmetric=(name in asymmetric)) for name in names])
+            xi,yi,zi = reinterpgrid(kind,reinterppoints,var,extent,ncell,interporder)
+        else:
+            var=np.column_stack([reinterpxyvar(fields[name]) for name in names])
+            xi,yi,zi = reinterpgrid(kind,reinterpxypoints,var,extent,ncell,interporder,sliceinfo=(reinterpxydomirror(),))
+        izs=dict((name,zi[:,:,index]) for (index,name) in enumerate(names))
+    #
+    # horizon masks, once per domask value
+    radius=np.sqrt((xi[None,:]**2) + (yi[:,None]**2))
+    interiors={}
+    result={}
+    for name in names:
+        if isinstance(domask,dict):
+            mask=domask.get(name,1)
+        else:
+            mask=domask
+        if mask!=0:
+            if mask not in interiors:
+                interiors[mask] = radius < (1+np.sqrt(1-a**2))*mask
+            result[name]=ma.masked_where(interiors[mask], izs[name])
+        else:
+            result[name]=izs[name]
+    return(result)
 
 def reinterpxyhor(vartointerp,extent,ncell,domask=1,interporder='cubic'):
     '''function made to project qtys on the bh horizon down to the midplane - created by Megan 2/29/16'''
@@ -5430,22 +5902,23 @@ def reinterpxyhor(vartointerp,extent,ncell,domask=1,interporder='cubic'):
     #rfd("fieldline0250.bin")
     rhor=1+(1-a**2)**0.5
     ihor=int(np.floor(iofr(rhor)+0.5))
-    xraw=r*np.sin(h)*np.cos(ph)
-    yraw=r*np.sin(h)*np.sin(ph)
-    #restrict values to BH upper hemisphere
-    x=xraw[ihor,0:ny//2,:].view().reshape(-1)
-    y=yraw[ihor,0:ny//2,:].view().reshape(-1)
+    domirror = nz*_dx3*dxdxp[3,3,0,0,0] < 0.99 * 2 * np.pi
+    def getpoints():
+        xraw=r[ihor,0:ny//2,:]*np.sin(h[ihor,0:ny//2,:])*np.cos(ph[ihor,0:ny//2,:])
+        yraw=r[ihor,0:ny//2,:]*np.sin(h[ihor,0:ny//2,:])*np.sin(ph[ihor,0:ny//2,:])
+        #restrict values to BH upper hemisphere
+        x=xraw.view().reshape(-1)
+        y=yraw.view().reshape(-1)
+        #mirror
+        if domirror:
+            x=np.concatenate((-x,x))
+            y=np.concatenate((-y,y))
+        return(x,y)
     var=vartointerp[ihor,0:ny//2,:].view().reshape(-1)
-    #mirror
-    if nz*_dx3*dxdxp[3,3,0,0,0] < 0.99 * 2 * np.pi:
-        x=np.concatenate((-x,x))
-        y=np.concatenate((-y,y))
+    if domirror:
         var=np.concatenate((var,var))
-    # define grid.
-    xi = np.linspace(extent[0], extent[1], ncell)
-    yi = np.linspace(extent[2], extent[3], ncell)
-    # grid the data.
-    zi = griddata((x, y), var, (xi[None,:], yi[:,None]), method=interporder)
+    # grid the data (triangulation of (x,y) cached, see reinterpgrid()).
+    xi,yi,zi = reinterpgrid('reinterpxyhor',getpoints,var,extent,ncell,interporder,sliceinfo=(ihor,domirror))
     #zi[interior] = np.ma.masked
     if domask!=0:
         interior = np.sqrt((xi[None,:]**2) + (yi[:,None]**2)) > (1+np.sqrt(1-a**2))*domask
@@ -5663,33 +6136,34 @@ def mkframe(fname,ax=None,cb=True,tight=False,useblank=True,vmin=None,vmax=None,
         # no, assume any cleaning occurs upon rfd() and averages get that result
         #localmaxbsqorho=maxbsqorho
         #
-        ibetatot = reinterp(betatot,extent,ncell,domask=1.0) # betatot now
-        iud0  = reinterp(ud[0],extent,ncell,domask=1.0)
-        #
         enth=1+ugclean*gam/rhoclean
         # limit value for same reason as below
         enth[rhoclean<1E-10]=1
         enth[enth>100]=100
         enth[enth<1]=1
         unb=(enth*ud[0])
-        iunb  = reinterp(unb,extent,ncell,domask=1.0)
         bsqorho=bsq/rho
         # if using avg_rho, already cleaned so can be very small and contours will oscillate stupidly, so limit value
         bsqorho[bsqorho>localmaxbsqorho]=localmaxbsqorho
-        ibsqorho = reinterp(bsqorho,extent,ncell,domask=1.0)
         # limit value for same reason as above
         #mu[mu>localmaxbsqorho]=localmaxbsqorho
         #imu = reinterp(mu,extent,ncell,domask=1.0)
         #
-        iuu1  = reinterp(uu[1],extent,ncell,domask=1.0)
+        ifields = reinterp_many({'betatot':betatot,'ud0':ud[0],'unb':unb,'bsqorho':bsqorho,'uu1':uu[1]},extent,ncell,domask=1.0)
+        ibetatot = ifields['betatot'] # betatot now
+        iud0 = ifields['ud0']
+        iunb = ifields['unb']
+        ibsqorho = ifields['bsqorho']
+        iuu1 = ifields['uu1']
         #
         taurad1integrated,taurad1flipintegrated,taurad2integrated,taurad2flipintegrated,tauradintegrated,tauradeff1integrated,tauradeff1flipintegrated,tauradeff2integrated,tauradeff2flipintegrated,tauradeffintegrated=compute_taurad()
         #
         # use linear to avoid oscillations that lead to multiple similar contours where only 1 originally existed
-        itaurad1integrated = reinterp(taurad1integrated,extent,ncell,domask=1.0,interporder='linear')
-        itaurad1flipintegrated = reinterp(taurad1flipintegrated,extent,ncell,domask=1.0,interporder='linear')
-        itaurad2integrated = reinterp(taurad2integrated,extent,ncell,domask=1.0,interporder='linear')
-        itaurad2flipintegrated = reinterp(taurad2flipintegrated,extent,ncell,domask=1.0,interporder='linear')
+        ifields = reinterp_many({'taurad1':taurad1integrated,'taurad1flip':taurad1flipintegrated,'taurad2':taurad2integrated,'taurad2flip':taurad2flipintegrated},extent,ncell,domask=1.0,interporder='linear')
+        itaurad1integrated = ifields['taurad1']
+        itaurad1flipintegrated = ifields['taurad1flip']
+        itaurad2integrated = ifields['taurad2']
+        itaurad2flipintegrated = ifields['taurad2flip']
         #
         #
         #print("taurad2integrated") ; sys.stdout.flush()
@@ -5758,10 +6232,11 @@ def mkframe(fname,ax=None,cb=True,tight=False,useblank=True,vmin=None,vmax=None,
     if douru0==1:
         toplot=np.copy(uradu[0])
         #toplot[toplot<20]=1
-        iuru0 = reinterp(toplot,extent,ncell,domask=1.0)
         #
         toplot2=np.copy(np.fabs(uradu[3])*np.sqrt(np.fabs(gv3[3,3])))
-        iuru3 = reinterp(toplot2,extent,ncell,domask=1.0)
+        ifields = reinterp_many({'uru0':toplot,'uru3':toplot2},extent,ncell,domask=1.0)
+        iuru0 = ifields['uru0']
+        iuru3 = ifields['uru3']
     #
     ###########################################
     # setup field stuff
@@ -5942,9 +6417,10 @@ def mkframe(fname,ax=None,cb=True,tight=False,useblank=True,vmin=None,vmax=None,
         Bznorm=Brnorm*np.cos(h)-Bhnorm*np.sin(h)
         BRnorm=Brnorm*np.sin(h)+Bhnorm*np.cos(h)
         #
-        iBz = reinterp(Bznorm,extent,ncell,domask=0.8)
-        #isasymmetric = True tells to flip the sign across polar axis
-        iBR = reinterp(BRnorm,extent,ncell,isasymmetric=True,domask=0.8)
+        #asymmetric tells to flip the sign across polar axis
+        ifields = reinterp_many({'Bz':Bznorm,'BR':BRnorm},extent,ncell,domask=0.8,asymmetric=('BR',))
+        iBz = ifields['Bz']
+        iBR = ifields['BR']
         #
         if dorandomcolor:
             # note, below is not necessarily B, can be uu
@@ -5980,8 +6456,9 @@ def mkframe(fname,ax=None,cb=True,tight=False,useblank=True,vmin=None,vmax=None,
             Baznorm=Barnorm*np.cos(h)-Bahnorm*np.sin(h)
             BaRnorm=Barnorm*np.sin(h)+Bahnorm*np.cos(h)
             #
-            iBaz = reinterp(Baznorm,extent,ncell,domask=0.8)
-            iBaR = reinterp(BaRnorm,extent,ncell,isasymmetric=True,domask=0.8) #isasymmetric = True tells to flip the sign across polar axis
+            ifields = reinterp_many({'Baz':Baznorm,'BaR':BaRnorm},extent,ncell,domask=0.8,asymmetric=('BaR',)) #asymmetric tells to flip the sign across polar axis
+            iBaz = ifields['Baz']
+            iBaR = ifields['BaR']
         else:
             iBaz = None
             iBaR = None
@@ -5989,8 +6466,9 @@ def mkframe(fname,ax=None,cb=True,tight=False,useblank=True,vmin=None,vmax=None,
         #    imu = reinterp(mu,extent,ncell,domask=0.8)
         #
         if dovarylw:
-            iibetatot = reinterp(0.5*bsq/((gam-1)*ug+(4.0/3.0-1)*urad),extent,ncell,domask=0)
-            ibsqorho = reinterp(bsq/rho,extent,ncell,domask=1)
+            ifields = reinterp_many({'ibetatot':0.5*bsq/((gam-1)*ug+(4.0/3.0-1)*urad),'bsqorho':bsq/rho},extent,ncell,domask={'ibetatot':0,'bsqorho':1})
+            iibetatot = ifields['ibetatot']
+            ibsqorho = ifields['bsqorho']
             ibsqo2rho = 0.5 * ibsqorho
         xi = np.linspace(extent[0], extent[1], ncell)
         yi = np.linspace(extent[2], extent[3], ncell)
@@ -6223,11 +6701,12 @@ def mkframexy(fname,ax=None,cb=True,vmin=None,vmax=None,len=20,ncell=800,pt=True
         Bynorm=BRnorm*np.sin(ph)+Bpnorm*np.cos(ph)
         #
         #
-        iBx = reinterpxy(Bxnorm,extent,ncell,domask=1)
-        iBy = reinterpxy(Bynorm,extent,ncell,domask=1)
-        iibeta = reinterpxy(0.5*bsq/(gam-1)/ug,extent,ncell,domask=0)
-        iibetatot = reinterpxy(0.5*bsq/((gam-1)*ug+(4.0/3.0-1)*urad),extent,ncell,domask=0)
-        ibsqorho = reinterpxy(bsq/rho,extent,ncell,domask=1)
+        ifields = reinterp_many({'Bx':Bxnorm,'By':Bynorm,'ibeta':0.5*bsq/(gam-1)/ug,'ibetatot':0.5*bsq/((gam-1)*ug+(4.0/3.0-1)*urad),'bsqorho':bsq/rho},extent,ncell,domask={'Bx':1,'By':1,'ibeta':0,'ibetatot':0,'bsqorho':1},plane='xy')
+        iBx = ifields['Bx']
+        iBy = ifields['By']
+        iibeta = ifields['ibeta']
+        iibetatot = ifields['ibetatot']
+        ibsqorho = ifields['bsqorho']
         ibsqo2rho = 0.5 * ibsqorho
         xi = np.linspace(extent[0], extent[1], ncell)
         yi = np.linspace(extent[2], extent[3], ncell)
@@ -6277,8 +6756,7 @@ def setupframe(gs=3,loadq=0,which=1):
     #
     if loadq==1:
         grid3d( os.path.basename(glob.glob(os.path.join("dumps/", "gdump*"))[0]), use2d=use2dglobal )
-        flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-        sort_nicely(flist)
+        flist = getfieldlinelist()
         firstfieldlinefile=flist[0]
         rfdheaderonly(firstfieldlinefile)
         #
@@ -7083,10 +7561,9 @@ def rrdump(dumpname):
 def reresrdump(dumpname,writenew=False,newf1=None,newf2=None,newf3=None,divbclean=True,fieldsmooth=True):
     global nx
     # get dx1,2,3
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
+    flist = getfieldlinelist()
     # can specify fieldline
     #flist = glob.glob( os.path.join("dumps/", "fieldline2493.bin") )
-    sort_nicely(flist)
     if len(flist)>0:
         firstfieldlinefile=flist[0]
         rfdheaderonly(firstfieldlinefile)
@@ -7903,14 +8380,15 @@ def rgfd(fieldlinefilename,**kwargs):
 
 #  http://norvig.com/python-lisp.html   
 
-def rfdheader(fin=None):
+def rfdheader(fin=None,header=None):
     global t,nx,ny,nz,startx1,startx2,startx3,_dx1,_dx2,_dx3,nstep,gam,a,R0,Rin,Rout,hslope,rundt,defcoord
     global MBH,QBH,EP3,THETAROT,_is,_ie,_js,_je,_ks,_ke,whichdump,whichdumpversion,numcolumns
     global rhor
     #global header
     #
-    #
-    header = fin.readline().split()
+    # header can be passed already split (e.g. from fieldlinecatalog()) instead of read from fin
+    if header is None:
+        header = fin.readline().split()
     #
     numheaderitems=len(header) #.shape[0]
     #
@@ -8048,41 +8526,232 @@ def rfdheader(fin=None):
         numcolumns=int(header[29])
 
 def rfdheaderonly(filename="dumps/fieldline0000.bin"):
+    # use header from catalog if file hasn't changed since cataloged
+    header=fieldlinecatalogheader(filename)
+    if header is not None:
+        rfdheader(header=header)
+        return
     fin = open(filename, "rb" )
     rfdheader(fin=fin)
     fin.close()
 
-def rfdheaderfirstfile():
+
+# catalog of fieldline file headers (t,nstep,nx,ny,nz,THETAROT,numcolumns) so drivers don't have to open every file to get (e.g.) times
+# kept in dumps/ like the gdump cache, and only new or changed (size or mtime) files get their header read.
+fieldlinecatalogname="dumps/fieldlinecatalog.npz"
+fieldlinecatalogkeys=['fname','t','nstep','nx','ny','nz','THETAROT','numcolumns','size','mtime','header']
+
+def rfdheaderparse(header):
+    """ Get (t,nstep,nx,ny,nz,THETAROT,numcolumns) from split fieldline header without setting any globals like rfdheader() does """
+    numheaderitems=len(header)
+    headerTHETAROT=0.0
+    headernumcolumns=-1
+    if numheaderitems>=32:
+        headerTHETAROT=float(header[22])
+        headernumcolumns=int(header[31])
+    elif numheaderitems==31:
+        headernumcolumns=int(header[30])
+    elif numheaderitems==30:
+        headernumcolumns=int(header[29])
+    return(float(header[0]),int(header[10]),int(header[1]),int(header[2]),int(header[3]),headerTHETAROT,headernumcolumns)
+
+def fieldlinecatalog(dosave=True):
+    """
+    Returns catalog of dumps/fieldline*.bin as dictionary of arrays (keys fieldlinecatalogkeys), sorted like sort_nicely().
+    Reuses in-memory or on-disk catalog and only reads headers of new files or files whose size or mtime changed.
+    """
+    global fieldlinecatalogmem
     flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
     sort_nicely(flist)
+    #
+    oldcat=None
+    if 'fieldlinecatalogmem' in globals() and fieldlinecatalogmem is not None:
+        oldcat=fieldlinecatalogmem
+    elif os.path.isfile(fieldlinecatalogname):
+        try:
+            data=np.load(fieldlinecatalogname)
+            oldcat={}
+            for key in fieldlinecatalogkeys:
+                oldcat[key]=data[key]
+            data.close()
+        except:
+            print(("fieldlinecatalog: could not read %s, rebuilding" % (fieldlinecatalogname))) ; sys.stdout.flush()
+            oldcat=None
+    oldindex={}
+    if oldcat is not None:
+        for ii, oldfname in enumerate(oldcat['fname']):
+            oldindex[str(oldfname)]=ii
+    #
+    rows=[]
+    numnew=0
+    for fname in flist:
+        st=os.stat(fname)
+        basename=os.path.basename(fname)
+        ii=oldindex.get(basename,-1)
+        if ii>=0 and oldcat['size'][ii]==st.st_size and oldcat['mtime'][ii]==st.st_mtime:
+            rows.append([oldcat[key][ii] for key in fieldlinecatalogkeys])
+        else:
+            fin = open(fname, "rb" )
+            headerline=fin.readline().decode('ascii','replace').strip()
+            fin.close()
+            (headert,headernstep,headernx,headerny,headernz,headerTHETAROT,headernumcolumns)=rfdheaderparse(headerline.split())
+            rows.append([basename,headert,headernstep,headernx,headerny,headernz,headerTHETAROT,headernumcolumns,st.st_size,st.st_mtime,headerline])
+            numnew=numnew+1
+    #
+    cat={}
+    for jj, key in enumerate(fieldlinecatalogkeys):
+        cat[key]=np.array([row[jj] for row in rows])
+    # keep types even if no files
+    cat['fname']=cat['fname'].astype(str)
+    cat['header']=cat['header'].astype(str)
+    for key in ['t','THETAROT','mtime']:
+        cat[key]=cat[key].astype(np.float64)
+    for key in ['nstep','nx','ny','nz','numcolumns','size']:
+        cat[key]=cat[key].astype(np.int64)
+    fieldlinecatalogmem=cat
+    #
+    numold=0
+    if oldcat is not None:
+        numold=len(oldcat['fname'])
+    print(("fieldlinecatalog: %d files, %d new or changed headers read" % (len(rows),numnew))) ; sys.stdout.flush()
+    if dosave and (numnew>0 or numold!=len(rows) or not os.path.isfile(fieldlinecatalogname)):
+        # write then rename, so other jobs never see partial file
+        try:
+            tmpname="%s.%d.tmp.npz" % (fieldlinecatalogname[:-4],os.getpid())
+            np.savez(tmpname,**cat)
+            os.rename(tmpname,fieldlinecatalogname)
+        except (IOError,OSError):
+            print(("fieldlinecatalog: could not write %s" % (fieldlinecatalogname))) ; sys.stdout.flush()
+    return(cat)
+
+def fieldlinecatalogheader(filename):
+    """ Return split header of filename from in-memory catalog, or None if not cataloged or changed since """
+    if 'fieldlinecatalogmem' not in globals() or fieldlinecatalogmem is None:
+        return(None)
+    if os.path.normpath(os.path.dirname(filename))!="dumps":
+        return(None)
+    ii=np.where(fieldlinecatalogmem['fname']==os.path.basename(filename))[0]
+    if len(ii)!=1:
+        return(None)
+    ii=ii[0]
+    try:
+        st=os.stat(filename)
+    except OSError:
+        return(None)
+    if fieldlinecatalogmem['size'][ii]!=st.st_size or fieldlinecatalogmem['mtime'][ii]!=st.st_mtime:
+        return(None)
+    return(str(fieldlinecatalogmem['header'][ii]).split())
+
+def getfieldlinelist():
+    """ Same as glob of dumps/fieldline*.bin and sort_nicely(), but also updates the catalog """
+    cat=fieldlinecatalog()
+    return([os.path.join("dumps/", fname) for fname in cat['fname']])
+
+def rfdheaderfirstfile():
+    flist = getfieldlinelist()
     firstfieldlinefile=flist[0]
     #rfd("fieldline0000.bin")  #to definea
     rfdheaderonly(firstfieldlinefile)
 
 def rfdheaderlastfile():
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     lastfieldlinefile=flist[-1]
     #rfd("fieldline0000.bin")  #to definea
     rfdheaderonly(lastfieldlinefile)
 
 
 def rfdfirstfile():
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     firstfieldlinefile=flist[0]
     basenamefirst=os.path.basename(firstfieldlinefile)
     print(("rfdfirstfile using %s" % (basenamefirst))) ; sys.stdout.flush()
     rfd(basenamefirst)
 
 def rfdlastfile():
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     lastfieldlinefile=flist[-1]
     basenamelast=os.path.basename(lastfieldlinefile)
     rfd(basenamelast)
 
 
+def rfdprefetchread(fname,usemmap=False):
+    """
+    Read body of fieldline file fname, done in background thread by rfdprefetch().
+    Only file I/O here (np.fromfile releases the GIL), no globals.
+    For usemmap, just read through file so it's in the page cache for rfd()'s memory map.
+    """
+    fin = open(fname, "rb" )
+    fin.readline()
+    if usemmap==True:
+        while len(fin.read(16*1024*1024))>0:
+            pass
+        body=None
+    else:
+        body = np.fromfile(fin,dtype=np.float32,count=-1)
+    fin.close()
+    return(body)
+
+def rfdprefetchget(fname):
+    """
+    Return body of fname if rfdprefetch() read it (waiting for read to finish if needed), else None.
+    """
+    if 'rfdprefetchpending' not in globals():
+        return(None)
+    future=rfdprefetchpending.pop(os.path.normpath(fname),None)
+    if future is None:
+        return(None)
+    return(future.result())
+
+def rfdprefetch(flist,whichread=None,depth=None):
+    """
+    Same as enumerate(flist), but while caller processes file findex,
+    the next depth files that will be read (whichread[findex] True, all if None) are read by a background thread.
+    rfd() then uses the already read data, so reading (I/O bound) overlaps with cvel(), Tcalcud(), etc. (CPU bound).
+    depth=None uses prefetchdepthglobal if set, else 1.  depth=0 does no prefetching.
+    """
+    import concurrent.futures
+    global rfdprefetchpending
+    if depth is None:
+        if 'prefetchdepthglobal' in globals():
+            depth=prefetchdepthglobal
+        else:
+            depth=1
+    if 'usemmapglobal' in globals():
+        usemmap=usemmapglobal
+    else:
+        usemmap=False
+    #
+    todo=[findex for findex in np.arange(0,len(flist)) if whichread is None or whichread[findex]]
+    rfdprefetchpending={}
+    executor=None
+    if depth>0:
+        executor=concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    numsubmitted=0
+    numreached=0
+    try:
+        for findex, fname in enumerate(flist):
+            if numreached<len(todo) and todo[numreached]==findex:
+                numreached=numreached+1
+            # keep this file and next depth files to be read submitted
+            while executor is not None and numsubmitted<len(todo) and numsubmitted<numreached+depth:
+                fnamesubmit=flist[todo[numsubmitted]]
+                rfdprefetchpending[os.path.normpath(fnamesubmit)]=executor.submit(rfdprefetchread,fnamesubmit,usemmap)
+                numsubmitted=numsubmitted+1
+            #
+            yield findex, fname
+            #
+            # drop if caller skipped it after all
+            future=rfdprefetchpending.pop(os.path.normpath(fname),None)
+            if future is not None:
+                future.cancel()
+    finally:
+        for future in rfdprefetchpending.values():
+            future.cancel()
+        rfdprefetchpending={}
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
 def rfd(fieldlinefilename,**kwargs):
     # MEMMARK: 5+4+1+4+4+4+1+16=39 full 3D vars
     #read information from "fieldline" file: 
@@ -8097,11 +8766,11 @@ def rfd(fieldlinefilename,**kwargs):
     # get starting time so can compute time differences
     start_time=datetime.now()
     #
-    #### read header
+    #### read header (only once, file stays open for reading body)
     fname= "dumps/" + fieldlinefilename
     fin = open(fname, "rb" )
-    rfdheader(fin=fin)
-    fin.close()
+    header = fin.readline().split()
+    rfdheader(header=header)
     #
     #
     # check if last-read gdump has same nx,ny,nz,THETAROT as fieldline file
@@ -8110,29 +8779,59 @@ def rfd(fieldlinefilename,**kwargs):
     else:
         print("fieldline file has different nx,ny,nz,THETAROT as gdump file, so reading correct gdump file") ; sys.stdout.flush()
         if THETAROT==0.0:
-            grid3d("gdump.bin",use2d=use2dglobal,usethetarot0=True)
+            grid3d("gdump.bin",use2d=use2dglobal,usethetarot0=True,usememo=False)
         else:
-            grid3d("gdump.bin",use2d=use2dglobal,usethetarot0=False)
+            grid3d("gdump.bin",use2d=use2dglobal,usethetarot0=False,usememo=False)
         # re-read fieldline file header so (e.g.) time is correct
     #
     #
-    # generally re-read header in case grid3d() was loaded
-    fin = open(fname, "rb" )
-    rfdheader(fin=fin)
+    # generally re-set header globals in case grid3d() was loaded
+    rfdheader(header=header)
     #read grid dump per-cell data
     #
-    if(0):
+    # whether to memory-map the file instead of reading it all into memory.
+    # Can pass usemmap=True/False, else uses usemmapglobal if set (e.g. by main()), else reads normally.
+    usemmap=kwargs.pop('usemmap',None)
+    if usemmap is None:
+        if 'usemmapglobal' in globals():
+            usemmap=usemmapglobal
+        else:
+            usemmap=False
+    #
+    # fields=['rho','B',...] only reads those columns (see rfdfields()), and derived quantities are computed when asked for by rfdneed()
+    fields=kwargs.pop('fields',None)
+    if fields is not None and use2dglobal==True and np.fabs(THETAROT-0.0)>1E-13:
+        print("rfd: fields ignored for tilted data since rfdtransform() needs all columns") ; sys.stdout.flush()
+        fields=None
+    if fields is not None:
+        fin.close()
+        rfdprefetchget(fname)
+        rfdfields(fname,fields,usemmap=usemmap)
+        print(("rfd(fields) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+        return
+    #
+    if usemmap==True:
         # new way
         # http://www.mail-archive.com/numpy-discussion@scipy.org/msg07631.html
         # http://docs.scipy.org/doc/numpy/reference/generated/numpy.memmap.html
-        # still doesn't quite work once beyond this function!
-        numcolumns=int(header[29])
-        from numpy import memmap
-        d = np.memmap(fin, dtype='float32', mode='c', shape=(numcolumns,nx,ny,nz),order='F')
+        # body starts after text header line, so offset is where rfdheader() left the file.
+        # mode='c' is copy-on-write, so in-place changes never go back to the file.  uu and uradu, which are changed in place, are copied out
+        # below, so the map is only read and its pages stay shared with the page cache (and can be dropped) instead of being private memory.
+        # number of columns taken from file size, like count=-1 for np.fromfile() (numcolumns in header can be smaller, e.g. no gdetB)
+        offset=fin.tell()
+        ncolsfile=(os.path.getsize(fname)-offset)//(4*nx*ny*nz)
+        mm = np.memmap(fin, dtype='float32', mode='c', offset=offset, shape=(ncolsfile,nx,ny,nz),order='F')
+        # plain ndarray view, so derived quantities are normal arrays.  The view keeps the map alive after fin is closed and after this function returns.
+        d = np.asarray(mm)
+        del(mm)
+        print(("rfd: memory-mapped %s with %d columns" % (fname,ncolsfile))) ; sys.stdout.flush()
     #
     else:
         # old way:
-        body = np.fromfile(fin,dtype=np.float32,count=-1)
+        # use body already read in background by rfdprefetch() if there is one
+        body = rfdprefetchget(fname)
+        if body is None:
+            body = np.fromfile(fin,dtype=np.float32,count=-1)
         #body = np.load(fin,dtype=np.float32,count=-1)
         d=body.view().reshape((-1,nx,ny,nz),order='F')
         del(body)
@@ -8165,41 +8864,15 @@ def rfd(fieldlinefilename,**kwargs):
     #d[5:8] are 3-velocities, v^i
     uu=np.zeros((4,nx,ny,nz),dtype='float32',order='F')
     uu=d[4:8,:,:,:]  #again, note uu[i] are 3-velocities (as read from the fieldline file)
+    if usemmap==True:
+        # changed in place below, so copy out of map first: columns are interleaved per cell, so changing uu in the map would
+        # give every page of the map a private copy, i.e. as much memory as reading the whole file
+        uu=np.array(uu,order='F')
     #multiply by u^t to get 4-velocities: u^i = u^t v^i
     uu[1:4]=uu[1:4] * uu[0]
     #
     if whichpoledeath==2:
-        if np.fabs(THETAROT>0.0):
-            print("Fixing primitives") ; sys.stdout.flush()
-            # form relative 4-velocity
-            eta=np.copy(uu)*0 # setup memory
-            alpha=1.0/np.sqrt(-gn3[0,0])
-            eta[0]=-alpha
-            beta=np.copy(uu)*0
-            beta[:]=alpha**2*gn3[0,:] # only spatial part will be used
-            etaup=np.copy(uu)*0
-            etaup[:]=-beta[:]/alpha # spatial part
-            etaup[0]=1.0/alpha
-            #
-            gammarel=-uu[0]*eta[0]
-            urel=np.copy(uu)*0
-            urel=uu - gammarel * etaup  # so uu = urel + gamma * (-beta/alpha)
-            #
-            # only spatial part of urel will be used
-            urel[:,:,0,:]=urel[:,:,3,:]
-            urel[:,:,1,:]=urel[:,:,3,:]
-            urel[:,:,2,:]=urel[:,:,3,:]
-            urel[:,:,ny-1,:]=urel[:,:,ny-4,:]
-            urel[:,:,ny-2,:]=urel[:,:,ny-4,:]
-            urel[:,:,ny-3,:]=urel[:,:,ny-4,:]
-            #
-            # now back to uu
-            qsq = gv3[1,1]*urel[1]*urel[1] + gv3[2,2]*urel[2]*urel[2] + gv3[3,3]*urel[3]*urel[3] + 2.0*(gv3[1,2]*urel[1]*urel[2] + gv3[1,3]*urel[1]*urel[3] + gv3[2,3]*urel[2]*urel[3])
-            gamma = np.sqrt(1.0 + qsq)
-            #
-            uu[:]=urel[:]-(gamma/alpha)*beta[:] # spatial part
-            uu[0]=gamma/alpha
-            
+        rfdpolefixuu(uu)
     #
     #B = np.zeros_like(uu)
     #cell-centered magnetic field components
@@ -8242,6 +8915,9 @@ def rfd(fieldlinefilename,**kwargs):
         urad=Erf
         #
         uradu=d[12:16,:,:,:]  #again, note uu[i] are 3-velocities (as read from the fieldline file)
+        if usemmap==True:
+            # as for uu above
+            uradu=np.array(uradu,order='F')
         #multiply by u^t to get 4-velocities: u^i = u^t v^i
         uradu[1:4]=uradu[1:4] * uradu[0]
         #
@@ -8274,51 +8950,11 @@ def rfd(fieldlinefilename,**kwargs):
     if use2dglobal==True and (DEBUGTHETAROT or np.fabs(THETAROT-0.0)>1E-13):
         #
         print(("rfd(before rfdtransform) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # whether to always do transformation (for testing)
-        # save result so can use it if repeat
-        fnamenpz =  "dumps/" + fieldlinefilename + ".npz"
-        print(("THETAROT=%21.15g for fnamenpz=%s" % (THETAROT,fnamenpz))) ; sys.stdout.flush()
-        #
-        # but see: http://stackoverflow.com/questions/82831/how-do-i-check-if-a-file-exists-using-python
-        if os.path.exists(fnamenpz):
-            print(("THETAROT=%21.15g for loadz" % (THETAROT))) ; sys.stdout.flush()
-            #
-            #http://docs.scipy.org/doc/numpy/reference/generated/numpy.load.html#numpy.load
-            #data=np.load(fnamenpz,mmap_mode='r')
-            data=np.load(fnamenpz)
-            # no idea why default is reversed order of array put into npz
-            #datanameslist=data.files.reverse()
-            #rho=data[datanameslist[0]]
-            #ug=data[datanameslist[1]]
-            #uu=data[datanameslist[2]]
-            #B=data[datanameslist[3]]
-            #if gotgdetB==1:
-            #    gdetB=data[datanameslist[4]]
-            rho=data['rho']
-            ug=data['ug']
-            uu=data['uu']
-            B=data['B']
-            if gotgdetB==1:
-                gdetB=data['gdetB']
-            #
-            if numcolumns==16:
-                Erf=data['Erf']
-                uradu=data['uradu']
-            data.close()
-        else:
-            print(("THETAROT=%21.15g for rfdtransform" % (THETAROT))) ; sys.stdout.flush()
-            # then need to get transformed quantities
-            # transform uu,B into coordinates where spin is pointing in zhat.
-            rfdtransform(gotgdetB=gotgdetB)
-            #
-            # need to save since doesn't exist yet
-            if gotgdetB==1:
-                np.savez(fnamenpz,rho=rho,ug=ug,uu=uu,B=B,gdetB=gdetB)
-            else:
-                np.savez(fnamenpz,rho=rho,ug=ug,uu=uu,B=B)
-            #
-            #
-            print(("rfd(after rfdtransform) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+        print(("THETAROT=%21.15g for rfdtransform" % (THETAROT))) ; sys.stdout.flush()
+        # transform uu,B into coordinates where spin is pointing in zhat.
+        # rotation map is made once per grid and THETAROT (see rfdtransformmap()), so no need to save transformed data per dump
+        rfdtransform(gotgdetB=gotgdetB)
+        print(("rfd(after rfdtransform) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     else:
         print(("No rdtrans for file=%s with THETAROT=%g" % (fname,THETAROT))) ;  sys.stdout.flush()
     #
@@ -8335,69 +8971,351 @@ def rfd(fieldlinefilename,**kwargs):
     rddims(gotrad)
     getkappas(gotrad)
     #
+    # everything loaded, so rfdneed() has nothing to do
+    global rfdfname,rfdhave
+    rfdfname=fname
+    rfdhave=None
     #
     print(("rfd(after rfdprocess) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
     #
 
-def getkappas(gotrad):
-    global KAPPAUSER,KAPPAESUSER
-    if(gotrad==0):
-        KAPPA=1.0
-        KAPPAES=1.0
-        # Below should be as same in global.depmnemonics.rad.h
-        TEMPMINKELVIN=1.0E-10 # Kelvin
-        TEMPMIN=(TEMPMINKELVIN/TEMPBAR)
-        pg=(gam-1.0)*ug # ideal gas
-        prad=(4.0/3.0-1.0)*urad # radiation isotropic in some frame
-        Tgas=pg/rho # gas temperature for ideal gas
-        KAPPAUSER=rho*0
-        KAPPAESUSER=rho*0
+def rfdpolefixuu(uu):
+    # fix-up 4-velocity near pole for tilted runs (whichpoledeath==2 in rfd()).  Modifies uu in place.
+    if np.fabs(THETAROT>0.0):
+        print("Fixing primitives") ; sys.stdout.flush()
+        # form relative 4-velocity
+        eta=np.copy(uu)*0 # setup memory
+        alpha=1.0/np.sqrt(-gn3[0,0])
+        eta[0]=-alpha
+        beta=np.copy(uu)*0
+        beta[:]=alpha**2*gn3[0,:] # only spatial part will be used
+        etaup=np.copy(uu)*0
+        etaup[:]=-beta[:]/alpha # spatial part
+        etaup[0]=1.0/alpha
         #
-    else:
-        # now compute auxillary opacity related quantities since only otherwise in raddump???? files and not in fieldline files
-        KAPPA=1.0
-        KAPPAES=1.0
-        # KORALTODO: Put a lower limit on T~1E4K so not overly wrongly opaque in spots where u_g->0 anomologously?
-        TEMPMINKELVIN=1.0E-10 # Kelvin
-        TEMPMIN=(TEMPMINKELVIN/TEMPBAR)
-        # ideal gas assumed for Tgas
-        # code pg
-        pg=(gam-1.0)*ug  #clean # use clean to keep pg low and Tgas will have floor like below  # no, need to use what was in simulation to be consistent with simulation's idea of what optical depth was
-        # and of used ugclean above, then in funnel temperature would be very small and kappaff would be huge.
+        gammarel=-uu[0]*eta[0]
+        urel=np.copy(uu)*0
+        urel=uu - gammarel * etaup  # so uu = urel + gamma * (-beta/alpha)
         #
-        prad=(4.0/3.0-1.0)*urad
-        # code Tgas for ideal gas
-        Tgas=pg/rho
-        # use rho to keep kappa low.
-        KAPPAUSER=(rho*KAPPA*KAPPA_FF_CODE(rho,Tgas+TEMPMIN))
-        KAPPAESUSER=(rho*KAPPAES*KAPPA_ES_CODE(rho,Tgas))
-
+        # only spatial part of urel will be used
+        urel[:,:,0,:]=urel[:,:,3,:]
+        urel[:,:,1,:]=urel[:,:,3,:]
+        urel[:,:,2,:]=urel[:,:,3,:]
+        urel[:,:,ny-1,:]=urel[:,:,ny-4,:]
+        urel[:,:,ny-2,:]=urel[:,:,ny-4,:]
+        urel[:,:,ny-3,:]=urel[:,:,ny-4,:]
+        #
+        # now back to uu
+        qsq = gv3[1,1]*urel[1]*urel[1] + gv3[2,2]*urel[2]*urel[2] + gv3[3,3]*urel[3]*urel[3] + 2.0*(gv3[1,2]*urel[1]*urel[2] + gv3[1,3]*urel[1]*urel[3] + gv3[2,3]*urel[2]*urel[3])
+        gamma = np.sqrt(1.0 + qsq)
+        #
+        uu[:]=urel[:]-(gamma/alpha)*beta[:] # spatial part
+        uu[0]=gamma/alpha
 
-def pow(x,n):
-    return(x**n)
-def KAPPA_ES_CODE(rhocode,Tcode):
-    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
-    y=(0.2*(1.0+XFACT)/OPACITYBAR)
-    return(y)
-def KAPPA_FF_CODE(rhocode,Tcode):
-    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
-    y=(1.0E23*ZATOM*ZATOM/(MUE*MUI)*(rhocode*RHOBAR)*pow(Tcode*TEMPBAR,-7.0/2.0)/OPACITYBAR)
-    return(y)
-def KAPPA_BF_CODE(rhocode,Tcode):
-    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
-    y=(1.0E25*ZATOM*(1.0+XFACT)*(rhocode*RHOBAR)*pow(Tcode*TEMPBAR,-7.0/2.0)/OPACITYBAR)
-    return(y)
 
-def rddims(gotrad):
-    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
-    if(gotrad==1):
-        # then also get radiation constants
-        fname= "dimensions.txt"
-        fin = open(fname, "rt" )
-        dimfile = fin.readline().split()
-        numheaderitems=len(dimfile) #.shape[0]
-        #
+def rfdfixgridnz():
+    # make r,h,ph have fieldline file's nz if gdump had different (e.g. 1 for use2d) 3rd dimension size
+    global r,h,ph
+    if 'r' in globals() and r.shape[2] != nz:
+        #dynamically change the 3rd dimension size
+        rnew = np.zeros((nx,ny,nz),dtype=r.dtype)
+        hnew = np.zeros((nx,ny,nz),dtype=h.dtype)
+        phnew = np.zeros((nx,ny,nz),dtype=ph.dtype)
+        rnew += r[:,:,0:1]
+        hnew += h[:,:,0:1]
+        #compute size of phi wedge assuming dxdxp[3][3] is up to date
+        phiwedge = dxdxp[3][3][0,0,0]*_dx3*nz
+        a_phi = phiwedge/(2.*nz)+np.linspace(0,phiwedge,num=nz,endpoint=False)
+        phnew += a_phi[None,None,:]
+        del r
+        del h
+        del ph
+        r = rnew
+        h = hnew
+        ph = phnew
+        print("phnew") ; sys.stdout.flush()
+        print((phnew[0,0,:])) ; sys.stdout.flush()
+        gc.collect()
+    else:
+        print("r in globals has shape2 of nz") ; sys.stdout.flush()
+
+
+# columns in fieldline file for each primitive, for reading only some of them with rfd(...,fields=[...])
+# gdetB only exists if numcolumns==14, Erf,uradu only if numcolumns==16
+rfdfieldcolumns={'rho':[0],'ug':[1],'uu':[4,5,6,7],'B':[8,9,10],'gdetB':[11,12,13],'Erf':[11],'uradu':[12,13,14,15]}
+#
+# derived quantities from rfdprocess() etc. and what they need
+rfdderivedneeds={'lrho':['rho'],
+                 'rholab':['rho','uu'],'lrholab':['rho','uu'],
+                 'ud':['uu','B'],'bu':['uu','B'],'bd':['uu','B'],'bsq':['uu','B'],
+                 'rhoclean':['rho','ug','uu','bsq'],'ugclean':['rho','ug','uu','bsq'],'uuclean':['rho','ug','uu','bsq'],'rhounclean':['rho','ug','uu','bsq'],'ugunclean':['rho','ug','uu','bsq'],'rholabclean':['rho','ug','uu','bsq'],'rholabunclean':['rho','ug','uu','bsq'],'condmaxbsqorho':['rho','ug','uu','bsq'],'condmaxbsqorhorhs':['rho','ug','uu','bsq'],'rinterp':['rho','ug','uu','bsq'],
+                 'entropy':['rho','ugclean'],
+                 'urad':['Erf'],
+                 'KAPPAUSER':['rho','ug','urad'],'KAPPAESUSER':['rho','ug','urad']}
+
+
+def rfdreadcolumns(fname,cols,usemmap=False):
+    """
+    Read only columns cols of fieldline file fname.  Returns dictionary of column number -> (nx,ny,nz) array.
+    Body is Fortran ordered with column index fastest, so columns are interleaved per cell,
+    and the whole file is read (or paged in) whichever columns are wanted: this saves memory, not I/O.
+    Read one k-slab at a time so only the wanted columns (plus one slab) are ever in memory.
+    Each call is a pass over the file, so ask for all columns needed at once (as rfdneed() does).
+    """
+    fin = open(fname, "rb" )
+    fin.readline()
+    offset=fin.tell()
+    ncolsfile=(os.path.getsize(fname)-offset)//(4*nx*ny*nz)
+    cols=sorted(set(cols))
+    if cols[-1]>=ncolsfile:
+        fin.close()
+        raise Exception('rfdreadcolumns', 'column %d not in %s with %d columns' % (cols[-1],fname,ncolsfile))
+    dcols={}
+    if usemmap==True:
+        # copy-on-write, see rfd()
+        mm = np.memmap(fin, dtype='float32', mode='c', offset=offset, shape=(ncolsfile,nx,ny,nz),order='F')
+        for col in cols:
+            dcols[col]=np.array(mm[col],order='F')
+        del(mm)
+    else:
+        for col in cols:
+            dcols[col]=np.zeros((nx,ny,nz),dtype='float32',order='F')
+        for kk in np.arange(0,nz):
+            slab=np.fromfile(fin,dtype=np.float32,count=ncolsfile*nx*ny).reshape((ncolsfile,nx,ny),order='F')
+            for col in cols:
+                dcols[col][:,:,kk]=slab[col]
+        del(slab)
+    fin.close()
+    return(dcols)
+
+
+def rfdfields(fname,fields,usemmap=False):
+    """
+    Read only primitives in fields (keys of rfdfieldcolumns) of fieldline file fname (header already read by rfd())
+    Other primitives and derived quantities (lrho, bsq, rhoclean, entropy, ...) are set to None until rfdneed() asks for them.
+    """
+    global rfdfname,rfdhave,rfdcolumns,gotrad
+    # unset everything from any previous rfd() so not mixing different files
+    for name in list(rfdfieldcolumns.keys())+list(rfdderivedneeds.keys()):
+        globals()[name]=None
+    rfdfname=fname
+    rfdhave=set()
+    rfdcolumns={}
+    gotrad=0
+    if numcolumns==16:
+        gotrad=1
+    #
+    rfdfixgridnz()
+    #
+    rfdneed(fields,usemmap=usemmap)
+    print(("rfdfields: have %s from %s" % (sorted(rfdhave),fname))) ; sys.stdout.flush()
+
+
+def rfdtakecolumns(name):
+    """ Columns of primitive name read by rfdneed(), dropped from rfdcolumns once taken """
+    return(dict([(col,rfdcolumns.pop(col)) for col in rfdfieldcolumns[name]]))
+
+
+def rfdneedprimitives(fields):
+    """ Primitives (keys of rfdfieldcolumns) not yet read that fields need, directly or for derived quantities """
+    prims=set()
+    for name in fields:
+        if name in rfdhave:
+            continue
+        if name in rfdderivedneeds:
+            prims.update(rfdneedprimitives(rfdderivedneeds[name]))
+        elif name=='gdetB' and numcolumns!=11+3:
+            # approximated from B
+            prims.update(rfdneedprimitives(['B']))
+        elif name in ['Erf','uradu'] and gotrad!=1:
+            # not in file
+            continue
+        elif name in rfdfieldcolumns:
+            prims.add(name)
+    return(prims)
+
+
+def rfdneed(fields,usemmap=False):
+    """
+    Make sure fields (primitives or derived quantities) exist for last file read by rfd().
+    Only reads or computes what isn't already there, so cheap if called again.
+    All missing primitive columns are read in one pass over the file (see rfdreadcolumns()).
+    E.g. rfd("fieldline0000.bin",fields=['rho','uu']) ; rfdneed(['bsq']) reads B and gets bsq.
+    """
+    global rho,ug,uu,B,gdetB,Erf,urad,uradu
+    global lrho,rholab,lrholab,rhoclean,rholabclean,rhounclean,rholabunclean,ugclean,ugunclean,uuclean,entropy
+    global maxbsqorhonear,maxbsqorhofar,condmaxbsqorho,condmaxbsqorhorhs,rinterp
+    global rfdhave,rfdcolumns
+    if rfdhave is None:
+        # full rfd() already done
+        return
+    if isinstance(fields,str):
+        fields=[fields]
+    #
+    # read columns of all primitives needed (incl. for derived quantities) at once, each taken out of rfdcolumns below when used
+    cols=[]
+    for name in rfdneedprimitives(fields):
+        cols=cols+[col for col in rfdfieldcolumns[name] if col not in rfdcolumns]
+    if len(cols)>0:
+        rfdcolumns.update(rfdreadcolumns(rfdfname,cols,usemmap=usemmap))
+    #
+    for name in fields:
+        if name in rfdhave:
+            continue
+        if name in rfdderivedneeds:
+            rfdneed(rfdderivedneeds[name],usemmap=usemmap)
+            if name in rfdhave:
+                continue
+        elif name not in rfdfieldcolumns:
+            raise Exception('rfdneed', 'unknown field %s' % (name))
+        #
+        if name=='rho' or name=='ug':
+            dcols=rfdtakecolumns(name)
+            if name=='rho':
+                rho=dcols[0]
+            else:
+                ug=dcols[1]
+            if(EOMTYPE==0):
+                globals()[name]=globals()[name]+1E-30
+            rfdhave.add(name)
+        elif name=='uu':
+            dcols=rfdtakecolumns(name)
+            uu=np.zeros((4,nx,ny,nz),dtype='float32',order='F')
+            for ii in np.arange(0,4):
+                uu[ii]=dcols[4+ii]
+            #multiply by u^t to get 4-velocities: u^i = u^t v^i
+            uu[1:4]=uu[1:4] * uu[0]
+            rfdpolefixuu(uu)
+            rfdhave.add(name)
+        elif name=='B':
+            dcols=rfdtakecolumns(name)
+            B=np.zeros((4,nx,ny,nz),dtype='float32',order='F')
+            for ii in np.arange(1,4):
+                B[ii]=dcols[7+ii]
+            rfdhave.add(name)
+        elif name=='gdetB':
+            if numcolumns==11+3:
+                dcols=rfdtakecolumns(name)
+                gdetB=np.zeros((4,nx,ny,nz),dtype='float32',order='F')
+                for ii in np.arange(1,4):
+                    gdetB[ii]=dcols[10+ii]
+            else:
+                print("No data on gdetB, approximating it.") ; sys.stdout.flush()
+                rfdneed(['B'],usemmap=usemmap)
+                gdetB = np.zeros((4,nx,ny,nz),dtype='float32',order='F')
+                gdetB[1:4] = gdet * B[1:4]
+            rfdhave.add(name)
+        elif name=='Erf' or name=='uradu':
+            if gotrad==1:
+                dcols=rfdtakecolumns(name)
+                if name=='Erf':
+                    Erf=dcols[11]
+                else:
+                    uradu=np.zeros((4,nx,ny,nz),dtype='float32',order='F')
+                    for ii in np.arange(0,4):
+                        uradu[ii]=dcols[12+ii]
+                    uradu[1:4]=uradu[1:4] * uradu[0]
+            else:
+                if name=='Erf':
+                    Erf=np.zeros((nx,ny,nz),dtype='float32',order='F')+1E-30
+                else:
+                    uradu=np.zeros((4,nx,ny,nz),dtype='float32',order='F')+1E-30
+            rfdhave.add(name)
+        elif name=='urad':
+            # approximation, but correct if used in pressure ultimately
+            if gotrad==1:
+                urad=Erf
+            else:
+                urad=Erf*0+1E-30
+            rfdhave.add(name)
+        elif name=='lrho':
+            lrho = np.log10(rho)
+            rfdhave.add(name)
+        elif name=='rholab' or name=='lrholab':
+            # lab-frame density
+            rholab=rho*uu[0]
+            lrholab = np.log10(rholab)
+            rfdhave.update(['rholab','lrholab'])
+        elif name in ['ud','bu','bd','bsq']:
+            getbsq_pre()
+            rfdhave.update(['ud','bu','bd','bsq'])
+        elif name=='entropy':
+            entropy=(gam-1.0)*ugclean/rho**(gam)
+            rfdhave.add(name)
+        elif name=='KAPPAUSER' or name=='KAPPAESUSER':
+            rddims(gotrad)
+            getkappas(gotrad)
+            rfdhave.update(['KAPPAUSER','KAPPAESUSER'])
+        else:
+            # floor-cleaned versions, as in rfdprocess()
+            (rhoclean,ugclean,uuclean,maxbsqorhonear,maxbsqorhofar,condmaxbsqorho,condmaxbsqorhorhs,rinterp)=getrhouclean(rho,ug,uu)
+            uu=np.copy(uuclean)
+            rhounclean=np.copy(rho)
+            ugunclean=np.copy(ug)
+            rholabunclean=rhounclean*uu[0]
+            rholabclean=rhoclean*uu[0]
+            rfdhave.update(['rhoclean','ugclean','uuclean','rhounclean','ugunclean','rholabclean','rholabunclean','condmaxbsqorho','condmaxbsqorhorhs','rinterp'])
+
+
+def getkappas(gotrad):
+    global KAPPAUSER,KAPPAESUSER
+    if(gotrad==0):
+        KAPPA=1.0
+        KAPPAES=1.0
+        # Below should be as same in global.depmnemonics.rad.h
+        TEMPMINKELVIN=1.0E-10 # Kelvin
+        TEMPMIN=(TEMPMINKELVIN/TEMPBAR)
+        pg=(gam-1.0)*ug # ideal gas
+        prad=(4.0/3.0-1.0)*urad # radiation isotropic in some frame
+        Tgas=pg/rho # gas temperature for ideal gas
+        KAPPAUSER=rho*0
+        KAPPAESUSER=rho*0
+        #
+    else:
+        # now compute auxillary opacity related quantities since only otherwise in raddump???? files and not in fieldline files
+        KAPPA=1.0
+        KAPPAES=1.0
+        # KORALTODO: Put a lower limit on T~1E4K so not overly wrongly opaque in spots where u_g->0 anomologously?
+        TEMPMINKELVIN=1.0E-10 # Kelvin
+        TEMPMIN=(TEMPMINKELVIN/TEMPBAR)
+        # ideal gas assumed for Tgas
+        # code pg
+        pg=(gam-1.0)*ug  #clean # use clean to keep pg low and Tgas will have floor like below  # no, need to use what was in simulation to be consistent with simulation's idea of what optical depth was
+        # and of used ugclean above, then in funnel temperature would be very small and kappaff would be huge.
+        #
+        prad=(4.0/3.0-1.0)*urad
+        # code Tgas for ideal gas
+        Tgas=pg/rho
+        # use rho to keep kappa low.
+        KAPPAUSER=(rho*KAPPA*KAPPA_FF_CODE(rho,Tgas+TEMPMIN))
+        KAPPAESUSER=(rho*KAPPAES*KAPPA_ES_CODE(rho,Tgas))
+
+
+def pow(x,n):
+    return(x**n)
+def KAPPA_ES_CODE(rhocode,Tcode):
+    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
+    y=(0.2*(1.0+XFACT)/OPACITYBAR)
+    return(y)
+def KAPPA_FF_CODE(rhocode,Tcode):
+    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
+    y=(1.0E23*ZATOM*ZATOM/(MUE*MUI)*(rhocode*RHOBAR)*pow(Tcode*TEMPBAR,-7.0/2.0)/OPACITYBAR)
+    return(y)
+def KAPPA_BF_CODE(rhocode,Tcode):
+    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
+    y=(1.0E25*ZATOM*(1.0+XFACT)*(rhocode*RHOBAR)*pow(Tcode*TEMPBAR,-7.0/2.0)/OPACITYBAR)
+    return(y)
+
+def rddims(gotrad):
+    global GGG,CCCTRUE,MSUNCM,MPERSUN,LBAR,TBAR,VBAR,RHOBAR,MBAR,ENBAR,UBAR,TEMPBAR,ARAD_CODE_DEF,XFACT,ZATOM,AATOM,MUE,MUI,OPACITYBAR,MASSCM,KORAL2HARMRHO1,Leddcode,Mdoteddcode,rhoeddcode,ueddcode,beddcode
+    if(gotrad==1):
+        # then also get radiation constants
+        fname= "dimensions.txt"
+        fin = open(fname, "rt" )
+        dimfile = fin.readline().split()
+        numheaderitems=len(dimfile) #.shape[0]
+        #
         GGG = np.float64(dimfile[0])
         CCCTRUE = np.float64(dimfile[1])
         MSUNCM = np.float64(dimfile[2])
@@ -8520,293 +9438,194 @@ def rddims(gotrad):
 
 
 
-# handle THETAROT!=0
-def rfdtransform(gotgdetB=0):
+# THETAROT!=0 rotation map: for each cell of the rotated (Vmetric) grid, which cells of the original data to take (and with what weights),
+# and the single 4x4 matrix that takes vector components there from Xorig to Xmetric.  Only depends upon grid and THETAROT (not the dump),
+# so rfdtransformmap() makes it once per grid and keeps it in dumps/ and in memory, and each dump is then just a gather and weighted sum.
+rfdtransformmapname="dumps/rfdtransformmap.%dx%dx%d.%s.THETAROT%.15g.npz"
+rfdtransformmapmem=None
+
+def rfdtransformmap(order=None):
+    """
+    order=None uses rfdtransformorderglobal if set, else 'nearest'.
+    Get THETAROT rotation map for current grid and THETAROT as dictionary:
+    jidx,kidx,w: (nst,nx,ny,nz) source j,k and weights (nst=1 for order='nearest', nst=4 for order='linear' bilinear in j,k)
+    mat: (4,4,nx,ny,nz) contravariant vector transformation idxdxp^T[dest] . transV2Vmetric[dest] . dxdxp[source]
+    """
+    global rfdtransformmapmem
+    if order is None:
+        order='nearest'
+        if 'rfdtransformorderglobal' in globals():
+            order=rfdtransformorderglobal
+    if order!='nearest' and order!='linear':
+        raise Exception('rfdtransformmap','order must be nearest or linear')
+    #
+    r2d=np.asarray(r[:,:,0],dtype=np.float64)
+    h2d=np.asarray(h[:,:,0],dtype=np.float64)
+    gridinfo=np.array([nx,ny,nz,THETAROT,startx3,_dx3],dtype=np.float64)
+    def goodmap(tmap):
+        return(tmap is not None and str(tmap['order'])==order and np.array_equal(tmap['gridinfo'],gridinfo) and np.array_equal(tmap['r2d'],r2d) and np.array_equal(tmap['h2d'],h2d))
+    if goodmap(rfdtransformmapmem):
+        return(rfdtransformmapmem)
+    #
+    fname=rfdtransformmapname % (nx,ny,nz,order,THETAROT)
+    if os.path.isfile(fname):
+        try:
+            data=np.load(fname)
+            tmap={}
+            for key in data.files:
+                tmap[key]=data[key]
+            data.close()
+        except:
+            tmap=None
+        if goodmap(tmap):
+            print(("rfdtransformmap: read %s" % (fname))) ; sys.stdout.flush()
+            tmap['matnz']=[(mu,nu) for mu in range(4) for nu in range(4) if np.any(tmap['mat'][mu,nu]!=0.0)]
+            rfdtransformmapmem=tmap
+            return(tmap)
+        print(("rfdtransformmap: %s is for a different grid, so remaking it" % (fname))) ; sys.stdout.flush()
     #
-    # get starting time so can compute time differences
     start_time=datetime.now()
-    print(("rfdtransform(start) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-    #
-    # modified globals
-    global nzgdump
-    global r,h,ph
-    global rho,ug,uu,B,gdetB,Erf,urad,uradu
-    #
-    print(("what: %d\n",nz)) ; sys.stdout.flush()
-    print(("what2: %d\n",nzgdump)) ; sys.stdout.flush()
-    #
     ###########################################
-    # first deal with ti,tj,tk,x1,x2,x3,r,h,ph that are gdump data size, while need true ph at least on same sized-grid as rfd() data is on.
+    # Vmetric: r,h from (THETAROT=0) gdump, ph on rfd()'s nz (ph(x3) only, x3=0 is phi=0 and x3=1 is phi=2pi)
     ###########################################
-    #
-    ti1d=ti[:,0,0].view().reshape(-1)
-    tj1d=tj[0,:,0].view().reshape(-1)
-    tk1d=tk[0,0,:].view().reshape(-1)
-    tk1dnew=0.5 + np.float32(np.arange(0,nz)) # cell centered tk using rfd's nz
-    x11d=x1[:,0,0].view().reshape(-1)
-    x21d=x2[0,:,0].view().reshape(-1)
-    x31d=x3[0,0,:].view().reshape(-1)
+    tk1dnew=0.5 + np.arange(0,nz) # cell centered tk using rfd's nz
     endx3=startx3 + _dx3*nz
     x31dnew=startx3 + tk1dnew*(endx3-startx3)/(nz-0.0)
-    # r and h are not constant along x1,x2 grid lines.  Only ph is constant for constant tk,x3.
-    #tk1dnew = griddata(tk1d, vartointerp, (V[1,:,0,0], V[2,0,:,0], V[3,0,0,:]), method='linear')
-    #    zi = griddata((x, y), lrho, (xi[None,:], yi[:,None]), method='cubic')
-    ph1d=ph[0,0,:].view().reshape(-1)
-    ph1dnew=2.0*np.pi*x31dnew  # i.e. x3=0 is phi=0 and x3=1 is phi=2pi
-
-    print("ph1dnew")
-    print(ph1dnew) ; sys.stdout.flush()
-    #griddata(tk1d, x31d, tk1dnew, method='cubic')
-    #print("shapes: ",x1.shape,x2.shape,x3.shape,r.shape,x11d.shape,x11d[:,None,None].shape,x21d.shape,x21d[None,:,None].shape,x31dnew.shape,x31dnew[None,None,:].shape) ; sys.stdout.flush()
-    #
-    #http://mail.scipy.org/pipermail/astropy/2011-April/001255.html
-    print(("pre-r2d shape (nx=%d ny=%d)" % (nx,ny))) ; sys.stdout.flush()
-    print((r[:,:,0].shape)) ; sys.stdout.flush()
-    # .view().reshape(-1)
-    r2d=r[:,:,0].view().reshape((nx,ny))
-    h2d=h[:,:,0].view().reshape((nx,ny))
-    #print("r2d")
-    #print(r2d)
-    #print("h2d")
-    #print(h2d)
-    #r3d = np.tile(r2d,nz).view().reshape((nx,ny,nz))
-    #h3d = np.tile(h2d,nz).view().reshape((nx,ny,nz))
-    #r3d = np.tile(r2d,(nz,1,1))
-    r3d = np.transpose(np.tile(r2d,(nz,1,1)),(1,2,0))
-    #h3d = np.tile(h2d,(nz,1,1))
-    h3d = np.transpose(np.tile(h2d,(nz,1,1)),(1,2,0))
-    #print("r3d")
-    #print(r3d[:,0,0])
-    print("h3d")
-    print((h3d[0,:,0]))
-    #rnew = griddata((x1, x2, x3), r, (x11d[:,None,None], x21d[None,:,None], x31dnew[None,None,:]), method='linear')
-    #r=rnew # overwrite
-    #hnew = griddata((x1, x2, x3), h, (x11d, x21d, x31dnew), method='linear')
-    #h=hnew # overwrite
-    # below phnew works if ph(x3) only and not ph(x1,x2).  This is currently true.  Using np.tile is more accurate than using griddata that would extrapolate near boundaries.
-    #http://stackoverflow.com/questions/5559851/numpy-constructing-a-3d-array-from-a-1d-array
-    #ph3d = np.tile(ph1dnew,nx*ny).reshape((nx,ny,nz))
-    ph3d = np.tile(ph1dnew,(nx,ny,1))
-    #
-    # DEBUG:
-    #print("gods: %g %g %g : %g %g %g\n" % (r[20,15,0],h[20,15,0],ph[20,15,0],r3d[20,15,20],h3d[20,15,20],ph3d[20,15,20]))
-    #
-    # set nzgdump since updated 3d things.  Now won't have to do this again unless read-in gdump again.
-    #    nzgdump=nz
-    #
-    #
-    ###########################################
-    # Assign Vmetric
-    ###########################################
+    ph1dnew=2.0*np.pi*x31dnew
     #
     Vmetric=np.zeros((4,nx,ny,nz),dtype='float32')
-    Vmetric[0]=Vmetric[0]*0.0
-    Vmetric[1]=r3d
-    Vmetric[2]=h3d
-    Vmetric[3]=ph3d
-    #
-    print(("rfdtransform(done assign Vmetric) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-    # DEBUG:
-    #print("shapes")
-    #print(Vmetric[1].shape)
-    #print(Vmetric[2].shape)
-    #print(Vmetric[3].shape)
-    #sys.stdout.flush()
+    Vmetric[1]=r2d[:,:,None]
+    Vmetric[2]=h2d[:,:,None]
+    Vmetric[3]=ph1dnew[None,None,:]
     #
+    # Vorig=V(Vmetric): de-rotated r,th,ph of original data that shows up at each Vmetric position
+    Vorig=rotate_VtoVmetric(Vmetric,np.copy(Vmetric),b0=-THETAROT)
     #
     ###########################################
-    # Assign Vorig
+    # source cell: r doesn't change in rotation so same i, ph(x3) only so k from ph, and h(x1,x2) so j from h along each i
     ###########################################
+    if nz>1:
+        kfloat=(Vorig[3]-ph1dnew[0])/(ph1dnew[1]-ph1dnew[0])
+    else:
+        kfloat=0.0*Vorig[3]
+    jfloat=np.zeros((nx,ny,nz),dtype=np.float64)
+    if ny>1:
+        tjfake=np.arange(0,ny,dtype=np.float64)
+        for ii in np.arange(0,nx):
+            jfloat[ii]=np.interp(Vorig[2,ii],h2d[ii],tjfake)
+    jnear=np.round(jfloat).astype(np.int32)
+    if order=='nearest':
+        jidx=jnear[None]
+        kidx=(np.round(kfloat).astype(np.int32) % nz)[None]
+        w=np.ones((1,nx,ny,nz),dtype='float32')
+    else:
+        j0=np.clip(np.floor(jfloat).astype(np.int32),0,max(ny-2,0))
+        wj=np.clip(jfloat-j0,0.0,1.0)
+        k0=np.floor(kfloat).astype(np.int32)
+        wk=kfloat-k0
+        jidx=np.array([j0,j0+1,j0,j0+1],dtype=np.int32)
+        jidx[jidx>=ny]=ny-1
+        kidx=np.array([k0,k0,k0+1,k0+1],dtype=np.int32) % nz
+        w=np.array([(1-wj)*(1-wk),wj*(1-wk),(1-wj)*wk,wj*wk],dtype='float32')
     #
-    print("rotate_VtoVmetric BEGIN\n");sys.stdout.flush()
-    # get Vorig if different than Vmetric
-    # This assumes original grid use same exact r,\theta,\phi grid on same x1,x2,x3 and same ti,tj,tk.
-    Vorig=np.copy(Vmetric)
-    # no time-component operations
-    # get Vmetric(V)
-    # Note that ti,tj,tk,x1,x2,x3,r,h,ph,dxdxp don't change -- we simply identify them with Vmetric instead of V, so that V no longer is relevant except as required to interpolate grid data to Vmetric positions from V positions and to transform vectors/tensors as required.  But we still need the stored value of Vorig on the grid, which means we need Vorig=V(Vmetric).
-    # assume ti,tj,tk,x1,x2,x3,r,h,ph,dxdxp already rotated, and now Vmetric already.
-    # then just get original V
-    #Vorig=rotate_Vmetric2V(Vmetric,Vorig,b0=-THETAROT)
-    # NO: use Vmetric for fieldline data's V as required, so that get out de-rotated version of r,th,ph as required
-    # takes (e.g.) zhat and moves it -15deg around y-axis, so that below the reinterp3dspc() assumes Vmetric offset with +15deg around y-axis meant original data's zaxis that's is not offset and so shows up at +15deg.
-    Vorig=rotate_VtoVmetric(Vmetric,Vorig,b0=-THETAROT)
-    #
-    #print("Vmetricalongj")
-    #print(Vmetric[2,0,:,0])
-    #sys.stdout.flush()
-    #
-    #print("Vorigalongj")
-    #print(Vorig[2,0,:,0])
-    #sys.stdout.flush()
-    #
-    print("rotate_VtoVmetric END\n");sys.stdout.flush()
-    print(("rfdtransform(done assign Vorig) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-    #
+    print(("rfdtransformmap(done with source cells) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
     ###########################################
-    # Interpolate (and transform vectors from X->V)
+    # vector transformation matrix
     ###########################################
+    # dxdxp at (nearest) source cell: only dxdxp11,12,21,22 depend upon position for simple normal setup (see dxdxpverysimpletensordot())
+    ii3=np.arange(0,nx)[:,None,None]
+    dsource=np.zeros((4,4,nx,ny,nz),dtype=np.float64)
+    dsource[0,0]=dxdxp[0,0,0,0,0]
+    for mu in [1,2]:
+        for nu in [1,2]:
+            dsource[mu,nu]=dxdxp[mu,nu,ii3,jnear,0]
+    dsource[3,3]=dxdxp[3,3,0,0,0]
+    #
+    # transV2Vmetric^\mu[Vmetric]_\nu[V] at Vmetric
+    transV2Vmetric=set_transV2Vmetric(Vmetric=Vmetric,b0=-THETAROT)
+    mat=np.einsum('abijk,bnijk->anijk',transV2Vmetric,dsource)
+    del transV2Vmetric
+    del dsource
+    gc.collect()
+    # then idxdxp^T (as tensordot00() applied it) to get u^\nu[Xmetric]
+    idxdxp=np.linalg.inv(np.moveaxis(np.asarray(dxdxp[:,:,:,:,0],dtype=np.float64),(0,1),(2,3)))
+    mat=np.einsum('ijam,anijk->mnijk',idxdxp,mat).astype('float32')
     #
-    print("reinterp3dspc BEGIN\n");sys.stdout.flush()
-    #
-    if 0==1:
-        # 3D interpolate from Vorig positions on grid to Vmetric positions
-        # in this context, Vorig is de-rotated r,th,ph, while Vmetric is new grid with BH spin axis pointing along zhat.
-        rhoi=reinterp3dspc(Vorig,Vmetric,rho)
-        ugi=reinterp3dspc(Vorig,Vmetric,ug)
-        uu0i=reinterp3dspc(Vorig,Vmetric,uu[0])
-        uu1i=reinterp3dspc(Vorig,Vmetric,uu[1])
-        uu2i=reinterp3dspc(Vorig,Vmetric,uu[2])
-        uu3i=reinterp3dspc(Vorig,Vmetric,uu[3])
-        B1i=reinterp3dspc(Vorig,Vmetric,B[1])
-        B2i=reinterp3dspc(Vorig,Vmetric,B[2])
-        B3i=reinterp3dspc(Vorig,Vmetric,B[3])
-        if gotgdetB==1:
-            gdetB1i=reinterp3dspc(Vorig,Vmetric,gdetB[1])
-            gdetB2i=reinterp3dspc(Vorig,Vmetric,gdetB[2])
-            gdetB3i=reinterp3dspc(Vorig,Vmetric,gdetB[3])
-        #
-        # NOT SETUP FOR URADU GODMARK
-        rho=rhoi
-        ug=ugi
-        uu[0]=uu0i
-        uu[1]=uu1i
-        uu[2]=uu2i
-        uu[3]=uu3i
-        #B[0] is still zero
-        B[1]=B1i
-        B[2]=B2i
-        B[3]=B3i
-        if gotgdetB==1:
-            #gdetB[0] is still zero
-            gdetB[1]=gdetB1i
-            gdetB[2]=gdetB2i
-            gdetB[3]=gdetB3i
-    else:
-        # Jon's SPC-optimized version of inteprolation
-        # and overwrite non-interpolated versions
-        if gotgdetB==1:
-            (rho,ug,uu[0],uu[1],uu[2],uu[3],B[1],B[2],B[3],gdetB[1],gdetB[2],gdetB[3])=reinterp3dspc_opt_all(Vorig,Vmetric,rho,ug,uu,B,gdetB=gdetB)
-        else:
-            (rho,ug,uu[0],uu[1],uu[2],uu[3],B[1],B[2],B[3])=reinterp3dspc_opt_all(Vorig,Vmetric,rho,ug,uu,B)
-    #
-    print("reinterp3dspc END\n");sys.stdout.flush()
-    print(("rfdtransform(done assign interpolated prims) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-    #
+    print(("rfdtransformmap(done with matrices) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
-    ###########################################
-    # Get transformation matrices that actually only depend upon Vmetric=r,h,ph
-    ###########################################
+    tmap={'order':np.array(order),'gridinfo':gridinfo,'r2d':r2d,'h2d':h2d,'jidx':jidx,'kidx':kidx,'w':w,'mat':mat}
+    # write then rename, so other jobs never see partial file
+    try:
+        tmpname="%s.%d.tmp.npz" % (fname[:-4],os.getpid())
+        np.savez(tmpname,**tmap)
+        os.rename(tmpname,fname)
+        print(("rfdtransformmap: wrote %s" % (fname))) ; sys.stdout.flush()
+    except (IOError,OSError):
+        print(("rfdtransformmap: could not write %s" % (fname))) ; sys.stdout.flush()
+    tmap['matnz']=[(mu,nu) for mu in range(4) for nu in range(4) if np.any(mat[mu,nu]!=0.0)]
+    rfdtransformmapmem=tmap
+    return(tmap)
+
+def rfdtransformgather(tmap,var):
+    """ var (nx,ny,nz) at original positions -> weighted sum of source cells at rotated positions """
+    ii3=np.arange(0,nx)[:,None,None]
+    jidx=tmap['jidx']
+    kidx=tmap['kidx']
+    w=tmap['w']
+    if w.shape[0]==1:
+        return(var[ii3,jidx[0],kidx[0]])
+    result=w[0]*var[ii3,jidx[0],kidx[0]]
+    for ss in np.arange(1,w.shape[0]):
+        result+=w[ss]*var[ii3,jidx[ss],kidx[ss]]
+    return(result)
+
+def rfdtransformvector(tmap,vec,notime=False):
+    """ contravariant vec (4,nx,ny,nz) in X at original positions -> in Xmetric at rotated positions.  notime=True for B-like vectors with vec[0]=0 """
+    vecgathered=[rfdtransformgather(tmap,vec[nu]) for nu in np.arange(0,4)]
+    if notime:
+        vecgathered[0]=0.0*vecgathered[0]
+    mat=tmap['mat']
+    result=np.zeros((4,nx,ny,nz),dtype=np.result_type(vec.dtype,mat.dtype))
+    for (mu,nu) in tmap['matnz']:
+        result[mu]+=mat[mu,nu]*vecgathered[nu]
+    return(result)
+
+# handle THETAROT!=0
+def rfdtransform(gotgdetB=0):
     #
-    # transV2Vmetric^\mu[Vmetric]_\nu[V] u^\nu[V] : So first index is Vmetric-type.  Second index is V-type.  Operates on contravariant V-type.
-    # transVmetric2V^\mu[V]_\nu[Vmetric] u^\nu[Vmetric] : So first index is V-type.  Second index is Vmetric-type.  Operates on contravariant Vmetric-type.
-    print("set_transV2Vmetric BEGIN\n");sys.stdout.flush()
+    # get starting time so can compute time differences
+    start_time=datetime.now()
+    print(("rfdtransform(start) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
-    (transV2Vmetric)=set_transV2Vmetric(Vmetric=Vmetric,b0=-THETAROT)
-    #(transV2Vmetric)=set_transV2Vmetric(Vmetric=Vmetric,b0=+THETAROT)
-    gc.collect() #try to release unneeded memory
+    # modified globals
+    global rho,ug,uu,B,gdetB,Erf,urad,uradu
     #
-    # test transV2Vmetric
-    #
-    utest1old=np.zeros((4),dtype=r.dtype)
-    utest1old[0]=1.0
-    utest1old[1]=1.0
-    utest1old[2]=0.0
-    utest1old[3]=0.0
-    utest1new=np.tensordot(utest1old,transV2Vmetric[:,:,60,ny//2,nz/4],axes=[0,1])
-    print("utest1new");sys.stdout.flush()
-    print(utest1new);sys.stdout.flush()
-    #
-    utest1old=np.zeros((4),dtype=r.dtype)
-    utest1old[0]=1.0
-    utest1old[1]=0.0
-    utest1old[2]=1.0
-    utest1old[3]=0.0
-    utest1new=np.tensordot(utest1old,transV2Vmetric[:,:,60,ny//2,nz/4],axes=[0,1])
-    print("utest2new");sys.stdout.flush()
-    print(utest1new);sys.stdout.flush()
-    #
-    utest1old=np.zeros((4),dtype=r.dtype)
-    utest1old[0]=1.0
-    utest1old[1]=0.0
-    utest1old[2]=0.0
-    utest1old[3]=1.0
-    utest1new=np.tensordot(utest1old,transV2Vmetric[:,:,60,ny//2,nz/4],axes=[0,1])
-    print("utest3new");sys.stdout.flush()
-    print(utest1new);sys.stdout.flush()
-    #
-    #
-    print("set_transV2Vmetric END\n");sys.stdout.flush()
-    print(("rfdtransform(done get transV2Vmetric) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+    # in this context, Vorig is de-rotated r,th,ph, while Vmetric is new grid with BH spin axis pointing along zhat.
+    # grid and THETAROT part is done once in rfdtransformmap()
+    tmap=rfdtransformmap()
+    print(("rfdtransform(done get map) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
     ###########################################
-    # Transform vector components from Vorig -> Vmetric -> Xmetric
+    # Interpolate (and transform vectors from Xorig->Vorig->Vmetric->Xmetric)
     ###########################################
     #
-    # transform tensors (gv3=gv3_{\mu[V]\nu[V]} and dxdxp=dx^\mu[V]/dxp^\nu[V], but dxdxp just dV/dX that we understand now is just dVmetric/dXmetric that is already new grid by assumed rotation)
-    # So only have to transform gv3 (everything remains correct/consistent as long as all vector components are interpolated in same spatial way and transformed in correct/consistent way)
-    # using transV just does a local rotation, not global.  Global relocation done by interpolation already.
-    # u^\mu[V] -> u^\mu[Vmetric]
     # problem is u.u=-1 won't be satisfied except to truncation error.  But for python analysis, never need it to be exactly correct.
-    #
-    # full transformation is:
-    # dx^{\mu'''[X]} = dx^{\mu[Xmetric]} \Lambda^{\mu'[Vmetric]}_{\mu[Xmetric]} \Lambda^{\mu''[V]}_{\mu'[Vmetric]} \Lambda^{\mu'''[X]}_{\mu''[V]}
-    # dx^{\mu'''[Xmetric]} = dx^{\mu[X]} \Lambda^{\mu'[V]}_{\mu[X]} \Lambda^{\mu''[Vmetric]}_{\mu'[V]} \Lambda^{\mu'''[Xmetric]}_{\mu''[Vmetric]} <--- this one is what we do here.
-    #
-    # Note that dxdxp=dV^\mu/dX^\nu=\Lambda^\mu[V]_\nu[X] at Vorig on original grid is same value as dVmetric^\mu/dXmetric^\nu on Vmetric on new grid. But, transV2Vmetric has to operate on V, not X.
-    print("tensordots BEGIN\n");sys.stdout.flush()
-    #
-    # this gives inverse without transposition, so gives (dX^\nu/dV^\mu)^T = \Lambda_\mu[V]^\nu[X] and \Lambda_\mu[Vmetric]^\nu[Xmetric]
-    idxdxp=np.copy(dxdxp)
-    for ii in np.arange(0,nx):
-        for jj in np.arange(0,ny):
-            idxdxp[:,:,ii,jj,0]=np.linalg.inv(dxdxp[:,:,ii,jj,0])
-    #
-    print("About to do uunew1");sys.stdout.flush()
-    printusage()
-    #
-    if 0==1:
-        uunew1=tensordot01(uu,dxdxp) #,axes=([0],[1])) # now u^\mu[V]
-    else:
-        uunew1=uu # assume already applied dxdxp at same r,theta,phi location as uu
-    #
-    printusage()
-    uunew2=tensordot01(uunew1,transV2Vmetric) #,axes=([0],[1])) # now u^\nu[Vmetric]
-    uunew3=tensordot00(uunew2,idxdxp) #,axes=([0],[0])) # now u^\nu[Xmetric]
-    uu=np.copy(uunew3) # overwrite
-    #
     # assumes no transformation on time component, which is true for the spatial rotation involving THETAROT
-    if 0==1:
-        Bnew1=tensordot01(B,dxdxp) #,axes=([0],[1])) # now u^\mu[V]
-    else:
-        Bnew1=B # assume already applied dxdxp at same r,theta,phi location as uu
-    #
-    Bnew2=tensordot01(Bnew1,transV2Vmetric) #,axes=([0],[1])) # now u^\nu[Vmetric]
-    Bnew3=tensordot00(Bnew2,idxdxp) #,axes=([0],[0])) # now u^\nu[Xmetric]
-    B=np.copy(Bnew3) # overwrite
-    #
+    rho=rfdtransformgather(tmap,rho)
+    ug=rfdtransformgather(tmap,ug)
+    uu=rfdtransformvector(tmap,uu)
+    B=rfdtransformvector(tmap,B,notime=True)
     if gotgdetB==1:
-        # assumes no transformation on time component, which is true for the spatial rotation involving THETAROT
         # assume for gdetB that gdet changes little for Vorig and Vmetric.  Inaccurate near BH, but only use gdetB in special cases.  Even very near BH, gdet doesn't change too much with THETAROT changes.
         # To get accurate, would have to divide out gdet[Vorig] and multiply by gdet[V].
         # But, then divB=0 won't be very accurate still.  To have that, would have to form A_i and recompute face values of gdetB.
-        if 0==1:
-            gdetBnew1=tensordot01(gdetB,dxdxp) #,axes=([0],[1])) # now u^\mu[V]
-        else:
-            gdetBnew1=gdetB # assume already applied dxdxp at same r,theta,phi location as uu
-        #
-        gdetBnew2=tensordot01(gdetBnew1,transV2Vmetric) #,axes=([0],[1])) # now u^\nu[Vmetric]
-        gdetBnew3=tensordot00(gdetBnew2,idxdxp) #,axes=([0],[0])) # now u^\nu[Xmetric]
-        gdetB=np.copy(gdetBnew3) # overwrite
-    #
-    # NOT SETUP FOR URADU GODMARK
-    #
-    printusage()
-    print("tensordots END\n");sys.stdout.flush()
-    print(("rfdtransform(done tensordots) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-    #
+        gdetB=rfdtransformvector(tmap,gdetB,notime=True)
+    if numcolumns==16:
+        Erf=rfdtransformgather(tmap,Erf)
+        uradu=rfdtransformvector(tmap,uradu)
     #
+    print(("rfdtransform(done) time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
     #
 
 # do np.tensordot with full 3D first arg and axisym (nz=1 like) second arg
@@ -8993,28 +9812,7 @@ def rfdprocess(gotgdetB=0):
     #     else:
     #         print( "rfd: warning: since gdet is not defined, I am skipping the computation of cell-centered fields, B" )
     # else:
-    if 'r' in globals() and r.shape[2] != nz:
-        #dynamically change the 3rd dimension size
-        rnew = np.zeros((nx,ny,nz),dtype=r.dtype)
-        hnew = np.zeros((nx,ny,nz),dtype=h.dtype)
-        phnew = np.zeros((nx,ny,nz),dtype=ph.dtype)
-        rnew += r[:,:,0:1]
-        hnew += h[:,:,0:1]
-        #compute size of phi wedge assuming dxdxp[3][3] is up to date
-        phiwedge = dxdxp[3][3][0,0,0]*_dx3*nz
-        a_phi = phiwedge/(2.*nz)+np.linspace(0,phiwedge,num=nz,endpoint=False)
-        phnew += a_phi[None,None,:]
-        del r
-        del h
-        del ph
-        r = rnew
-        h = hnew
-        ph = phnew
-        print("phnew") ; sys.stdout.flush()
-        print((phnew[0,0,:])) ; sys.stdout.flush()
-        gc.collect()
-    else:
-        print("r in globals has shape2 of nz") ; sys.stdout.flush()
+    rfdfixgridnz()
     #
     # other stuff
     entropy=(gam-1.0)*ugclean/rho**(gam)
@@ -9042,8 +9840,9 @@ def cvel():
     ud = mdot(gv3,uu)                  #g_mn u^n
     etad = np.zeros_like(uu)
     etad[0] = -1/(-gn3[0,0])**0.5      #ZAMO frame velocity (definition)
-    etau = mdot(gn3,etad)
-    gamma=-mdot(uu,etad)                #Lorentz factor as measured by ZAMO
+    # only etad[0]!=0, so mdot(gn3,etad) and mdot(uu,etad) reduce to one term
+    etau = gn3[:,0]*etad[0]
+    gamma=-uu[0]*etad[0]                #Lorentz factor as measured by ZAMO
     vu = uu - gamma*etau               #u^m = v^m + gamma eta^m
     vd = mdot(gv3,vu)
     #
@@ -9104,6 +9903,109 @@ def cvel():
     taurad1integrated,taurad1flipintegrated,taurad2integrated,taurad2flipintegrated,tauradintegrated,tauradeff1integrated,tauradeff1flipintegrated,tauradeff2integrated,tauradeff2flipintegrated,tauradeffintegrated=compute_taurad()
     #return bu, bd, ud #Megan 1/19/15
 
+
+# per-cell globals (from grid3d(), rfd() and loadavg()) that runradialblocks() restricts to a radial block.  Radius is always axis ndim-3.
+radialblocknames=['ti','tj','tk','x1','x2','x3','r','h','ph','gn3','gv3','gdet','dxdxp',
+                  'rho','ug','uu','B','gdetB','Erf','urad','uradu',
+                  'lrho','rholab','lrholab','rhoclean','rholabclean','rhounclean','rholabunclean','ugclean','ugunclean','uuclean','entropy',
+                  'maxbsqorhonear','maxbsqorhofar','condmaxbsqorho','condmaxbsqorhorhs','rinterp','KAPPAUSER','KAPPAESUSER',
+                  'ud','bu','bd','bsq',
+                  'avg_uu','avg_ud','avg_bu','avg_bd']
+# per-cell globals that cvel(), Tcalcud() and faraday() create, only block-sized inside runradialblocks()
+radialblockderivednames=['etad','etau','gamma','vu','vd','beta','betatot','betatoplot','Q1','Q2','Q2toplot','uradd','tauradintegrated','tauradeffintegrated','aphi',
+                         'Tud','TudEM','TudMA','TudPA','TudEN','TudRAD','mu','sigma','enth','unb','isunbound',
+                         'fdd','fuu','omegaf1','omegaf1b','omegaf2','omegaf2b']
+# None unless inside runradialblocks(), then the current block and what compute_taurad() must add from other blocks
+radialblock=None
+
+def radialblockranges(blocksize=32):
+    """
+    (i0,i1) radial index ranges of blocks of blocksize cells covering 0..nx
+    """
+    return([(i0,min(i0+blocksize,nx)) for i0 in np.arange(0,nx,blocksize)])
+
+def radialblockset(saved,i0,i1):
+    # point per-cell globals at [i0,i1) part of saved full arrays (views, no copies)
+    global nx
+    for name in radialblocknames:
+        if name in saved:
+            val=saved[name]
+            if isinstance(val,np.ndarray) and val.ndim>=3 and val.shape[val.ndim-3]==saved['nx']:
+                globals()[name]=val[(slice(None),)*(val.ndim-3)+(slice(i0,i1),)]
+    nx=i1-i0
+
+def runradialblocks(dodump,blocksize=32,halo=1,radiussettau1zero=80):
+    """
+    Process currently loaded dump (grid3d() and rfd() already done) in radial blocks of i-indices,
+    so cvel() (36 full 3D vars), Tcalcud() (85) and faraday() (36) only ever hold blocksize*ny*nz cells.
+    For each block, per-cell globals are set to the block (plus halo cells above it) and nx to its size, then dodump() is called.
+    dodump() calls cvel(), Tcalcud(), etc. and returns an array or tuple of arrays with radius as first axis
+    (e.g. intangle(), jetpowcalc(), horcalc(...)[0].sum(2).sum(1)).  These are returned concatenated over all blocks.
+    i-indices inside dodump() are relative to the block (e.g. iofr() won't work).
+    halo: cells above each block also computed and then dropped, for stencils reaching up in i (fieldcalc()'s radial average needs 1).
+    compute_taurad()'s radial cumsums get the other blocks' parts added (computed first for radiussettau1zero).
+    """
+    global radialblock
+    if radialblock is not None:
+        raise Exception('runradialblocks','already inside runradialblocks()')
+    #
+    ranges=radialblockranges(blocksize)
+    saved={'nx':nx}
+    for name in radialblocknames+radialblockderivednames:
+        if name in globals():
+            saved[name]=globals()[name]
+    #
+    results=None
+    try:
+        # first pass: radial optical depth each block contributes (cheap, just few 3D vars per block)
+        sumtaurad1=[]
+        sumtauradeff1=[]
+        for (i0,i1) in ranges:
+            radialblockset(saved,i0,i1)
+            taurad1,tauradeff1=compute_taurad1(radiussettau1zero=radiussettau1zero)
+            sumtaurad1.append(taurad1.sum(axis=0,dtype=np.float64))
+            sumtauradeff1.append(tauradeff1.sum(axis=0,dtype=np.float64))
+        totaltaurad1=np.sum(sumtaurad1,axis=0)
+        totaltauradeff1=np.sum(sumtauradeff1,axis=0)
+        #
+        beforetaurad1=0.0*totaltaurad1
+        beforetauradeff1=0.0*totaltauradeff1
+        for blockindex,(i0,i1) in enumerate(ranges):
+            i1halo=min(i1+halo,saved['nx'])
+            print(("runradialblocks: i=%d..%d of %d" % (i0,i1,saved['nx']))) ; sys.stdout.flush()
+            radialblockset(saved,i0,i1halo)
+            radialblock={'i0':i0,'i1':i1,'nxblock':i1-i0,'radiussettau1zero':radiussettau1zero,
+                         'taurad1before':beforetaurad1,'taurad1after':totaltaurad1-beforetaurad1-sumtaurad1[blockindex],
+                         'tauradeff1before':beforetauradeff1,'tauradeff1after':totaltauradeff1-beforetauradeff1-sumtauradeff1[blockindex]}
+            #
+            result=dodump()
+            istuple=isinstance(result,tuple) or isinstance(result,list)
+            if not istuple:
+                result=(result,)
+            if results is None:
+                results=[[] for qty in result]
+            for qtyindex,qty in enumerate(result):
+                if np.ndim(qty)==0 or len(qty)!=i1halo-i0:
+                    raise Exception('runradialblocks','dodump() must return arrays with radius as first axis')
+                # drop halo
+                results[qtyindex].append(np.copy(qty[0:i1-i0]))
+            #
+            beforetaurad1=beforetaurad1+sumtaurad1[blockindex]
+            beforetauradeff1=beforetauradeff1+sumtauradeff1[blockindex]
+    finally:
+        radialblock=None
+        # put back full arrays, and remove block-sized things left by cvel(), etc.
+        for name in radialblockderivednames:
+            if name not in saved:
+                globals().pop(name,None)
+        for name in saved:
+            globals()[name]=saved[name]
+    #
+    results=[np.concatenate(qty,axis=0) for qty in results]
+    if istuple:
+        return(tuple(results))
+    return(results[0])
+
 def decolumnify(dumpname):
     print(( "Reading data from " + "dumps/" + dumpname + " ..." ))
     gin = open( "dumps/" + dumpname + "-col0000", "rb" )
@@ -9203,7 +10105,7 @@ def grid3d_thetarot_notusing(dumpname,use2d=False,doface=False): #read grid dump
     print( "Done grid3d!" ) ; sys.stdout.flush()
 
 
-def grid3d(dumpname,use2d=False,doface=False,usethetarot0=False): #read grid dump file: header and body
+def grid3d(dumpname,use2d=False,doface=False,usethetarot0=False,usecache=True,usememo=True): #read grid dump file: header and body
     #
     #
     #
@@ -9247,32 +10149,43 @@ def grid3d(dumpname,use2d=False,doface=False,usethetarot0=False): #read grid dum
     #
     print(( "realdumpname=%s" % (realdumpname) )) ; sys.stdout.flush()
     #
+    # if same gdump already loaded in this process, just put back those globals (rfd() may have replaced r,h,ph with nz versions since)
+    global grid3dmemokey,grid3dmemo
+    memokey=(realdumpname,os.path.getmtime("dumps/" + realdumpname),use2d,usethetarot0)
+    if usememo==True and 'grid3dmemokey' in globals() and grid3dmemokey==memokey:
+        for name in grid3dmemonames:
+            globals()[name]=grid3dmemo[name]
+        print( "Done grid3d (already loaded)!" ) ; sys.stdout.flush()
+        return
+    grid3dmemokey=None
+    grid3dmemo=None
+    #
     # load axisymmetric metric-grid data
     # this sets THETAROT=0 if THETAROT true is non-zero.  rfd() is responsible for setting THETAROT for each fieldline file so data inputted is transformed/interpolated correctly.
-    grid3d_load(dumpname=realdumpname,use2d=use2d,doface=doface,loadsimple=False)
+    # use binary per-block cache of gdump if exists and up to date, else read gdump and make cache for next time
+    if usecache==False or grid3d_loadcache(dumpname=realdumpname,use2d=use2d)==False:
+        grid3d_load(dumpname=realdumpname,use2d=use2d,doface=doface,loadsimple=False)
+        #
+        # get other things
+        gridcellverts()
+        #
+        if usecache==True:
+            grid3d_savecache(dumpname=realdumpname,use2d=use2d)
     #
-    # get other things
-    gridcellverts()
+    # remember for next grid3d() call
+    grid3dmemo={}
+    for name in grid3dmemonames:
+        grid3dmemo[name]=globals()[name]
+    grid3dmemokey=memokey
     # 
     gc.collect() #try to release unneeded memory
     print( "Done grid3d!" ) ; sys.stdout.flush()
 
 
-def grid3d_load(dumpname=None,use2d=False,doface=False,loadsimple=False): #read grid dump file: header and body
-    #The internal cell indices along the three axes: (ti, tj, tk)
-    #The internal uniform coordinates, (x1, x2, x3), are mapped into the physical
-    #non-uniform coordinates, (r, h, ph), which correspond to radius (r), polar angle (theta), and toroidal angle (phi).
-    #There are more variables, e.g., dxdxp, which is the Jacobian of (x1,x2,x3)->(r,h,ph) transformation, that I can
-    #go over, if needed.
+def grid3d_header(header,use2d=False):
+    # set grid globals from split gdump header
     global nx,ny,nz,lnz,_startx1,_startx2,_startx3,_dx1,_dx2,_dx3,gam,a,Rin,Rout
     global nzgdump
-    global ti,tj,tk,x1,x2,x3,r,h,ph,gn3,gv3,dxdxp,gdet
-    # global ck,conn
-    print(( "Reading grid from " + "dumps/" + dumpname + " ..." )) ; sys.stdout.flush()
-    gin = open( "dumps/" + dumpname, "rb" )
-    #
-    #First line of grid dump file is a text line that contains general grid information:
-    header = gin.readline().split()
     #dimensions of the grid
     nx = int(header[1])
     ny = int(header[2])
@@ -9299,12 +10212,29 @@ def grid3d_load(dumpname=None,use2d=False,doface=False,loadsimple=False): #read
     Rin=myfloatalt(float(header[14]))
     #Spherical polar radius of the outermost radial cell
     Rout=myfloatalt(float(header[15]))
-    #read grid dump per-cell data
     #
     if use2d:
         lnz = 1
     else:
         lnz = nz
+
+
+def grid3d_load(dumpname=None,use2d=False,doface=False,loadsimple=False): #read grid dump file: header and body
+    #The internal cell indices along the three axes: (ti, tj, tk)
+    #The internal uniform coordinates, (x1, x2, x3), are mapped into the physical
+    #non-uniform coordinates, (r, h, ph), which correspond to radius (r), polar angle (theta), and toroidal angle (phi).
+    #There are more variables, e.g., dxdxp, which is the Jacobian of (x1,x2,x3)->(r,h,ph) transformation, that I can
+    #go over, if needed.
+    global nx,ny,nz,lnz,_startx1,_startx2,_startx3,_dx1,_dx2,_dx3,gam,a,Rin,Rout
+    global nzgdump
+    global ti,tj,tk,x1,x2,x3,r,h,ph,gn3,gv3,dxdxp,gdet
+    # global ck,conn
+    print(( "Reading grid from " + "dumps/" + dumpname + " ..." )) ; sys.stdout.flush()
+    gin = open( "dumps/" + dumpname, "rb" )
+    #
+    #First line of grid dump file is a text line that contains general grid information:
+    header = gin.readline().split()
+    grid3d_header(header,use2d=use2d)
     #
     print( "Done reading grid header" ) ; sys.stdout.flush()
     #
@@ -9349,6 +10279,82 @@ def grid3d_load(dumpname=None,use2d=False,doface=False,loadsimple=False): #read
         #
     #
 
+# globals set by grid3d_header() and grid3d_load()/gridcellverts() that grid3d() remembers so repeated calls don't re-read gdump
+grid3dmemonames=['nx','ny','nz','lnz','_startx1','_startx2','_startx3','_dx1','_dx2','_dx3','gam','a','Rin','Rout','nzgdump','ti','tj','tk','x1','x2','x3','r','h','ph','gn3','gv3','gdet','dxdxp','rf','hf','phf','tif','tjf','tkf']
+
+# what grid3d() keeps in the gdump cache.  Columns 9-72 (conn) and 106-109 (ck) are never used so aren't cached.
+gdumpcachenames=['ti','tj','tk','x1','x2','x3','r','h','ph','gn3','gv3','gdet','dxdxp','rf','hf','phf','tif','tjf','tkf']
+
+def grid3d_cachedir(dumpname,use2d=False):
+    if use2d:
+        return("dumps/" + dumpname + ".cache2d")
+    else:
+        return("dumps/" + dumpname + ".cache3d")
+
+def grid3d_savecache(dumpname=None,use2d=False):
+    """
+    Save grid3d() globals (already loaded by grid3d_load() and gridcellverts()) as one .npy per block,
+    so next grid3d() can memory-map just the blocks it needs instead of reading all 126 columns of gdump.
+    Other jobs (e.g. makemovie.sh's) may be reading or writing the same cache, so each file is written under a per-process
+    name then renamed into place: readers never see a partial file, and ones that have a block mapped keep the old one.
+    """
+    cachedir=grid3d_cachedir(dumpname,use2d=use2d)
+    tmpname=None
+    try:
+        if not os.path.isdir(cachedir):
+            try:
+                os.makedirs(cachedir)
+            except OSError:
+                # another job just made it
+                if not os.path.isdir(cachedir):
+                    raise
+        st=os.stat("dumps/" + dumpname)
+        # save source file info last, so partially written cache is never used
+        blocks=[(name,globals()[name]) for name in gdumpcachenames]+[("source",np.array([st.st_size,st.st_mtime,lnz],dtype=np.float64))]
+        for name,value in blocks:
+            tmpname=os.path.join(cachedir,"%s.%d.tmp.npy" % (name,os.getpid()))
+            np.save(tmpname,value)
+            os.rename(tmpname,os.path.join(cachedir,name + ".npy"))
+        tmpname=None
+        print(( "Saved grid cache %s" % (cachedir) )) ; sys.stdout.flush()
+    except (IOError,OSError):
+        print(( "Could not save grid cache %s" % (cachedir) )) ; sys.stdout.flush()
+        if tmpname is not None and os.path.isfile(tmpname):
+            os.remove(tmpname)
+
+def grid3d_loadcache(dumpname=None,use2d=False,loadsimple=False):
+    """
+    Load grid from cache made by grid3d_savecache().  Returns False if there is no cache or gdump changed since it was made.
+    Blocks are memory-mapped copy-on-write, so only pages actually used are read and changes never go back to the cache.
+    """
+    global ti,tj,tk,x1,x2,x3,r,h,ph,gn3,gv3,dxdxp,gdet
+    global tif,tjf,tkf,rf,hf,phf
+    cachedir=grid3d_cachedir(dumpname,use2d=use2d)
+    sourcename=os.path.join(cachedir,"source.npy")
+    if not os.path.isfile(sourcename):
+        return(False)
+    st=os.stat("dumps/" + dumpname)
+    source=np.load(sourcename)
+    if source[0]!=st.st_size or source[1]!=st.st_mtime:
+        print(( "Grid cache %s is older than %s, so not using it" % (cachedir,dumpname) )) ; sys.stdout.flush()
+        return(False)
+    #
+    print(( "Reading grid from " + cachedir + " ..." )) ; sys.stdout.flush()
+    gin = open( "dumps/" + dumpname, "rb" )
+    header = gin.readline().split()
+    gin.close()
+    grid3d_header(header,use2d=use2d)
+    #
+    if loadsimple:
+        names=['ti','tj','tk','x1','x2','x3','r','h','ph','gv3']
+    else:
+        names=gdumpcachenames
+    for name in names:
+        # plain ndarray view of the map, so results of operations are normal arrays
+        globals()[name]=np.asarray(np.load(os.path.join(cachedir,name + ".npy"),mmap_mode='c'))
+    print( "Done reading grid cache" ) ; sys.stdout.flush()
+    return(True)
+
 def gridcellverts():
     ##################################
     #CELL VERTICES:
@@ -9555,20 +10561,73 @@ def compute_delta():
         delta[i,i] = 1
     return(delta)
 
-def odot(a,b):
+def odot(a,b,out=None):
     """ Outer product of two vectors a^mu b_nu"""
     #the shape of the product is (4,4,nx,ny,max(a.nz,b.nz))
-    outer_product = np.zeros(np.concatenate((np.array((4,4)),amax(a[0].shape,b[0].shape))),dtype=np.float32,order='F')
-    for mu in np.arange(4):
-        for nu in np.arange(4):
-            outer_product[mu,nu] = a[mu]*b[nu]
-    return(outer_product)
-
-def mdot(a,b):
+    # C order: writing into Fortran-ordered (4,4,...) is strided and several times slower
+    if out is None:
+        out = np.empty(np.concatenate((np.array((4,4)),amax(a[0].shape,b[0].shape))),dtype=np.float32)
+    np.multiply(a[:,None],b[None,:],out=out,casting='same_kind')
+    return(out)
+
+# number of cells per chunk in mdotmatvec() (so temporaries stay in cache)
+mdotchunkcells=32768
+
+def mdotchunk(x,i0,i1,axis):
+    # [i0:i1] along first spatial axis, unless broadcasting along it
+    if x.shape[axis]==1:
+        return(x)
+    return(x[(slice(None),)*axis+(slice(i0,i1),)])
+
+def mdotmatvec(a,b,out=None,dtype=None):
+    """
+    c[m] = \sum_n a[m,n]*b[n] for tensor a[m,n,i,j,k] and vector b[n,i,j,k]
+    Spatial shapes broadcast (e.g. axisymmetric a[m,n,i,j,0:1] with lnz=1).
+    Done in chunks of first spatial index with multiply/add into out= buffers, so no full 3D temporaries.
+    """
+    shape=np.broadcast_shapes(a.shape[2:],b.shape[1:])
+    if dtype is None:
+        dtype=b.dtype
+    if out is None:
+        out=np.empty((a.shape[0],)+shape,dtype=dtype)
+    chunk=max(1,mdotchunkcells//max(1,int(np.prod(shape[1:]))))
+    tmp=np.empty((chunk,)+shape[1:],dtype=out.dtype)
+    for i0 in range(0,shape[0],chunk):
+        i1=min(i0+chunk,shape[0])
+        achunk=mdotchunk(a,i0,i1,2)
+        bchunk=mdotchunk(b,i0,i1,1)
+        tmpchunk=tmp[0:i1-i0]
+        for m in range(a.shape[0]):
+            c=mdotchunk(out[m],i0,i1,0)
+            np.multiply(achunk[m,0],bchunk[0],out=c,casting='same_kind')
+            for n in range(1,a.shape[1]):
+                np.multiply(achunk[m,n],bchunk[n],out=tmpchunk,casting='same_kind')
+                np.add(c,tmpchunk,out=c,casting='same_kind')
+    return(out)
+
+def mdot(a,b,out=None):
     """
     Computes a contraction of two tensors/vectors.  Assumes
     the following structure: tensor[m,n,i,j,k] OR vector[m,i,j,k], 
     where i,j,k are spatial indices and m,n are variable indices. 
+    Spatial shapes broadcast (e.g. metric with lnz=1).  Result goes into out if given.
+    """
+    if a.ndim == 4 and b.ndim == 4:
+          c = np.einsum('m...,m...->...',a,b,out=out,casting='same_kind')
+    elif a.ndim == 5 and b.ndim == 4:
+          c = mdotmatvec(a,b,out=out,dtype=b.dtype)
+    elif a.ndim == 4 and b.ndim == 5:
+          # \sum_m a[m] b[m,n] = \sum_m (b^T)[n,m] a[m]
+          c = mdotmatvec(np.swapaxes(b,0,1),a,out=out,dtype=a.dtype)
+    elif a.ndim == 5 and b.ndim == 5:
+          c = np.einsum('mk...,kn...->mn...',a,b,out=out,dtype=a.dtype,casting='same_kind')
+    else:
+           raise Exception('mdot', 'wrong dimensions')
+    return c
+
+def mdotloop(a,b):
+    """
+    Original loop version of mdot(), kept for mdotbenchmark()
     """
     if a.ndim == 4 and b.ndim == 4:
           c = (a*b).sum(0)
@@ -9589,6 +10648,40 @@ def mdot(a,b):
            raise Exception('mdot', 'wrong dimensions')
     return c
 
+def mdotbenchmark(nx=288,ny=128,nz=128,lnz=1,numtries=3):
+    """
+    Time mdot() against mdotloop() for what cvel() does: g_mn u^n, u^m u_m, and
+    mdot() into preallocated out= buffer.  lnz=1 is axisymmetric metric (broadcast in \phi), lnz=nz full 3D metric.
+    """
+    import time
+    g=np.random.rand(4,4,nx,ny,lnz).astype('float32')
+    g=g+np.swapaxes(g,0,1)
+    u=np.random.rand(4,nx,ny,nz).astype('float32')
+    ud=np.empty_like(u)
+    tests=[('g_mn u^n',lambda: mdotloop(g,u),lambda: mdot(g,u)),
+           ('u^m g_mn',lambda: mdotloop(u,g),lambda: mdot(u,g)),
+           ('u^m u_m',lambda: mdotloop(u,u),lambda: mdot(u,u)),
+           ('g_mn u^n out=',lambda: mdotloop(g,u),lambda: mdot(g,u,out=ud)),
+           ('u^m u_n',lambda: odotloop(u,u),lambda: odot(u,u))]
+    print(("mdotbenchmark: nx=%d ny=%d nz=%d lnz=%d" % (nx,ny,nz,lnz))) ; sys.stdout.flush()
+    for (name,funcold,funcnew) in tests:
+        timeold=[]
+        timenew=[]
+        for tries in np.arange(0,numtries):
+            start=time.time() ; resultold=funcold() ; timeold.append(time.time()-start)
+            start=time.time() ; resultnew=funcnew() ; timenew.append(time.time()-start)
+        maxdiff=np.max(np.fabs(resultold-resultnew))/np.max(np.fabs(resultold))
+        print(("%15s: loop %8.4fs  new %8.4fs  speedup %5.2f  maxreldiff=%g" % (name,min(timeold),min(timenew),min(timeold)/min(timenew),maxdiff))) ; sys.stdout.flush()
+        del resultold,resultnew
+
+def odotloop(a,b):
+    """ Original loop version of odot(), kept for mdotbenchmark()"""
+    outer_product = np.zeros(np.concatenate((np.array((4,4)),amax(a[0].shape,b[0].shape))),dtype=np.float32,order='F')
+    for mu in np.arange(4):
+        for nu in np.arange(4):
+            outer_product[mu,nu] = a[mu]*b[nu]
+    return(outer_product)
+
 def fieldcalc(gdetB1=None):
     """
     Computes the field vector potential
@@ -9664,28 +10757,28 @@ def horfluxcalc(ivalue=None,jvalue=None,takeabs=1,takecumsum=0,takeextreme=0,min
     """
     global gdetB, _dx2, _dx3
     #1D function of theta only:
-    if takeabs==1:
-        tosum=np.abs(gdetB[1]*(bsq/rho>=minbsqorho))
-    else:
-        tosum=gdetB[1]*(bsq/rho>=minbsqorho)
-    #
-    if inflowonly==None:
-        tosum=tosum
-    else:
-        tosum=tosum*(uu[1]<0)
-    #
-    if outflowonly==None:
-        tosum=tosum
-    else:
-        tosum=tosum*(uu[1]>0)
+    # conditions cached per dump by condmask()
+    conds=[]
+    if minbsqorho is not None:
+        conds.append(('bsqorho','>=',minbsqorho))
+    if inflowonly is not None:
+        conds.append(('uu1','<',0))
+    if outflowonly is not None:
+        conds.append(('uu1','>',0))
+    if uphalf is not None:
+        conds.append(('h','<=',np.pi*0.5))
+    insideall=condmask(conds)
     #
-    if uphalf==None:
-        tosum=tosum
+    if takeabs==1:
+        tosum=np.abs(gdetB[1])
     else:
-        tosum=tosum*(h<=np.pi*0.5)
+        tosum=gdetB[1]
+    if insideall is not None:
+        tosum=tosum*insideall
     #
     #
-    tosum=tosum*(whichcondition==True)
+    if whichcondition is not True:
+        tosum=tosum*(whichcondition==True)
     #
     dfabs = (tosum).sum(2)*_dx2*_dx3
     #
@@ -9833,8 +10926,7 @@ def mfjhorvstime(ihor):
     """
     #flist = np.sort(glob.glob( os.path.join("dumps/", "fieldline*.bin") ) )
     #flist.sort()
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     #
     ts=np.empty(len(flist),dtype=np.float32)
     fs=np.empty(len(flist),dtype=np.float32)
@@ -9863,22 +10955,50 @@ def mfjhorvstime(ihor):
     print( "Done mfjhorvstime!" )
     return((ts,fs,md,jem,jtot))
 
-def mergeqtyvstime(n):
+def mergeqtyvstime(n,which=None):
     #
-    if OLDQTYMEMMEM==1:
+    if qtystoreexists(qtystorename(0,n,which)):
+        mergeqtystore(n,which=which)
+    elif which is not None:
+        raise Exception('mergeqtyvstime','no stores to merge',qtystorename(0,n,which))
+    elif OLDQTYMEMMEM==1:
         mergeqtyvstime_old(n)
     else:
         mergeqtyvstime_new(n)
     #
 
 
+# merges below stream: inputs and output are memory-mapped and copied one quantity at a time,
+# so memory use is one quantity's time series rather than all of qtymem (tens of GB for long runs).
+def mergecoverage(partfindexs,flist):
+    """
+    Check partfindexs (list of each part's findexs) cover each dump in flist exactly once.
+    Raises if any dump is covered more than once (or findex out of range), and reports and returns findexs of dumps not covered.
+    """
+    numtimeslices=len(flist)
+    coverage=np.zeros(numtimeslices,dtype=int)
+    for i, findexs in enumerate(partfindexs):
+        if len(findexs)>0 and (np.min(findexs)<0 or np.max(findexs)>=numtimeslices):
+            raise Exception('mergecoverage','part has findex outside of dump list',i,np.min(findexs),np.max(findexs),numtimeslices)
+        np.add.at(coverage,findexs,1)
+    duplicates=np.where(coverage>1)[0]
+    if len(duplicates)>0:
+        raise Exception('mergecoverage','dumps in more than one part',[flist[findex] for findex in duplicates])
+    missing=np.where(coverage==0)[0]
+    if len(missing)>0:
+        print(("Merge missing %d of %d dumps (left as zeros): %s" % (len(missing),numtimeslices," ".join([flist[findex] for findex in missing])))) ; sys.stdout.flush()
+    return(missing)
+
+def mergeopenmemmap(fname,shape):
+    """ Preallocated float32 .npy memory map written as temporary file; rename to fname once filled """
+    tmpname="%s.%d.tmp.npy" % (fname[:-4],os.getpid())
+    return(tmpname,np.lib.format.open_memmap(tmpname,mode='w+',dtype=np.float32,shape=shape))
+
 # merge qty*.npy files
 # assume each i-th file only has part of data
 def mergeqtyvstime_new(n):
     #
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    #flist.sort()
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     #
     # get supposed number of quantities
     nqty=getnqty(dobob=0)
@@ -9888,61 +11008,428 @@ def mergeqtyvstime_new(n):
     # total number of time slices over all files as should be once merged
     numtimeslices=len(flist)
     #
+    qtymemtemps=[]
+    partfindexs=[]
     for i in np.arange(n):
-        #load each file
+        #open each file
         fname = "qty2_%d_%d.npy" % (i, n)
-        print(( "Loading " + fname + " ..." )) ; sys.stdout.flush()
-        qtymemtemp = np.load( fname )
-        findexs=qtymemtemp[0,:,0] # list of findex's where realy should be stored when in findex order
-        #per-element sum relevant parts of each file
+        print(( "Opening " + fname + " ..." )) ; sys.stdout.flush()
+        qtymemtemp = np.load( fname , mmap_mode='r' )
         #
         nqtyfull=qtymemtemp.shape[0]
         if nqtyfull!=nqty and nqtyfull!=nqtywithbob:
-            # has to be one or the other, else exit
-            print(("in mergeqtyvstime_new: nqtyfull=%d and nqty=%d nqtywithbob=%d" % (nqtyfull,nqty,nqtywithbob))) ; sys.stdout.flush()
-            exit
-        #
-        #
-        numtimesliceslocal=qtymemtemp.shape[1] # can change each file
-        nxfull=qtymemtemp.shape[2]
-        if i == 0:
-            qtymem=np.zeros((nqtyfull,numtimeslices,nxfull),dtype=np.float32)
-            #qtymem = np.zeros_like(qtymemtemp)
-        #
-        if nqtyfull!=qtymem.shape[0]:
-            print(("in mergeqtyvstime_new: nqtyfull=%d qtymem.shape[0]=%d" % (nqtyfull,qtymem.shape[0]))) ; sys.stdout.flush()
-            print("Can't change number of quantities in each qty file to be merged") ; sys.stdout.flush()
-            exit
-        #
-        #1st index: which qty
-        #2nd index: which file number
-        for qindex in np.arange(0,numtimesliceslocal):
-            # assumes file only had portion of data # GODMARK: Why does Sasha have += ?
-            qtymem[:,findexs[qindex]] += qtymemtemp[:,qindex]
-        #
+            # has to be one or the other
+            raise Exception('mergeqtyvstime_new','number of quantities not with or without Bob',fname,nqtyfull,nqty,nqtywithbob)
+        if i>0 and qtymemtemp.shape[0::2]!=qtymemtemps[0].shape[0::2]:
+            raise Exception('mergeqtyvstime_new','Can\'t change number of quantities or nx in each qty file to be merged',fname,qtymemtemp.shape,qtymemtemps[0].shape)
+        qtymemtemps.append(qtymemtemp)
+        partfindexs.append(np.array(qtymemtemp[0,:,0],dtype=int)) # list of findex's where really should be stored when in findex order
+    #
+    mergecoverage(partfindexs,flist)
+    #
     fname = "qty2.npy"
-    print(( "Saving into " + fname + " ..." )) ; sys.stdout.flush()
-    np.save( fname , qtymem )
+    print(( "Merging into " + fname + " ..." )) ; sys.stdout.flush()
+    (tmpname,qtymem)=mergeopenmemmap(fname,(qtymemtemps[0].shape[0],numtimeslices,qtymemtemps[0].shape[2]))
+    #1st index: which qty
+    #2nd index: which file number
+    for qtyindex in np.arange(qtymem.shape[0]):
+        for i in np.arange(n):
+            qtymem[qtyindex,partfindexs[i]] = qtymemtemps[i][qtyindex]
+    qtymem.flush()
+    qtymem=None
+    os.rename(tmpname,fname)
     print( "Done mergeqtyvstime!" ) ; sys.stdout.flush()
 
 
 # OLD: merge qty*.npy files
 # assumes wrote full-sized npy file even if only processed part of data
 def mergeqtyvstime_old(n):
+    flist = getfieldlinelist()
+    qtymemtemps=[]
     for i in np.arange(n):
-        #load each file
+        #open each file
         fname = "qty2_%d_%d.npy" % (i, n)
-        print(( "Loading " + fname + " ..." )) ; sys.stdout.flush()
-        qtymemtemp = np.load( fname )
-        #per-element sum relevant parts of each file
-        if i == 0:
-            qtymem = np.zeros_like(qtymemtemp)
-        #1st index: whichqty
-        #2nd index: whichdumpnumber
-        qtymem[:,i::n] += qtymemtemp[:,i::n]
+        print(( "Opening " + fname + " ..." )) ; sys.stdout.flush()
+        qtymemtemp = np.load( fname , mmap_mode='r' )
+        if i>0 and qtymemtemp.shape!=qtymemtemps[0].shape:
+            raise Exception('mergeqtyvstime_old','qty files to be merged have different shapes',fname,qtymemtemp.shape,qtymemtemps[0].shape)
+        qtymemtemps.append(qtymemtemp)
+    # i-th file has every n-th dump starting at i, up to as many dumps as there were then
+    numtimeslices=qtymemtemps[0].shape[1]
+    mergecoverage([np.arange(i,numtimeslices,n) for i in np.arange(n)],flist[0:numtimeslices])
+    if numtimeslices<len(flist):
+        print(("Merge has %d of %d dumps, rest not in qty files" % (numtimeslices,len(flist)))) ; sys.stdout.flush()
+    #
     fname = "qty2.npy"
-    print(( "Saving into " + fname + " ..." )) ; sys.stdout.flush()
-    np.save( fname , qtymem )
+    print(( "Merging into " + fname + " ..." )) ; sys.stdout.flush()
+    (tmpname,qtymem)=mergeopenmemmap(fname,qtymemtemps[0].shape)
+    #1st index: whichqty
+    #2nd index: whichdumpnumber
+    for qtyindex in np.arange(qtymem.shape[0]):
+        for i in np.arange(n):
+            qtymem[qtyindex,i::n] = qtymemtemps[i][qtyindex,i::n]
+    qtymem.flush()
+    qtymem=None
+    os.rename(tmpname,fname)
+    print( "Done mergeqtyvstime!" ) ; sys.stdout.flush()
+
+
+##########################
+# Named columnar store for getqtyvstime() results (replaces positional qty2.npy)
+# Directory qtystore/ (qtystore_<whichi>_<whichn>/ for partial runs) has one <name>.npy per quantity, each shape (ntimes,nx) float32,
+# (qtystore_<which>/ and qtystore_<which>_<whichi>_<whichn>/ when only some diagnostics are computed, see qtydiagnostics)
+# and a qtystore.npz manifest with schema version, nx, ntimes, names, and validfrom (first time slice each column was computed for).
+# Names come from getqtymem() itself (see getqtynames()), so there's no separate list to keep in sync.
+# Readers open only the quantities they use (memory-mapped), and adding a quantity to getqtymem() just adds a column:
+# existing columns stay valid and the new one is computed for time slices processed from then on.
+# The manifest also has source<key> arrays (qtystoresourcekeys) giving identity of the dump behind each time slice,
+# so a later getqtyvstime() only computes new or changed dumps (see qtystorematch()).
+qtystoreversion=1
+qtystoremanifestname="qtystore.npz"
+qtystoremmapmax=512 # beyond this many columns open in one store, read into memory instead of memory-map (each map holds a file descriptor)
+qtynamesmem={}
+qtystoresourcekeys=['fname','size','mtime','t'] # same as in fieldlinecatalog()
+
+def qtystorename(whichi=-1,whichn=0,which=None):
+    name="qtystore"
+    if which is not None:
+        if isinstance(which,str):
+            which=[which]
+        name=name + "_" + "+".join(sorted(set(which)))
+    if whichi>=0 and whichn>0:
+        return("%s_%d_%d" % (name, whichi, whichn))
+    return(name)
+
+def qtystoreexists(dirname):
+    return(os.path.isfile(os.path.join(dirname,qtystoremanifestname)))
+
+class QtyNameProbe(object):
+    # stands in for qtymem in getqtymem() and hands out a distinct row object per index
+    def __init__(self):
+        self.rows={}
+    def __getitem__(self,key):
+        if isinstance(key,tuple):
+            key=key[0]
+        row=np.zeros(1,dtype=np.float32)
+        self.rows[id(row)]=(row,int(key))
+        return(row)
+
+def getqtynames(dobob=0):
+    """ Names of per-dump quantities in qtymem order (as set by getqtymem()), plus bob%03d for Bob's quantities if dobob==1 """
+    if OLDQTYMEMMEM not in qtynamesmem:
+        # run getqtymem() on a probe, see which global each row went to, then put back those globals
+        probe=QtyNameProbe()
+        saved=dict(globals())
+        num=getqtymem(probe)
+        found={}
+        for name,value in list(globals().items()):
+            if id(value) in probe.rows and probe.rows[id(value)][0] is value:
+                found[probe.rows[id(value)][1]]=name
+        for name in found.values():
+            if name in saved:
+                globals()[name]=saved[name]
+            else:
+                del globals()[name]
+        if sorted(found.keys())!=list(range(num)):
+            raise Exception('getqtynames','getqtymem() rows not each bound to a distinct global',num,len(found))
+        qtynamesmem[OLDQTYMEMMEM]=[found[ii] for ii in range(num)]
+    names=list(qtynamesmem[OLDQTYMEMMEM])
+    if dobob==1:
+        names=names+["bob%03d" % (ii) for ii in range(getbobnqty())]
+    return(names)
+
+class QtyStore(object):
+    """
+    getqtyvstime() results as named columns (see qtystore comments above).
+    QtyStore(dirname) opens an existing store for reading, columns memory-mapped on first use.
+    QtyStore(dirname,names=...,ntimes=...) starts a new in-memory store to fill and save(), holding just stored=... of names if given.
+    store['mdtot'] gives one quantity, while store[qindex,...] indexes like old positional qtymem (getqtynames() order),
+    so getqtymem(store) and older code work unchanged.  Quantities not in the store read as zeros.
+    """
+    def __init__(self,dirname,names=None,ntimes=None,nxstore=None,stored=None):
+        self.dirname=dirname
+        self.columns={}
+        self.nummapped=0
+        if ntimes is None:
+            data=np.load(os.path.join(dirname,qtystoremanifestname))
+            version=int(data['version'])
+            if version>qtystoreversion:
+                raise Exception('QtyStore','store is newer version than this code',dirname,version,qtystoreversion)
+            self.validfrom=dict(zip([str(name) for name in data['names']],[int(v) for v in data['validfrom']]))
+            self.ntimes=int(data['ntimes'])
+            self.nx=int(data['nx'])
+            self.sources=None
+            if 'source' + qtystoresourcekeys[0] in data.files:
+                self.sources=dict([(key,data['source' + key]) for key in qtystoresourcekeys])
+            data.close()
+            self.writable=False
+            if names is None:
+                names=getqtynames(dobob=int("bob000" in self.validfrom))
+        else:
+            self.ntimes=ntimes
+            self.nx=nx if nxstore is None else nxstore
+            if stored is None:
+                stored=names
+            self.validfrom=dict([(name,0) for name in stored])
+            self.sources=None
+            self.writable=True
+        self.names=list(names)
+        self.shape=(len(self.names),self.ntimes,self.nx)
+    #
+    def __len__(self):
+        return(len(self.names))
+    #
+    def has(self,name):
+        return(name in self.validfrom)
+    #
+    def column(self,name):
+        if name not in self.columns:
+            if self.writable:
+                self.columns[name]=np.zeros((self.ntimes,self.nx),dtype=np.float32)
+            elif name in self.validfrom:
+                mmap_mode=None
+                if self.nummapped<qtystoremmapmax:
+                    mmap_mode='r'
+                    self.nummapped=self.nummapped+1
+                self.columns[name]=np.load(os.path.join(self.dirname,name + ".npy"),mmap_mode=mmap_mode)
+            else:
+                print(("QtyStore: %s not in %s, using zeros" % (name,self.dirname))) ; sys.stdout.flush()
+                self.columns[name]=np.zeros((self.ntimes,self.nx),dtype=np.float32)
+        return(self.columns[name])
+    #
+    def release(self,name):
+        """ Drop column (e.g. once copied elsewhere), closing its memory map """
+        col=self.columns.pop(name,None)
+        if isinstance(col,np.memmap):
+            self.nummapped=self.nummapped-1
+    #
+    def _split(self,key):
+        rest=()
+        if isinstance(key,tuple):
+            key,rest=key[0],key[1:]
+        if isinstance(key,str):
+            return(self.column(key),rest)
+        if isinstance(key,(int,np.integer)):
+            return(self.column(self.names[key]),rest)
+        return(None,rest)
+    #
+    def __getitem__(self,key):
+        col,rest=self._split(key)
+        if col is None:
+            # e.g. qtymem[:,tcondition,:]: have to form full positional array
+            return(np.array([self.column(name) for name in self.names])[key])
+        if len(rest)==0:
+            return(col)
+        return(col[rest])
+    #
+    def __setitem__(self,key,value):
+        col,rest=self._split(key)
+        if col is None:
+            raise Exception('QtyStore','can only set one quantity at a time',key)
+        col[rest]=value
+    #
+    def save(self):
+        """ Write every column the store holds, then the manifest (so a manifest never lists a column not yet written) """
+        if not os.path.isdir(self.dirname):
+            os.makedirs(self.dirname)
+        for name in self.validfrom:
+            # write then rename, so readers never see partial file
+            tmpname=os.path.join(self.dirname,"%s.%d.tmp.npy" % (name,os.getpid()))
+            np.save(tmpname,np.asarray(self.column(name),dtype=np.float32))
+            os.rename(tmpname,os.path.join(self.dirname,name + ".npy"))
+        self.savemanifest()
+        print(("Saved %d quantities x %d times into %s" % (len(self.validfrom),self.ntimes,self.dirname))) ; sys.stdout.flush()
+    #
+    def savemanifest(self):
+        """ Write just the manifest (e.g. to add sources to an opened store), listing only quantities the store has """
+        storednames=list(self.validfrom.keys())
+        tmpname=os.path.join(self.dirname,"%s.%d.tmp.npz" % (qtystoremanifestname[:-4],os.getpid()))
+        sourcearrays={}
+        if self.sources is not None:
+            for key in qtystoresourcekeys:
+                sourcearrays['source' + key]=self.sources[key]
+        np.savez(tmpname,version=qtystoreversion,nx=self.nx,ntimes=self.ntimes,names=np.array(storednames),validfrom=np.array([self.validfrom[name] for name in storednames]),**sourcearrays)
+        os.rename(tmpname,os.path.join(self.dirname,qtystoremanifestname))
+
+def qtystorefromarray(dirname,qtymem2,dobob=None):
+    """
+    Convert positional qtymem (e.g. np.load("qty2.npy",mmap_mode='r')) into a store, one column at a time.
+    getqtymem() only ever appends quantities, so an older file's rows are the first of getqtynames() (then Bob's if dobob==1),
+    and quantities added since aren't stored (so read as zeros and get recomputed, see getqtyvstime()).
+    dobob=None: tell from number of rows (Bob's add more rows than any older getqtymem() is short)
+    """
+    nonbobnames=getqtynames(dobob=0)
+    numbob=getbobnqty()
+    if dobob is None:
+        dobob=int(qtymem2.shape[0]>len(nonbobnames))
+    numnonbob=qtymem2.shape[0]-numbob*(dobob==1)
+    if numnonbob<=0 or numnonbob>len(nonbobnames):
+        raise Exception('qtystorefromarray','number of quantities does not match getqtymem()',qtymem2.shape[0],len(nonbobnames),dobob)
+    stored=nonbobnames[0:numnonbob]
+    if dobob==1:
+        stored=stored+["bob%03d" % (ii) for ii in range(numbob)]
+    if numnonbob<len(nonbobnames):
+        print(("%d quantities added since %d-row array was made, not stored: %s" % (len(nonbobnames)-numnonbob,qtymem2.shape[0]," ".join(nonbobnames[numnonbob:])))) ; sys.stdout.flush()
+    store=QtyStore(dirname,names=getqtynames(dobob=dobob),ntimes=qtymem2.shape[1],nxstore=qtymem2.shape[2],stored=stored)
+    for ii, name in enumerate(stored):
+        store.columns[name]=qtymem2[ii]
+    store.save()
+    return(QtyStore(dirname))
+
+def getqtystore(names,dirname="qtystore"):
+    """ Open store and set only the named quantities as globals (as getqtymem() would for all of them).  Returns the store. """
+    store=QtyStore(dirname)
+    for name in names:
+        if name in ('findexs','ts'):
+            globals()[name]=store[name][:,0]
+        else:
+            globals()[name]=store[name]
+    return(store)
+
+def qtystoresources(flist):
+    """ Identity (keys qtystoresourcekeys) of each dump in flist, as dictionary of arrays, from fieldlinecatalog() """
+    cat=fieldlinecatalog(dosave=False)
+    catindex={}
+    for ii, fname in enumerate(cat['fname']):
+        catindex[str(fname)]=ii
+    rows=np.array([catindex[os.path.basename(fname)] for fname in flist],dtype=int)
+    return(dict([(key,cat[key][rows]) for key in qtystoresourcekeys]))
+
+def fieldlinegaps(sources):
+    """ Report missing dump numbers and dumps whose time goes backwards (e.g. restart over older dumps).  Returns number of problems. """
+    numproblems=0
+    fnames=[str(fname) for fname in sources['fname']]
+    nums=[int(re.findall(r'\d+',fname)[-1]) for fname in fnames]
+    for jj in np.arange(1,len(fnames)):
+        if nums[jj]-nums[jj-1]>1:
+            print(("Gap in dumps: %d missing between %s and %s" % (nums[jj]-nums[jj-1]-1,fnames[jj-1],fnames[jj]))) ; sys.stdout.flush()
+            numproblems=numproblems+1
+        if sources['t'][jj]<=sources['t'][jj-1]:
+            print(("Dumps out of time order: %s t=%g after %s t=%g" % (fnames[jj],sources['t'][jj],fnames[jj-1],sources['t'][jj-1]))) ; sys.stdout.flush()
+            numproblems=numproblems+1
+    return(numproblems)
+
+def qtystorematch(store,sources):
+    """
+    For each dump in sources (from qtystoresources()), the row in store with its results if that dump hasn't changed (same name, size, mtime, and header time), else -1.
+    Stores without sources are matched by position, checking their stored ts.
+    """
+    numrows=len(sources['fname'])
+    oldrow=-np.ones(numrows,dtype=int)
+    if store.sources is not None:
+        storeindex={}
+        for ii, fname in enumerate(store.sources['fname']):
+            storeindex[str(fname)]=ii
+        numchanged=0
+        for jj, fname in enumerate(sources['fname']):
+            ii=storeindex.pop(str(fname),-1)
+            if ii<0:
+                continue
+            if all([store.sources[key][ii]==sources[key][jj] for key in qtystoresourcekeys[1:]]):
+                oldrow[jj]=ii
+            else:
+                print(("Dump changed since stored, recomputing: %s" % (fname))) ; sys.stdout.flush()
+                numchanged=numchanged+1
+        if len(storeindex)>0:
+            print(("Stored dumps no longer present, dropping: %s" % (" ".join(sorted(storeindex.keys()))))) ; sys.stdout.flush()
+        nummoved=np.sum((oldrow>=0)*(oldrow!=np.arange(numrows)))
+        if nummoved>0:
+            print(("%d stored time slices moved to new positions (dumps inserted or removed before them)" % (nummoved))) ; sys.stdout.flush()
+    else:
+        # ts as stored (float32)
+        num=min(store.ntimes,numrows)
+        same=(np.asarray(store['ts'][0:num,0])==np.float32(sources['t'][0:num]))
+        oldrow[0:num][same]=np.arange(num)[same]
+        if np.sum(~same)>0:
+            print(("%d stored time slices have different times than the dumps now at those positions, recomputing them" % (np.sum(~same)))) ; sys.stdout.flush()
+    return(oldrow)
+
+def qtystorereuse(qtymem,qtymem2,oldrow,rowfindexs):
+    """
+    Copy into qtymem the rows of qtymem2 that oldrow (from qtystorematch()) says are still good, and set validfrom for what's left.
+    rowfindexs: dump (findex) of each row of qtymem, put into findexs of reused rows since dumps may have moved.
+    """
+    reused=np.where(oldrow>=0)[0]
+    for name in list(qtymem.validfrom.keys()):
+        if qtymem2.has(name):
+            qtymem.column(name)[reused] = qtymem2[name][oldrow[reused]]
+            # reused slices from before this quantity existed aren't valid
+            stale=reused[oldrow[reused]<qtymem2.validfrom[name]]
+        else:
+            stale=reused
+        if len(stale)>0:
+            qtymem.validfrom[name]=int(stale.max())+1
+        else:
+            qtymem.validfrom[name]=0
+    if qtymem.has('findexs'):
+        # loop in getqtyvstime() skips reused dumps, so wouldn't set these
+        qtymem['findexs'][reused,0]=rowfindexs[reused]
+    return(reused)
+
+# merge qtystore_i_n stores, each with only some time slices (at their findexs) into full qtystore
+# streams like mergeqtyvstime_new(): each column memory-mapped from the parts into a memory-mapped output column
+def mergeqtystore(n,which=None):
+    #
+    flist = getfieldlinelist()
+    numtimeslices=len(flist)
+    #
+    parts=[]
+    partfindexs=[]
+    for i in np.arange(n):
+        dirname=qtystorename(i,n,which)
+        print(( "Opening " + dirname + " ..." )) ; sys.stdout.flush()
+        part=QtyStore(dirname)
+        if i>0 and (part.names!=parts[0].names or part.nx!=parts[0].nx):
+            raise Exception('mergeqtystore','stores to be merged have different quantities or nx',dirname,qtystorename(0,n,which))
+        parts.append(part)
+        partfindexs.append(np.array(part['findexs'][:,0],dtype=int)) # where really should be stored when in findex order
+        part.release('findexs')
+    #
+    missing=mergecoverage(partfindexs,flist)
+    #
+    # quantities any part has (all of them unless parts only computed some diagnostics)
+    stored=[name for name in parts[0].names if any([part.has(name) for part in parts])]
+    qtymem=QtyStore(qtystorename(which=which),names=parts[0].names,ntimes=numtimeslices,nxstore=parts[0].nx,stored=stored)
+    if not os.path.isdir(qtymem.dirname):
+        os.makedirs(qtymem.dirname)
+    print(( "Merging into " + qtymem.dirname + " ..." )) ; sys.stdout.flush()
+    for name in stored:
+        fname=os.path.join(qtymem.dirname,name + ".npy")
+        (tmpname,column)=mergeopenmemmap(fname,(numtimeslices,qtymem.nx))
+        for i, part in enumerate(parts):
+            column[partfindexs[i]] = part[name]
+            part.release(name)
+            if part.has(name):
+                validfrom=part.validfrom[name]
+            else:
+                # zeros for all of this part's dumps
+                validfrom=part.ntimes
+            # part's validfrom is in its own time slices
+            if validfrom>0:
+                qtymem.validfrom[name]=max(qtymem.validfrom[name],int(partfindexs[i][0:validfrom].max())+1)
+        column.flush()
+        column=None
+        os.rename(tmpname,fname)
+    #
+    # part's dumps as they were when computed
+    qtymem.sources=qtystoresources(flist)
+    for i, part in enumerate(parts):
+        if part.sources is None:
+            # can't tell which dumps this part came from
+            qtymem.sources=None
+            break
+        for key in qtystoresourcekeys:
+            if key=='fname':
+                fnames=qtymem.sources[key].astype(object)
+                fnames[partfindexs[i]]=part.sources[key]
+                qtymem.sources[key]=fnames.astype(str)
+            else:
+                qtymem.sources[key][partfindexs[i]]=part.sources[key]
+    if qtymem.sources is not None:
+        # so next getqtyvstime() computes them
+        qtymem.sources['size'][missing]=-1
+    # manifest last, as in QtyStore.save()
+    qtymem.savemanifest()
     print( "Done mergeqtyvstime!" ) ; sys.stdout.flush()
 
 
@@ -9953,10 +11440,8 @@ def getnonbobnqty():
         value=1 + 6 + 14 + 4 + 22*5 + 25 + 22*3 + (13*4+13*4) + 11+15 + (14+2+48) +  (8+42) + (6) + (13*4+13*4) + (13*4+13*4)
     else:
         #value=2 + 6 + 14 + 4 + 22*5 + 25 + 22*3 + (13*4+13*4) + 11+15 + (14+2+48) +  (8+42) + (6) + (13*4+13*4) + (13*4+13*4)
-        # with urad stuff
-        value=2 + 6 + 14 + 4 + 23*5 + 26 + 23*3 + (14*4+14*4) + 11+15 + (14+2+48) +  (8+42) + (6) + (14*4+14*4) + (14*4+14*4) + 1 #added for alphamagpert (Megan)
-        value=value+4 # for edrad edradthin and ldrad ldradthin
-                               
+        # with urad stuff, alphamagpert, edrad/ldrad, shell Y_lm l-spectra, ...: just however many getqtymem() sets
+        value=len(getqtynames())
 
     #value=702 # fake temp over what's needed   GODMARK
 
@@ -11534,6 +13019,24 @@ def getqtymem(qtymem):
     global     alphamagpert
     alphamagpert=qtymem[i];i+=1 #(Megan)
     #
+    #rho and bsq true Y_lm angular power C_l on shells (see shpowervsl()): NQTY=8
+    global     rho_shellpowvsl_radhor
+    rho_shellpowvsl_radhor=qtymem[i];i+=1
+    global     rho_shellpowvsl_rad4
+    rho_shellpowvsl_rad4=qtymem[i];i+=1
+    global     rho_shellpowvsl_rad8
+    rho_shellpowvsl_rad8=qtymem[i];i+=1
+    global     rho_shellpowvsl_rad30
+    rho_shellpowvsl_rad30=qtymem[i];i+=1
+    global     bsq_shellpowvsl_radhor
+    bsq_shellpowvsl_radhor=qtymem[i];i+=1
+    global     bsq_shellpowvsl_rad4
+    bsq_shellpowvsl_rad4=qtymem[i];i+=1
+    global     bsq_shellpowvsl_rad8
+    bsq_shellpowvsl_rad8=qtymem[i];i+=1
+    global     bsq_shellpowvsl_rad30
+    bsq_shellpowvsl_rad30=qtymem[i];i+=1
+    #
     #
     ###################################
     return(i)
@@ -11556,98 +13059,645 @@ def getnqty(dobob=0):
 
 
 
-# MEMMARK: currently about 700 numtimeslices,nx quantities
-# so per timeslice included per core: 700*nx*4
-# (so now relatively small if use many cores, but still big for making movie.)
-# otherwise, if (e.g.) there were 35000 files (e.g. thickdisk3) then 700*128*35000=6GB by itself!
-def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altread=False):
+##########################
+# getqtyvstime(...,nproc=N): in-process parallel version of running N copies with whichi/whichn and then mergeqtyvstime().
+# Parent does all of getqtyvstime() up to its loop over dumps (incl. reusing previous results), then forks N workers.
+# Workers (copies of parent, so with grid and averages already loaded) take dumps one at a time off a shared queue,
+# so no worker sits idle while others still have dumps, however the dump sizes/costs vary,
+# and run getqtyvstime()'s loop body writing into one memory map of the positional qtymem.  Parent never merges anything.
+# Dumps whose computation raises (or whose worker dies) are retried up to qtyvstimemaxretries times, then given up on.
+# Each worker's output goes to <store>_worker<id>.log, while parent prints progress.
+##########################
+# Diagnostics getqtyvstime() computes for each dump, so a run can do just some of them, e.g. getqtyvstime(ihor,which=['fluxes'])
+# name: {'needs': [...], 'outputs': [...]}
+#   needs: what has to be done first for the same dump: other diagnostics (e.g. 'hor' for hoverr3d used to pick out the disk),
+#          or 'cvel' and 'Tcalcud' for what they compute (bu, ud, bsq, condmaxbsqorho, etc. already come from rfd())
+#   outputs: regular expressions for names (see getqtynames()) of quantities it fills, each (ntimes,nx) like all of qtymem
+# Entries without outputs just set up things others need, or (like 'fluxes') stand for a group of diagnostics.
+qtydiagnostics={
+    'cvel':{'needs':[],'outputs':[]}, # e.g. tauradintegrated
+    'Tcalcud':{'needs':['cvel'],'outputs':[]}, # Tud, TudEM, TudMA, ..., isunbound
+    'hor':{'needs':[],'outputs':[r'^(hoverr|thetamid)']},
+    'qmri':{'needs':[],'outputs':[r'mridisk']},
+    'betas':{'needs':[],'outputs':[r'^beta(min|avg|ratofavg|ratofmax)$']},
+    'alpha':{'needs':[],'outputs':[r'^alpha(mag|reynolds)']},
+    'primitives':{'needs':[],'outputs':[]}, # myuu*, myB*, mybu* and their averages
+    'averages':{'needs':['hor','primitives'],'outputs':[r'^rhosq(dc|dcden|eq|horpick)?s$',r'^rhosqrad(4|8|30)$',
+                                                        r'^(rhos|ugs|urads|uu0|vua?s[13]|vuasrot|Ba?s[123]|ba?s[123]|bsq)rhosq(dc|dcden|eq|horpick|rad4|rad8|rad30)?$',
+                                                        r'^(gdetint|rhos|ugs|urads|bsqs|bsqorhos|bsqougs|uu0|vua?s[13]|vuasrot|Ba?s[123]|ba?s[123]|bsq)hor$']},
+    'phipow':{'needs':['Tcalcud','primitives'],'outputs':[r'_phipow_']},
+    'perturbations':{'needs':['Tcalcud','primitives'],'outputs':[]}, # deviations from time-average for thetapow and radiuspow
+    'thetapow':{'needs':['perturbations'],'outputs':[r'_thetapow_']},
+    'radiuspow':{'needs':['perturbations'],'outputs':[r'_radiuspow_']},
+    'shellpow':{'needs':[],'outputs':[r'_shellpowvsl_']},
+    'flux':{'needs':['hor'],'outputs':[r'^(fs|feq)']},
+    'mdot':{'needs':['Tcalcud','hor'],'outputs':[r'^md']},
+    'edot':{'needs':['Tcalcud','hor'],'outputs':[r'^ed']},
+    'pjet':{'needs':['Tcalcud'],'outputs':[r'^(pj|phiabsj)']},
+    'ldot':{'needs':['Tcalcud'],'outputs':[r'^(ld|lj)']},
+    'fluxes':{'needs':['flux','mdot','edot','pjet','ldot'],'outputs':[]},
+    'bob':{'needs':['hor'],'outputs':[r'^bob\d+$']}, # only with dobob=1
+}
+
+def qtydiagnosticresolve(which=None,dobob=0):
     """
-    Returns a tuple (ts,fs,mdot,pjetem,pjettot): lists of times, horizon fluxes, and Mdot
+    Which diagnostics (see qtydiagnostics) to do for which (list of names, or None for all), including what they need.
+    Returns dictionary of each diagnostic's name: True/False.
     """
-    if ismb09model(modelname):
-        horval=0.2
-    elif issashamodel(modelname):
-        horval=0.2
-    elif isthickdiskmodel(modelname):
-        horval=0.6
-    elif isradmodel(modelname):
-        horval=0.2
-    else:
-        horval=1.0 # so know how to remove effect
-    if isradmodelC(modelname):
-        horval=0.02
+    if which is None:
+        which=[name for name in qtydiagnostics if name!='bob']
+    elif isinstance(which,str):
+        which=[which]
+    if dobob==1:
+        which=list(which)+['bob']
+    qtyneed=dict([(name,False) for name in qtydiagnostics])
+    todo=list(which)
+    while len(todo)>0:
+        name=todo.pop()
+        if name not in qtydiagnostics:
+            raise Exception('qtydiagnosticresolve','unknown diagnostic',name,sorted(qtydiagnostics.keys()))
+        if not qtyneed[name]:
+            qtyneed[name]=True
+            todo.extend(qtydiagnostics[name]['needs'])
+    return(qtyneed)
+
+def qtydiagnosticof(name):
+    """ Diagnostics whose outputs match quantity name (should be exactly one, see qtydiagnosticcheck()) """
+    return([diag for diag in qtydiagnostics if any([re.search(pattern,name) for pattern in qtydiagnostics[diag]['outputs']])])
+
+def qtydiagnosticcheck(dobob=1):
+    """ Make sure each quantity from getqtynames(), other than findexs and ts set for every dump, is filled by exactly one diagnostic """
+    for name in getqtynames(dobob=dobob):
+        if name in ('findexs','ts'):
+            continue
+        diags=qtydiagnosticof(name)
+        if len(diags)!=1:
+            raise Exception('qtydiagnosticcheck','quantity not output of exactly one diagnostic',name,diags)
+
+def qtydiagnosticnames(qtyneed,dobob=0):
+    """ Names of quantities (in getqtynames() order, with findexs and ts) filled when doing the diagnostics in qtyneed (from qtydiagnosticresolve()) """
+    qtydiagnosticcheck(dobob=dobob)
+    return([name for name in getqtynames(dobob=dobob) if name in ('findexs','ts') or qtyneed[qtydiagnosticof(name)[0]]])
+
+# per-radius diagnostics that getqtyvstime(...,radialblocks=N) does in radial blocks of N cells (see runradialblocks())
+def qtyhorcalc():
+    """
+    getqtyvstime()'s disk, disk-corona and corona-jet horcalc2d() for currently loaded dump
+    Returns (hoverr2d,thetamid2d,hoverr2dcorona,thetamid2dcorona,hoverr2djet,thetamid2djet), each (nx,nz), so can be done in radial blocks (see runradialblocks())
+    """
+    #v4asq=bsq/(rho+ug+(gam-1)*ug)
+    #mum1fake=uu[0]*(1.0+v4asq)-1.0
+    # mum1fake not good marker of where jet is for near the BH.
+    # mu>2 is also poor, since mu\propto sin\theta so mu turns small again near pole.
+    # bsq/rho>1 much better.
     #
-    if whichn != None and (whichi < 0 or whichi > whichn):
-        print(( "whichi = %d shoudl be >= 0 and < whichn = %d" % (whichi, whichn) )) ; sys.stdout.flush()
-        return( -1 )
-    if 'rho' in globals():
-        tiny=np.finfo(rho.dtype).tiny
-    else:
-        tiny = np.finfo(np.float64).tiny
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    #flist.sort()
-    sort_nicely(flist)
+    beta=((gam-1)*ug)/(1E-30 + bsq*0.5)
+    betatot=((gam-1)*ug + (4.0/3.0-1)*urad)/(1E-30 + bsq*0.5)
     #
-    nqty=getnqty(dobob=dobob)
+    # disk mass density scale height
+    #diskcondition=(betatot>2.0)
+    # was (bsq/rho<1.0)
+    #diskcondition=diskcondition*(mum1fake<1.0)
+    # just avoid floor mass
+    #cond1=(bsq/rho<30)
+    #cond2=(bsq/rho<10)
+    #condmaxbsqorho=cond1*(r<9.0)+cond2*(r>=9.0)
+    #rinterp=(r-9.0)*(1.0-0.0)/(0.0-9.0) # gives 0 for use near 9   gives 1 for use near 0
+    #rinterp[rinterp>1.0]=1.0
+    #rinterp[rinterp<0.0]=0.0
+    #condmaxbsqorho=(bsq/rho < rinterp*30.0 + (1.0-rinterp)*10.0)
+    diskcondition1=condmaxbsqorho
+    diskcondition2=condmaxbsqorho
+    # was denfactor=rho, but want uniform with corona and jet
+    hoverr2d,thetamid2d=horcalc2d(hortype=1,which1=diskcondition1,which2=diskcondition2,denfactor=rholab)
     #
-    ####################################
-    # total number of time slices over all files
-    numtimeslices=len(flist)
     #
+    # disk-corona boundary
+    coronacondition1=(betatot<1.0)
+    coronacondition1=coronacondition1*(betatot>0.5)
+    coronacondition1=coronacondition1*condmaxbsqorho
+    coronacondition2=(betatot<1.0)
+    coronacondition2=coronacondition2*(betatot>0.1)
+    coronacondition2=coronacondition2*condmaxbsqorho
+    # was (bsq/rho<1.0)
+    # was denfactor=bsq+rho+gam*ug
+    # can't make this -T^t_t that can go through zero.
+    hoverr2dcorona,thetamid2dcorona=horcalc2d(hortype=2,which1=coronacondition1,which2=coronacondition2,denfactor=(bsq+rho+gam*ug)*uu[0])
+    #
+    # corona-jet boundary
+    # was jetcondition=(bsq/rho>2.0)
+    #jetcondition=(mum1fake>1.0)
+    #jetcondition=(mum1fake<1.5)
+    #jetcondition=jetcondition*(mum1fake>1.0)
+    # can't use just bsq/rho<2.0 below, since too sparse and some radii have no such smallish range of bsq/rho
+    jetcondition1=(bsq/rho<2.0)
+    jetcondition1=jetcondition1*(bsq/rho>1.0)
+    jetcondition2=condmaxbsqorho
+    jetcondition2=jetcondition2*(bsq/rho>1.0)
+    hoverr2djet,thetamid2djet=horcalc2d(hortype=2,which1=jetcondition1,which2=jetcondition2,denfactor=(bsq+rho+gam*ug)*uu[0])
+    return(hoverr2d,thetamid2d,hoverr2dcorona,thetamid2dcorona,hoverr2djet,thetamid2djet)
+
+
+# alpha quantities in order returned by qtyalphacalc()
+qtyalphanames=['alphamag1','alphamag2','alphamag3','alphamag4','alphamagpert','alphareynoldsa2','alphareynoldsb2','alphareynoldsc2','alphareynoldsa3','alphareynoldsb3','alphareynoldsc3']
+
+def qtyalphacalc(tiny):
+    """
+    getqtyvstime()'s alphamag* and alphareynolds* (each vs. radius, see qtyalphanames) for currently loaded dump, so can be done in radial blocks (see runradialblocks())
+    tiny is added to normalizations, as in getqtyvstime()
+    """
+    # any not computed are zeros
+    result=dict([(name,np.zeros(nx,dtype=rho.dtype)) for name in qtyalphanames])
+    #################################
     #
-    # determine how many time slices for *this* core
-    numtimesliceslocal=0
-    for findex, fname in enumerate(flist):
-        if( whichi >=0 and whichn > 0 ):
-            if( findex % whichn != whichi ):
-                continue
-        #
-        numtimesliceslocal=numtimesliceslocal+1
     #
-    print(("numtimeslices=%d numtimesliceslocal=%d" % (numtimeslices,numtimesliceslocal))) ; sys.stdout.flush()
+    denfactor=1.0 + rholab*0.0
+    diskcondition=condmaxbsqorho
+    keywordsrhosq={'which': diskcondition}
+    rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+    #alphamag1[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+    denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    result['alphamag1']=numer/denom
+    #
+    denfactor=1.0 + rholab*0.0
+    diskcondition=(bsq/rho<1)
+    keywordsrhosq={'which': diskcondition}
+    rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+    #alphamag2[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+    denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    result['alphamag2']=numer/denom
     #
-    #############################################
+    if 1==1:
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphamag3[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        # do averaging as in Hawley et al. (2010) assessing paper
+        numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphamag3']=numer/denom
+        #
+        # alpha_mag in Hawley et al. (2011) or Sorathia et al. (2010) convergence papers
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphamag4[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5)*denfactor,**keywordsrhosq)/rhosqint
+        numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphamag4']=numer/denom
     #
-    havefull=0
-    print("Number of time slices: %d" % numtimeslices) ; sys.stdout.flush()
-    if whichi >=0 and whichi < whichn:
-        fname = "qty2_%d_%d.npy" % (whichi, whichn)
-        havefull=0
     else:
-        fname = "qty2.npy" 
-        havefull=1
+        # tests
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #
+        #numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)
+        #denom=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)
+        #alphamag4[qindex]=numer/denom
+        #alphamag3[qindex]=numer/denom
+        #
+        #alphamag3[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)
+        #alphamag4[qindex]=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)
     #
-    #############################################
-    global qtymem
-    if OLDQTYMEMMEM==1 or havefull==1:
-        qtymem=np.zeros((nqty,numtimeslices,nx),dtype=np.float32)
-    else:
-        # only need to process slices currently dealing with
-        # this can be coincidentally the same as above when whichn=1
-        qtymem=np.zeros((nqty,numtimesliceslocal,nx),dtype=np.float32)
     #
-    #np.seterr(invalid='raise',divide='raise')
+    #alphamagpert is the Maxwell Stress due to perturbations in the magnetic field of the disk; calculated with same conditions as alphamag3 (Megan)
+    denfactor=rholab
+    diskcondition=condmaxbsqorho
+    keywordsrhosq={'which': diskcondition}
+    rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+    #alphamagpert[qindex]=intangle(gdet*jabs(-(bu[1]-avg_bu[1])*np.sqrt(gv3[1,1])*(bd[3]-avg_bd[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    numer=intangle(gdet*jabs(-(bu[1]-avg_bu[1])*np.sqrt(gv3[1,1])*(bd[3]-avg_bd[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+    denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+    result['alphamagpert']=numer/denom
     #
-    #############################################
-    print(("File trying to load or see if exist: %s" % fname)) ; sys.stdout.flush()
+    gc.collect()
+    #################################
+    print("alphareynolds") ; sys.stdout.flush()
+    #################################
     #
-    qtymemready=0
-    if fmtver == 2 and os.path.isfile( fname ):
-        #qtymem2=np.load( fname )
-        qtymem2=np.load( fname , mmap_mode='r' )
-        numtimeslices2 = qtymem2.shape[1]
-        #require same number of variables, don't allow format changes on the fly for safety
-        print("Number of previously saved time slices: %d" % numtimeslices2)  ; sys.stdout.flush()
-        if( (numtimeslices2 >= numtimeslices and (OLDQTYMEMMEM==1 or havefull==1)) or (numtimeslices2 >= numtimesliceslocal and OLDQTYMEMMEM==0) )  :
-            print("Number of previously saved time slices is >= than of timeslices to be loaded, re-using previously saved time slices") ; sys.stdout.flush()
-            #np.save("qty2.npy",qtymem2[:,:-1])  #kill last time slice
-            return(qtymem2)
-        else:
-            assert qtymem2.shape[0] == qtymem.shape[0]
+    # do only disk+corona (bsq/rho<1) and disk (weight by rholab)
+    # (rho+u+p+bsq) u^\mu u_\nu + \delta^\mu_\nu (p_g + p_b) - b^\mu b_\nu
+    #
+    # stressreya: rho du^r du_\phi
+    # stressreyb: (u+p) du^r du_\phi
+    # stressreyc: (bsq) du^r du_\phi
+    # stressmag: - b^r b_\phi (alphamag1,2,3 above, where 4 is with pb as denominator)
+    #
+    computealphareynolds=1
+    #
+    if computealphareynolds==1: # can skip if don't care, will just be zeros
+        print(("for alphareynolds: avgexists=%d" % (avgexists)))  ; sys.stdout.flush()
+        #
+        # stressreya2
+        denfactor=1.0 + rholab*0.0
+        diskcondition=(bsq/rho<1)
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsa2[qindex]=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom==intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsa2']=numer/denom
+        #
+        # stressreyb2
+        denfactor=1.0 + rholab*0.0
+        diskcondition=(bsq/rho<1)
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsb2[qindex]=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsb2']=numer/denom
+        #
+        # stressreyc2
+        denfactor=1.0 + rholab*0.0
+        diskcondition=(bsq/rho<1)
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsc2[qindex]=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs((bsq)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsc2']=numer/denom
+        #
+        # stressreya3
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsa3[qindex]=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsa3']=numer/denom
+        #
+        # stressreyb3
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsb3[qindex]=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsb3']=numer/denom
+        #
+        # stressreyc3
+        denfactor=rholab
+        diskcondition=condmaxbsqorho
+        keywordsrhosq={'which': diskcondition}
+        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
+        #alphareynoldsc3[qindex]=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        if avgexists==1:
+            numer=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        else:
+            numer=intangle(gdet*jabs((bsq)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+        result['alphareynoldsc3']=numer/denom
+    return(tuple([result[name] for name in qtyalphanames]))
+
+
+qtyvstimeworker=None # set only in worker processes
+qtyvstimemaxretries=2
+qtyvstimepolltime=10.0 # seconds between checks for dead workers and progress reports when nothing finishes
+
+def getqtyvstimeworkertasks(flist):
+    """ Used by getqtyvstime() in worker instead of enumerate(flist): yields (findex,fname) of each dump handed out, reporting ones finished """
+    state=qtyvstimeworker
+    while True:
+        if state['findex'] is not None:
+            # previous dump done (loop came back here)
+            state['qtymem'].flush()
+            state['results'].put(('done',state['workerid'],state['findex'],None))
+            state['findex']=None
+        findex=state['tasks'].get()
+        if findex is None:
+            state['finished']=True
+            return
+        state['findex']=findex
+        state['results'].put(('start',state['workerid'],findex,None))
+        yield findex, flist[findex]
+
+def getqtyvstimeworker(workerid,sharedname,shape,rowoffindex,tasks,results,logname,args,kwargs):
+    """ Body of forked worker process: runs getqtyvstime() until parent says there are no more dumps """
+    import traceback
+    global qtyvstimeworker
+    sys.stdout=open(logname,"a")
+    sys.stderr=sys.stdout
+    qtyvstimeworker={'qtymem':np.memmap(sharedname,dtype=np.float32,mode='r+',shape=shape),'rowoffindex':rowoffindex,'tasks':tasks,'results':results,'workerid':workerid,'findex':None,'finished':False}
+    while True:
+        try:
+            getqtyvstime(*args,**kwargs)
+            if not qtyvstimeworker['finished']:
+                results.put(('fail',workerid,None,"getqtyvstime() returned before taking dumps"))
+            break
+        except Exception:
+            # report and continue with next dump
+            message=traceback.format_exc()
+            print(message) ; sys.stdout.flush()
+            results.put(('fail',workerid,qtyvstimeworker['findex'],message.strip().split("\n")[-1]))
+            if qtyvstimeworker['findex'] is None:
+                # failed before getting any dump, so would fail again
+                break
+            qtyvstimeworker['findex']=None
+    sys.stdout.flush()
+
+def getqtyvstimepool(qtymem,flist,todo,rowoffindex,nproc,args,kwargs):
+    """
+    Compute dumps flist[todo] into rows rowoffindex[todo] of QtyStore qtymem using nproc forked workers running getqtyvstime(*args,**kwargs).
+    Rows of dumps that failed after retries are left as zeros, and their sources marked so next getqtyvstime() tries them again.
+    """
+    import multiprocessing
+    import queue
+    if len(todo)==0:
+        return
+    nproc=min(nproc,len(todo))
+    ctx=multiprocessing.get_context('fork')
+    start_time=datetime.now()
+    #
+    # shared positional qtymem, starting with rows already in qtymem (e.g. reused from previous run)
+    sharedname="%s.%d.tmp.dat" % (qtymem.dirname,os.getpid())
+    shared=np.memmap(sharedname,dtype=np.float32,mode='w+',shape=qtymem.shape)
+    for ii, name in enumerate(qtymem.names):
+        if qtymem.has(name):
+            shared[ii]=qtymem.column(name)
+    shared.flush()
+    #
+    tasks=ctx.Queue()
+    results=ctx.Queue()
+    for findex in todo:
+        tasks.put(findex)
+    #
+    workers={}
+    for workerid in np.arange(nproc):
+        workers[workerid]=ctx.Process(target=getqtyvstimeworker,args=(workerid,sharedname,qtymem.shape,rowoffindex,tasks,results,"%s_worker%d.log" % (qtymem.dirname,workerid),args,kwargs))
+        workers[workerid].start()
+    print(("getqtyvstimepool: %d dumps on %d workers" % (len(todo),nproc))) ; sys.stdout.flush()
+    #
+    inflight={}
+    tries={}
+    finished=set()
+    failed=set()
+    while len(finished)+len(failed)<len(todo):
+        try:
+            events=[results.get(timeout=qtyvstimepolltime)]
+        except queue.Empty:
+            # nothing finished, but still report progress
+            events=[(None,None,None,None)]
+        # worker gone without saying why (e.g. killed for using too much memory): checked every time, since others may keep reporting
+        deadworkers=[workerid for workerid in workers if not workers[workerid].is_alive()]
+        if len(deadworkers)>0:
+            # first take what they said before going, so know which dump each was on
+            while True:
+                try:
+                    events.append(results.get_nowait())
+                except queue.Empty:
+                    break
+            events=events+[('exited',workerid,None,None) for workerid in deadworkers]
+        for (what,workerid,findex,message) in events:
+            if what=='exited':
+                findex=inflight.pop(workerid,None)
+                print(("getqtyvstimepool: worker %d exited with code %s" % (workerid,str(workers[workerid].exitcode)))) ; sys.stdout.flush()
+                workers[workerid]=ctx.Process(target=getqtyvstimeworker,args=(workerid,sharedname,qtymem.shape,rowoffindex,tasks,results,"%s_worker%d.log" % (qtymem.dirname,workerid),args,kwargs))
+                workers[workerid].start()
+                if findex is None:
+                    continue
+                what='fail'
+                message="worker exited"
+            if what=='start':
+                inflight[workerid]=findex
+            elif what=='done':
+                inflight.pop(workerid,None)
+                finished.add(findex)
+            if what=='fail' and findex is None:
+                for workerid in workers:
+                    workers[workerid].terminate()
+                os.remove(sharedname)
+                raise Exception('getqtyvstimepool','worker failed before computing any dump',message)
+            if what=='fail':
+                inflight.pop(workerid,None)
+                tries[findex]=tries.get(findex,0)+1
+                if tries[findex]<=qtyvstimemaxretries:
+                    print(("getqtyvstimepool: %s failed (%s), retrying" % (flist[findex],message))) ; sys.stdout.flush()
+                    tasks.put(findex)
+                else:
+                    print(("getqtyvstimepool: %s failed (%s), giving up" % (flist[findex],message))) ; sys.stdout.flush()
+                    failed.add(findex)
+                    # may have got part way, so make row zeros like other dumps not computed,
+                    # but still at its own dump for mergeqtystore() (and its sources marked below so it's recomputed)
+                    shared[:,rowoffindex[findex]]=0.0
+                    if 'findexs' in qtymem.names:
+                        shared[qtymem.names.index('findexs'),rowoffindex[findex],0]=findex
+        elapsed=(datetime.now()-start_time).seconds
+        numdone=len(finished)
+        eta=0
+        if numdone>0:
+            eta=elapsed*(len(todo)-numdone-len(failed))/numdone
+        if any([event[0]!='start' for event in events]):
+            print(("getqtyvstimepool: %d/%d dumps done, %d failed, %d running, time elapsed: %d ETA: %d" % (numdone,len(todo),len(failed),len(inflight),elapsed,eta))) ; sys.stdout.flush()
+    #
+    for workerid in workers:
+        tasks.put(None)
+    for workerid in workers:
+        workers[workerid].join()
+    #
+    for ii, name in enumerate(qtymem.names):
+        if qtymem.has(name):
+            qtymem.columns[name]=np.array(shared[ii])
+    shared=None
+    os.remove(sharedname)
+    if len(failed)>0:
+        print(("getqtyvstimepool: failed dumps: %s" % (" ".join([flist[findex] for findex in sorted(failed)])))) ; sys.stdout.flush()
+        if qtymem.sources is not None:
+            qtymem.sources['size'][rowoffindex[sorted(failed)]]=-1
+    print(("getqtyvstimepool: done" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+
+# MEMMARK: currently about 700 numtimeslices,nx quantities
+# so per timeslice included per core: 700*nx*4
+# (so now relatively small if use many cores, but still big for making movie.)
+# otherwise, if (e.g.) there were 35000 files (e.g. thickdisk3) then 700*128*35000=6GB by itself!
+def getqtyvstime(ihor,horval=1.0,fmtver=3,dobob=0,whichi=None,whichn=None,altread=False,nproc=1,which=None,radialblocks=None):
+    """
+    Returns a tuple (ts,fs,mdot,pjetem,pjettot): lists of times, horizon fluxes, and Mdot
+    fmtver=3: named per-quantity store (QtyStore) in qtystore/, converted from qty2.npy if only that exists
+    fmtver=2: positional qty2.npy ; fmtver=1: older qty.npy
+    nproc>1: compute dumps in that many forked processes (see getqtyvstimepool()), fmtver=3 only
+    which: only compute these diagnostics (see qtydiagnostics), e.g. ['fluxes'], into their own store (see qtystorename()), fmtver=3 only
+    radialblocks=N: do 'hor' and 'alpha' diagnostics (qtyhorcalc() and qtyalphacalc()) in radial blocks of N cells (see runradialblocks()), so their temporaries are only N*ny*nz
+    """
+    if ismb09model(modelname):
+        horval=0.2
+    elif issashamodel(modelname):
+        horval=0.2
+    elif isthickdiskmodel(modelname):
+        horval=0.6
+    elif isradmodel(modelname):
+        horval=0.2
+    else:
+        horval=1.0 # so know how to remove effect
+    if isradmodelC(modelname):
+        horval=0.02
+    #
+    if whichn != None and (whichi < 0 or whichi > whichn):
+        print(( "whichi = %d shoudl be >= 0 and < whichn = %d" % (whichi, whichn) )) ; sys.stdout.flush()
+        return( -1 )
+    if whichi is None or whichn is None:
+        # not splitting up the work
+        whichi=-1
+        whichn=0
+    if 'rho' in globals():
+        tiny=np.finfo(rho.dtype).tiny
+    else:
+        tiny = np.finfo(np.float64).tiny
+    flist = getfieldlinelist()
+    #
+    nqty=getnqty(dobob=dobob)
+    #
+    ####################################
+    # total number of time slices over all files
+    numtimeslices=len(flist)
+    #
+    #
+    # determine how many time slices for *this* core
+    numtimesliceslocal=0
+    for findex, fname in enumerate(flist):
+        if( whichi >=0 and whichn > 0 ):
+            if( findex % whichn != whichi ):
+                continue
+        #
+        numtimesliceslocal=numtimesliceslocal+1
+    #
+    print(("numtimeslices=%d numtimesliceslocal=%d" % (numtimeslices,numtimesliceslocal))) ; sys.stdout.flush()
+    #
+    #############################################
+    #
+    havefull=0
+    print("Number of time slices: %d" % numtimeslices) ; sys.stdout.flush()
+    if whichi >=0 and whichi < whichn:
+        fname = "qty2_%d_%d.npy" % (whichi, whichn)
+        havefull=0
+    else:
+        fname = "qty2.npy" 
+        havefull=1
+    #
+    #############################################
+    global qtymem
+    if OLDQTYMEMMEM==1 or havefull==1:
+        numtimesneed=numtimeslices
+    else:
+        # only need to process slices currently dealing with
+        # this can be coincidentally the same as above when whichn=1
+        numtimesneed=numtimesliceslocal
+    # files to compute (those already done are skipped below)
+    needfile=np.zeros(numtimeslices,dtype=bool)
+    for findex in np.arange(numtimeslices):
+        needfile[findex]=(whichi<0 or whichn<=0 or findex % whichn == whichi)
+    if nproc>1 and fmtver!=3:
+        raise Exception('getqtyvstime','nproc>1 requires fmtver=3',nproc,fmtver)
+    if which is not None and fmtver!=3:
+        raise Exception('getqtyvstime','which requires fmtver=3',which,fmtver)
+    # diagnostics to compute for each dump
+    qtyneed=qtydiagnosticresolve(which,dobob=dobob)
+    if qtyvstimeworker is not None:
+        # in getqtyvstimepool() worker: results go into shared memory map set up by parent
+        qtymem=qtyvstimeworker['qtymem']
+    elif fmtver == 3:
+        # named columns instead of one positional array
+        storename=qtystorename(whichi,whichn,which)
+        stored=None
+        if which is not None:
+            stored=qtydiagnosticnames(qtyneed,dobob=dobob)
+            print(("Computing only %s, %d quantities" % (" ".join(sorted([name for name in qtyneed if qtyneed[name]])),len(stored)))) ; sys.stdout.flush()
+        qtymem=QtyStore(storename,names=getqtynames(dobob=dobob),ntimes=numtimesneed,stored=stored)
+        # file for each row of store
+        if numtimesneed==numtimeslices:
+            rowfindexs=np.arange(numtimeslices)
+        else:
+            rowfindexs=np.where(needfile)[0]
+        allsources=qtystoresources(flist)
+        fieldlinegaps(allsources)
+        qtymem.sources=dict([(key,allsources[key][rowfindexs]) for key in qtystoresourcekeys])
+        if which is None and not qtystoreexists(storename) and os.path.isfile( fname ):
+            # one-time conversion of older positional file
+            print(("Converting %s into %s" % (fname,storename))) ; sys.stdout.flush()
+            try:
+                qtystorefromarray(storename,np.load( fname , mmap_mode='r' ))
+            except Exception as e:
+                # just compute everything again
+                print(("Could not convert %s, not using it: %s" % (fname,str(e)))) ; sys.stdout.flush()
+        fname=storename
+    else:
+        qtymem=np.zeros((nqty,numtimesneed,nx),dtype=np.float32)
+    #
+    #np.seterr(invalid='raise',divide='raise')
+    #
+    #############################################
+    print(("File trying to load or see if exist: %s" % fname)) ; sys.stdout.flush()
+    #
+    qtymemready=0
+    if qtyvstimeworker is not None:
+        # parent already took care of previous results
+        numtimeslices2 = 0
+    elif fmtver == 3 and qtystoreexists( fname ):
+        qtymem2=QtyStore( fname )
+        numtimeslices2 = qtymem2.ntimes
+        if qtymem2.nx!=nx:
+            raise Exception('getqtyvstime','stored nx does not match grid',fname,qtymem2.nx,nx)
+        # quantities added since store was made only get computed for new time slices
+        missing=[name for name in qtymem.validfrom if not qtymem2.has(name)]
+        if len(missing)>0:
+            print(("Quantities not in %s: %s" % (fname," ".join(missing)))) ; sys.stdout.flush()
+        print("Number of previously saved time slices: %d" % numtimeslices2)  ; sys.stdout.flush()
+        # match stored time slices to current dumps by identity, not position
+        oldrow=qtystorematch(qtymem2,qtymem.sources)
+        reused=np.where(oldrow>=0)[0]
+        print("Re-using %d previously saved time slices, computing %d" % (len(reused),numtimesneed-len(reused))) ; sys.stdout.flush()
+        if numtimeslices2==numtimesneed and np.all(oldrow==np.arange(numtimesneed)):
+            print("Previously saved time slices are up to date") ; sys.stdout.flush()
+            if qtymem2.sources is None:
+                # older store: record dumps it was matched to, so later changes are caught
+                qtymem2.sources=qtymem.sources
+                qtymem2.savemanifest()
+            return(qtymem2)
+        qtystorereuse(qtymem,qtymem2,oldrow,rowfindexs)
+        needfile[rowfindexs[reused]]=False
+        qtymem2=None
+        qtymemready=1
+    elif fmtver == 2 and os.path.isfile( fname ):
+        #qtymem2=np.load( fname )
+        qtymem2=np.load( fname , mmap_mode='r' )
+        numtimeslices2 = qtymem2.shape[1]
+        #require same number of variables, don't allow format changes on the fly for safety
+        print("Number of previously saved time slices: %d" % numtimeslices2)  ; sys.stdout.flush()
+        if numtimeslices2 >= numtimesneed:
+            print("Number of previously saved time slices is >= than of timeslices to be loaded, re-using previously saved time slices") ; sys.stdout.flush()
+            #np.save("qty2.npy",qtymem2[:,:-1])  #kill last time slice
+            return(qtymem2)
+        else:
+            assert qtymem2.shape[0] == qtymem.shape[0]
             print("Number of previously saved time slices is < than of timeslices to be loaded, re-using previously saved time slices") ; sys.stdout.flush()
             qtymem[:,0:numtimeslices2] = qtymem2[:,0:numtimeslices2]
             qtymem2=None
             qtymemready=1
+            # assumes dumps only added at end since saved
+            needfile[0:numtimeslices2]=False
     elif fmtver == 1 and os.path.isfile("qty.npy"):
         #qtymem2=np.load( "qty.npy" )
         qtymem2=np.load( "qty.npy" , mmap_mode='r' )
@@ -11700,21 +13750,40 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
     #
     #
     ##############################################
+    # which files loop below will read, so they can be read ahead in background
+    whichread=list(needfile)
+    #
+    if nproc>1 and qtyvstimeworker is None:
+        # all dumps to compute done by pool, directly into qtymem, so nothing left for loop below
+        rowoffindex=-np.ones(numtimeslices,dtype=int)
+        rowoffindex[rowfindexs]=np.arange(len(rowfindexs))
+        getqtyvstimepool(qtymem,flist,np.where(needfile)[0],rowoffindex,nproc,(ihor,horval),dict(fmtver=fmtver,dobob=dobob,whichi=(whichi if whichn>0 else None),whichn=(whichn if whichn>0 else None),altread=altread,which=which,radialblocks=radialblocks))
+        needfile[:]=False
+        whichread=list(needfile)
+    #
+    if qtyvstimeworker is not None:
+        # dumps handed out one at a time by parent
+        fileiter=getqtyvstimeworkertasks(flist)
+    else:
+        fileiter=rfdprefetch(flist,whichread=whichread)
+    #
     # findex refers to true file list, while qindex refers to how put into qtymem.  Also put in stacked way when saving memory.
     qindex=-1 # start with -1 since need below qindex to start at 0 and prefer to not place the qindex iteration at bottom
-    for findex, fname in enumerate(flist):
+    for findex, fname in fileiter:
         if( whichi >=0 and whichn > 0 ):
             if( findex % whichn != whichi ):
                 continue
         #
         # 
-        if OLDQTYMEMMEM==1:
+        if qtyvstimeworker is not None:
+            qindex=qtyvstimeworker['rowoffindex'][findex]
+        elif OLDQTYMEMMEM==1:
             qindex=findex # old non-stacked way
         else:
             qindex=qindex+1 # new stacked way
         #
-        #skip pre-loaded time slices (GODMARK: Not sure this is trustable generally, if added files in time, ok, but otherwise not)
-        if findex < numtimeslices2: 
+        #skip pre-loaded time slices (for fmtver=3, those whose dump is unchanged since saved)
+        if not needfile[findex]:
             continue
         #
         #call garbage collector -- trying to get req'd memory under control
@@ -11726,13 +13795,15 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         printusage()
         #
         print(("Computing getqtyvstime:" + fname + " ..." + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        print(("computing cvel()" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        cvel()
+        if qtyneed['cvel']:
+            print(("computing cvel()" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            cvel()
         #
         printusage()
         #
-        print(("computing Tcalcud()" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        Tcalcud()
+        if qtyneed['Tcalcud']:
+            print(("computing Tcalcud()" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            Tcalcud()
         #
         #
         printusage()
@@ -11748,944 +13819,751 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         #
         ##################################
         #
-        print(("HoverR" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #v4asq=bsq/(rho+ug+(gam-1)*ug)
-        #mum1fake=uu[0]*(1.0+v4asq)-1.0
-        # mum1fake not good marker of where jet is for near the BH.
-        # mu>2 is also poor, since mu\propto sin\theta so mu turns small again near pole.
-        # bsq/rho>1 much better.
-        #
-        beta=((gam-1)*ug)/(1E-30 + bsq*0.5)
-        betatot=((gam-1)*ug + (4.0/3.0-1)*urad)/(1E-30 + bsq*0.5)
-        #
-        # disk mass density scale height
-        #diskcondition=(betatot>2.0)
-        # was (bsq/rho<1.0)
-        #diskcondition=diskcondition*(mum1fake<1.0)
-        # just avoid floor mass
-        #cond1=(bsq/rho<30)
-        #cond2=(bsq/rho<10)
-        #condmaxbsqorho=cond1*(r<9.0)+cond2*(r>=9.0)
-        #rinterp=(r-9.0)*(1.0-0.0)/(0.0-9.0) # gives 0 for use near 9   gives 1 for use near 0
-        #rinterp[rinterp>1.0]=1.0
-        #rinterp[rinterp<0.0]=0.0
-        #condmaxbsqorho=(bsq/rho < rinterp*30.0 + (1.0-rinterp)*10.0)
-        diskcondition1=condmaxbsqorho
-        diskcondition2=condmaxbsqorho
-        # was denfactor=rho, but want uniform with corona and jet
-        hoverr3d,thetamid3d=horcalc(hortype=1,which1=diskcondition1,which2=diskcondition2,denfactor=rholab)
-        hoverr[qindex]=hoverr3d.sum(2).sum(1)/(ny*nz)
-        thetamid[qindex]=thetamid3d.sum(2).sum(1)/(ny*nz)
-        #
-        #
-        # disk-corona boundary
-        coronacondition1=(betatot<1.0)
-        coronacondition1=coronacondition1*(betatot>0.5)
-        coronacondition1=coronacondition1*condmaxbsqorho
-        coronacondition2=(betatot<1.0)
-        coronacondition2=coronacondition2*(betatot>0.1)
-        coronacondition2=coronacondition2*condmaxbsqorho
-        # was (bsq/rho<1.0)
-        # was denfactor=bsq+rho+gam*ug
-        # can't make this -T^t_t that can go through zero.
-        hoverr3dcorona,thetamid3dcorona=horcalc(hortype=2,which1=coronacondition1,which2=coronacondition2,denfactor=(bsq+rho+gam*ug)*uu[0])
-        hoverrcorona[qindex]=hoverr3dcorona.sum(2).sum(1)/(ny*nz)
-        thetamidcorona[qindex]=thetamid3dcorona.sum(2).sum(1)/(ny*nz)
-        #
-        # corona-jet boundary
-        # was jetcondition=(bsq/rho>2.0)
-        #jetcondition=(mum1fake>1.0)
-        #jetcondition=(mum1fake<1.5)
-        #jetcondition=jetcondition*(mum1fake>1.0)
-        # can't use just bsq/rho<2.0 below, since too sparse and some radii have no such smallish range of bsq/rho
-        jetcondition1=(bsq/rho<2.0)
-        jetcondition1=jetcondition1*(bsq/rho>1.0)
-        jetcondition2=condmaxbsqorho
-        jetcondition2=jetcondition2*(bsq/rho>1.0)
-        hoverr3djet,thetamid3djet=horcalc(hortype=2,which1=jetcondition1,which2=jetcondition2,denfactor=(bsq+rho+gam*ug)*uu[0])
-        hoverr_jet[qindex]=hoverr3djet.sum(2).sum(1)/(ny*nz)
-        thetamidjet[qindex]=thetamid3djet.sum(2).sum(1)/(ny*nz)
-        #
-        #####################################################################
-        diskcondition=condmaxbsqorho
-        #diskcondition=diskcondition*(betatot>1.0)
-        # below allows for magnetized disk
-        if isradmodel(modelname):
-            # only around equator, not far away from equator
-            diskcondition=diskcondition*(bsq/rho<1.0)*(np.fabs(h-np.pi*0.5)<horval*0.5)
-        else:
-            diskcondition=diskcondition*(bsq/rho<0.5)
-        # was (bsq/rho<1.0)
-        #diskcondition=diskcondition*(mum1fake<1.0)
-        #
-        diskeqcondition=diskcondition
-        # (qmri3d,norm3d,q3mri3d,norm33d,iq2mri3d)
-        qmri3ddisk,normmri3ddisk,q3mri3ddisk,norm3mri3ddisk,iq2mri3ddisk=Qmri_simple(which=diskeqcondition)
-        #
-        # Q1
-        qmridisk[qindex]=qmri3ddisk.sum(2).sum(1)/(ny*nz)
-        normmridisk[qindex]=normmri3ddisk.sum(2).sum(1)/(ny*nz)
-        #
-        # Q3
-        q3mridisk[qindex]=q3mri3ddisk.sum(2).sum(1)/(ny*nz)
-        norm3mridisk[qindex]=norm3mri3ddisk.sum(2).sum(1)/(ny*nz)
-        #
-        # Q2: number of wavelengths per disk scale height
-        iq2mridisk[qindex]=iq2mri3ddisk.sum(2).sum(1)/(ny*nz)
+        if qtyneed['hor']:
+            print(("HoverR" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            if radialblocks is None:
+                horresults=qtyhorcalc()
+            else:
+                horresults=runradialblocks(qtyhorcalc,blocksize=radialblocks)
+            hoverr2d,thetamid2d,hoverr2dcorona,thetamid2dcorona,hoverr2djet,thetamid2djet=horresults
+            hoverr3d,thetamid3d=hor2dto3d(hoverr2d),hor2dto3d(thetamid2d)
+            hoverr[qindex]=hoverr2d.sum(1)/nz
+            thetamid[qindex]=thetamid2d.sum(1)/nz
+            hoverrcorona[qindex]=hoverr2dcorona.sum(1)/nz
+            thetamidcorona[qindex]=thetamid2dcorona.sum(1)/nz
+            hoverr_jet[qindex]=hoverr2djet.sum(1)/nz
+            thetamidjet[qindex]=thetamid2djet.sum(1)/nz
+            #
+            # pick out *at* horpickit*H/R and portion of \phi (for averages at 2.5H/R and Mdot within 2H,4H)
+            horpickit=2.5
+            horpickcondition=(np.abs(h-np.pi*0.5)<horpickit*hoverr3d)
+            horpickcondition=horpickcondition*(np.abs(h-np.pi*0.5)>0.5*horpickit*hoverr3d)
+            if nz>1:
+                horpickcondition=horpickcondition*(ph>0.0)
+                horpickcondition=horpickcondition*(ph<np.pi/4.0)
         #
         #####################################################################
-        qmri3ddiskweak,normmri3ddiskweak,q3mri3ddiskweak,norm3mri3ddiskweak,iq2mri3ddiskweak=Qmri_simple(weak=1,which=diskeqcondition)
-        #
-        # Q1
-        qmridiskweak[qindex]=qmri3ddiskweak.sum(2).sum(1)/(ny*nz)
-        normmridiskweak[qindex]=normmri3ddiskweak.sum(2).sum(1)/(ny*nz)
-        #
-        # Q3
-        q3mridiskweak[qindex]=q3mri3ddiskweak.sum(2).sum(1)/(ny*nz)
-        norm3mridiskweak[qindex]=norm3mri3ddiskweak.sum(2).sum(1)/(ny*nz)
-        #
-        # Q2
-        # number of wavelengths per disk scale height
-        iq2mridiskweak[qindex]=iq2mri3ddiskweak.sum(2).sum(1)/(ny*nz)
+        if qtyneed['qmri']:
+            diskcondition=condmaxbsqorho
+            #diskcondition=diskcondition*(betatot>1.0)
+            # below allows for magnetized disk
+            if isradmodel(modelname):
+                # only around equator, not far away from equator
+                diskcondition=diskcondition*(bsq/rho<1.0)*(np.fabs(h-np.pi*0.5)<horval*0.5)
+            else:
+                diskcondition=diskcondition*(bsq/rho<0.5)
+            # was (bsq/rho<1.0)
+            #diskcondition=diskcondition*(mum1fake<1.0)
+            #
+            diskeqcondition=diskcondition
+            # (qmri3d,norm3d,q3mri3d,norm33d,iq2mri3d)
+            qmri3ddisk,normmri3ddisk,q3mri3ddisk,norm3mri3ddisk,iq2mri3ddisk=Qmri_simple(which=diskeqcondition)
+            #
+            # Q1
+            qmridisk[qindex]=qmri3ddisk.sum(2).sum(1)/(ny*nz)
+            normmridisk[qindex]=normmri3ddisk.sum(2).sum(1)/(ny*nz)
+            #
+            # Q3
+            q3mridisk[qindex]=q3mri3ddisk.sum(2).sum(1)/(ny*nz)
+            norm3mridisk[qindex]=norm3mri3ddisk.sum(2).sum(1)/(ny*nz)
+            #
+            # Q2: number of wavelengths per disk scale height
+            iq2mridisk[qindex]=iq2mri3ddisk.sum(2).sum(1)/(ny*nz)
+            #
+            #####################################################################
+            qmri3ddiskweak,normmri3ddiskweak,q3mri3ddiskweak,norm3mri3ddiskweak,iq2mri3ddiskweak=Qmri_simple(weak=1,which=diskeqcondition)
+            #
+            # Q1
+            qmridiskweak[qindex]=qmri3ddiskweak.sum(2).sum(1)/(ny*nz)
+            normmridiskweak[qindex]=normmri3ddiskweak.sum(2).sum(1)/(ny*nz)
+            #
+            # Q3
+            q3mridiskweak[qindex]=q3mri3ddiskweak.sum(2).sum(1)/(ny*nz)
+            norm3mridiskweak[qindex]=norm3mri3ddiskweak.sum(2).sum(1)/(ny*nz)
+            #
+            # Q2
+            # number of wavelengths per disk scale height
+            iq2mridiskweak[qindex]=iq2mri3ddiskweak.sum(2).sum(1)/(ny*nz)
         #
         #####################################################################
-        diskaltcondition=(bsq/rho<1.0)
-        #diskaltcondition=diskaltcondition*(betatot>1.0)
-        betamin[qindex,0],betaavg[qindex,0],betaratofavg[qindex,0],betaratofmax[qindex,0]=betascalc(which=diskaltcondition)
-        # no condition, use clean versions if required
-        betamin[qindex,1:17]=luminosities()
+        if qtyneed['betas']:
+            diskaltcondition=(bsq/rho<1.0)
+            #diskaltcondition=diskaltcondition*(betatot>1.0)
+            betamin[qindex,0],betaavg[qindex,0],betaratofavg[qindex,0],betaratofmax[qindex,0]=betascalc(which=diskaltcondition)
+            # no condition, use clean versions if required
+            betamin[qindex,1:17]=luminosities()
         #
         #####################################################################
         gc.collect()
         #
         #################################
-        print(("alphamag" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #################################
-        #
-        #
-        denfactor=1.0 + rholab*0.0
-        diskcondition=condmaxbsqorho
-        keywordsrhosq={'which': diskcondition}
-        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-        #alphamag1[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        alphamag1[qindex]=numer/denom
-        #
-        denfactor=1.0 + rholab*0.0
-        diskcondition=(bsq/rho<1)
-        keywordsrhosq={'which': diskcondition}
-        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-        #alphamag2[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        alphamag2[qindex]=numer/denom
-        #
-        if 1==1:
-            denfactor=rholab
-            diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphamag3[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            # do averaging as in Hawley et al. (2010) assessing paper
-            numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphamag3[qindex]=numer/denom
-            #
-            # alpha_mag in Hawley et al. (2011) or Sorathia et al. (2010) convergence papers
-            denfactor=rholab
-            diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphamag4[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))/(bsq*0.5)*denfactor,**keywordsrhosq)/rhosqint
-            numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)/rhosqint
-            alphamag4[qindex]=numer/denom
+        if qtyneed['alpha']:
+            print(("alphamag" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            if radialblocks is None:
+                alpharesults=qtyalphacalc(tiny)
+            else:
+                alpharesults=runradialblocks(lambda: qtyalphacalc(tiny),blocksize=radialblocks)
+            for name,alpharesult in zip(qtyalphanames,alpharesults):
+                globals()[name][qindex]=alpharesult
         #
-        else:
-            # tests
-            denfactor=rholab
-            diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #
-            #numer=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)
-            #denom=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)
-            #alphamag4[qindex]=numer/denom
-            #alphamag3[qindex]=numer/denom
-            #
-            #alphamag3[qindex]=intangle(gdet*jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)
-            #alphamag4[qindex]=intangle(gdet*(bsq*0.5)*denfactor,**keywordsrhosq)
         #
         #
-        #alphamagpert is the Maxwell Stress due to perturbations in the magnetic field of the disk; calculated with same conditions as alphamag3 (Megan)
-        denfactor=rholab
-        diskcondition=condmaxbsqorho
-        keywordsrhosq={'which': diskcondition}
-        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-        #alphamagpert[qindex]=intangle(gdet*jabs(-(bu[1]-avg_bu[1])*np.sqrt(gv3[1,1])*(bd[3]-avg_bd[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        numer=intangle(gdet*jabs(-(bu[1]-avg_bu[1])*np.sqrt(gv3[1,1])*(bd[3]-avg_bd[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-        denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-        alphamagpert[qindex]=numer/denom
         #
+        printusage()
         gc.collect()
+        printusage()
         #################################
-        print(("alphareynolds" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #################################
+        if qtyneed['primitives']:
+            print(("all primitives in various forms" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #################################
+            #
+            # MEMMARK: below increases as if 48 variables per 3D point!
+            # should be about 30, not 48.  GODMARK.  metric and avg stuff should be 2d!
+            #
+            # whether velocity outputted will be 4-vel or fake orthonormal 3-vel
+            output4vel=1
+            #
+            if output4vel==0:
+                # avoid nan inside r=2M.  But set get fabs, so can recover values
+                mygv300=-gv3[0,0]
+                mygv300=np.fabs(mygv300)
+                iuu0hat=1.0/(uu[0]*np.sqrt(mygv300))
+                myuu0=uu[0]*np.sqrt(mygv300)
+                myuu1=uu[1]*np.sqrt(gv3[1,1])*iuu0hat
+                myuu2=uu[2]*np.sqrt(gv3[2,2])*iuu0hat
+                myuu3=uu[3]*np.sqrt(gv3[3,3])*iuu0hat
+                myuurot=np.sqrt(myuu2**2+myuu3**2)
+                myB1=B[1]*np.sqrt(gv3[1,1])
+                myB2=B[2]*np.sqrt(gv3[2,2])
+                myB3=B[3]*np.sqrt(gv3[3,3])
+                mybu1=bu[1]*np.sqrt(gv3[1,1])
+                mybu2=bu[2]*np.sqrt(gv3[2,2])
+                mybu3=bu[3]*np.sqrt(gv3[3,3])
+                #
+                if avgexists==1:
+                    # then do for these as well since needed
+                    # NOTEMARK: works since metric not \phi-dependent
+                    avg_iuu0hat=1.0/(avg_uu[0]*np.sqrt(mygv300))
+                    avg_myuu0=avg_uu[0]*np.sqrt(mygv300)
+                    avg_myuu1=avg_uu[1]*np.sqrt(gv3[1,1])*avg_iuu0hat
+                    avg_myuu2=avg_uu[2]*np.sqrt(gv3[2,2])*avg_iuu0hat
+                    avg_myuu3=avg_uu[3]*np.sqrt(gv3[3,3])*avg_iuu0hat
+                    avg_myuurot=np.sqrt(avg_myuu2**2+avg_myuu3**2)  # GODMARK: should have rot version directly averaged so \theta,\phi correlations accounted for
+                    avg_myB1=avg_B[1-1]*np.sqrt(gv3[1,1])
+                    avg_myB2=avg_B[2-1]*np.sqrt(gv3[2,2])
+                    avg_myB3=avg_B[3-1]*np.sqrt(gv3[3,3])
+                    avg_mybu1=avg_bu[1]*np.sqrt(gv3[1,1])
+                    avg_mybu2=avg_bu[2]*np.sqrt(gv3[2,2])
+                    avg_mybu3=avg_bu[3]*np.sqrt(gv3[3,3])
+                    #
+                    avg_iauu0hat=1.0/(avg_absuu[0]*np.sqrt(mygv300))
+                    avg_myauu0=avg_absuu[0]*np.sqrt(mygv300)
+                    avg_myauu1=avg_absuu[1]*np.sqrt(gv3[1,1])*avg_iauu0hat
+                    avg_myauu2=avg_absuu[2]*np.sqrt(gv3[2,2])*avg_iauu0hat
+                    avg_myauu3=avg_absuu[3]*np.sqrt(gv3[3,3])*avg_iauu0hat
+                    avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2)
+                    avg_myaB1=avg_absB[1-1]*np.sqrt(gv3[1,1])
+                    avg_myaB2=avg_absB[2-1]*np.sqrt(gv3[2,2])
+                    avg_myaB3=avg_absB[3-1]*np.sqrt(gv3[3,3])
+                    avg_myabu1=avg_absbu[1]*np.sqrt(gv3[1,1])
+                    avg_myabu2=avg_absbu[2]*np.sqrt(gv3[2,2])
+                    avg_myabu3=avg_absbu[3]*np.sqrt(gv3[3,3])
+                #
+                #
+            elif output4vel==1:
+                # fully obtain approximate invariant 3-vel and 4-field so averaging makes sense
+                sigmaks=r**2+(a*np.cos(h))**2
+                deltaks=r**2-2*r+a**2
+                Aks=(r**2+a**2)**2-a**2*deltaks*(np.sin(h))**2
+                #
+                gvks00=-(1.0-2.0*r/sigmaks)
+                gvks11=(1.0+2.0*r/sigmaks)
+                gvks22=sigmaks
+                gvks33=(np.sin(h))**2*(sigmaks + a**2*(1.0 + 2.0*r/sigmaks)*(np.sin(h))**2)
+                #
+                myuu0=uu[0]*dxdxp[0,0]
+                myuu1=(uu[1]*dxdxp[1,1] + uu[2]*dxdxp[1,2])*np.sqrt(gvks11)/myuu0
+                myuu2=(uu[1]*dxdxp[2,1] + uu[2]*dxdxp[2,2])*np.sqrt(gvks22)/myuu0
+                myuu3=(uu[3]*dxdxp[3,3])*np.sqrt(gvks33)/myuu0
+                myuurot=np.sqrt(myuu2**2+myuu3**2)
+                myB1=(B[1]*dxdxp[1,1] + B[2]*dxdxp[1,2])*np.sqrt(gvks11)
+                myB2=(B[1]*dxdxp[2,1] + B[2]*dxdxp[2,2])*np.sqrt(gvks22)
+                myB3=(B[3]*dxdxp[3,3])*np.sqrt(gvks33)
+                mybu1=(bu[1]*dxdxp[1,1] + bu[2]*dxdxp[1,2])*np.sqrt(gvks11)
+                mybu2=(bu[1]*dxdxp[2,1] + bu[2]*dxdxp[2,2])*np.sqrt(gvks22)
+                mybu3=(bu[3]*dxdxp[3,3])*np.sqrt(gvks33)
+                #
+                if avgexists==1:
+                    # NOTEMARK: works since metric not \phi-dependent
+                    avg_myuu0=avg_uu[0]*dxdxp[0,0]
+                    avg_myuu1=(avg_uu[1]*dxdxp[1,1] + avg_uu[2]*dxdxp[1,2])*np.sqrt(gvks11)/avg_myuu0
+                    avg_myuu2=(avg_uu[1]*dxdxp[2,1] + avg_uu[2]*dxdxp[2,2])*np.sqrt(gvks22)/avg_myuu0
+                    avg_myuu3=(avg_uu[3]*dxdxp[3,3])*np.sqrt(gvks33)/avg_myuu0
+                    avg_myuurot=np.sqrt(avg_myuu2**2+avg_myuu3**2)    # GODMARK: should have rot version directly averaged so \theta,\phi correlations accounted for
+                    avg_myB1=(avg_B[1-1]*dxdxp[1,1] + avg_B[2-1]*dxdxp[1,2])*np.sqrt(gvks11)
+                    avg_myB2=(avg_B[1-1]*dxdxp[2,1] + avg_B[2-1]*dxdxp[2,2])*np.sqrt(gvks22)
+                    avg_myB3=(avg_B[3-1]*dxdxp[3,3])*np.sqrt(gvks33)
+                    avg_mybu1=(avg_bu[1]*dxdxp[1,1] + avg_bu[2]*dxdxp[1,2])*np.sqrt(gvks11)
+                    avg_mybu2=(avg_bu[1]*dxdxp[2,1] + avg_bu[2]*dxdxp[2,2])*np.sqrt(gvks22)
+                    avg_mybu3=(avg_bu[3]*dxdxp[3,3])*np.sqrt(gvks33)
+                    #
+                    avg_myauu0=avg_absuu[0]*dxdxp[0,0]
+                    avg_myauu1=(avg_absuu[1]*dxdxp[1,1] + avg_absuu[2]*dxdxp[1,2])*np.sqrt(gvks11)/avg_myauu0
+                    avg_myauu2=(avg_absuu[1]*dxdxp[2,1] + avg_absuu[2]*dxdxp[2,2])*np.sqrt(gvks22)/avg_myauu0
+                    avg_myauu3=(avg_absuu[3]*dxdxp[3,3])*np.sqrt(gvks33)/avg_myauu0
+                    avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2)
+                    #avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2) # GODMARK
+                    avg_myaB1=(avg_absB[1-1]*dxdxp[1,1] + avg_absB[2-1]*dxdxp[1,2])*np.sqrt(gvks11)
+                    avg_myaB2=(avg_absB[1-1]*dxdxp[2,1] + avg_absB[2-1]*dxdxp[2,2])*np.sqrt(gvks22)
+                    avg_myaB3=(avg_absB[3-1]*dxdxp[3,3])*np.sqrt(gvks33)
+                    avg_myabu1=(avg_absbu[1]*dxdxp[1,1] + avg_absbu[2]*dxdxp[1,2])*np.sqrt(gvks11)
+                    avg_myabu2=(avg_absbu[1]*dxdxp[2,1] + avg_absbu[2]*dxdxp[2,2])*np.sqrt(gvks22)
+                    avg_myabu3=(avg_absbu[3]*dxdxp[3,3])*np.sqrt(gvks33)
+                #
+            elif output4vel==2:
+                print("Not yet")
+                if avgexists==1:
+                    print(("avgexists=%d: Not yet" % (avgexists)))
+            #
+            myauu0=np.abs(myuu0)
+            myauu1=np.abs(myuu1)
+            myauu2=np.abs(myuu2)
+            myauu3=np.abs(myuu3)
+            myauurot=np.abs(myuurot)
+            myaB1=np.abs(myB1)
+            myaB2=np.abs(myB2)
+            myaB3=np.abs(myB3)
+            myabu1=np.abs(mybu1)
+            myabu2=np.abs(mybu2)
+            myabu3=np.abs(mybu3)
+        # 0 = 1 + u^t u_t + u^r u_r + u^h u_h + u^p u_p
+        # 0 = 1 + u^r u_r / (1+u^t u_t) + u^h u_h / (1+u^t u_t) + u^p u_p / (1+u^t u_t)
+        # 1/(-u^t u_t) + 1 =  + u^r u_r / (-u^t u_t) + u^h u_h / (-u^t u_t) + u^p u_p / (-u^t u_t)
         #
-        # do only disk+corona (bsq/rho<1) and disk (weight by rholab)
-        # (rho+u+p+bsq) u^\mu u_\nu + \delta^\mu_\nu (p_g + p_b) - b^\mu b_\nu
         #
-        # stressreya: rho du^r du_\phi
-        # stressreyb: (u+p) du^r du_\phi
-        # stressreyc: (bsq) du^r du_\phi
-        # stressmag: - b^r b_\phi (alphamag1,2,3 above, where 4 is with pb as denominator)
+        printusage()
+        gc.collect()
+        printusage()
         #
-        computealphareynolds=1
         #
-        if computealphareynolds==1: # can skip if don't care, will just be zeros
-            print(("for alphareynolds: avgexists=%d" % (avgexists)))  ; sys.stdout.flush()
+        #############
+        if qtyneed['averages']:
+            print(("over full flow" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            #rhosq:
+            # for most dense part of flow:
+            #denfactor=rholab**2
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
             #
-            # stressreya2
+            diskcondition=condmaxbsqorho
+            keywordsrhosq={'which': diskcondition}
+            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny # gdet is 2d by default
+            rhosqs[qindex]=rhosqint
+            maxrhosq2d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosq3d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosq3d[:,j,:] = maxrhosq2d
+            rhosrhosq[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosq)/rhosqint
+            ugsrhosq[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosq)/rhosqint
+            uradsrhosq[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosq)/rhosqint
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
             denfactor=1.0 + rholab*0.0
-            diskcondition=(bsq/rho<1)
+            # yes, over whole disk so include jet for vel/field
+            diskcondition=1 + condmaxbsqorho*0.0
             keywordsrhosq={'which': diskcondition}
             rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsa2[qindex]=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            if avgexists==1:
-                numer=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            else:
-                numer=intangle(gdet*jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom==intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsa2[qindex]=numer/denom
+            uu0rhosq[qindex]=intangle(gdet*denfactor*myuu0,**keywordsrhosq)/rhosqint
+            vus1rhosq[qindex]=intangle(gdet*denfactor*myuu1,**keywordsrhosq)/rhosqint
+            vuas1rhosq[qindex]=intangle(gdet*denfactor*np.abs(myuu1),**keywordsrhosq)/rhosqint
+            vus3rhosq[qindex]=intangle(gdet*denfactor*myuu3,**keywordsrhosq)/rhosqint
+            vuas3rhosq[qindex]=intangle(gdet*denfactor*np.abs(myuu3),**keywordsrhosq)/rhosqint
+            vuasrotrhosq[qindex]=intangle(gdet*denfactor*np.abs(myuurot),**keywordsrhosq)/rhosqint
+            Bs1rhosq[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosq)/rhosqint
+            Bas1rhosq[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosq)/rhosqint
+            Bs2rhosq[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosq)/rhosqint
+            Bas2rhosq[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosq)/rhosqint
+            Bs3rhosq[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosq)/rhosqint
+            Bas3rhosq[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosq)/rhosqint
+            bs1rhosq[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosq)/rhosqint
+            bas1rhosq[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosq)/rhosqint
+            bs2rhosq[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosq)/rhosqint
+            bas2rhosq[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosq)/rhosqint
+            bs3rhosq[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosq)/rhosqint
+            bas3rhosq[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosq)/rhosqint
+            bsqrhosq[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosq)/rhosqint
+            #rhosq:
+            #
+            printusage()
+            gc.collect()
+            printusage()
             #
-            # stressreyb2
+            #############
+            print(("over disk+corona" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            #rhosqdc:
+            # for most dense part of flow:
+            #denfactor=rholab**2
+            # for entire flow:
             denfactor=1.0 + rholab*0.0
-            diskcondition=(bsq/rho<1)
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsb2[qindex]=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            if avgexists==1:
-                numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            else:
-                numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsb2[qindex]=numer/denom
             #
-            # stressreyc2
+            diskcondition=condmaxbsqorho*(bsq/rho<1.0) # non-jet
+            keywordsrhosqdc={'which': diskcondition}
+            rhosqdcint=intangle(gdet*denfactor,**keywordsrhosqdc)+tiny # gdet is 2d by default
+            rhosqdcs[qindex]=rhosqdcint
+            maxrhosqdc2d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqdc3d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqdc3d[:,j,:] = maxrhosqdc2d
+            rhosrhosqdc[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqdc)/rhosqdcint
+            ugsrhosqdc[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqdc)/rhosqdcint
+            uradsrhosqdc[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqdc)/rhosqdcint
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
             denfactor=1.0 + rholab*0.0
-            diskcondition=(bsq/rho<1)
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsc2[qindex]=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            if avgexists==1:
-                numer=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            else:
-                numer=intangle(gdet*jabs((bsq)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsc2[qindex]=numer/denom
+            diskcondition=condmaxbsqorho*(bsq/rho<1.0) # non-jet
+            keywordsrhosqdc={'which': diskcondition}
+            rhosqdcint=intangle(gdet*denfactor,**keywordsrhosqdc)+tiny
+            uu0rhosqdc[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqdc)/rhosqdcint
+            vus1rhosqdc[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqdc)/rhosqdcint
+            vuas1rhosqdc[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            vus3rhosqdc[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqdc)/rhosqdcint
+            vuas3rhosqdc[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            vuasrotrhosqdc[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bs1rhosqdc[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bas1rhosqdc[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bs2rhosqdc[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bas2rhosqdc[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bs3rhosqdc[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqdc)/rhosqdcint
+            Bas3rhosqdc[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bs1rhosqdc[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bas1rhosqdc[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bs2rhosqdc[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bas2rhosqdc[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bs3rhosqdc[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bas3rhosqdc[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqdc)/rhosqdcint
+            bsqrhosqdc[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqdc)/rhosqdcint
+            #rhosqdc:
             #
-            # stressreya3
+            printusage()
+            gc.collect()
+            printusage()
+            #
+            #############
+            print(("over dense part of disk+corona" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            #rhosqdcden:
+            # for most dense part of flow:
+            #denfactor=rholab**2
+            # for entire flow:
             denfactor=rholab
-            diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsa3[qindex]=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            if avgexists==1:
-                numer=intangle(gdet*jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            else:
-                numer=intangle(gdet*jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsa3[qindex]=numer/denom
             #
-            # stressreyb3
+            diskcondition=condmaxbsqorho # full non-jet
+            keywordsrhosqdcden={'which': diskcondition}
+            rhosqdcdenint=intangle(gdet*denfactor,**keywordsrhosqdcden)+tiny # gdet is 2d by default
+            rhosqdcdens[qindex]=rhosqdcdenint
+            maxrhosqdcden2d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqdcden3d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqdcden3d[:,j,:] = maxrhosqdcden2d
+            rhosrhosqdcden[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqdcden)/rhosqdcdenint
+            ugsrhosqdcden[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqdcden)/rhosqdcdenint
+            uradsrhosqdcden[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqdcden)/rhosqdcdenint
             denfactor=rholab
+            diskcondition=condmaxbsqorho # full non-jet
+            keywordsrhosqdcden={'which': diskcondition}
+            rhosqdcdenint=intangle(gdet*denfactor,**keywordsrhosqdcden)+tiny
+            uu0rhosqdcden[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            vus1rhosqdcden[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            vuas1rhosqdcden[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            vus3rhosqdcden[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            vuas3rhosqdcden[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            vuasrotrhosqdcden[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bs1rhosqdcden[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bas1rhosqdcden[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bs2rhosqdcden[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bas2rhosqdcden[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bs3rhosqdcden[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            Bas3rhosqdcden[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bs1rhosqdcden[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bas1rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bs2rhosqdcden[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bas2rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bs3rhosqdcden[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bas3rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            bsqrhosqdcden[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
+            #rhosqdcden:
+            #
+            printusage()
+            gc.collect()
+            printusage()
+            #############
+            print(("at equator and portion of \phi" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
+            # pick out equator (within 3 cells to smear out grid-scale noise) and a restricted portion of \phi in order to avoid averaging over warping disk
+            diskcondition0=(np.abs(tj-ny/2)<3)
+            if nz>1:
+                diskcondition0=diskcondition0*(ph>0.0)
+                diskcondition0=diskcondition0*(ph<np.pi/4.0)
+            #
+            diskcondition=diskcondition0*condmaxbsqorho
+            keywordsrhosqeq={'which': diskcondition}
+            rhosqeqint=intangle(gdet*denfactor,**keywordsrhosqeq)+tiny
+            rhosqeqs[qindex]=rhosqeqint
+            maxrhosqeq2d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqeq3d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqeq3d[:,j,:] = maxrhosqeq2d
+            rhosrhosqeq[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqeq)/rhosqeqint
+            ugsrhosqeq[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqeq)/rhosqeqint
+            uradsrhosqeq[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqeq)/rhosqeqint
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
+            denfactor=1.0 + rholab*0.0
+            # yes avoid restriction, at equator no matter if disk or jet
+            diskcondition=diskcondition0*(1 + condmaxbsqorho*0.0)
+            keywordsrhosqeq={'which': diskcondition}
+            rhosqeqint=intangle(gdet*denfactor,**keywordsrhosqeq)+tiny
+            uu0rhosqeq[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqeq)/rhosqeqint
+            vus1rhosqeq[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqeq)/rhosqeqint
+            vuas1rhosqeq[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            vus3rhosqeq[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqeq)/rhosqeqint
+            vuas3rhosqeq[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            vuasrotrhosqeq[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bs1rhosqeq[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bas1rhosqeq[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bs2rhosqeq[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bas2rhosqeq[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bs3rhosqeq[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqeq)/rhosqeqint
+            Bas3rhosqeq[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bs1rhosqeq[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bas1rhosqeq[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bs2rhosqeq[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bas2rhosqeq[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bs3rhosqeq[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bas3rhosqeq[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqeq)/rhosqeqint
+            bsqrhosqeq[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqeq)/rhosqeqint
+            #
+            printusage()
+            gc.collect()
+            printusage()
+            #############
+            print(("at 2.5H/R and portion of \phi" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
+            # pick out *at* horpickit*H/R (set with H/R above)
+            diskcondition0=horpickcondition
+            diskcondition=diskcondition0*condmaxbsqorho
+            # and avoid averaging over warp by restricing phi range
+            keywordsrhosqhorpick={'which': diskcondition}
+            rhosqhorpickint=intangle(gdet*denfactor,**keywordsrhosqhorpick)+tiny
+            rhosqhorpicks[qindex]=rhosqhorpickint
+            maxrhosqhorpick2d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqhorpick3d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqhorpick3d[:,j,:] = maxrhosqhorpick2d
+            rhosrhosqhorpick[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqhorpick)/rhosqhorpickint
+            ugsrhosqhorpick[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqhorpick)/rhosqhorpickint
+            uradsrhosqhorpick[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqhorpick)/rhosqhorpickint
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
+            denfactor=1.0 + rholab*0.0
+            # don't restrict since fixed point in space related to disk but not entirely.  The bsq/rho condition would also remove the disk at inner radii even for H/R within hoverr3d that is mass-density weighted.
+            diskcondition=diskcondition0*(1 + condmaxbsqorho*0.0)
+            keywordsrhosqhorpick={'which': diskcondition}
+            rhosqhorpickint=intangle(gdet*denfactor,**keywordsrhosqhorpick)+tiny
+            uu0rhosqhorpick[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            vus1rhosqhorpick[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            vuas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            vus3rhosqhorpick[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            vuas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            vuasrotrhosqhorpick[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bs1rhosqhorpick[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bs2rhosqhorpick[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bas2rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bs3rhosqhorpick[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            Bas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bs1rhosqhorpick[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bs2rhosqhorpick[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bas2rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bs3rhosqhorpick[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            bsqrhosqhorpick[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
+            #
+            ##2h (keywords2h now set in Mdot below)
+            #keywords2h={'hoverr': 2*horval, 'which': diskcondition}
+            #denfactor=1.0 + rholab*0.0
+            #gdetint=intangle(gdet*denfactor,**keywords2h)+tiny
+            #gdetint2h[qindex]=gdetint
+            #rhos2h[qindex]=intangle(gdet*rho,**keywords2h)/gdetint
+            #ugs2h[qindex]=intangle(gdet*ug,**keywords2h)/gdetint
+            #uu02h[qindex]=intangle(gdet*myuu0,**keywords2h)/gdetint
+            #vus12h[qindex]=intangle(gdet*myuu1,**keywords2h)/gdetint
+            #vuas12h[qindex]=intangle(gdet*np.fabs(myuu1),**keywords2h)/gdetint
+            #vus32h[qindex]=intangle(gdet*myuu3,**keywords2h)/gdetint
+            #vuas32h[qindex]=intangle(gdet*np.fabs(myuu3),**keywords2h)/gdetint
+            #vuasrot2h[qindex]=intangle(gdet*np.fabs(myuurot),**keywords2h)/gdetint
+            #Bs12h[qindex]=intangle(gdet*myB1,**keywords2h)/gdetint
+            #Bas12h[qindex]=intangle(np.abs(gdet*myB1),**keywords2h)/gdetint
+            #Bs22h[qindex]=intangle(gdet*myB2,**keywords2h)/gdetint
+            #Bas22h[qindex]=intangle(np.abs(gdet*myB2),**keywords2h)/gdetint
+            #Bs32h[qindex]=intangle(gdet*myB3,**keywords2h)/gdetint
+            #Bas32h[qindex]=intangle(np.abs(gdet*myB3),**keywords2h)/gdetint
+            ##4h (keywords4h now set in Mdot below)
+            #keywords4h={'hoverr': 4*horval, 'which': diskcondition}
+            #denfactor=1.0 + rholab*0.0
+            #gdetint=intangle(gdet*denfactor,**keywords4h)+tiny
+            #gdetint4h[qindex]=gdetint
+            #rhos4h[qindex]=intangle(gdet*rho,**keywords4h)/gdetint
+            #ugs4h[qindex]=intangle(gdet*ug,**keywords4h)/gdetint
+            #uu04h[qindex]=intangle(gdet*myuu0,**keywords4h)/gdetint
+            #vus14h[qindex]=intangle(gdet*myuu1,**keywords4h)/gdetint
+            #vuas14h[qindex]=intangle(gdet*np.fabs(myuu1),**keywords4h)/gdetint
+            #vus34h[qindex]=intangle(gdet*myuu3,**keywords4h)/gdetint
+            #vuas34h[qindex]=intangle(gdet*np.fabs(myuu3),**keywords4h)/gdetint
+            #vuasrot4h[qindex]=intangle(gdet*np.fabs(myuurot),**keywords4h)/gdetint
+            #Bs14h[qindex]=intangle(gdet*myB1,**keywords4h)/gdetint
+            #Bas14h[qindex]=intangle(np.abs(gdet*myB1),**keywords4h)/gdetint
+            #Bs24h[qindex]=intangle(gdet*myB2,**keywords4h)/gdetint
+            #Bas24h[qindex]=intangle(np.abs(gdet*myB2),**keywords4h)/gdetint
+            #Bs34h[qindex]=intangle(gdet*myB3,**keywords4h)/gdetint
+            #Bas34h[qindex]=intangle(np.abs(gdet*myB3),**keywords4h)/gdetint
+            ##
+            printusage()
+            gc.collect()
+            printusage()
+            #############
+            print(("within 2.0H/R" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            #2.0hor
             diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsb3[qindex]=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
+            keywordshor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
+            denfactor=1.0 + rholab*0.0
+            gdetint=intangle(gdet*denfactor,**keywordshor) # gdet is 2D by default
+            gdetinthor[qindex]=gdetint+tiny
+            rhoshor[qindex]=intangle(gdet*rho,**keywordshor)/gdetint
+            ugshor[qindex]=intangle(gdet*ug,**keywordshor)/gdetint
+            # no restriction for velocity or field quantities!
+            #diskcondition=1 + condmaxbsqorho*0.0
+            # no, should still restrict since this is choosing within 2H/R -- so focus is the disk!
+            diskcondition=condmaxbsqorho
+            keywordshor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
+            gdetint=intangle(gdet*denfactor,**keywordshor)
+            gdetinthor[qindex]=gdetint+tiny
+            bsqshor[qindex]=intangle(gdet*bsq,**keywordshor)/gdetint
+            bsqorhoshor[qindex]=intangle(gdet*(bsq/rho),**keywordshor)/gdetint
+            bsqougshor[qindex]=intangle(gdet*(bsq/ug),**keywordshor)/gdetint
+            uu0hor[qindex]=intangle(gdet*myuu0,**keywordshor)/gdetint
+            vus1hor[qindex]=intangle(gdet*myuu1,**keywordshor)/gdetint
+            vuas1hor[qindex]=intangle(gdet*np.fabs(myuu1),**keywordshor)/gdetint
+            vus3hor[qindex]=intangle(gdet*myuu3,**keywordshor)/gdetint
+            vuas3hor[qindex]=intangle(gdet*np.fabs(myuu3),**keywordshor)/gdetint
+            vuasrothor[qindex]=intangle(gdet*np.fabs(myuurot),**keywordshor)/gdetint
+            Bs1hor[qindex]=intangle(gdet*myB1,**keywordshor)/gdetint
+            Bas1hor[qindex]=intangle(np.abs(gdet*myB1),**keywordshor)/gdetint
+            Bs2hor[qindex]=intangle(gdet*myB2,**keywordshor)/gdetint
+            Bas2hor[qindex]=intangle(np.abs(gdet*myB2),**keywordshor)/gdetint
+            Bs3hor[qindex]=intangle(gdet*myB3,**keywordshor)/gdetint
+            Bas3hor[qindex]=intangle(np.abs(gdet*myB3),**keywordshor)/gdetint
+            bs1hor[qindex]=intangle(gdet*mybu1,**keywordshor)/gdetint
+            bas1hor[qindex]=intangle(np.abs(gdet*mybu1),**keywordshor)/gdetint
+            bs2hor[qindex]=intangle(gdet*mybu2,**keywordshor)/gdetint
+            bas2hor[qindex]=intangle(np.abs(gdet*mybu2),**keywordshor)/gdetint
+            bs3hor[qindex]=intangle(gdet*mybu3,**keywordshor)/gdetint
+            bas3hor[qindex]=intangle(np.abs(gdet*mybu3),**keywordshor)/gdetint
+            bsqhor[qindex]=intangle(gdet*bsq,**keywordshor)/gdetint
+            #
+            #
+            #### Updated 3/9/15 by Megan for stress,bz correlation analysis                                                                                                                          
+            #anls=open("out"+str(findex)+".npz","w") ###try not to write over important stuff                                                                             
+            ###Unaveraged quantities                                                                     
+            numMag=jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))
+            denMR=(bsq*0.5+(gam-1.0)*ug)
+            amag=numMag/denMR                                                                                                                                                                                      
             if avgexists==1:
-                numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+                numRey=jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))
             else:
-                numer=intangle(gdet*jabs((ug+(gam-1.0)*ug)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsb3[qindex]=numer/denom
+                numRey=jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))
+            arey=numRey/denMR
+            stress=amag+arey
+                                                                                                                                                                         
+            bz=mybu2
+            abz=myabu2                                                                                                
+            #np.savez(anls, amag=amag, arey=arey, bz=bz, abz=abz)
+            #anls.close()
             #
-            # stressreyc3
-            denfactor=rholab
-            diskcondition=condmaxbsqorho
-            keywordsrhosq={'which': diskcondition}
-            rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-            #alphareynoldsc3[qindex]=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))/(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            if avgexists==1:
-                numer=intangle(gdet*jabs((bsq)*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
+            #
+            #
+            printusage()
+            gc.collect()
+            printusage()
+            #
+            #
+            #
+            #############
+            print(("Along theta, not r.  Only portion in \phi to avoid washing out warping" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            #############
+            #
+            #
+            print(("pick out *at* r\sim 4M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
+            pickr=4.0
+            spreadr=0.1*pickr
+            rin=pickr-spreadr
+            rout=pickr+spreadr
+            if nz>1:
+                phiin=0.0
+                phiout=np.pi/4.0  # pi/4 so can capture m=1,2,3,4,5,6,7,8 modes in time series while averaging over noise to promote signal
             else:
-                numer=intangle(gdet*jabs((bsq)*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))*denfactor,**keywordsrhosq)/rhosqint
-            denom=intangle(gdet*(bsq*0.5+(gam-1.0)*ug)*denfactor,**keywordsrhosq)/rhosqint
-            alphareynoldsc3[qindex]=numer/denom
+                phiin=0.0
+                phiout=2.0*np.pi
             #
-        #
-        #
-        #
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #################################
-        print(("all primitives in various forms" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #################################
-        #
-        # MEMMARK: below increases as if 48 variables per 3D point!
-        # should be about 30, not 48.  GODMARK.  metric and avg stuff should be 2d!
-        #
-        # whether velocity outputted will be 4-vel or fake orthonormal 3-vel
-        output4vel=1
-        #
-        if output4vel==0:
-            # avoid nan inside r=2M.  But set get fabs, so can recover values
-            mygv300=-gv3[0,0]
-            mygv300=np.fabs(mygv300)
-            iuu0hat=1.0/(uu[0]*np.sqrt(mygv300))
-            myuu0=uu[0]*np.sqrt(mygv300)
-            myuu1=uu[1]*np.sqrt(gv3[1,1])*iuu0hat
-            myuu2=uu[2]*np.sqrt(gv3[2,2])*iuu0hat
-            myuu3=uu[3]*np.sqrt(gv3[3,3])*iuu0hat
-            myuurot=np.sqrt(myuu2**2+myuu3**2)
-            myB1=B[1]*np.sqrt(gv3[1,1])
-            myB2=B[2]*np.sqrt(gv3[2,2])
-            myB3=B[3]*np.sqrt(gv3[3,3])
-            mybu1=bu[1]*np.sqrt(gv3[1,1])
-            mybu2=bu[2]*np.sqrt(gv3[2,2])
-            mybu3=bu[3]*np.sqrt(gv3[3,3])
+            diskcondition=condmaxbsqorho
+            # and avoid averaging over warp by restricing phi range
+            keywordsrhosqrad4={'which': diskcondition}
+            rhosqrad4int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad4)+tiny
+            rhosqrad4[qindex]=rhosqrad4int
+            maxrhosqrad42d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqrad43d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqrad43d[:,j,:] = maxrhosqrad42d
+            rhosrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad4)/rhosqrad4int
+            ugsrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad4)/rhosqrad4int
+            uradsrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad4)/rhosqrad4int
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
+            denfactor=1.0 + rholab*0.0
+            diskcondition=(1 + condmaxbsqorho*0.0)
+            keywordsrhosqrad4={'which': diskcondition}
+            rhosqrad4int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad4)+tiny
+            uu0rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            #uu0rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad4)/rhosqrad4int
+            vus1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            vuas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            vus3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            vuas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            vuasrotrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bs1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bs2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bas2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bs3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            Bas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bs1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bs2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bas2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bs3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
+            bsqrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad4)/rhosqrad4int
             #
-            if avgexists==1:
-                # then do for these as well since needed
-                # NOTEMARK: works since metric not \phi-dependent
-                avg_iuu0hat=1.0/(avg_uu[0]*np.sqrt(mygv300))
-                avg_myuu0=avg_uu[0]*np.sqrt(mygv300)
-                avg_myuu1=avg_uu[1]*np.sqrt(gv3[1,1])*avg_iuu0hat
-                avg_myuu2=avg_uu[2]*np.sqrt(gv3[2,2])*avg_iuu0hat
-                avg_myuu3=avg_uu[3]*np.sqrt(gv3[3,3])*avg_iuu0hat
-                avg_myuurot=np.sqrt(avg_myuu2**2+avg_myuu3**2)  # GODMARK: should have rot version directly averaged so \theta,\phi correlations accounted for
-                avg_myB1=avg_B[1-1]*np.sqrt(gv3[1,1])
-                avg_myB2=avg_B[2-1]*np.sqrt(gv3[2,2])
-                avg_myB3=avg_B[3-1]*np.sqrt(gv3[3,3])
-                avg_mybu1=avg_bu[1]*np.sqrt(gv3[1,1])
-                avg_mybu2=avg_bu[2]*np.sqrt(gv3[2,2])
-                avg_mybu3=avg_bu[3]*np.sqrt(gv3[3,3])
-                #
-                avg_iauu0hat=1.0/(avg_absuu[0]*np.sqrt(mygv300))
-                avg_myauu0=avg_absuu[0]*np.sqrt(mygv300)
-                avg_myauu1=avg_absuu[1]*np.sqrt(gv3[1,1])*avg_iauu0hat
-                avg_myauu2=avg_absuu[2]*np.sqrt(gv3[2,2])*avg_iauu0hat
-                avg_myauu3=avg_absuu[3]*np.sqrt(gv3[3,3])*avg_iauu0hat
-                avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2)
-                avg_myaB1=avg_absB[1-1]*np.sqrt(gv3[1,1])
-                avg_myaB2=avg_absB[2-1]*np.sqrt(gv3[2,2])
-                avg_myaB3=avg_absB[3-1]*np.sqrt(gv3[3,3])
-                avg_myabu1=avg_absbu[1]*np.sqrt(gv3[1,1])
-                avg_myabu2=avg_absbu[2]*np.sqrt(gv3[2,2])
-                avg_myabu3=avg_absbu[3]*np.sqrt(gv3[3,3])
-            #
-            #
-        elif output4vel==1:
-            # fully obtain approximate invariant 3-vel and 4-field so averaging makes sense
-            sigmaks=r**2+(a*np.cos(h))**2
-            deltaks=r**2-2*r+a**2
-            Aks=(r**2+a**2)**2-a**2*deltaks*(np.sin(h))**2
-            #
-            gvks00=-(1.0-2.0*r/sigmaks)
-            gvks11=(1.0+2.0*r/sigmaks)
-            gvks22=sigmaks
-            gvks33=(np.sin(h))**2*(sigmaks + a**2*(1.0 + 2.0*r/sigmaks)*(np.sin(h))**2)
-            #
-            myuu0=uu[0]*dxdxp[0,0]
-            myuu1=(uu[1]*dxdxp[1,1] + uu[2]*dxdxp[1,2])*np.sqrt(gvks11)/myuu0
-            myuu2=(uu[1]*dxdxp[2,1] + uu[2]*dxdxp[2,2])*np.sqrt(gvks22)/myuu0
-            myuu3=(uu[3]*dxdxp[3,3])*np.sqrt(gvks33)/myuu0
-            myuurot=np.sqrt(myuu2**2+myuu3**2)
-            myB1=(B[1]*dxdxp[1,1] + B[2]*dxdxp[1,2])*np.sqrt(gvks11)
-            myB2=(B[1]*dxdxp[2,1] + B[2]*dxdxp[2,2])*np.sqrt(gvks22)
-            myB3=(B[3]*dxdxp[3,3])*np.sqrt(gvks33)
-            mybu1=(bu[1]*dxdxp[1,1] + bu[2]*dxdxp[1,2])*np.sqrt(gvks11)
-            mybu2=(bu[1]*dxdxp[2,1] + bu[2]*dxdxp[2,2])*np.sqrt(gvks22)
-            mybu3=(bu[3]*dxdxp[3,3])*np.sqrt(gvks33)
             #
-            if avgexists==1:
-                # NOTEMARK: works since metric not \phi-dependent
-                avg_myuu0=avg_uu[0]*dxdxp[0,0]
-                avg_myuu1=(avg_uu[1]*dxdxp[1,1] + avg_uu[2]*dxdxp[1,2])*np.sqrt(gvks11)/avg_myuu0
-                avg_myuu2=(avg_uu[1]*dxdxp[2,1] + avg_uu[2]*dxdxp[2,2])*np.sqrt(gvks22)/avg_myuu0
-                avg_myuu3=(avg_uu[3]*dxdxp[3,3])*np.sqrt(gvks33)/avg_myuu0
-                avg_myuurot=np.sqrt(avg_myuu2**2+avg_myuu3**2)    # GODMARK: should have rot version directly averaged so \theta,\phi correlations accounted for
-                avg_myB1=(avg_B[1-1]*dxdxp[1,1] + avg_B[2-1]*dxdxp[1,2])*np.sqrt(gvks11)
-                avg_myB2=(avg_B[1-1]*dxdxp[2,1] + avg_B[2-1]*dxdxp[2,2])*np.sqrt(gvks22)
-                avg_myB3=(avg_B[3-1]*dxdxp[3,3])*np.sqrt(gvks33)
-                avg_mybu1=(avg_bu[1]*dxdxp[1,1] + avg_bu[2]*dxdxp[1,2])*np.sqrt(gvks11)
-                avg_mybu2=(avg_bu[1]*dxdxp[2,1] + avg_bu[2]*dxdxp[2,2])*np.sqrt(gvks22)
-                avg_mybu3=(avg_bu[3]*dxdxp[3,3])*np.sqrt(gvks33)
-                #
-                avg_myauu0=avg_absuu[0]*dxdxp[0,0]
-                avg_myauu1=(avg_absuu[1]*dxdxp[1,1] + avg_absuu[2]*dxdxp[1,2])*np.sqrt(gvks11)/avg_myauu0
-                avg_myauu2=(avg_absuu[1]*dxdxp[2,1] + avg_absuu[2]*dxdxp[2,2])*np.sqrt(gvks22)/avg_myauu0
-                avg_myauu3=(avg_absuu[3]*dxdxp[3,3])*np.sqrt(gvks33)/avg_myauu0
-                avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2)
-                #avg_myauurot=np.sqrt(avg_myauu2**2+avg_myauu3**2) # GODMARK
-                avg_myaB1=(avg_absB[1-1]*dxdxp[1,1] + avg_absB[2-1]*dxdxp[1,2])*np.sqrt(gvks11)
-                avg_myaB2=(avg_absB[1-1]*dxdxp[2,1] + avg_absB[2-1]*dxdxp[2,2])*np.sqrt(gvks22)
-                avg_myaB3=(avg_absB[3-1]*dxdxp[3,3])*np.sqrt(gvks33)
-                avg_myabu1=(avg_absbu[1]*dxdxp[1,1] + avg_absbu[2]*dxdxp[1,2])*np.sqrt(gvks11)
-                avg_myabu2=(avg_absbu[1]*dxdxp[2,1] + avg_absbu[2]*dxdxp[2,2])*np.sqrt(gvks22)
-                avg_myabu3=(avg_absbu[3]*dxdxp[3,3])*np.sqrt(gvks33)
-            #
-        elif output4vel==2:
-            print("Not yet")
-            if avgexists==1:
-                print(("avgexists=%d: Not yet" % (avgexists)))
-        #
-        myauu0=np.abs(myuu0)
-        myauu1=np.abs(myuu1)
-        myauu2=np.abs(myuu2)
-        myauu3=np.abs(myuu3)
-        myauurot=np.abs(myuurot)
-        myaB1=np.abs(myB1)
-        myaB2=np.abs(myB2)
-        myaB3=np.abs(myB3)
-        myabu1=np.abs(mybu1)
-        myabu2=np.abs(mybu2)
-        myabu3=np.abs(mybu3)
-        # 0 = 1 + u^t u_t + u^r u_r + u^h u_h + u^p u_p
-        # 0 = 1 + u^r u_r / (1+u^t u_t) + u^h u_h / (1+u^t u_t) + u^p u_p / (1+u^t u_t)
-        # 1/(-u^t u_t) + 1 =  + u^r u_r / (-u^t u_t) + u^h u_h / (-u^t u_t) + u^p u_p / (-u^t u_t)
-        #
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #
-        #
-        #############
-        print(("over full flow" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        #rhosq:
-        # for most dense part of flow:
-        #denfactor=rholab**2
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        #
-        diskcondition=condmaxbsqorho
-        keywordsrhosq={'which': diskcondition}
-        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny # gdet is 2d by default
-        rhosqs[qindex]=rhosqint
-        maxrhosq2d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosq3d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosq3d[:,j,:] = maxrhosq2d
-        rhosrhosq[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosq)/rhosqint
-        ugsrhosq[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosq)/rhosqint
-        uradsrhosq[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosq)/rhosqint
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        # yes, over whole disk so include jet for vel/field
-        diskcondition=1 + condmaxbsqorho*0.0
-        keywordsrhosq={'which': diskcondition}
-        rhosqint=intangle(gdet*denfactor,**keywordsrhosq)+tiny
-        uu0rhosq[qindex]=intangle(gdet*denfactor*myuu0,**keywordsrhosq)/rhosqint
-        vus1rhosq[qindex]=intangle(gdet*denfactor*myuu1,**keywordsrhosq)/rhosqint
-        vuas1rhosq[qindex]=intangle(gdet*denfactor*np.abs(myuu1),**keywordsrhosq)/rhosqint
-        vus3rhosq[qindex]=intangle(gdet*denfactor*myuu3,**keywordsrhosq)/rhosqint
-        vuas3rhosq[qindex]=intangle(gdet*denfactor*np.abs(myuu3),**keywordsrhosq)/rhosqint
-        vuasrotrhosq[qindex]=intangle(gdet*denfactor*np.abs(myuurot),**keywordsrhosq)/rhosqint
-        Bs1rhosq[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosq)/rhosqint
-        Bas1rhosq[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosq)/rhosqint
-        Bs2rhosq[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosq)/rhosqint
-        Bas2rhosq[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosq)/rhosqint
-        Bs3rhosq[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosq)/rhosqint
-        Bas3rhosq[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosq)/rhosqint
-        bs1rhosq[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosq)/rhosqint
-        bas1rhosq[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosq)/rhosqint
-        bs2rhosq[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosq)/rhosqint
-        bas2rhosq[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosq)/rhosqint
-        bs3rhosq[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosq)/rhosqint
-        bas3rhosq[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosq)/rhosqint
-        bsqrhosq[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosq)/rhosqint
-        #rhosq:
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #
-        #############
-        print(("over disk+corona" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        #rhosqdc:
-        # for most dense part of flow:
-        #denfactor=rholab**2
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        #
-        diskcondition=condmaxbsqorho*(bsq/rho<1.0) # non-jet
-        keywordsrhosqdc={'which': diskcondition}
-        rhosqdcint=intangle(gdet*denfactor,**keywordsrhosqdc)+tiny # gdet is 2d by default
-        rhosqdcs[qindex]=rhosqdcint
-        maxrhosqdc2d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqdc3d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqdc3d[:,j,:] = maxrhosqdc2d
-        rhosrhosqdc[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqdc)/rhosqdcint
-        ugsrhosqdc[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqdc)/rhosqdcint
-        uradsrhosqdc[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqdc)/rhosqdcint
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        diskcondition=condmaxbsqorho*(bsq/rho<1.0) # non-jet
-        keywordsrhosqdc={'which': diskcondition}
-        rhosqdcint=intangle(gdet*denfactor,**keywordsrhosqdc)+tiny
-        uu0rhosqdc[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqdc)/rhosqdcint
-        vus1rhosqdc[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqdc)/rhosqdcint
-        vuas1rhosqdc[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        vus3rhosqdc[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqdc)/rhosqdcint
-        vuas3rhosqdc[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        vuasrotrhosqdc[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bs1rhosqdc[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bas1rhosqdc[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bs2rhosqdc[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bas2rhosqdc[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bs3rhosqdc[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqdc)/rhosqdcint
-        Bas3rhosqdc[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bs1rhosqdc[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bas1rhosqdc[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bs2rhosqdc[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bas2rhosqdc[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bs3rhosqdc[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bas3rhosqdc[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqdc)/rhosqdcint
-        bsqrhosqdc[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqdc)/rhosqdcint
-        #rhosqdc:
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #
-        #############
-        print(("over dense part of disk+corona" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        #rhosqdcden:
-        # for most dense part of flow:
-        #denfactor=rholab**2
-        # for entire flow:
-        denfactor=rholab
-        #
-        diskcondition=condmaxbsqorho # full non-jet
-        keywordsrhosqdcden={'which': diskcondition}
-        rhosqdcdenint=intangle(gdet*denfactor,**keywordsrhosqdcden)+tiny # gdet is 2d by default
-        rhosqdcdens[qindex]=rhosqdcdenint
-        maxrhosqdcden2d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqdcden3d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqdcden3d[:,j,:] = maxrhosqdcden2d
-        rhosrhosqdcden[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqdcden)/rhosqdcdenint
-        ugsrhosqdcden[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqdcden)/rhosqdcdenint
-        uradsrhosqdcden[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqdcden)/rhosqdcdenint
-        denfactor=rholab
-        diskcondition=condmaxbsqorho # full non-jet
-        keywordsrhosqdcden={'which': diskcondition}
-        rhosqdcdenint=intangle(gdet*denfactor,**keywordsrhosqdcden)+tiny
-        uu0rhosqdcden[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        vus1rhosqdcden[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        vuas1rhosqdcden[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        vus3rhosqdcden[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        vuas3rhosqdcden[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        vuasrotrhosqdcden[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bs1rhosqdcden[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bas1rhosqdcden[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bs2rhosqdcden[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bas2rhosqdcden[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bs3rhosqdcden[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        Bas3rhosqdcden[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bs1rhosqdcden[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bas1rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bs2rhosqdcden[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bas2rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bs3rhosqdcden[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bas3rhosqdcden[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        bsqrhosqdcden[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqdcden)/rhosqdcdenint
-        #rhosqdcden:
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #############
-        print(("at equator and portion of \phi" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        # pick out equator (within 3 cells to smear out grid-scale noise) and a restricted portion of \phi in order to avoid averaging over warping disk
-        diskcondition0=(np.abs(tj-ny/2)<3)
-        if nz>1:
-            diskcondition0=diskcondition0*(ph>0.0)
-            diskcondition0=diskcondition0*(ph<np.pi/4.0)
-        #
-        diskcondition=diskcondition0*condmaxbsqorho
-        keywordsrhosqeq={'which': diskcondition}
-        rhosqeqint=intangle(gdet*denfactor,**keywordsrhosqeq)+tiny
-        rhosqeqs[qindex]=rhosqeqint
-        maxrhosqeq2d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqeq3d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqeq3d[:,j,:] = maxrhosqeq2d
-        rhosrhosqeq[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqeq)/rhosqeqint
-        ugsrhosqeq[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqeq)/rhosqeqint
-        uradsrhosqeq[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqeq)/rhosqeqint
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        # yes avoid restriction, at equator no matter if disk or jet
-        diskcondition=diskcondition0*(1 + condmaxbsqorho*0.0)
-        keywordsrhosqeq={'which': diskcondition}
-        rhosqeqint=intangle(gdet*denfactor,**keywordsrhosqeq)+tiny
-        uu0rhosqeq[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqeq)/rhosqeqint
-        vus1rhosqeq[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqeq)/rhosqeqint
-        vuas1rhosqeq[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        vus3rhosqeq[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqeq)/rhosqeqint
-        vuas3rhosqeq[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        vuasrotrhosqeq[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bs1rhosqeq[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bas1rhosqeq[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bs2rhosqeq[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bas2rhosqeq[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bs3rhosqeq[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqeq)/rhosqeqint
-        Bas3rhosqeq[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bs1rhosqeq[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bas1rhosqeq[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bs2rhosqeq[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bas2rhosqeq[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bs3rhosqeq[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bas3rhosqeq[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqeq)/rhosqeqint
-        bsqrhosqeq[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqeq)/rhosqeqint
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #############
-        print(("at 2.5H/R and portion of \phi" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        # pick out *at* horpickit*H/R
-        horpickit=2.5
-        diskcondition0=(np.abs(h-np.pi*0.5)<horpickit*hoverr3d)
-        diskcondition0=diskcondition0*(np.abs(h-np.pi*0.5)>0.5*horpickit*hoverr3d)
-        if nz>1:
-            diskcondition0=diskcondition0*(ph>0.0)
-            diskcondition0=diskcondition0*(ph<np.pi/4.0)
-        diskcondition=diskcondition0*condmaxbsqorho
-        # and avoid averaging over warp by restricing phi range
-        keywordsrhosqhorpick={'which': diskcondition}
-        rhosqhorpickint=intangle(gdet*denfactor,**keywordsrhosqhorpick)+tiny
-        rhosqhorpicks[qindex]=rhosqhorpickint
-        maxrhosqhorpick2d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqhorpick3d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqhorpick3d[:,j,:] = maxrhosqhorpick2d
-        rhosrhosqhorpick[qindex]=intangle(gdet*denfactor*rho,**keywordsrhosqhorpick)/rhosqhorpickint
-        ugsrhosqhorpick[qindex]=intangle(gdet*denfactor*ug,**keywordsrhosqhorpick)/rhosqhorpickint
-        uradsrhosqhorpick[qindex]=intangle(gdet*denfactor*urad,**keywordsrhosqhorpick)/rhosqhorpickint
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        # don't restrict since fixed point in space related to disk but not entirely.  The bsq/rho condition would also remove the disk at inner radii even for H/R within hoverr3d that is mass-density weighted.
-        diskcondition=diskcondition0*(1 + condmaxbsqorho*0.0)
-        keywordsrhosqhorpick={'which': diskcondition}
-        rhosqhorpickint=intangle(gdet*denfactor,**keywordsrhosqhorpick)+tiny
-        uu0rhosqhorpick[qindex]=intangle(gdet*myuu0*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        vus1rhosqhorpick[qindex]=intangle(gdet*myuu1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        vuas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        vus3rhosqhorpick[qindex]=intangle(gdet*myuu3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        vuas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        vuasrotrhosqhorpick[qindex]=intangle(gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bs1rhosqhorpick[qindex]=intangle(gdet*myB1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bs2rhosqhorpick[qindex]=intangle(gdet*myB2*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bas2rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB2)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bs3rhosqhorpick[qindex]=intangle(gdet*myB3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        Bas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(myB3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bs1rhosqhorpick[qindex]=intangle(gdet*mybu1*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bas1rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bs2rhosqhorpick[qindex]=intangle(gdet*mybu2*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bas2rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bs3rhosqhorpick[qindex]=intangle(gdet*mybu3*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bas3rhosqhorpick[qindex]=intangle(gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        bsqrhosqhorpick[qindex]=intangle(gdet*bsq*denfactor,**keywordsrhosqhorpick)/rhosqhorpickint
-        #
-        ##2h
-        keywords2h={'hoverr': 2*horval, 'which': diskcondition}
-        #denfactor=1.0 + rholab*0.0
-        #gdetint=intangle(gdet*denfactor,**keywords2h)+tiny
-        #gdetint2h[qindex]=gdetint
-        #rhos2h[qindex]=intangle(gdet*rho,**keywords2h)/gdetint
-        #ugs2h[qindex]=intangle(gdet*ug,**keywords2h)/gdetint
-        #uu02h[qindex]=intangle(gdet*myuu0,**keywords2h)/gdetint
-        #vus12h[qindex]=intangle(gdet*myuu1,**keywords2h)/gdetint
-        #vuas12h[qindex]=intangle(gdet*np.fabs(myuu1),**keywords2h)/gdetint
-        #vus32h[qindex]=intangle(gdet*myuu3,**keywords2h)/gdetint
-        #vuas32h[qindex]=intangle(gdet*np.fabs(myuu3),**keywords2h)/gdetint
-        #vuasrot2h[qindex]=intangle(gdet*np.fabs(myuurot),**keywords2h)/gdetint
-        #Bs12h[qindex]=intangle(gdet*myB1,**keywords2h)/gdetint
-        #Bas12h[qindex]=intangle(np.abs(gdet*myB1),**keywords2h)/gdetint
-        #Bs22h[qindex]=intangle(gdet*myB2,**keywords2h)/gdetint
-        #Bas22h[qindex]=intangle(np.abs(gdet*myB2),**keywords2h)/gdetint
-        #Bs32h[qindex]=intangle(gdet*myB3,**keywords2h)/gdetint
-        #Bas32h[qindex]=intangle(np.abs(gdet*myB3),**keywords2h)/gdetint
-        ##4h
-        keywords4h={'hoverr': 4*horval, 'which': diskcondition}
-        #denfactor=1.0 + rholab*0.0
-        #gdetint=intangle(gdet*denfactor,**keywords4h)+tiny
-        #gdetint4h[qindex]=gdetint
-        #rhos4h[qindex]=intangle(gdet*rho,**keywords4h)/gdetint
-        #ugs4h[qindex]=intangle(gdet*ug,**keywords4h)/gdetint
-        #uu04h[qindex]=intangle(gdet*myuu0,**keywords4h)/gdetint
-        #vus14h[qindex]=intangle(gdet*myuu1,**keywords4h)/gdetint
-        #vuas14h[qindex]=intangle(gdet*np.fabs(myuu1),**keywords4h)/gdetint
-        #vus34h[qindex]=intangle(gdet*myuu3,**keywords4h)/gdetint
-        #vuas34h[qindex]=intangle(gdet*np.fabs(myuu3),**keywords4h)/gdetint
-        #vuasrot4h[qindex]=intangle(gdet*np.fabs(myuurot),**keywords4h)/gdetint
-        #Bs14h[qindex]=intangle(gdet*myB1,**keywords4h)/gdetint
-        #Bas14h[qindex]=intangle(np.abs(gdet*myB1),**keywords4h)/gdetint
-        #Bs24h[qindex]=intangle(gdet*myB2,**keywords4h)/gdetint
-        #Bas24h[qindex]=intangle(np.abs(gdet*myB2),**keywords4h)/gdetint
-        #Bs34h[qindex]=intangle(gdet*myB3,**keywords4h)/gdetint
-        #Bas34h[qindex]=intangle(np.abs(gdet*myB3),**keywords4h)/gdetint
-        ##
-        printusage()
-        gc.collect()
-        printusage()
-        #############
-        print(("within 2.0H/R" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        #2.0hor
-        diskcondition=condmaxbsqorho
-        keywordshor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
-        denfactor=1.0 + rholab*0.0
-        gdetint=intangle(gdet*denfactor,**keywordshor) # gdet is 2D by default
-        gdetinthor[qindex]=gdetint+tiny
-        rhoshor[qindex]=intangle(gdet*rho,**keywordshor)/gdetint
-        ugshor[qindex]=intangle(gdet*ug,**keywordshor)/gdetint
-        # no restriction for velocity or field quantities!
-        #diskcondition=1 + condmaxbsqorho*0.0
-        # no, should still restrict since this is choosing within 2H/R -- so focus is the disk!
-        diskcondition=condmaxbsqorho
-        keywordshor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
-        gdetint=intangle(gdet*denfactor,**keywordshor)
-        gdetinthor[qindex]=gdetint+tiny
-        bsqshor[qindex]=intangle(gdet*bsq,**keywordshor)/gdetint
-        bsqorhoshor[qindex]=intangle(gdet*(bsq/rho),**keywordshor)/gdetint
-        bsqougshor[qindex]=intangle(gdet*(bsq/ug),**keywordshor)/gdetint
-        uu0hor[qindex]=intangle(gdet*myuu0,**keywordshor)/gdetint
-        vus1hor[qindex]=intangle(gdet*myuu1,**keywordshor)/gdetint
-        vuas1hor[qindex]=intangle(gdet*np.fabs(myuu1),**keywordshor)/gdetint
-        vus3hor[qindex]=intangle(gdet*myuu3,**keywordshor)/gdetint
-        vuas3hor[qindex]=intangle(gdet*np.fabs(myuu3),**keywordshor)/gdetint
-        vuasrothor[qindex]=intangle(gdet*np.fabs(myuurot),**keywordshor)/gdetint
-        Bs1hor[qindex]=intangle(gdet*myB1,**keywordshor)/gdetint
-        Bas1hor[qindex]=intangle(np.abs(gdet*myB1),**keywordshor)/gdetint
-        Bs2hor[qindex]=intangle(gdet*myB2,**keywordshor)/gdetint
-        Bas2hor[qindex]=intangle(np.abs(gdet*myB2),**keywordshor)/gdetint
-        Bs3hor[qindex]=intangle(gdet*myB3,**keywordshor)/gdetint
-        Bas3hor[qindex]=intangle(np.abs(gdet*myB3),**keywordshor)/gdetint
-        bs1hor[qindex]=intangle(gdet*mybu1,**keywordshor)/gdetint
-        bas1hor[qindex]=intangle(np.abs(gdet*mybu1),**keywordshor)/gdetint
-        bs2hor[qindex]=intangle(gdet*mybu2,**keywordshor)/gdetint
-        bas2hor[qindex]=intangle(np.abs(gdet*mybu2),**keywordshor)/gdetint
-        bs3hor[qindex]=intangle(gdet*mybu3,**keywordshor)/gdetint
-        bas3hor[qindex]=intangle(np.abs(gdet*mybu3),**keywordshor)/gdetint
-        bsqhor[qindex]=intangle(gdet*bsq,**keywordshor)/gdetint
-        #
-        #
-        #### Updated 3/9/15 by Megan for stress,bz correlation analysis                                                                                                                          
-        #anls=open("out"+str(findex)+".npz","w") ###try not to write over important stuff                                                                             
-        ###Unaveraged quantities                                                                     
-        numMag=jabs(-bu[1]*np.sqrt(gv3[1,1])*bd[3]*np.sqrt(gn3[3,3]))
-        denMR=(bsq*0.5+(gam-1.0)*ug)
-        amag=numMag/denMR                                                                                                                                                                                      
-        if avgexists==1:
-            numRey=jabs(rho*(uu[1]-avg_uu[1])*np.sqrt(gv3[1,1])*(ud[3]-avg_ud[3])*np.sqrt(gn3[3,3]))
-        else:
-            numRey=jabs(rho*(uu[1])*np.sqrt(gv3[1,1])*(ud[3])*np.sqrt(gn3[3,3]))
-        arey=numRey/denMR
-        stress=amag+arey
-                                                                                                                                                                         
-        bz=mybu2
-        abz=myabu2                                                                                                
-        #np.savez(anls, amag=amag, arey=arey, bz=bz, abz=abz)
-        #anls.close()
-        #
-        #
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #
-        #
-        #
-        #############
-        print(("Along theta, not r.  Only portion in \phi to avoid washing out warping" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        #############
-        #
-        #
-        print(("pick out *at* r\sim 4M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        pickr=4.0
-        spreadr=0.1*pickr
-        rin=pickr-spreadr
-        rout=pickr+spreadr
-        if nz>1:
-            phiin=0.0
-            phiout=np.pi/4.0  # pi/4 so can capture m=1,2,3,4,5,6,7,8 modes in time series while averaging over noise to promote signal
-        else:
-            phiin=0.0
-            phiout=2.0*np.pi
-        #
-        diskcondition=condmaxbsqorho
-        # and avoid averaging over warp by restricing phi range
-        keywordsrhosqrad4={'which': diskcondition}
-        rhosqrad4int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad4)+tiny
-        rhosqrad4[qindex]=rhosqrad4int
-        maxrhosqrad42d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqrad43d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqrad43d[:,j,:] = maxrhosqrad42d
-        rhosrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad4)/rhosqrad4int
-        ugsrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad4)/rhosqrad4int
-        uradsrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad4)/rhosqrad4int
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        diskcondition=(1 + condmaxbsqorho*0.0)
-        keywordsrhosqrad4={'which': diskcondition}
-        rhosqrad4int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad4)+tiny
-        uu0rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        #uu0rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad4)/rhosqrad4int
-        vus1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        vuas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        vus3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        vuas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        vuasrotrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bs1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bs2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bas2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bs3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        Bas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bs1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bas1rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bs2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bas2rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bs3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bas3rhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        bsqrhosqrad4[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad4)/rhosqrad4int
-        #
-        #
-        print(("pick out *at* r\sim 8M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        pickr=8.0
-        spreadr=0.1*pickr
-        rin=pickr-spreadr
-        rout=pickr+spreadr
-        if nz>1:
-            phiin=0.0
-            phiout=np.pi/4.0
-        else:
-            phiin=0.0
-            phiout=2.0*np.pi
-        #
-        diskcondition=condmaxbsqorho
-        # and avoid averaging over warp by restricing phi range
-        keywordsrhosqrad8={'which': diskcondition}
-        rhosqrad8int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad8)+tiny
-        rhosqrad8[qindex]=rhosqrad8int
-        maxrhosqrad82d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqrad83d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqrad83d[:,j,:] = maxrhosqrad82d
-        rhosrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad8)/rhosqrad8int
-        ugsrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad8)/rhosqrad8int
-        uradsrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad8)/rhosqrad8int
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        diskcondition=(1 + condmaxbsqorho*0.0)
-        keywordsrhosqrad8={'which': diskcondition}
-        rhosqrad8int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad8)+tiny
-        uu0rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        #uu0rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad8)/rhosqrad8int
-        vus1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        vuas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        vus3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        vuas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        vuasrotrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bs1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bs2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bas2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bs3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        Bas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bs1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bs2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bas2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bs3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        bsqrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad8)/rhosqrad8int
-        #
-        #
-        print(("pick out *at* r\sim 30M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # for entire flow:
-        denfactor=1.0 + rholab*0.0
-        pickr=30.0
-        spreadr=0.1*pickr
-        rin=pickr-spreadr
-        rout=pickr+spreadr
-        if nz>1:
-            phiin=0.0
-            phiout=np.pi/4.0
-        else:
-            phiin=0.0
-            phiout=2.0*np.pi
-        #
-        diskcondition=condmaxbsqorho
-        # and avoid averaging over warp by restricing phi range
-        keywordsrhosqrad30={'which': diskcondition}
-        rhosqrad30int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad30)+tiny
-        rhosqrad30[qindex]=rhosqrad30int
-        maxrhosqrad302d=(denfactor*diskcondition).max(1)+tiny
-        maxrhosqrad303d=np.empty_like(rho)
-        for j in np.arange(0,ny):
-            maxrhosqrad303d[:,j,:] = maxrhosqrad302d
-        rhosrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad30)/rhosqrad30int
-        ugsrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad30)/rhosqrad30int
-        uradsrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad30)/rhosqrad30int
-        # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
-        denfactor=1.0 + rholab*0.0
-        diskcondition=(1 + condmaxbsqorho*0.0)
-        keywordsrhosqrad30={'which': diskcondition}
-        rhosqrad30int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad30)+tiny
-        uu0rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        #uu0rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad30)/rhosqrad30int
-        vus1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        vuas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        vus3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        vuas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        vuasrotrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bs1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bs2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bas2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bs3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        Bas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bs1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bs2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bas2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bs3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
-        bsqrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            print(("pick out *at* r\sim 8M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
+            pickr=8.0
+            spreadr=0.1*pickr
+            rin=pickr-spreadr
+            rout=pickr+spreadr
+            if nz>1:
+                phiin=0.0
+                phiout=np.pi/4.0
+            else:
+                phiin=0.0
+                phiout=2.0*np.pi
+            #
+            diskcondition=condmaxbsqorho
+            # and avoid averaging over warp by restricing phi range
+            keywordsrhosqrad8={'which': diskcondition}
+            rhosqrad8int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad8)+tiny
+            rhosqrad8[qindex]=rhosqrad8int
+            maxrhosqrad82d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqrad83d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqrad83d[:,j,:] = maxrhosqrad82d
+            rhosrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad8)/rhosqrad8int
+            ugsrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad8)/rhosqrad8int
+            uradsrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad8)/rhosqrad8int
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
+            denfactor=1.0 + rholab*0.0
+            diskcondition=(1 + condmaxbsqorho*0.0)
+            keywordsrhosqrad8={'which': diskcondition}
+            rhosqrad8int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad8)+tiny
+            uu0rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            #uu0rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad8)/rhosqrad8int
+            vus1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            vuas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            vus3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            vuas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            vuasrotrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bs1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bs2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bas2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bs3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            Bas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bs1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bas1rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bs2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bas2rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bs3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bas3rhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            bsqrhosqrad8[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad8)/rhosqrad8int
+            #
+            #
+            print(("pick out *at* r\sim 30M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # for entire flow:
+            denfactor=1.0 + rholab*0.0
+            pickr=30.0
+            spreadr=0.1*pickr
+            rin=pickr-spreadr
+            rout=pickr+spreadr
+            if nz>1:
+                phiin=0.0
+                phiout=np.pi/4.0
+            else:
+                phiin=0.0
+                phiout=2.0*np.pi
+            #
+            diskcondition=condmaxbsqorho
+            # and avoid averaging over warp by restricing phi range
+            keywordsrhosqrad30={'which': diskcondition}
+            rhosqrad30int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad30)+tiny
+            rhosqrad30[qindex]=rhosqrad30int
+            maxrhosqrad302d=(denfactor*diskcondition).max(1)+tiny
+            maxrhosqrad303d=np.empty_like(rho)
+            for j in np.arange(0,ny):
+                maxrhosqrad303d[:,j,:] = maxrhosqrad302d
+            rhosrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*rho,**keywordsrhosqrad30)/rhosqrad30int
+            ugsrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*ug,**keywordsrhosqrad30)/rhosqrad30int
+            uradsrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*urad,**keywordsrhosqrad30)/rhosqrad30int
+            # no restriction for velocity or field quantities! (as long as denfactor=1 this is good)
+            denfactor=1.0 + rholab*0.0
+            diskcondition=(1 + condmaxbsqorho*0.0)
+            keywordsrhosqrad30={'which': diskcondition}
+            rhosqrad30int=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor,**keywordsrhosqrad30)+tiny
+            uu0rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu0*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            #uu0rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*denfactor*uu[0],**keywordsrhosqrad30)/rhosqrad30int
+            vus1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            vuas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            vus3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myuu3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            vuas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuu3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            vuasrotrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myuurot)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bs1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bs2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB2*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bas2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB2)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bs3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*myB3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            Bas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(myB3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bs1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu1*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bas1rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu1)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bs2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu2*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bas2rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu2)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bs3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*mybu3*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bas3rhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*np.fabs(mybu3)*denfactor,**keywordsrhosqrad30)/rhosqrad30int
+            bsqrhosqrad30[qindex]=intrpvsh(rin=rin,rout=rout,phiin=phiin,phiout=phiout,qty=gdet*bsq*denfactor,**keywordsrhosqrad30)/rhosqrad30int
         #
         #
         #
@@ -12695,7 +14573,7 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         printusage()
         #
         # setup things to find l,n Fourier transform of
-        if avgexists==1:
+        if avgexists==1 and qtyneed['perturbations']:
             drho=(rho-avg_rho)
             denomdrho=avg_rho
             dug=(ug-avg_ug)
@@ -12734,221 +14612,59 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         #############
         #
         # decide if want to compute this, since can be expensive and might not care to always compute it.
-        computephipow=1
+        computephipow=1 if qtyneed['phipow'] else 0
         #
         if computephipow==1:
-            print(("DISK+CORONA ONLY (never jet)" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            #
-            print(("pick out *at* r\sim r+" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=rhor
-            spreadr=0.1*pickr
-            rin=max(pickr-spreadr,1.01*Rin)
-            rout=pickr+spreadr
-            print(("rin=%g rout=%g Rin=%g rhor=%g r0=%g" % (rin,rout,Rin,rhor,r[0,0,0])))
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_diskcorona_phipow_radhor={'which': diskcondition}
-            maxbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=rhor
-            rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            rhosrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            ugsrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            uradsrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            uu0rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            vuas3rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            vuasrotrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            bas1rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu1*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            bas2rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            bas3rhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            bsqrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            FMrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            FEMArhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            FEEMrhosq_diskcorona_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_radhor)
-            #
-            #
-            print(("pick out *at* r\sim 4M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=4.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_diskcorona_phipow_rad4={'which': diskcondition}
-            maxbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=4
-            rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            rhosrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            ugsrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            uradsrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            uu0rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            vuas3rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            vuasrotrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            bas1rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu1*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            bas2rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            bas3rhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            bsqrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            FMrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            FEMArhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            FEEMrhosq_diskcorona_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad4)
-            #
-            #
-            print(("pick out *at* r\sim 8M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # all bands (r\sim r+, 4M, 8M, 30M) for each quantity from one powerspectra() call, same as powervsm() for each band
+            # qtypaper==0 quantities are not used in final paper result, so just zero like powervsm() does
             denfactor=1.0 + rholab*0.0
-            pickr=8.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_diskcorona_phipow_rad8={'which': diskcondition}
-            maxbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=8
-            rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            rhosrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            ugsrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            uradsrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            uu0rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            vuas3rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            vuasrotrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            bas1rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu1*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            bas2rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            bas3rhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            bsqrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            FMrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            FEMArhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            FEEMrhosq_diskcorona_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad8)
-            #
-            print(("pick out *at* r\sim 30M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=30.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
             diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_diskcorona_phipow_rad30={'which': diskcondition}
-            maxbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=30
-            rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            rhosrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            ugsrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            uradsrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            uu0rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            vuas3rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            vuasrotrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            bas1rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu1*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            bas2rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            bas3rhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            bsqrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            FMrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            FEMArhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            FEEMrhosq_diskcorona_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=0,**keywordsrhosq_diskcorona_phipow_rad30)
-            #
-            #
-            #
-            #
-            #
-            #
-            #
+            phipowbands=[]
+            condbsqorhophipow=[]
+            for pickr in [rhor,4.0,8.0,30.0]:
+                spreadr=0.1*pickr
+                if pickr==rhor:
+                    phipowbands.append((max(pickr-spreadr,1.01*Rin),pickr+spreadr))
+                else:
+                    phipowbands.append((pickr-spreadr,pickr+spreadr))
+                condbsqorhophipow.append(condmaxbsqorhorhs[iofr(pickr),0,0]) # good for r=pickr
+            print(("rin=%g rout=%g Rin=%g rhor=%g r0=%g" % (phipowbands[0][0],phipowbands[0][1],Rin,rhor,r[0,0,0])))
+            print(("DISK+CORONA ONLY (never jet)" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            (rhosq_diskcorona_phipow_radhor[qindex],rhosq_diskcorona_phipow_rad4[qindex],rhosq_diskcorona_phipow_rad8[qindex],rhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (rhosrhosq_diskcorona_phipow_radhor[qindex],rhosrhosq_diskcorona_phipow_rad4[qindex],rhosrhosq_diskcorona_phipow_rad8[qindex],rhosrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*rho,bands=phipowbands,kinds='m',denom=None,doabs=1,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (ugsrhosq_diskcorona_phipow_radhor[qindex],ugsrhosq_diskcorona_phipow_rad4[qindex],ugsrhosq_diskcorona_phipow_rad8[qindex],ugsrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*ug,bands=phipowbands,kinds='m',denom=None,doabs=1,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (uradsrhosq_diskcorona_phipow_radhor[qindex],uradsrhosq_diskcorona_phipow_rad4[qindex],uradsrhosq_diskcorona_phipow_rad8[qindex],uradsrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*urad,bands=phipowbands,kinds='m',denom=None,doabs=1,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (uu0rhosq_diskcorona_phipow_radhor[qindex],uu0rhosq_diskcorona_phipow_rad4[qindex],uu0rhosq_diskcorona_phipow_rad8[qindex],uu0rhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (vuas3rhosq_diskcorona_phipow_radhor[qindex],vuas3rhosq_diskcorona_phipow_rad4[qindex],vuas3rhosq_diskcorona_phipow_rad8[qindex],vuas3rhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (vuasrotrhosq_diskcorona_phipow_radhor[qindex],vuasrotrhosq_diskcorona_phipow_rad4[qindex],vuasrotrhosq_diskcorona_phipow_rad8[qindex],vuasrotrhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bas1rhosq_diskcorona_phipow_radhor[qindex],bas1rhosq_diskcorona_phipow_rad4[qindex],bas1rhosq_diskcorona_phipow_rad8[qindex],bas1rhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*mybu1*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=1,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (bas2rhosq_diskcorona_phipow_radhor[qindex],bas2rhosq_diskcorona_phipow_rad4[qindex],bas2rhosq_diskcorona_phipow_rad8[qindex],bas2rhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bas3rhosq_diskcorona_phipow_radhor[qindex],bas3rhosq_diskcorona_phipow_rad4[qindex],bas3rhosq_diskcorona_phipow_rad8[qindex],bas3rhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bsqrhosq_diskcorona_phipow_radhor[qindex],bsqrhosq_diskcorona_phipow_rad4[qindex],bsqrhosq_diskcorona_phipow_rad8[qindex],bsqrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*bsq*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=1,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (FMrhosq_diskcorona_phipow_radhor[qindex],FMrhosq_diskcorona_phipow_rad4[qindex],FMrhosq_diskcorona_phipow_rad8[qindex],FMrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*(-rho*uu[1])*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=0,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (FEMArhosq_diskcorona_phipow_radhor[qindex],FEMArhosq_diskcorona_phipow_rad4[qindex],FEMArhosq_diskcorona_phipow_rad8[qindex],FEMArhosq_diskcorona_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (FEEMrhosq_diskcorona_phipow_radhor[qindex],FEEMrhosq_diskcorona_phipow_rad4[qindex],FEEMrhosq_diskcorona_phipow_rad8[qindex],FEEMrhosq_diskcorona_phipow_rad30[qindex])=powerspectra(qty=gdet*(TudEM[1,0])*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=0,maxbsqorho=condbsqorhophipow,which=diskcondition)['m']
             #
             printusage()
             gc.collect()
             printusage()
             #
-            #
             print(("Jet ONLY (never DISK+CORONA)" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            #
-            print(("pick out *at* r\sim 4M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=rhor
-            spreadr=0.1*pickr
-            rin=max(pickr-spreadr,1.01*Rin)
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_jet_phipow_radhor={'which': diskcondition}
-            minbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=rhor
-            rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            rhosrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            ugsrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            uradsrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            uu0rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            vuas3rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            vuasrotrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            bas1rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu1*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            bas2rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            bas3rhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            bsqrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            FMrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            FEMArhosq_jet_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            FEEMrhosq_jet_phipow_radhor[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_radhor)
-            #
-            #
-            print(("pick out *at* r\sim 4M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=4.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_jet_phipow_rad4={'which': diskcondition}
-            minbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=4
-            rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            rhosrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            ugsrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            uradsrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            uu0rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            vuas3rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            vuasrotrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            bas1rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu1*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            bas2rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            bas3rhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            bsqrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            FMrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            FEMArhosq_jet_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            FEEMrhosq_jet_phipow_rad4[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad4)
-            #
-            #
-            print(("pick out *at* r\sim 8M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=8.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_jet_phipow_rad8={'which': diskcondition}
-            minbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=8
-            rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            rhosrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            ugsrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            uradsrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            uu0rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            vuas3rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            vuasrotrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            bas1rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu1*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            bas2rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            bas3rhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            bsqrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            FMrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            FEMArhosq_jet_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            FEEMrhosq_jet_phipow_rad8[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad8)
-            #
-            print(("pick out *at* r\sim 30M" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-            denfactor=1.0 + rholab*0.0
-            pickr=30.0
-            spreadr=0.1*pickr
-            rin=pickr-spreadr
-            rout=pickr+spreadr
-            diskcondition=1.0 + rho*0.0 #(np.abs(r-pickr)<spreadr)
-            keywordsrhosq_jet_phipow_rad30={'which': diskcondition}
-            minbsqorho=condmaxbsqorhorhs[iofr(pickr),0,0] # good for r=30
-            rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            rhosrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*rho,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            ugsrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*ug,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            uradsrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*denfactor*urad,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            uu0rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu0*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            vuas3rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            vuasrotrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*myuurot*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            bas1rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu1*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            bas2rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu2*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            bas3rhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*mybu3*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            bsqrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=1,rin=rin,rout=rout,minbsqorho=minbsqorho,qty=gdet*bsq*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            FMrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(-rho*uu[1])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            FEMArhosq_jet_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudMA[1,0])*denfactor,qtypaper=0,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
-            FEEMrhosq_jet_phipow_rad30[qindex]=powervsm(doabs=0,rin=rin,rout=rout,maxbsqorho=maxbsqorho,qty=gdet*(TudEM[1,0])*denfactor,qtypaper=1,diskorjet=1,**keywordsrhosq_jet_phipow_rad30)
+            (rhosq_jet_phipow_radhor[qindex],rhosq_jet_phipow_rad4[qindex],rhosq_jet_phipow_rad8[qindex],rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (rhosrhosq_jet_phipow_radhor[qindex],rhosrhosq_jet_phipow_rad4[qindex],rhosrhosq_jet_phipow_rad8[qindex],rhosrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*rho,bands=phipowbands,kinds='m',denom=None,doabs=1,minbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (ugsrhosq_jet_phipow_radhor[qindex],ugsrhosq_jet_phipow_rad4[qindex],ugsrhosq_jet_phipow_rad8[qindex],ugsrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*ug,bands=phipowbands,kinds='m',denom=None,doabs=1,minbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (uradsrhosq_jet_phipow_radhor[qindex],uradsrhosq_jet_phipow_rad4[qindex],uradsrhosq_jet_phipow_rad8[qindex],uradsrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*denfactor*urad,bands=phipowbands,kinds='m',denom=None,doabs=1,minbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            (uu0rhosq_jet_phipow_radhor[qindex],uu0rhosq_jet_phipow_rad4[qindex],uu0rhosq_jet_phipow_rad8[qindex],uu0rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (vuas3rhosq_jet_phipow_radhor[qindex],vuas3rhosq_jet_phipow_rad4[qindex],vuas3rhosq_jet_phipow_rad8[qindex],vuas3rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (vuasrotrhosq_jet_phipow_radhor[qindex],vuasrotrhosq_jet_phipow_rad4[qindex],vuasrotrhosq_jet_phipow_rad8[qindex],vuasrotrhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bas1rhosq_jet_phipow_radhor[qindex],bas1rhosq_jet_phipow_rad4[qindex],bas1rhosq_jet_phipow_rad8[qindex],bas1rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bas2rhosq_jet_phipow_radhor[qindex],bas2rhosq_jet_phipow_rad4[qindex],bas2rhosq_jet_phipow_rad8[qindex],bas2rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bas3rhosq_jet_phipow_radhor[qindex],bas3rhosq_jet_phipow_rad4[qindex],bas3rhosq_jet_phipow_rad8[qindex],bas3rhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (bsqrhosq_jet_phipow_radhor[qindex],bsqrhosq_jet_phipow_rad4[qindex],bsqrhosq_jet_phipow_rad8[qindex],bsqrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*bsq*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=1,minbsqorho=condbsqorhophipow,which=diskcondition)['m']
+            # jet fluxes cut with disk's r\sim 30M maxbsqorho as always done here
+            (FMrhosq_jet_phipow_radhor[qindex],FMrhosq_jet_phipow_rad4[qindex],FMrhosq_jet_phipow_rad8[qindex],FMrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*(-rho*uu[1])*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=0,maxbsqorho=condbsqorhophipow[-1],which=diskcondition)['m']
+            (FEMArhosq_jet_phipow_radhor[qindex],FEMArhosq_jet_phipow_rad4[qindex],FEMArhosq_jet_phipow_rad8[qindex],FEMArhosq_jet_phipow_rad30[qindex])=(0.0,0.0,0.0,0.0)
+            (FEEMrhosq_jet_phipow_radhor[qindex],FEEMrhosq_jet_phipow_rad4[qindex],FEEMrhosq_jet_phipow_rad8[qindex],FEEMrhosq_jet_phipow_rad30[qindex])=powerspectra(qty=gdet*(TudEM[1,0])*denfactor,bands=phipowbands,kinds='m',denom=None,doabs=0,maxbsqorho=condbsqorhophipow[-1],which=diskcondition)['m']
         #
         #
             
@@ -12972,7 +14688,7 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         #
         #
         # decide if want to compute this, since can be expensive and might not care to always compute it.
-        computethetapow=1
+        computethetapow=1 if qtyneed['thetapow'] else 0
         #
         print(("DISK+CORONA ONLY (never jet)" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
         #
@@ -13238,7 +14954,7 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         # This periodic-likeness ensures don't introduce artificial scales size of \delta r (range of Fourier transform) or on smallest scales of Fourier transform due to jump at boundary.
         # Also, more comparable to local simulation.
         # Be careful by dealing with things that vanish across equator by using absolute versions of average and quantity itself.
-        computeradiuspow=1
+        computeradiuspow=1 if qtyneed['radiuspow'] else 0
         #
         print(("DISK+CORONA ONLY (never jet)" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
         #
@@ -13463,6 +15179,19 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         #
         #
         #
+        #############
+        print(("Along l for true Y_lm on shells" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+        #############
+        #
+        # cheap (Legendre tables cached per grid), so do whenever asked for
+        computeshellpow=1 if qtyneed['shellpow'] else 0
+        #
+        if computeshellpow==1:
+            shellradii=[rhor,4.0,8.0,30.0]
+            (rho_shellpowvsl_radhor[qindex],rho_shellpowvsl_rad4[qindex],rho_shellpowvsl_rad8[qindex],rho_shellpowvsl_rad30[qindex])=shpowervsl(rho,radii=shellradii)
+            (bsq_shellpowvsl_radhor[qindex],bsq_shellpowvsl_rad4[qindex],bsq_shellpowvsl_rad8[qindex],bsq_shellpowvsl_rad30[qindex])=shpowervsl(bsq,radii=shellradii)
+        #
+        #
         printusage()
         gc.collect()
         printusage()
@@ -13472,251 +15201,256 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
         ##############################################################################################################################################################
         #
         #
+        # shared by Flux, Mdot, Edot, Pjet, Ldot, and Bob below, so each can be done without the others (or the averages above)
         diskcondition=condmaxbsqorho
-        keywords2hor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
-        #
-        print(("Flux" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # radial absolute flux as function of radius
-        fstot[qindex]=horfluxcalc(minbsqorho=0)
-        # ingoing flow's absolute magnetic flux (so use same bsq/rho and inflow condition)
-        fscondition=condmaxbsqorho
-        fsin[qindex]=horfluxcalc(minbsqorho=0,inflowonly=1,whichcondition=fscondition)
-        #
-        # horizon radial cumulative flux as function of theta (not function of radius!)
-        #fhortot[qindex]=horfluxcalc(ivalue=ihor,takeabs=0,takecumsum=1)
-        # equatorial vertical cumulative flux as function of radius
-        feqtot[qindex]=eqfluxcalc(jvalue=ny/2,takeabs=0,takecumsum=1,minbsqorho=0)
-        #
-        fsmaxtot[qindex]=horfluxcalc(minbsqorho=0,takeextreme=1,takecumsum=1,takeabs=0)
-        #
-        # upper-hemisphere radial flux to be added or compared to equatorial vertical flux
-        fsuphalf[qindex]=horfluxcalc(minbsqorho=0,takeabs=0,uphalf=1)
-        #
-        #
-        fs2hor[qindex]==intangle(np.abs(gdetB[1]),**keywords2hor)
-        fsj5[qindex]=horfluxcalc(ivalue=ihor,minbsqorho=5)
-        fsj10[qindex]=horfluxcalc(ivalue=ihor,minbsqorho=10)
-        fsj20[qindex]=horfluxcalc(ivalue=ihor,minbsqorho=20)
-        fsj30[qindex]=horfluxcalc(ivalue=ihor,minbsqorho=30)
-        fsj40[qindex]=horfluxcalc(ivalue=ihor,minbsqorho=40)
-        #
-        ##################################
-        print(("Mdot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        avoidfloorcondition=condmaxbsqorho
-        keywordsavoidfloor={'which': avoidfloorcondition}
-        #
+        if qtyneed['hor']:
+            keywords2hor={'hoverr': 2.0*hoverr3d, 'thetamid': thetamid3d, 'which': diskcondition}
+        # as for averages over full flow
+        maxrhosq2d=((1.0 + rholab*0.0)*diskcondition).max(1)+tiny
         enth=1+ug*gam/rho
-        mdtot[qindex]=mdotcalc(which=avoidfloorcondition)
-        mdtotbound[qindex]=mdotcalc(which=avoidfloorcondition*(-enth*ud[0]<=1))
-        md2h[qindex]=mdotcalc(**keywords2h)
-        md4h[qindex]=mdotcalc(**keywords4h)
-        md2hor[qindex]=mdotcalc(**keywords2hor)
-        md5[qindex]=intangle(-gdet*rho*uu[1],minbsqorho=5)
-        md10[qindex]=intangle(-gdet*rho*uu[1],minbsqorho=10)
-        md20[qindex]=intangle(-gdet*rho*uu[1],minbsqorho=20)
-        # md30 really is Mdot for floor
-        md30[qindex]=intangle(-gdet*rho*uu[1],which=(avoidfloorcondition==0))
-        md40[qindex]=intangle(-gdet*rho*uu[1],minbsqorho=40)
         # use 10 for jet and wind since at larger radii jet has lower bsqorho
         # don't include maxbeta=3 since outflows from disk can have larger beta
         windmaxbeta=1E30 # used so Mdot_j + Mdot_w = Mdot_{in} in steady-state
-        # want outflow only (NOT TO BE USED for efficiency, just Mdot{jet,mw,w}(r))
-        mdwind[qindex]=intangle(gdet*rho*uu[1],mumax=1,maxbeta=windmaxbeta,which=condmaxbsqorho,outflowonly=1)
         # only mw has unbound connection.  Want Mjet+Mdotwind = Mdotin in steady-state, so only flow direction changes
         mwindmaxbeta=2
-        mdmwind[qindex]=intangle(gdet*rho*uu[1],mumax=1,maxbeta=mwindmaxbeta,which=condmaxbsqorho,outflowonly=1,unboundonly=1)
-        #
-        mdjet[qindex]=intangle(gdet*rho*uu[1],mumin=1,which=condmaxbsqorho,outflowonly=1)
-        #
-        mdrhosq[qindex]=scaletofullwedge(((-gdet*rho**2*rho*uu[1]*diskcondition).sum(1)/maxrhosq2d).sum(1)*_dx2*_dx3)
-        #mdrhosq[qindex]=(-gdet*rho**2*rho*uu[1]).sum(1).sum(1)/(-gdet*rho**2).sum(1).sum(1)*(-gdet).sum(1).sum(1)*_dx2*_dx3
-        #
-        # use same below maxbsqorho condition for fsin for proper division comparison
-        mdin[qindex]=intangle(-gdet*rho*uu[1],which=condmaxbsqorho,inflowonly=1)
-        #
-        ##################################
-        #
-        print(("Edot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        edtot[qindex]=intangle(-gdet*Tud[1][0])
-        ed2h[qindex]=intangle(-gdet*Tud[1][0],hoverr=2*horval)
-        ed4h[qindex]=intangle(-gdet*Tud[1][0],hoverr=4*horval)
-        ed2hor[qindex]=intangle(-gdet*Tud[1][0],hoverr=2*hoverr3d,thetamid=thetamid3d)
-        edrhosq[qindex]=scaletofullwedge(((-gdet*rho**2*Tud[1][0]).sum(1)/maxrhosq2d).sum(1)*_dx2*_dx3)
-        #
-        # Tud's already using rhoclean and ugclean
-        edem[qindex]=intangle(-gdet*TudEM[1][0])
-        edma[qindex]=intangle(-gdet*TudMA[1][0])
-        edm[qindex]=intangle(gdet*rho*uu[1]) # not using clean version
-        edpa[qindex]=intangle(-gdet*TudPA[1][0])
-        eden[qindex]=intangle(-gdet*TudEN[1][0])
-        #
-        edrad[qindex]=intangle(-gdet*TudRAD[1][0])
-        tauradlocal=(KAPPAUSER+KAPPAESUSER)*(_dx1*sqrt(np.fabs(gv3[1,1]))+_dx2*sqrt(np.fabs(gv3[2,2])))
-        #edradthin[qindex]=intangle(-gdet*TudRAD[1][0],which=tauradlocal<=1.0)
-        edradthin[qindex]=intangle(-gdet*TudRAD[1][0],which=tauradintegrated<=1.0)
-        #
-        edma30[qindex]=intangle(-gdet*TudMA[1][0],which=(condmaxbsqorho==0))
-        edm30[qindex]=intangle(gdet*rho*uu[1],which=(condmaxbsqorho==0))
-        #
-        edtotbound[qindex]=intangle(-gdet*Tud[1][0],which=(-enth*ud[0]<=1))
-        edmabound[qindex]=intangle(-gdet*TudMA[1][0],which=(-enth*ud[0]<=1))
-        #
-        print(("Pjet" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        pjem5[qindex]=jetpowcalc(0,minbsqorho=5)
-        pjma5[qindex]=jetpowcalc(1,minbsqorho=5)
-        #
-        printusage()
-        gc.collect()
-        printusage()
-        #
         # use md10-like restriction since in jet or wind at large radii bsq/rho doesn't reach ~30 but floors still fed in mass
         # OLD style floor calculation kept, but not using _flr stuff anymore
         jetwind_minbsqorho=10.0
         #
-        # these jetpowcalc's are for efficiencies that need *net* energy flux, not one-way energy flux (i.e. wind has to include inflow as well)
-        print(("north hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        pjem_n_mu1[qindex]=jetpowcalc(0,mumin=1,donorthsouth=1)
-        pjem_n_mumax1[qindex]=jetpowcalc(0,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
-        pjem_n_mumax1m[qindex]=jetpowcalc(0,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
-        #
-        pjrm_n_mu1[qindex]=jetpowcalc(3,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        pjrm_n_mumax1[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        pjrm_n_mumax1m[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        pjrm_n_mu1_flr[qindex]=jetpowcalc(3,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        pjrm_n_mumax1_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        pjrm_n_mumax1m_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        #
-        pjma_n_mu1[qindex]=jetpowcalc(1,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        pjma_n_mumax1[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        pjma_n_mumax1m[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        pjma_n_mu1_flr[qindex]=jetpowcalc(1,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        pjma_n_mumax1_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        pjma_n_mumax1m_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        #
-        pjpa_n_mu1[qindex]=jetpowcalc(15,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        pjpa_n_mumax1[qindex]=jetpowcalc(15,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        pjpa_n_mumax1m[qindex]=jetpowcalc(15,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        pjen_n_mu1[qindex]=jetpowcalc(16,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        pjen_n_mumax1[qindex]=jetpowcalc(16,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        pjen_n_mumax1m[qindex]=jetpowcalc(16,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        phiabsj_n_mu1[qindex]=jetpowcalc(4,mumin=1,donorthsouth=1)
-        phiabsj_n_mumax1[qindex]=jetpowcalc(4,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
-        phiabsj_n_mumax1m[qindex]=jetpowcalc(4,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
-        #
-        print(("south hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        pjem_s_mu1[qindex]=jetpowcalc(0,mumin=1,donorthsouth=-1)
-        pjem_s_mumax1[qindex]=jetpowcalc(0,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
-        pjem_s_mumax1m[qindex]=jetpowcalc(0,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
-        #
-        pjrm_s_mu1[qindex]=jetpowcalc(3,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjrm_s_mumax1[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjrm_s_mumax1m[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        #
-        pjrm_s_mu1_flr[qindex]=jetpowcalc(3,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        pjrm_s_mumax1_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        pjrm_s_mumax1m_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        #
-        pjma_s_mu1[qindex]=jetpowcalc(1,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjma_s_mumax1[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjma_s_mumax1m[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        #
-        pjma_s_mu1_flr[qindex]=jetpowcalc(1,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        pjma_s_mumax1_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        pjma_s_mumax1m_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+        if qtyneed['flux']:
+            print(("Flux" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # radial absolute flux as function of radius
+            fstot[qindex]=horfluxcalc(minbsqorho=0)
+            # ingoing flow's absolute magnetic flux (so use same bsq/rho and inflow condition)
+            fscondition=condmaxbsqorho
+            fsin[qindex]=horfluxcalc(minbsqorho=0,inflowonly=1,whichcondition=fscondition)
+            #
+            # horizon radial cumulative flux as function of theta (not function of radius!)
+            #fhortot[qindex]=horfluxcalc(ivalue=ihor,takeabs=0,takecumsum=1)
+            # equatorial vertical cumulative flux as function of radius
+            feqtot[qindex]=eqfluxcalc(jvalue=ny//2,takeabs=0,takecumsum=1,minbsqorho=0)
+            #
+            fsmaxtot[qindex]=horfluxcalc(minbsqorho=0,takeextreme=1,takecumsum=1,takeabs=0)
+            #
+            # upper-hemisphere radial flux to be added or compared to equatorial vertical flux
+            fsuphalf[qindex]=horfluxcalc(minbsqorho=0,takeabs=0,uphalf=1)
+            #
+            #
+            fs2hor[qindex]==intangle(np.abs(gdetB[1]),**keywords2hor)
+            # same as horfluxcalc(ivalue=ihor,minbsqorho=v) for each v
+            (fsj5[qindex],fsj10[qindex],fsj20[qindex],fsj30[qindex],fsj40[qindex])=horfluxcalcmany([5,10,20,30,40],ivalue=ihor)
         #
-        pjpa_s_mu1[qindex]=jetpowcalc(15,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjpa_s_mumax1[qindex]=jetpowcalc(15,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjpa_s_mumax1m[qindex]=jetpowcalc(15,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+        ##################################
+        if qtyneed['mdot']:
+            print(("Mdot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            avoidfloorcondition=condmaxbsqorho
+            keywordsavoidfloor={'which': avoidfloorcondition}
+            keywords2h={'hoverr': 2*horval, 'which': horpickcondition*(1 + condmaxbsqorho*0.0)}
+            keywords4h={'hoverr': 4*horval, 'which': horpickcondition*(1 + condmaxbsqorho*0.0)}
+            #
+            mdtot[qindex]=mdotcalc(which=avoidfloorcondition)
+            mdtotbound[qindex]=mdotcalc(which=avoidfloorcondition*(-enth*ud[0]<=1))
+            md2h[qindex]=mdotcalc(**keywords2h)
+            md4h[qindex]=mdotcalc(**keywords4h)
+            md2hor[qindex]=mdotcalc(**keywords2hor)
+            # same as intangle(-gdet*rho*uu[1],minbsqorho=v) for each v
+            (md5[qindex],md10[qindex],md20[qindex],md40[qindex])=intanglemany(-gdet*rho*uu[1],[5,10,20,40])
+            # md30 really is Mdot for floor
+            md30[qindex]=intangle(-gdet*rho*uu[1],which=(avoidfloorcondition==0))
+            # want outflow only (NOT TO BE USED for efficiency, just Mdot{jet,mw,w}(r))
+            mdwind[qindex]=intangle(gdet*rho*uu[1],mumax=1,maxbeta=windmaxbeta,which=condmaxbsqorho,outflowonly=1)
+            mdmwind[qindex]=intangle(gdet*rho*uu[1],mumax=1,maxbeta=mwindmaxbeta,which=condmaxbsqorho,outflowonly=1,unboundonly=1)
+            #
+            mdjet[qindex]=intangle(gdet*rho*uu[1],mumin=1,which=condmaxbsqorho,outflowonly=1)
+            #
+            mdrhosq[qindex]=scaletofullwedge(((-gdet*rho**2*rho*uu[1]*diskcondition).sum(1)/maxrhosq2d).sum(1)*_dx2*_dx3)
+            #mdrhosq[qindex]=(-gdet*rho**2*rho*uu[1]).sum(1).sum(1)/(-gdet*rho**2).sum(1).sum(1)*(-gdet).sum(1).sum(1)*_dx2*_dx3
+            #
+            # use same below maxbsqorho condition for fsin for proper division comparison
+            mdin[qindex]=intangle(-gdet*rho*uu[1],which=condmaxbsqorho,inflowonly=1)
         #
-        pjen_s_mu1[qindex]=jetpowcalc(16,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjen_s_mumax1[qindex]=jetpowcalc(16,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        pjen_s_mumax1m[qindex]=jetpowcalc(16,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+        ##################################
         #
-        phiabsj_s_mu1[qindex]=jetpowcalc(4,mumin=1,donorthsouth=-1)
-        phiabsj_s_mumax1[qindex]=jetpowcalc(4,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
-        phiabsj_s_mumax1m[qindex]=jetpowcalc(4,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
+        if qtyneed['edot']:
+            print(("Edot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            edtot[qindex]=intangle(-gdet*Tud[1][0])
+            ed2h[qindex]=intangle(-gdet*Tud[1][0],hoverr=2*horval)
+            ed4h[qindex]=intangle(-gdet*Tud[1][0],hoverr=4*horval)
+            ed2hor[qindex]=intangle(-gdet*Tud[1][0],hoverr=2*hoverr3d,thetamid=thetamid3d)
+            edrhosq[qindex]=scaletofullwedge(((-gdet*rho**2*Tud[1][0]).sum(1)/maxrhosq2d).sum(1)*_dx2*_dx3)
+            #
+            # Tud's already using rhoclean and ugclean
+            edem[qindex]=intangle(-gdet*TudEM[1][0])
+            edma[qindex]=intangle(-gdet*TudMA[1][0])
+            edm[qindex]=intangle(gdet*rho*uu[1]) # not using clean version
+            edpa[qindex]=intangle(-gdet*TudPA[1][0])
+            eden[qindex]=intangle(-gdet*TudEN[1][0])
+            #
+            edrad[qindex]=intangle(-gdet*TudRAD[1][0])
+            tauradlocal=(KAPPAUSER+KAPPAESUSER)*(_dx1*sqrt(np.fabs(gv3[1,1]))+_dx2*sqrt(np.fabs(gv3[2,2])))
+            #edradthin[qindex]=intangle(-gdet*TudRAD[1][0],which=tauradlocal<=1.0)
+            edradthin[qindex]=intangle(-gdet*TudRAD[1][0],which=tauradintegrated<=1.0)
+            #
+            edma30[qindex]=intangle(-gdet*TudMA[1][0],which=(condmaxbsqorho==0))
+            edm30[qindex]=intangle(gdet*rho*uu[1],which=(condmaxbsqorho==0))
+            #
+            edtotbound[qindex]=intangle(-gdet*Tud[1][0],which=(-enth*ud[0]<=1))
+            edmabound[qindex]=intangle(-gdet*TudMA[1][0],which=(-enth*ud[0]<=1))
+        #
+        if qtyneed['pjet']:
+            print(("Pjet" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            pjem5[qindex]=jetpowcalc(0,minbsqorho=5)
+            pjma5[qindex]=jetpowcalc(1,minbsqorho=5)
+            #
+            printusage()
+            gc.collect()
+            printusage()
+            #
+            # these jetpowcalc's are for efficiencies that need *net* energy flux, not one-way energy flux (i.e. wind has to include inflow as well)
+            print(("north hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            pjem_n_mu1[qindex]=jetpowcalc(0,mumin=1,donorthsouth=1)
+            pjem_n_mumax1[qindex]=jetpowcalc(0,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
+            pjem_n_mumax1m[qindex]=jetpowcalc(0,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
+            #
+            pjrm_n_mu1[qindex]=jetpowcalc(3,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            pjrm_n_mumax1[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            pjrm_n_mumax1m[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            pjrm_n_mu1_flr[qindex]=jetpowcalc(3,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            pjrm_n_mumax1_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            pjrm_n_mumax1m_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            #
+            pjma_n_mu1[qindex]=jetpowcalc(1,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            pjma_n_mumax1[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            pjma_n_mumax1m[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            pjma_n_mu1_flr[qindex]=jetpowcalc(1,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            pjma_n_mumax1_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            pjma_n_mumax1m_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            #
+            pjpa_n_mu1[qindex]=jetpowcalc(15,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            pjpa_n_mumax1[qindex]=jetpowcalc(15,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            pjpa_n_mumax1m[qindex]=jetpowcalc(15,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            pjen_n_mu1[qindex]=jetpowcalc(16,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            pjen_n_mumax1[qindex]=jetpowcalc(16,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            pjen_n_mumax1m[qindex]=jetpowcalc(16,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            phiabsj_n_mu1[qindex]=jetpowcalc(4,mumin=1,donorthsouth=1)
+            phiabsj_n_mumax1[qindex]=jetpowcalc(4,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
+            phiabsj_n_mumax1m[qindex]=jetpowcalc(4,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
+            #
+            print(("south hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            pjem_s_mu1[qindex]=jetpowcalc(0,mumin=1,donorthsouth=-1)
+            pjem_s_mumax1[qindex]=jetpowcalc(0,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
+            pjem_s_mumax1m[qindex]=jetpowcalc(0,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
+            #
+            pjrm_s_mu1[qindex]=jetpowcalc(3,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjrm_s_mumax1[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjrm_s_mumax1m[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            pjrm_s_mu1_flr[qindex]=jetpowcalc(3,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            pjrm_s_mumax1_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            pjrm_s_mumax1m_flr[qindex]=jetpowcalc(3,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            #
+            pjma_s_mu1[qindex]=jetpowcalc(1,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjma_s_mumax1[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjma_s_mumax1m[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            pjma_s_mu1_flr[qindex]=jetpowcalc(1,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            pjma_s_mumax1_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            pjma_s_mumax1m_flr[qindex]=jetpowcalc(1,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            #
+            pjpa_s_mu1[qindex]=jetpowcalc(15,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjpa_s_mumax1[qindex]=jetpowcalc(15,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjpa_s_mumax1m[qindex]=jetpowcalc(15,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            pjen_s_mu1[qindex]=jetpowcalc(16,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjen_s_mumax1[qindex]=jetpowcalc(16,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            pjen_s_mumax1m[qindex]=jetpowcalc(16,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            phiabsj_s_mu1[qindex]=jetpowcalc(4,mumin=1,donorthsouth=-1)
+            phiabsj_s_mumax1[qindex]=jetpowcalc(4,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
+            phiabsj_s_mumax1m[qindex]=jetpowcalc(4,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
         #
         #
         printusage()
         gc.collect()
         printusage()
         #
-        print(("Ldot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        # Tud's already using rhoclean and ugclean
-        ldtot[qindex]=intangle(gdet*Tud[1][3]/dxdxp[3,3])
-        ldem[qindex]=intangle(gdet*TudEM[1][3]/dxdxp[3,3])
-        ldma[qindex]=intangle(gdet*TudMA[1][3]/dxdxp[3,3])
-        ldm[qindex]=intangle(0.0*gdet*rho*uu[3]*dxdxp[3,3])
-        ldpa[qindex]=intangle(gdet*TudPA[1][3]/dxdxp[3,3])
-        lden[qindex]=intangle(gdet*TudEN[1][3]/dxdxp[3,3])
-        ldrad[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3])
-        #ldradthin[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3],which=tauradlocal<=1.0)
-        ldradthin[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3],which=tauradintegrated<=1.0)
-        #
-        ldma30[qindex]=intangle(gdet*TudMA[1][3]/dxdxp[3,3],which=(condmaxbsqorho==0))
-        ldm30[qindex]=intangle(0.0*gdet*rho*uu[3]*dxdxp[3,3],which=(condmaxbsqorho==0))
-        #
-        print(("north hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        ljem_n_mu1[qindex]=jetpowcalc(10,mumin=1,donorthsouth=1)
-        ljem_n_mumax1[qindex]=jetpowcalc(10,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
-        ljem_n_mumax1m[qindex]=jetpowcalc(10,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
-        #
-        ljrm_n_mu1[qindex]=jetpowcalc(13,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        ljrm_n_mumax1[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        ljrm_n_mumax1m[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        ljrm_n_mu1_flr[qindex]=jetpowcalc(13,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        ljrm_n_mumax1_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        ljrm_n_mumax1m_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        #
-        ljma_n_mu1[qindex]=jetpowcalc(11,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        ljma_n_mumax1[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        ljma_n_mumax1m[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        ljma_n_mu1_flr[qindex]=jetpowcalc(11,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        ljma_n_mumax1_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        ljma_n_mumax1m_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
-        #
-        ljpa_n_mu1[qindex]=jetpowcalc(17,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        ljpa_n_mumax1[qindex]=jetpowcalc(17,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        ljpa_n_mumax1m[qindex]=jetpowcalc(17,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        ljen_n_mu1[qindex]=jetpowcalc(18,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
-        ljen_n_mumax1[qindex]=jetpowcalc(18,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        ljen_n_mumax1m[qindex]=jetpowcalc(18,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
-        #
-        print(("south hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
-        ljem_s_mu1[qindex]=jetpowcalc(10,mumin=1,donorthsouth=-1)
-        ljem_s_mumax1[qindex]=jetpowcalc(10,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
-        ljem_s_mumax1m[qindex]=jetpowcalc(10,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
-        #
-        ljrm_s_mu1[qindex]=jetpowcalc(13,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljrm_s_mumax1[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljrm_s_mumax1m[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        #
-        ljrm_s_mu1_flr[qindex]=jetpowcalc(13,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        ljrm_s_mumax1_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        ljrm_s_mumax1m_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        #
-        ljma_s_mu1[qindex]=jetpowcalc(11,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljma_s_mumax1[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljma_s_mumax1m[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        #
-        ljma_s_mu1_flr[qindex]=jetpowcalc(11,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        ljma_s_mumax1_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        ljma_s_mumax1m_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
-        #
-        ljpa_s_mu1[qindex]=jetpowcalc(17,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljpa_s_mumax1[qindex]=jetpowcalc(17,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljpa_s_mumax1m[qindex]=jetpowcalc(17,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        #
-        ljen_s_mu1[qindex]=jetpowcalc(18,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljen_s_mumax1[qindex]=jetpowcalc(18,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
-        ljen_s_mumax1m[qindex]=jetpowcalc(18,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+        if qtyneed['ldot']:
+            print(("Ldot" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            # Tud's already using rhoclean and ugclean
+            ldtot[qindex]=intangle(gdet*Tud[1][3]/dxdxp[3,3])
+            ldem[qindex]=intangle(gdet*TudEM[1][3]/dxdxp[3,3])
+            ldma[qindex]=intangle(gdet*TudMA[1][3]/dxdxp[3,3])
+            ldm[qindex]=intangle(0.0*gdet*rho*uu[3]*dxdxp[3,3])
+            ldpa[qindex]=intangle(gdet*TudPA[1][3]/dxdxp[3,3])
+            lden[qindex]=intangle(gdet*TudEN[1][3]/dxdxp[3,3])
+            ldrad[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3])
+            #ldradthin[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3],which=tauradlocal<=1.0)
+            ldradthin[qindex]=intangle(gdet*TudRAD[1][3]/dxdxp[3,3],which=tauradintegrated<=1.0)
+            #
+            ldma30[qindex]=intangle(gdet*TudMA[1][3]/dxdxp[3,3],which=(condmaxbsqorho==0))
+            ldm30[qindex]=intangle(0.0*gdet*rho*uu[3]*dxdxp[3,3],which=(condmaxbsqorho==0))
+            #
+            print(("north hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            ljem_n_mu1[qindex]=jetpowcalc(10,mumin=1,donorthsouth=1)
+            ljem_n_mumax1[qindex]=jetpowcalc(10,mumax=1,maxbeta=windmaxbeta,donorthsouth=1)
+            ljem_n_mumax1m[qindex]=jetpowcalc(10,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1)
+            #
+            ljrm_n_mu1[qindex]=jetpowcalc(13,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            ljrm_n_mumax1[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            ljrm_n_mumax1m[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            ljrm_n_mu1_flr[qindex]=jetpowcalc(13,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            ljrm_n_mumax1_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            ljrm_n_mumax1m_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            #
+            ljma_n_mu1[qindex]=jetpowcalc(11,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            ljma_n_mumax1[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            ljma_n_mumax1m[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            ljma_n_mu1_flr[qindex]=jetpowcalc(11,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            ljma_n_mumax1_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            ljma_n_mumax1m_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=1)
+            #
+            ljpa_n_mu1[qindex]=jetpowcalc(17,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            ljpa_n_mumax1[qindex]=jetpowcalc(17,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            ljpa_n_mumax1m[qindex]=jetpowcalc(17,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            ljen_n_mu1[qindex]=jetpowcalc(18,mumin=1,donorthsouth=1,conditional=condmaxbsqorho)
+            ljen_n_mumax1[qindex]=jetpowcalc(18,mumax=1,maxbeta=windmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            ljen_n_mumax1m[qindex]=jetpowcalc(18,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=1,conditional=condmaxbsqorho)
+            #
+            print(("south hemisphere" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
+            ljem_s_mu1[qindex]=jetpowcalc(10,mumin=1,donorthsouth=-1)
+            ljem_s_mumax1[qindex]=jetpowcalc(10,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1)
+            ljem_s_mumax1m[qindex]=jetpowcalc(10,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1)
+            #
+            ljrm_s_mu1[qindex]=jetpowcalc(13,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljrm_s_mumax1[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljrm_s_mumax1m[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            ljrm_s_mu1_flr[qindex]=jetpowcalc(13,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            ljrm_s_mumax1_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            ljrm_s_mumax1m_flr[qindex]=jetpowcalc(13,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            #
+            ljma_s_mu1[qindex]=jetpowcalc(11,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljma_s_mumax1[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljma_s_mumax1m[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            ljma_s_mu1_flr[qindex]=jetpowcalc(11,mumin=1,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            ljma_s_mumax1_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=windmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            ljma_s_mumax1m_flr[qindex]=jetpowcalc(11,mumax=1,maxbeta=mwindmaxbeta,minbsqorho=jetwind_minbsqorho,donorthsouth=-1)
+            #
+            ljpa_s_mu1[qindex]=jetpowcalc(17,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljpa_s_mumax1[qindex]=jetpowcalc(17,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljpa_s_mumax1m[qindex]=jetpowcalc(17,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            #
+            ljen_s_mu1[qindex]=jetpowcalc(18,mumin=1,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljen_s_mumax1[qindex]=jetpowcalc(18,mumax=1,maxbeta=windmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
+            ljen_s_mumax1m[qindex]=jetpowcalc(18,mumax=1,maxbeta=mwindmaxbeta,donorthsouth=-1,conditional=condmaxbsqorho)
         #
         #
         printusage()
@@ -13727,6 +15461,7 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
             #
             print(("Bob's 1D quantities" + " time elapsed: %d" % (datetime.now()-start_time).seconds )) ; sys.stdout.flush()
             #
+            i=totalnum # Bob's quantities come after those set by getqtymem()
             dVF=_dx1*_dx2*_dx3
             dVA=_dx2*_dx3
             Dt=1
@@ -13911,8 +15646,13 @@ def getqtyvstime(ihor,horval=1.0,fmtver=2,dobob=0,whichi=None,whichn=None,altrea
     #
     #
     ########################################################################
+    if qtyvstimeworker is not None:
+        # parent saves once all dumps done
+        return(qtymem)
     print(("Saving to file..."  + " time elapsed: %d" % (datetime.now()-start_time).seconds  )) ; sys.stdout.flush()
-    if( whichi >=0 and whichn > 0 ):
+    if fmtver == 3:
+        qtymem.save()
+    elif( whichi >=0 and whichn > 0 ):
         np.save( "qty2_%d_%d.npy" % (whichi, whichn), qtymem )
     else:
         np.save( "qty2.npy", qtymem )
@@ -13926,15 +15666,15 @@ def fhorvstime(ihor):
     Returns a tuple (ts,fs,mdot): lists of times, horizon fluxes, and Mdot
     """
     #changed by Megan 10/20/15 - want values at the bh to be used to calculate phibh, so changed arguments, added dimension. Also changed np.empty to np.zeros because it's less confusing
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-    sort_nicely(flist)
+    flist = getfieldlinelist()
     #
     ts=np.zeros(len(flist),dtype=np.float32)
     fs=np.zeros((len(flist),272),dtype=np.float32)
     md=np.zeros((len(flist),272),dtype=np.float32)
     for findex, fname in enumerate(flist):
         print(( "Reading " + fname + " ..." ))
-        rfd("../"+fname)
+        # only what horfluxcalc() and mdotcalc() use
+        rfd("../"+fname,fields=['rho','uu','gdetB','bsq','condmaxbsqorho'])
         avoidfloorcondition=condmaxbsqorho
         fs[findex,:]=horfluxcalc(minbsqorho=0)
         md[findex]=mdotcalc(which=avoidfloorcondition)
@@ -13958,8 +15698,98 @@ def amin(arg1,arg2):
     return(ret)
 
 # allow to remove rho and ug component to remove floor effects
+class Tudlazy(object):
+    """
+    T^kapa_nu that computes each [kapa,nu] component (via compute(kapa,nu,delta)) on first access and keeps it.
+    Indexes like the full (4,4,nx,ny,nz) array: T[1,0], T[1][0], T[1,0,5,0,0].
+    T.sum(-1) and np.asarray(T) (and any other indexing) use all 16 components.
+    """
+    def __init__(self, compute, shape):
+        self.compute = compute
+        self.shape = (4,4)+tuple(shape)
+        self.ndim = len(self.shape)
+        self.dtype = np.dtype(np.float32)
+        self.components = {}
+    #
+    def component(self, kapa, nu):
+        kapa = int(kapa)
+        nu = int(nu)
+        if (kapa,nu) not in self.components:
+            if(kapa==nu): delta = 1
+            else: delta = 0
+            value = np.empty(self.shape[2:],dtype=self.dtype)
+            value[...] = self.compute(kapa,nu,delta)
+            self.components[(kapa,nu)] = value
+        return(self.components[(kapa,nu)])
+    #
+    def __len__(self):
+        return(4)
+    #
+    def __getitem__(self, index):
+        if not isinstance(index,tuple):
+            index = (index,)
+        isint = [isinstance(ii,(int,np.integer)) for ii in index]
+        if len(index)>=2 and isint[0] and isint[1]:
+            value = self.component(index[0],index[1])
+            if len(index)>2:
+                return(value[index[2:]])
+            return(value)
+        if len(index)==1 and isint[0]:
+            # T[kapa], so T[kapa][nu] still only computes one component
+            return(Tudlazyrow(self,int(index[0])))
+        return(np.asarray(self)[index])
+    #
+    def __array__(self, dtype=None, copy=None):
+        full = np.empty(self.shape,dtype=self.dtype,order='F')
+        for kapa in np.arange(4):
+            for nu in np.arange(4):
+                full[kapa,nu] = self.component(kapa,nu)
+        if dtype is not None:
+            return(full.astype(dtype))
+        return(full)
+    #
+    def sum(self, axis=None, **kwargs):
+        if axis is None or axis in (0,1,-5,-4) or isinstance(axis,tuple):
+            return(np.asarray(self).sum(axis=axis,**kwargs))
+        # sum over spatial axis one component at a time
+        if axis<0:
+            axis = axis + self.ndim
+        result = None
+        for kapa in np.arange(4):
+            for nu in np.arange(4):
+                value = self.component(kapa,nu).sum(axis=axis-2,**kwargs)
+                if result is None:
+                    result = np.empty((4,4)+value.shape,dtype=value.dtype)
+                result[kapa,nu] = value
+        return(result)
+
+class Tudlazyrow(object):
+    """
+    T[kapa] of a Tudlazy, so T[kapa][nu] only computes T[kapa,nu]
+    """
+    def __init__(self, tensor, kapa):
+        self.tensor = tensor
+        self.kapa = kapa
+        self.shape = tensor.shape[1:]
+        self.ndim = len(self.shape)
+        self.dtype = tensor.dtype
+    #
+    def __len__(self):
+        return(4)
+    #
+    def __getitem__(self, index):
+        if not isinstance(index,tuple):
+            index = (index,)
+        return(self.tensor[(self.kapa,)+index])
+    #
+    def __array__(self, dtype=None, copy=None):
+        row = np.array([self.tensor.component(self.kapa,nu) for nu in np.arange(4)])
+        if dtype is not None:
+            return(row.astype(dtype))
+        return(row)
+
 def Tcalcud(maxbsqorho=None, which=None):
-    # MEMMARK: 16*5+5=85 full 3D vars.
+    # MEMMARK: 16*5+5=85 full 3D vars if all components used (Tudlazy), else 5 plus 1 per component used.
     global Tud, TudEM, TudMA, TudPA, TudEN, TudRAD
     global mu, sigma
     global enth
@@ -13979,23 +15809,16 @@ def Tcalcud(maxbsqorho=None, which=None):
     w=rhoclean+ugclean+pg
     wnorhoclean=ugclean+pg
     eta=w+bsq
-    Tud = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    TudMA = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    TudEM = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    TudPA = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    TudEN = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    TudRAD = np.zeros((4,4,nx,ny,nz),dtype=np.float32,order='F')
-    for kapa in np.arange(4):
-        for nu in np.arange(4):
-            if(kapa==nu): delta = 1
-            else: delta = 0
-            TudEM[kapa,nu] = bsq*uu[kapa]*ud[nu] + 0.5*bsq*delta - bu[kapa]*bd[nu]
-            TudMA[kapa,nu] = w*uu[kapa]*ud[nu]+pg*delta
-            TudPA[kapa,nu] = rhoclean*uu[kapa]*ud[nu]
-            TudEN[kapa,nu] = wnorhoclean*uu[kapa]*ud[nu]+pg*delta
-            #Tud[kapa,nu] = eta*uu[kapa]*ud[nu]+(pg+0.5*bsq)*delta-bu[kapa]*bd[nu]
-            TudRAD[kapa,nu] = (Erf/3.0)*(4.0*uradu[kapa]*uradd[nu]+delta)
-            Tud[kapa,nu] = TudEM[kapa,nu] + TudMA[kapa,nu] + TudRAD[kapa,nu]
+    # each [kapa,nu] component only computed (and then kept) when first used, so only pay for the ones diagnostics touch.
+    # bind current arrays (not globals at time of use) so components are all for this dump.
+    shape=(nx,ny,nz)
+    TudEM = Tudlazy(lambda kapa,nu,delta,bsq=bsq,uu=uu,ud=ud,bu=bu,bd=bd: bsq*uu[kapa]*ud[nu] + 0.5*bsq*delta - bu[kapa]*bd[nu],shape)
+    TudMA = Tudlazy(lambda kapa,nu,delta,w=w,uu=uu,ud=ud,pg=pg: w*uu[kapa]*ud[nu]+pg*delta,shape)
+    TudPA = Tudlazy(lambda kapa,nu,delta,rhoclean=rhoclean,uu=uu,ud=ud: rhoclean*uu[kapa]*ud[nu],shape)
+    TudEN = Tudlazy(lambda kapa,nu,delta,wnorhoclean=wnorhoclean,uu=uu,ud=ud,pg=pg: wnorhoclean*uu[kapa]*ud[nu]+pg*delta,shape)
+    #Tud[kapa,nu] = eta*uu[kapa]*ud[nu]+(pg+0.5*bsq)*delta-bu[kapa]*bd[nu]
+    TudRAD = Tudlazy(lambda kapa,nu,delta,Erf=Erf,uradu=uradu,uradd=uradd: (Erf/3.0)*(4.0*uradu[kapa]*uradd[nu]+delta),shape)
+    Tud = Tudlazy(lambda kapa,nu,delta,TudEM=TudEM,TudMA=TudMA,TudRAD=TudRAD: TudEM[kapa,nu] + TudMA[kapa,nu] + TudRAD[kapa,nu],shape)
     #mu = -Tud[1,0]/(rhoclean*uu[1])
     mu = -Tud[1,0]*divideavoidinf(rhoclean*uu[1])
     sigma = TudEM[1,0]*divideavoidinf(TudMA[1,0])
@@ -14005,62 +15828,110 @@ def Tcalcud(maxbsqorho=None, which=None):
     isunbound=(-unb>1.0)
     #
     #
-    print(("TudEM[1,0,5,0,0]=%g" % (TudEM[1,0,5,0,0]))) ; sys.stdout.flush()
-    print(("bsq[5,0,0]=%g" % (bsq[5,0,0]))) ; sys.stdout.flush()
-    print(("uu[1,5,0,0]=%g" % (uu[1,5,0,0]))) ; sys.stdout.flush()
-    print(("ud[0,5,0,0]=%g" % (ud[0,5,0,0]))) ; sys.stdout.flush()
-    print(("bu[1,5,0,0]=%g" % (bu[1,5,0,0]))) ; sys.stdout.flush()
-    print(("bd[0,5,0,0]=%g" % (bd[0,5,0,0]))) ; sys.stdout.flush()
-    #
-    print(("uu[0,5,0,0]=%g" % (uu[0,5,0,0]))) ; sys.stdout.flush()
-    print(("B[0,5,0,0]=%g" % (B[0,5,0,0]))) ; sys.stdout.flush()
-    print(("uu[1,5,0,0]=%g" % (uu[1,5,0,0]))) ; sys.stdout.flush()
-    print(("B[1,5,0,0]=%g" % (B[1,5,0,0]))) ; sys.stdout.flush()
-    print(("uu[2,5,0,0]=%g" % (uu[2,5,0,0]))) ; sys.stdout.flush()
-    print(("B[2,5,0,0]=%g" % (B[2,5,0,0]))) ; sys.stdout.flush()
-    print(("uu[3,5,0,0]=%g" % (uu[3,5,0,0]))) ; sys.stdout.flush()
-    print(("B[3,5,0,0]=%g" % (B[3,5,0,0]))) ; sys.stdout.flush()
-    print(("udotB[5,0,0]=%g" % (ud[0,5,0,0]*B[0,5,0,0] + ud[1,5,0,0]*B[1,5,0,0] + ud[2,5,0,0]*B[2,5,0,0] + ud[3,5,0,0]*B[3,5,0,0]))) ; sys.stdout.flush()
+    # debug values at i=5 (if block or grid that big)
+    if nx>5:
+        print(("TudEM[1,0,5,0,0]=%g" % (TudEM[1,0,5,0,0]))) ; sys.stdout.flush()
+        print(("bsq[5,0,0]=%g" % (bsq[5,0,0]))) ; sys.stdout.flush()
+        print(("uu[1,5,0,0]=%g" % (uu[1,5,0,0]))) ; sys.stdout.flush()
+        print(("ud[0,5,0,0]=%g" % (ud[0,5,0,0]))) ; sys.stdout.flush()
+        print(("bu[1,5,0,0]=%g" % (bu[1,5,0,0]))) ; sys.stdout.flush()
+        print(("bd[0,5,0,0]=%g" % (bd[0,5,0,0]))) ; sys.stdout.flush()
+        #
+        print(("uu[0,5,0,0]=%g" % (uu[0,5,0,0]))) ; sys.stdout.flush()
+        print(("B[0,5,0,0]=%g" % (B[0,5,0,0]))) ; sys.stdout.flush()
+        print(("uu[1,5,0,0]=%g" % (uu[1,5,0,0]))) ; sys.stdout.flush()
+        print(("B[1,5,0,0]=%g" % (B[1,5,0,0]))) ; sys.stdout.flush()
+        print(("uu[2,5,0,0]=%g" % (uu[2,5,0,0]))) ; sys.stdout.flush()
+        print(("B[2,5,0,0]=%g" % (B[2,5,0,0]))) ; sys.stdout.flush()
+        print(("uu[3,5,0,0]=%g" % (uu[3,5,0,0]))) ; sys.stdout.flush()
+        print(("B[3,5,0,0]=%g" % (B[3,5,0,0]))) ; sys.stdout.flush()
+        print(("udotB[5,0,0]=%g" % (ud[0,5,0,0]*B[0,5,0,0] + ud[1,5,0,0]*B[1,5,0,0] + ud[2,5,0,0]*B[2,5,0,0] + ud[3,5,0,0]*B[3,5,0,0]))) ; sys.stdout.flush()
+
+# mu<nu pairs of an antisymmetric 4x4 tensor and where Fantisym stores them
+Fantisympairs=[(0,1),(0,2),(0,3),(1,2),(1,3),(2,3)]
+Fantisymindex=dict((pair,index) for (index,pair) in enumerate(Fantisympairs))
+
+class Fantisym(object):
+    """
+    Antisymmetric (sign=-1) or symmetric (sign=1, e.g. after fabs()) 4x4 tensor with zero diagonal,
+    storing only the 6 mu<nu components comps[6,nx,ny,nz].
+    F[mu,nu] gives a view of comps for mu<nu, sign*comps for mu>nu and a zero (read-only broadcast) view for mu==nu.
+    F.sum(-1) and np.asarray(F) give full (4,4,...) arrays.
+    """
+    def __init__(self, comps, sign=-1):
+        self.comps = comps
+        self.sign = sign
+        self.shape = (4,4)+comps.shape[1:]
+        self.ndim = len(self.shape)
+        self.dtype = comps.dtype
+    #
+    def component(self, mu, nu, comps=None):
+        if comps is None:
+            comps = self.comps
+        mu = int(mu)
+        nu = int(nu)
+        if mu==nu:
+            return(np.broadcast_to(np.zeros((),dtype=comps.dtype),comps.shape[1:]))
+        if mu<nu:
+            return(comps[Fantisymindex[(mu,nu)]])
+        if self.sign==1:
+            return(comps[Fantisymindex[(nu,mu)]])
+        return(-comps[Fantisymindex[(nu,mu)]])
+    #
+    def __len__(self):
+        return(4)
+    #
+    def __getitem__(self, index):
+        if not isinstance(index,tuple):
+            index = (index,)
+        if len(index)>=2 and isinstance(index[0],(int,np.integer)) and isinstance(index[1],(int,np.integer)):
+            return(self.component(index[0],index[1])[index[2:]])
+        return(np.asarray(self)[index])
+    #
+    def full(self, comps):
+        full = np.zeros((4,4)+comps.shape[1:],dtype=comps.dtype)
+        for (mu,nu) in Fantisympairs:
+            full[mu,nu] = comps[Fantisymindex[(mu,nu)]]
+            full[nu,mu] = self.sign*comps[Fantisymindex[(mu,nu)]]
+        return(full)
+    #
+    def __array__(self, dtype=None, copy=None):
+        full = self.full(self.comps)
+        if dtype is not None:
+            return(full.astype(dtype))
+        return(full)
+    #
+    def sum(self, axis=None, **kwargs):
+        if axis is None or isinstance(axis,tuple) or axis in (0,1,-self.ndim,-self.ndim+1):
+            return(np.asarray(self).sum(axis=axis,**kwargs))
+        if axis<0:
+            axis = axis + self.ndim
+        # sum over spatial axis of just the 6 components
+        return(self.full(self.comps.sum(axis=axis-1,**kwargs)))
+    #
+    def fabs(self):
+        return(Fantisym(np.fabs(self.comps),sign=1))
 
 def faraday():
-    # MEMMARK: 32+4=36 full 3D vars
+    # MEMMARK: 12+4=16 full 3D vars
     global fdd, fuu, omegaf1, omegaf1b, omegaf2, omegaf2b
     # these are native values according to HARM
-    fdd = np.zeros((4,4,nx,ny,nz),dtype=rho.dtype)
-    #fdd[0,0]=0*gdet
-    #fdd[1,1]=0*gdet
-    #fdd[2,2]=0*gdet
-    #fdd[3,3]=0*gdet
-    fdd[0,1]=gdet*(uu[2]*bu[3]-uu[3]*bu[2]) # f_tr
-    fdd[1,0]=-fdd[0,1]
-    fdd[0,2]=gdet*(uu[3]*bu[1]-uu[1]*bu[3]) # f_th
-    fdd[2,0]=-fdd[0,2]
-    fdd[0,3]=gdet*(uu[1]*bu[2]-uu[2]*bu[1]) # f_tp
-    fdd[3,0]=-fdd[0,3]
-    fdd[1,3]=gdet*(uu[2]*bu[0]-uu[0]*bu[2]) # f_rp = gdet*B2
-    fdd[3,1]=-fdd[1,3]
-    fdd[2,3]=gdet*(uu[0]*bu[1]-uu[1]*bu[0]) # f_hp = gdet*B1
-    fdd[3,2]=-fdd[2,3]
-    fdd[1,2]=gdet*(uu[0]*bu[3]-uu[3]*bu[0]) # f_rh = gdet*B3
-    fdd[2,1]=-fdd[1,2]
-    #
-    fuu = np.zeros((4,4,nx,ny,nz),dtype=rho.dtype)
-    #fuu[0,0]=0*gdet
-    #fuu[1,1]=0*gdet
-    #fuu[2,2]=0*gdet
-    #fuu[3,3]=0*gdet
-    fuu[0,1]=-1/gdet*(ud[2]*bd[3]-ud[3]*bd[2]) # f^tr
-    fuu[1,0]=-fuu[0,1]
-    fuu[0,2]=-1/gdet*(ud[3]*bd[1]-ud[1]*bd[3]) # f^th
-    fuu[2,0]=-fuu[0,2]
-    fuu[0,3]=-1/gdet*(ud[1]*bd[2]-ud[2]*bd[1]) # f^tp
-    fuu[3,0]=-fuu[0,3]
-    fuu[1,3]=-1/gdet*(ud[2]*bd[0]-ud[0]*bd[2]) # f^rp
-    fuu[3,1]=-fuu[1,3]
-    fuu[2,3]=-1/gdet*(ud[0]*bd[1]-ud[1]*bd[0]) # f^hp
-    fuu[3,2]=-fuu[2,3]
-    fuu[1,2]=-1/gdet*(ud[0]*bd[3]-ud[3]*bd[0]) # f^rh
-    fuu[2,1]=-fuu[1,2]
+    # only 6 independent components (antisymmetric), so store just those (fdd[1,0] gives -fdd[0,1], fdd[0,0] gives zeros)
+    fdd = Fantisym(np.empty((6,nx,ny,nz),dtype=rho.dtype))
+    fdd.comps[Fantisymindex[(0,1)]]=gdet*(uu[2]*bu[3]-uu[3]*bu[2]) # f_tr
+    fdd.comps[Fantisymindex[(0,2)]]=gdet*(uu[3]*bu[1]-uu[1]*bu[3]) # f_th
+    fdd.comps[Fantisymindex[(0,3)]]=gdet*(uu[1]*bu[2]-uu[2]*bu[1]) # f_tp
+    fdd.comps[Fantisymindex[(1,3)]]=gdet*(uu[2]*bu[0]-uu[0]*bu[2]) # f_rp = gdet*B2
+    fdd.comps[Fantisymindex[(2,3)]]=gdet*(uu[0]*bu[1]-uu[1]*bu[0]) # f_hp = gdet*B1
+    fdd.comps[Fantisymindex[(1,2)]]=gdet*(uu[0]*bu[3]-uu[3]*bu[0]) # f_rh = gdet*B3
+    #
+    fuu = Fantisym(np.empty((6,nx,ny,nz),dtype=rho.dtype))
+    fuu.comps[Fantisymindex[(0,1)]]=-1/gdet*(ud[2]*bd[3]-ud[3]*bd[2]) # f^tr
+    fuu.comps[Fantisymindex[(0,2)]]=-1/gdet*(ud[3]*bd[1]-ud[1]*bd[3]) # f^th
+    fuu.comps[Fantisymindex[(0,3)]]=-1/gdet*(ud[1]*bd[2]-ud[2]*bd[1]) # f^tp
+    fuu.comps[Fantisymindex[(1,3)]]=-1/gdet*(ud[2]*bd[0]-ud[0]*bd[2]) # f^rp
+    fuu.comps[Fantisymindex[(2,3)]]=-1/gdet*(ud[0]*bd[1]-ud[1]*bd[0]) # f^hp
+    fuu.comps[Fantisymindex[(1,2)]]=-1/gdet*(ud[0]*bd[3]-ud[3]*bd[0]) # f^rh
     #
     # these 2 are equal in degen electrodynamics when d/dt=d/dphi->0
     omegaf1=fdd[0,1]/fdd[1,3] # = ftr/frp
@@ -14146,56 +16017,53 @@ def jetpowcalc(which=2,minbsqorho=None,mumin=None,mumax=None,maxbeta=None,maxbsq
         #v4asq=bsq/(rho+ug+(gam-1)*ug)
         #mum1fake=uu[0]*(1.0+v4asq)-1.0
         # override (mum1fake or mu do poorly for marking boundary of jet)
-        mum1fake=bsq/rho
+        # so mum1fake=bsq/rho
+        # conditions are where to keep jetpowden (cached per dump by condmask())
+        conds=[]
         if mumax is None:
-            cond=(mum1fake<mumin)
+            if mumin is not None:
+                conds.append(('bsqorho','>=',mumin))
         else:
-            cond=(mum1fake>mumax)
+            conds.append(('bsqorho','<=',mumax))
         #
         # avoid disk component that might be unbound and moving out as transient or as part of outer part of disk
         #beta=((gam-1)*ug)*divideavoidinf(bsq*0.5)
-        beta=((gam-1)*ug)/(1E-30 + bsq*0.5)
-        betatot=((gam-1)*ug+(4.0/3.0-1)*urad)/(1E-30 + bsq*0.5)
-        if maxbeta is None:
-            donothing0000temp=1
-        else:
-            cond+=(betatot>maxbeta) # always use betatot
+        if maxbeta is not None:
+            conds.append(('betatot','<=',maxbeta)) # always use betatot
         #
-        if maxbsqorho is None:
-            donothing0001temp=1
-        else:
-            cond+=(bsq/rho>maxbsqorho)
+        if maxbsqorho is not None:
+            conds.append(('bsqorho','<=',maxbsqorho))
         #
-        if minbsqorho is None:
-            donothing0002temp=1
-        else:
-            cond+=(bsq/rho<minbsqorho)
+        if minbsqorho is not None:
+            conds.append(('bsqorho','>=',minbsqorho))
         #
         # NOTEMARK: this gives Edot[wind,out,unbound], but really want Edot[wind,net] because that's required to compute efficiency.  Edotout never otherwise used even if "interesting"
         if unboundonly==1:
             #zero out bound region
-            cond+=(1-isunbound)
+            conds.append(('isunbound','==',1))
         #
         if inflowonly==1:
             #zero out outflowing region
-            cond+=(uu[1]>=0.0)
+            conds.append(('uu1','<',0.0))
         #
         if outflowonly==1:
             #zero out infalling region
-            cond+=(uu[1]<=0.0)
+            conds.append(('uu1','>',0.0))
         #
         # 1 = north
         #-1 = south
         if donorthsouth==1:
             #NORTH
             #[zero out south hemisphere]
-            cond += (tj>=ny/2)
+            conds.append(('tj','<',ny/2))
         elif donorthsouth==-1:
             #SOUTH
             #[zero out north hemisphere]
-            cond += (tj<ny/2)
+            conds.append(('tj','>=',ny/2))
         #
-        jetpowden[cond] = 0*jetpowden[cond]
+        insideall=condmask(conds)
+        if insideall is not None:
+            jetpowden[np.logical_not(np.broadcast_to(insideall,jetpowden.shape))] = 0
     #
     jetpowtot = scaletofullwedge(np.sum(np.sum(conditional*jetpowden,axis=2),axis=1)*_dx2*_dx3)
     #print "which = %d, minbsqorho = %g" % (which, minbsqorho)
@@ -14226,64 +16094,130 @@ def plotit(ts,fs,md):
     plotlist[1].grid(True)
     fig.savefig('test.pdf')
 
+# piecewise linear y(x) for increasing x, constant beyond ends, using searchsorted on precomputed tables
+def coordinterp(x,y,q):
+    q=np.asarray(q,dtype=np.float64)
+    if len(x)==1:
+        return(y[0]+0.0*q)
+    idx=np.clip(np.searchsorted(x,q,side='right'),1,len(x)-1)
+    frac=np.clip((q-x[idx-1])/(x[idx]-x[idx-1]),0.0,1.0)
+    return(y[idx-1]+frac*(y[idx]-y[idx-1]))
+
+# r->i, (i,\theta)->j, \phi->k and t->index tables for current grid, made once by coordindex() and used by iofr(), jofh(), kofph(), tofts(), etc.
+# Queries can be scalars or arrays.  Like the interp1d() versions, results are rounded to nearest index, except jfloat()
+class CoordIndex(object):
+    def __init__(self):
+        self.sources=[condmasksourceref(obj) for obj in coordindexsources()]
+        self.nz=nz
+        self.rpole=np.array(r[:,0,0],dtype=np.float64)
+        self.req=np.array(r[:,ny//2,0],dtype=np.float64)
+        self.ti1d=np.array(ti[:,0,0],dtype=np.float64)
+        self.tieq1d=np.array(ti[:,ny//2,0],dtype=np.float64)
+        self.ph1d=np.array(ph[0,0,:],dtype=np.float64)
+        if len(self.ph1d)!=nz:
+            # use2d grid only has one \phi, but \phi(x3) is uniform so can get rest from rfd's nz
+            self.ph1d=self.ph1d[0] + _dx3*dxdxp[3,3,0,0,0]*np.arange(0,nz)
+        self.tk1d=np.arange(0,len(self.ph1d),dtype=np.float64)
+        # each row h[i,:] shifted by i*hsep so that all (i,\theta) are one increasing table for searchsorted
+        self.ny=h.shape[1]
+        self.hsep=2.0*np.pi+1.0
+        self.hshift=(np.array(h[:,:,0],dtype=np.float64) + self.hsep*np.arange(0,h.shape[0])[:,None]).reshape(-1)
+        self.tjflat=np.array(tj[:,:,0],dtype=np.float64).reshape(-1)
+        self.tsvalues=None
+    #
+    def current(self):
+        # same r,h,ph,ti,tj objects (by weak reference, since ids get reused once arrays are freed) and nz
+        return(self.nz==nz and all(ref() is obj for ref,obj in zip(self.sources,coordindexsources())))
+    #
+    def ifloat(self,rval,eq=False):
+        if eq:
+            return(coordinterp(self.req,self.tieq1d,rval))
+        return(coordinterp(self.rpole,self.ti1d,rval))
+    #
+    def iofr(self,rval,eq=False):
+        rval=np.asarray(rval,dtype=np.float64)
+        rtable=self.req if eq else self.rpole
+        ival=np.floor(self.ifloat(rval,eq=eq)+0.5)
+        ival=np.where(np.logical_or(rval<=Rin,rval<=rtable[0]),0,ival)
+        ival=np.where(np.logical_or(rval>=Rout,rval>=rtable[-1]),self.ti1d[-1],ival)
+        return(coordindexresult(ival))
+    #
+    def jfloat(self,hval,i):
+        hval=np.asarray(hval,dtype=np.float64)
+        i=np.asarray(i).astype(int)
+        q=hval + self.hsep*i
+        # keep within row i
+        rowstart=i*self.ny
+        if self.ny==1:
+            return(self.tjflat[rowstart]+0.0*q)
+        idx=np.clip(np.searchsorted(self.hshift,q,side='right'),rowstart+1,rowstart+self.ny-1)
+        frac=np.clip((q-self.hshift[idx-1])/(self.hshift[idx]-self.hshift[idx-1]),0.0,1.0)
+        return(self.tjflat[idx-1]+frac*(self.tjflat[idx]-self.tjflat[idx-1]))
+    #
+    def jofh(self,hval,i):
+        return(coordindexresult(np.floor(self.jfloat(hval,i)+0.5)))
+    #
+    def kofph(self,phval):
+        phval=np.array(phval,dtype=np.float64)
+        if len(self.ph1d)==1:
+            return(coordindexresult(0.0*phval))
+        phval=np.where(phval<0.0,phval+2.0*np.pi,phval)
+        phval=np.where(phval>2.0*np.pi,phval-2.0*np.pi,phval)
+        # outside ph[0]..ph[-1] goes to nearest end (k=0 or nz-1)
+        return(coordindexresult(np.floor(coordinterp(self.ph1d,self.tk1d,phval)+0.5)))
+    #
+    def tofts(self,tval,tslist):
+        # t table depends upon ts, not grid, so remade only if ts changes (compared by value, so also if changed in place)
+        tsvalues=np.array(tslist,dtype=np.float64)
+        if self.tsvalues is None or not np.array_equal(self.tsvalues,tsvalues):
+            tsorder=np.argsort(tsvalues,kind='mergesort')
+            self.tstable=tsvalues[tsorder]
+            self.tsindex=np.array(tsorder,dtype=np.float64)
+            self.tsvalues=tsvalues
+        return(coordindexresult(np.floor(coordinterp(self.tstable,self.tsindex,tval)+0.5)))
+
+def coordindexresult(ival):
+    ival=np.asarray(ival).astype(int)
+    if ival.ndim==0:
+        return(int(ival))
+    return(ival)
+
+def coordindexsources():
+    return([r,h,ph,ti,tj])
+
+coordindexmem=None
+
+def coordindex():
+    """ CoordIndex for current grid (remade only if grid3d() etc. replaced r,h,ph,ti,tj) """
+    global coordindexmem
+    if coordindexmem is None or not coordindexmem.current():
+        coordindexmem=CoordIndex()
+    return(coordindexmem)
+
 def iofr(rval):
     return(iofrpole(rval))
 
 def iofrpole(rval):
-    if rval<=Rin or rval<=r[0,0,0]:
-        return(0)
-    elif rval>=Rout or rval>=r[-1,0,0]:
-        return(ti[-1,0,0])
-    else:
-        res = interp1d(r[:,0,0], ti[:,0,0], kind='linear')
-        return(np.floor(res(rval)+0.5))
+    return(coordindex().iofr(rval))
 
 def iofreq(rval):
-    if rval<=Rin or rval<=r[0,0,0]:
-        return(0)
-    elif rval>=Rout or rval>=r[-1,0,0]:
-        return(ti[-1,0,0])
-    else:
-        res = interp1d(r[:,ny/2,0], ti[:,ny/2,0], kind='linear')
-        return(np.floor(res(rval)+0.5))
+    return(coordindex().iofr(rval,eq=True))
 
 def tofts(tval):
-    res = interp1d(ts[:], np.arange(0,len(ts)), kind='linear')
-    return(np.floor(res(tval)+0.5))
+    return(coordindex().tofts(tval,ts))
 
 
 def jofhfloatsimple(hval,i):
-    res = interp1d(h[i,:,0], tj[i,:,0], kind='linear')
     # return float result
-    return(res(hval))
+    return(coordindex().jfloat(hval,i))
 
 def jofh(hval,i):
-    return(np.floor(jofhfloatsimple(hval,i)+0.5))
+    return(coordindex().jofh(hval,i))
 
 
 
 def kofph(phval):
-    if nz==1:
-        return(0)
-    if phval<0.0:
-        phval=phval+2.0*np.pi
-    if phval>2.0*np.pi:
-        phval=phval-2.0*np.pi
-    #
-    faketk=np.zeros(nz,dtype=np.int)
-    for kk in np.arange(0,nz):
-        faketk[kk]=kk
-    #
-    res = interp1d(ph[0,0,:], faketk[:], kind='linear',bounds_error=False,fill_value=-1)
-    kval=np.floor(res(phval)+0.5)
-    if kval==-1:
-        if phval<np.pi:
-            kval=0
-        else:
-            kval=nz-1
-        #
-    #
-    return(kval)
+    return(coordindex().kofph(phval))
 
 
 
@@ -14299,7 +16233,7 @@ def get_NRU(pickr):
         iout=iin
     #
     iavg=int((iin+iout)*0.5)
-    ravg=r[iavg,ny/2,0] # should be ~pickr
+    ravg=r[iavg,ny//2,0] # should be ~pickr
     #halfdeltar=0.5*ravg # so deltar is +-halfdeltar.  Assumes structure not correlated on scales much larger than this, even though flow advects inward!  NOTEMARK
     halfdeltar=0.8*ravg # so deltar is +-halfdeltar. # trying larger span, which will be captured (i.e. fit into nx) for our current models
     rinner=max(1.01*Rin,ravg-halfdeltar)
@@ -14310,14 +16244,14 @@ def get_NRU(pickr):
     trueiout=iofr(router)
     #
     # re-get exact radii
-    rinner=r[trueiin,ny/2,0]
-    router=r[trueiout,ny/2,0]
+    rinner=r[trueiin,ny//2,0]
+    router=r[trueiout,ny//2,0]
     deltar=router-rinner
     #
     #NRU = int(deltar/(dxdxp[1][1][iavg,ny/2,0]*_dx1))
     # account for smaller dr at smaller radii, and do it more generally:
-    dr=dxdxp[1][1][trueiin:trueiout+1,ny/2,0]*_dx1
-    myr=r[trueiin:trueiout+1,ny/2,0]
+    dr=dxdxp[1][1][trueiin:trueiout+1,ny//2,0]*_dx1
+    myr=r[trueiin:trueiout+1,ny//2,0]
     #
     print("dr") ; sys.stdout.flush()
     print(dr) ; sys.stdout.flush()
@@ -25189,8 +27123,7 @@ def mkmovie(framesize=50, domakeavi=False):
         #grid3dlight("gdump")
         #rd( "dump0000.bin" )
         #flist = np.sort(glob.glob( os.path.join("dumps/", "fieldline*.bin") ) )
-        flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-        sort_nicely(flist)
+        flist = getfieldlinelist()
         firstfieldlinefile=flist[0]
         #rfd("fieldline0000.bin")  #to definea
         print("Loading header of first file") ;sys.stdout.flush()
@@ -25293,7 +27226,9 @@ def mkmovie(framesize=50, domakeavi=False):
     #
     ################################################
     # LOOP over frames
-    for findex, fname in enumerate(flist):
+    # files this core does, so they can be read ahead in background (some may still be fully skipped below)
+    whichread=[findex % whichn == whichi for findex in np.arange(0,len(flist))]
+    for findex, fname in rfdprefetch(flist,whichread=whichread):
         #
         # check if skip based upon if this core should be doing this findex
         if findex % whichn != whichi:
@@ -25763,7 +27698,7 @@ def mk2davg():
     #print("maxrho=%g" % (maxrho))
     #
     #
-    flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
+    flist = getfieldlinelist()
     numfiles=len(flist)
     #
     ####################################
@@ -27044,8 +28979,7 @@ def mklotsopanels(epsFm=None,epsFke=None,fti=None,ftf=None,domakeframes=True,pre
         ihor = np.floor(iofr(rhor)+0.5)
         qtymem=getqtyvstime(ihor,0.2)
         #flist = np.sort(glob.glob( os.path.join("dumps/", "fieldline*.bin") ) )
-        flist = glob.glob( os.path.join("dumps/", "fieldline*.bin") )
-        sort_nicely(flist)
+        flist = getfieldlinelist()
     #make accretion rate plot, etc.
     sys.stdout.flush()
     plotlen = plotleni+(plotlenf-plotleni)*(t-plotlenti)/(plotlentf-plotlenti)
@@ -27554,7 +29488,8 @@ def oldstuff():
                 print(( "Skipping " + fname + " as lrho%04d_xy%g.png exists" % (findex,len) ));
             else:
                 print(( "Processing " + fname + " ..." ))
-                rfd("../"+fname)
+                # only what mkframexy() uses for density with field lines
+                rfd("../"+fname,fields=['rho','ug','B','gdetB','bsq','urad'])
                 plt.clf()
                 mkframexy("lrho%04d_xy%g" % (findex,len), vmin=-8,vmax=1.5,len=len)
         print( "Done!" )
@@ -27888,6 +29823,22 @@ def main(argv=None):
     global use2dglobal
     # whether use 2d slice of gdump or full 3d
     use2dglobal=True
+    #
+    global usemmapglobal
+    # whether rfd() memory-maps fieldline files (copy-on-write) instead of reading all columns into memory (see rfd(): only columns it changes are copied)
+    usemmapglobal=True
+    #
+    global prefetchdepthglobal
+    # how many fieldline files ahead rfdprefetch() reads in background in getqtyvstime(), get2davgone() and mkmovie()
+    prefetchdepthglobal=1
+    #
+    global usestructuredreinterpglobal
+    # whether reinterp() and reinterpxy() interpolate using grid structure (map_coordinates) instead of griddata
+    usestructuredreinterpglobal=True
+    #
+    global rfdtransformorderglobal
+    # how rfdtransform() takes tilted (THETAROT!=0) data to rotated grid: 'nearest' source cell or 'linear' (bilinear in j,k)
+    rfdtransformorderglobal='nearest'
     # for now, use2dglobal=True doesn't work for tilted sims due to some transformation issue.
     #use2dglobal=False
     #
@@ -29100,10 +31051,12 @@ def get_RT_seedpoints(fnumber, ncell):
     #
     Bznorm=Brnorm*np.cos(h)-Bhnorm*np.sin(h)
     BRnorm=Brnorm*np.sin(h)+Bhnorm*np.cos(h)
-    #reinterpolate onto an evenly space grid on the equatorial plane
-    imyx=reinterpxy(myx,extent,ncell,domask=0,interporder='linear')
-    imyy=reinterpxy(myy,extent,ncell,domask=0,interporder='linear')
-    imyz=reinterpxy(myz,extent,ncell,domask=1,interporder='linear')
+    #reinterpolate onto an evenly space grid on the equatorial plane (done before velinterp() reads other dumps)
+    ifields=reinterp_many({'myx':myx,'myy':myy,'myz':myz,'Bz':Bznorm},extent,ncell,domask={'myx':0,'myy':0,'myz':1,'Bz':1},interporder='linear',plane='xy')
+    imyx=ifields['myx']
+    imyy=ifields['myy']
+    imyz=ifields['myz']
+    iBz=ifields['Bz']
     #replace z values that would be inside the black hole with those on the black hole horizon - need to not hard code this in case I change resolution
     imyz[imyz.mask==True]=np.sqrt(rhor**2-imyx[imyz.mask==True]**2-imyy[imyz.mask==True]**2)
 
@@ -29114,7 +31067,6 @@ def get_RT_seedpoints(fnumber, ncell):
     #irho_h=reinterpxyhor(rho,extent,ncell,domask=1,interporder='linear')
     #irho[irho.mask==True]=irho_h[irho.mask==True]
 
-    iBz=reinterpxy(Bznorm,extent,ncell,domask=1,interporder='linear')
     iBr=reinterpxyhor(Bznorm,extent,ncell,domask=1, interporder='linear') #Brnorm is spherical, BRnorm is cylindrical; switching to Bznorm to keep transition to the disk continuous, has sign info
 
     ahor=2.0*np.pi*(a**2+3*rhor**2)/3 #surface area of half of the horizon
@@ -29278,9 +31230,8 @@ def get_RT_seedpoints(fnumber, ncell):
 
 def velinterp(fnumber, rng, extent, ncell):
     grid3d("gdump.bin",use2d=True)
-    #load the fieldline file for a given time and compute standard quantities
-    rfd("fieldline"+str(fnumber)+".bin")
-    cvel()
+    #load the fieldline file for a given time, only need velocity
+    rfd("fieldline"+str(fnumber)+".bin",fields=['uu'])
     rhor=1+(1-a**2)**0.5
     ihor=np.floor(iofr(rhor)+0.5)
     #compute the 3-velocities in the equatorial slice
@@ -29300,10 +31251,11 @@ def velinterp(fnumber, rng, extent, ncell):
     vxhor=vRhor*np.cos(ph)-vpnorm*np.sin(ph)
     vyhor=vRhor*np.sin(ph)+vpnorm*np.cos(ph)
     #make uniform grid for velocity                                            
-    ivx=reinterpxy(vxnorm,extent,ncell,domask=1,interporder='linear')
+    ifields=reinterp_many({'vx':vxnorm,'vy':vynorm},extent,ncell,domask=1,interporder='linear',plane='xy')
+    ivx=ifields['vx']
     ivx_h=reinterpxyhor(vxhor,extent,ncell,domask=1,interporder='linear')
     ivx[ivx.mask==True]=ivx_h[ivx.mask==True]
-    ivy=reinterpxy(vynorm,extent,ncell,domask=1,interporder='linear')
+    ivy=ifields['vy']
     ivy_h=reinterpxyhor(vyhor,extent,ncell,domask=1,interporder='linear')
     ivy[ivy.mask==True]=ivy_h[ivy.mask==True]
 